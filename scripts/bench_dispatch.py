@@ -0,0 +1,112 @@
+"""
+⏱️ Button Dispatch Benchmark
+Measures ButtonHandler.handle_event throughput against the previous dict-based handler.
+
+Usage:
+    python scripts/bench_dispatch.py -n 200000
+"""
+
+import argparse
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add project root to path so we can import from src
+sys.path.append(str(Path(__file__).parent.parent))
+from src.handlers.button_handler import ButtonHandler
+
+logger = logging.getLogger("bench.legacy")
+
+
+@dataclass
+class LegacyButtonState:
+    is_pressed: bool = False
+    press_count: int = 0
+    last_velocity: int = 0
+
+
+class LegacyButtonHandler:
+    """The dict/dataclass handler ButtonHandler replaced, kept for comparison"""
+
+    def __init__(self, debug_mode: bool = False):
+        self.button_states: Dict[int, LegacyButtonState] = {}
+        self.callbacks: Dict[int, Callable] = {}
+        self.debug_mode = debug_mode
+
+    def _get_xy(self, note: int):
+        return note % 10, note // 10
+
+    def register_callback(self, note: int, callback: Callable):
+        self.callbacks[note] = callback
+
+    def handle_event(self, message: list):
+        if len(message) != 3:
+            return
+        status, note, velocity = message
+        x, y = self._get_xy(note)
+        if note not in self.button_states:
+            self.button_states[note] = LegacyButtonState()
+        state = self.button_states[note]
+        if self.debug_mode:
+            logger.info(
+                f"🔔 Button Event: ({x}, {y}) - "
+                f"{'Pressed' if velocity > 0 else 'Released'} "
+                f"[Note: {note}, Velocity: {velocity}]"
+            )
+        if velocity > 0:
+            if not state.is_pressed:
+                state.is_pressed = True
+                state.press_count += 1
+                if note in self.callbacks:
+                    self.callbacks[note]()
+        else:
+            state.is_pressed = False
+        state.last_velocity = velocity
+
+
+def make_events(count: int) -> List[list]:
+    """Drum over the 8x8 grid: press, aftertouch, release"""
+    events = []
+    notes = [x + y * 10 for y in range(8) for x in range(8)]
+    while len(events) < count:
+        for note in notes:
+            events.append([0x90, note, 100])
+            events.append([0xA0, note, 64])
+            events.append([0x90, note, 0])
+    return events[:count]
+
+
+def run(handler, events: List[list]) -> float:
+    for note in range(0, 78):
+        handler.register_callback(note, lambda: None)
+    handle = handler.handle_event
+    start = time.perf_counter()
+    for event in events:
+        handle(event)
+    return len(events) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--events', type=int, default=300000)
+    args = parser.parse_args()
+
+    # Debug mode on with INFO filtered out: the common "left DEBUG_MODE on" case
+    logging.basicConfig(level=logging.WARNING)
+    events = make_events(args.events)
+
+    print(f"\n=== handle_event x {len(events)} ===")
+    for debug_mode in (False, True):
+        before = run(LegacyButtonHandler(debug_mode=debug_mode), events)
+        after = run(ButtonHandler(debug_mode=debug_mode), events)
+        print(
+            f"debug_mode={str(debug_mode):<5} before {before:12,.0f} ev/s | "
+            f"after {after:12,.0f} ev/s | x{after / before:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+⏱️ Logging Benchmark
+Measures what button-event logging costs the MIDI callback: ButtonHandler.handle_event
+with DEBUG_MODE on, logging straight to a file versus through the queue pipeline.
+
+Usage:
+    python scripts/bench_logging.py -n 100000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Add project root to path so we can import from src
+sys.path.append(str(Path(__file__).parent.parent))
+from src.handlers.button_handler import ButtonHandler
+from src.utils.logger import TEXT_FORMAT, dropped_records, setup_logging, stop_logging
+
+
+def make_events(count: int) -> List[list]:
+    """Drum over the 8x8 grid: press then release"""
+    events = []
+    notes = [x + y * 10 for y in range(8) for x in range(8)]
+    while len(events) < count:
+        for note in notes:
+            events.append([0x90, note, 100])
+            events.append([0x80, note, 0])
+    return events[:count]
+
+
+def run(events: List[list]) -> List[float]:
+    """Per-event callback cost in microseconds"""
+    handler = ButtonHandler(debug_mode=True)
+    for note in range(0, 78):
+        handler.register_callback(note, lambda: None)
+    handle = handler.handle_event
+    clock = time.perf_counter
+    costs = []
+    for event in events:
+        start = clock()
+        handle(event)
+        costs.append((clock() - start) * 1e6)
+    return costs
+
+
+def report(name: str, costs: List[float]):
+    costs = sorted(costs)
+    pick = lambda q: costs[min(len(costs) - 1, int(q * len(costs)))]
+    print(f"{name:<28} mean {sum(costs) / len(costs):7.2f} µs | p50 {pick(0.5):7.2f} | "
+          f"p99 {pick(0.99):7.2f} | max {costs[-1]:9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--events', type=int, default=100000)
+    parser.add_argument('--rate', type=float, default=20.0,
+                        help="LOG_SAMPLE rate for the button handler (0 = no sampling)")
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+    root = logging.getLogger()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.log')
+        print(f"\n=== handle_event x {len(events)}, DEBUG_MODE on ===")
+
+        root.setLevel(logging.WARNING)
+        report("logging filtered out", run(events))
+
+        # What a plain synchronous handler costs: format and write in the callback
+        direct = logging.FileHandler(path)
+        direct.setFormatter(logging.Formatter(TEXT_FORMAT))
+        root.addHandler(direct)
+        root.setLevel(logging.DEBUG)
+        report("synchronous file handler", run(events))
+        root.removeHandler(direct)
+
+        # The same file handler, moved behind the queue (no console output either way)
+        root.addHandler(direct)
+        setup_logging('DEBUG', sample={})
+        report("queue pipeline", run(events))
+        stop_logging()
+
+        sample = {'src.handlers.button_handler': args.rate} if args.rate > 0 else {}
+        setup_logging('DEBUG', sample=sample)
+        report(f"queue pipeline + {args.rate:g}/s", run(events))
+        dropped = dropped_records()
+        stop_logging()
+        root.removeHandler(direct)
+        direct.close()
+        print(f"dropped: {dropped['queue_full']} (queue full), {dropped['sampled']} (sampled)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+⏱️ Shell Pool Benchmark
+Compares press-to-exec latency of cold `<shell> -i -c` spawns against warm pooled shells.
+
+Usage:
+    python scripts/bench_shell_pool.py --shell /bin/zsh --command git_status -n 20
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add project root to path so we can import from src
+sys.path.append(str(Path(__file__).parent.parent))
+from src.handlers.alias_handler import AliasHandler
+from src.handlers.shell_pool import ShellPool
+
+
+def measure(handler: AliasHandler, command: str, iterations: int) -> List[float]:
+    """Time `iterations` executions of command in milliseconds"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        handler.execute(command)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label: str, samples: List[float]):
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{label:<6} mean {statistics.mean(samples):8.2f} ms | "
+        f"p50 {statistics.median(samples):8.2f} ms | "
+        f"p95 {p95:8.2f} ms | max {ordered[-1]:8.2f} ms"
+    )
+
+
+def wait_until_warm(pool: ShellPool, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while pool.stats()['idle'] < pool.size:
+        if time.monotonic() > deadline:
+            raise RuntimeError("shell pool did not warm up in time")
+        time.sleep(0.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--shell', default='/bin/zsh', help="Shell to benchmark")
+    parser.add_argument('--command', default='true', help="Alias or command to run")
+    parser.add_argument('-n', '--iterations', type=int, default=20)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    args = parser.parse_args()
+
+    # Keep per-command logging out of the timings
+    logging.basicConfig(level=logging.ERROR)
+
+    print(f"\n=== {args.shell}: '{args.command}' x {args.iterations} ===")
+
+    cold = AliasHandler(shell_path=args.shell, timeout=args.timeout)
+    report("cold", measure(cold, args.command, args.iterations))
+
+    pool = ShellPool(shell_path=args.shell, size=1, max_commands=args.iterations + 1)
+    pool.start()
+    try:
+        wait_until_warm(pool)
+        warm = AliasHandler(shell_path=args.shell, timeout=args.timeout, shell_pool=pool)
+        report("warm", measure(warm, args.command, args.iterations))
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
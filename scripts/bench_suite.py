@@ -0,0 +1,217 @@
+"""
+⏱️ Hardware-free Benchmark Suite
+Drives the real LaunchpadApp wiring through the fake MIDI backend and reports
+callback cost, dispatch latency, LED traffic and execution-queue behaviour.
+
+Usage:
+    python scripts/bench_suite.py                   # simulated 20 ms jobs
+    python scripts/bench_suite.py --work-ms 0 --scenario drum_roll
+    python scripts/bench_suite.py --real            # really run `true` per press
+    python scripts/bench_suite.py --runtime threads # worker pool instead of the event loop
+    python scripts/bench_suite.py --session FILE    # replay a recorded session
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add project root to path so we can import from src
+sys.path.append(str(Path(__file__).parent.parent))
+from src.app import LaunchpadApp
+from src.handlers.process_watcher import ProcessFuture
+from src.managers import fake_midi_backend as streams
+from src.managers.fake_midi_backend import FakeMidiBackend
+from src.utils.constants import Colors
+from src.utils.session_recorder import read_session
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0.0
+
+
+def build_scenarios(args) -> Dict[str, list]:
+    n = args.events
+    if args.session:
+        return {'session': list(read_session(args.session))}
+    return {
+        'steady': list(streams.steady(rate=args.rate, count=n)),
+        'burst': list(streams.burst(size=64, bursts=max(1, n // 128))),
+        'drum_roll': list(streams.drum_roll(rate=args.rate * 10, count=n)),
+        'aftertouch_flood': list(streams.aftertouch_flood(rate=args.rate * 50, count=n)),
+    }
+
+
+def build_app(args) -> Tuple[LaunchpadApp, FakeMidiBackend]:
+    os.environ.update({
+        'EXEC_RUNTIME': args.runtime,
+        'EXEC_POOL_SIZE': str(args.workers),
+        'EXEC_QUEUE_SIZE': str(args.queue_size),
+        'METRICS_ENABLED': 'True',
+        'LOG_LEVEL': 'ERROR',
+        'DEBUG_MODE': str(args.debug),
+        'STATUS_LIGHTS': str(not args.no_status_lights),
+    })
+    if not args.real:
+        os.environ.update({'SHELL_POOL_SIZE': '0', 'ALIAS_CACHE': 'False'})
+
+    backend = FakeMidiBackend()
+    app = LaunchpadApp(midi_backend=backend)
+    backend.ports = [app.config.launchpad.port_name]
+
+    if not args.real:
+        work = args.work_ms / 1000
+
+        # Stand-in for process execution so runs measure the app, not fork/exec
+        def simulated(alias_name, sink, trace=None, wait=None, policy=None):
+            if trace:
+                trace.mark('spawn')
+            time.sleep(work)
+            completion = ProcessFuture()
+            completion.set_result(0)
+            return completion
+
+        async def simulated_async(alias_name, sink, trace=None, policy=None):
+            if trace:
+                trace.mark('spawn')
+            await asyncio.sleep(work)
+            return 0
+
+        app.alias_handler._launch = simulated
+        app.alias_handler._launch_async = simulated_async
+
+    mappings = [(x, y, Colors.BLUE, 'true') for y in range(8) for x in range(8)]
+    start_index = len(backend.sent)
+    app.add_mappings(mappings)
+    if not app.start():
+        raise RuntimeError("fake backend failed to connect")
+    startup = backend.sent_since(start_index)
+    print(f"🚀 Startup: {len(mappings)} mappings lit with {len(startup)} MIDI message(s), "
+          f"{sum(len(m) for m in startup)} bytes")
+    return app, backend
+
+
+class Outcomes:
+    """🧮 Execution listener counting how runs ended"""
+
+    def __init__(self):
+        self.succeeded = 0
+        self.failed = 0
+
+    def execution_finished(self, alias, context, result):
+        if result.success:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+
+def wait_idle(app: LaunchpadApp, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        stats = app.execution_manager.stats()
+        if not (stats['queue_depth'] or stats['running']):
+            return
+        time.sleep(0.01)
+
+
+def run_scenario(app: LaunchpadApp, backend: FakeMidiBackend, name: str,
+                 events: list, realtime: bool, outcomes: Outcomes) -> bool:
+    """▶️ Play one scenario and print its report; False if no run succeeded"""
+    app.metrics.reset()
+    outcomes.succeeded = outcomes.failed = 0
+    before = app.execution_manager.stats()
+    sent_index = len(backend.sent)
+
+    max_depth = 0
+    sampling = True
+
+    def sample_queue():
+        nonlocal max_depth
+        while sampling:
+            max_depth = max(max_depth, app.execution_manager.stats()['queue_depth'])
+            time.sleep(0.001)
+
+    sampler = threading.Thread(target=sample_queue, daemon=True)
+    sampler.start()
+
+    start = time.perf_counter()
+    durations = backend.play(events, realtime=realtime)
+    wall = time.perf_counter() - start
+    wait_idle(app)
+    # Let status-light flashes expire so their LED traffic is counted
+    time.sleep(0.6)
+    sampling = False
+    sampler.join()
+
+    after = app.execution_manager.stats()
+    led = backend.sent_since(sent_index)
+    queued = app.metrics.stage_histogram('queued')
+    started = app.metrics.stage_histogram('start')
+    finished = app.metrics.stage_histogram('exit')
+
+    print(f"\n=== {name}: {len(events)} events ({'realtime' if realtime else 'max rate'}) ===")
+    print(f"  input rate     {len(events) / wall:12,.0f} ev/s wall | "
+          f"{len(events) / sum(durations):12,.0f} ev/s callback-bound")
+    print(f"  callback       p50 {statistics.median(durations) * 1e6:8.1f} µs | "
+          f"p99 {percentile(durations, 0.99) * 1e6:8.1f} µs | max {max(durations) * 1e6:8.1f} µs")
+    print(f"  press->queued  p50 <= {queued.quantile(0.5) * 1e3:7.2f} ms | "
+          f"p99 <= {queued.quantile(0.99) * 1e3:7.2f} ms ({queued.count} presses)")
+    print(f"  press->start   p50 <= {started.quantile(0.5) * 1e3:7.2f} ms | "
+          f"p99 <= {started.quantile(0.99) * 1e3:7.2f} ms")
+    print(f"  press->exit    p50 <= {finished.quantile(0.5) * 1e3:7.2f} ms | "
+          f"p99 <= {finished.quantile(0.99) * 1e3:7.2f} ms")
+    print(f"  LED traffic    {len(led)} messages, {sum(len(m) for m in led)} bytes")
+    print(f"  exec queue     max depth {max_depth} | "
+          f"completed {after['completed'] - before['completed']} | "
+          f"rejected {after['rejected'] - before['rejected']} | "
+          f"dropped {after['dropped'] - before['dropped']} | "
+          f"coalesced {after['coalesced'] - before['coalesced']}")
+    print(f"  runs           succeeded {outcomes.succeeded} | failed {outcomes.failed}")
+    if outcomes.failed and not outcomes.succeeded:
+        print("  ❌ every run failed; the numbers above don't measure anything")
+        return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scenario', action='append',
+                        choices=['steady', 'burst', 'drum_roll', 'aftertouch_flood'],
+                        help="Scenario(s) to run (default: all)")
+    parser.add_argument('-n', '--events', type=int, default=2000)
+    parser.add_argument('--rate', type=float, default=200.0, help="Base events/second")
+    parser.add_argument('--max-rate', action='store_true', help="Ignore event timing")
+    parser.add_argument('--runtime', choices=['asyncio', 'threads'], default='asyncio')
+    parser.add_argument('--workers', type=int, default=4, help="Worker threads (threads runtime)")
+    parser.add_argument('--queue-size', type=int, default=64)
+    parser.add_argument('--work-ms', type=float, default=20.0, help="Simulated job duration")
+    parser.add_argument('--real', action='store_true', help="Execute the mapped alias for real")
+    parser.add_argument('--debug', action='store_true', help="Enable DEBUG_MODE event logging")
+    parser.add_argument('--no-status-lights', action='store_true')
+    parser.add_argument('--session', help="Replay a recording instead of synthetic streams")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    app, backend = build_app(args)
+    outcomes = Outcomes()
+    app.alias_handler.add_listener(outcomes)
+    ok = True
+    try:
+        scenarios = build_scenarios(args)
+        for name in args.scenario or scenarios:
+            ok &= run_scenario(app, backend, name, scenarios[name],
+                               realtime=not args.max_rate, outcomes=outcomes)
+    finally:
+        app._handle_shutdown()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+📼 Session Replay Tool
+Feeds a recorded MIDI session back through ButtonHandler.handle_event.
+
+Usage:
+    python scripts/replay_session.py                      # newest recording, original timing
+    python scripts/replay_session.py FILE --fast --loops 100   # as fast as possible (load test)
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path so we can import from src
+sys.path.append(str(Path(__file__).parent.parent))
+from src.handlers.button_handler import ButtonHandler
+from src.utils.constants import MIDI_NOTE_COUNT
+from src.utils.session_recorder import list_sessions, read_session
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('session', nargs='?', help="Recording to replay (default: newest)")
+    parser.add_argument('--dir', default='~/.cache/launchpad-shell/sessions')
+    parser.add_argument('--fast', action='store_true', help="Ignore recorded timing")
+    parser.add_argument('--loops', type=int, default=1)
+    parser.add_argument('--debug', action='store_true', help="Log every event")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.debug else logging.WARNING,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    path = args.session
+    if not path:
+        sessions = list_sessions(args.dir)
+        if not sessions:
+            print(f"❌ No recordings in {args.dir}")
+            return 1
+        path = sessions[-1]
+
+    events = list(read_session(path))
+    print(f"📼 {path}: {len(events)} events, {sum(d for _, d in events):.2f}s recorded")
+
+    handler = ButtonHandler(debug_mode=args.debug)
+    fired = [0]
+
+    def count():
+        fired[0] += 1
+
+    for note in range(MIDI_NOTE_COUNT):
+        handler.register_callback(note, count)
+
+    handle = handler.handle_event
+    start = time.perf_counter()
+    next_at = start
+    for _ in range(args.loops):
+        for message, delta in events:
+            if not args.fast and delta > 0:
+                next_at += delta
+                wait = next_at - time.perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+            handle(message)
+    elapsed = time.perf_counter() - start
+
+    total = len(events) * args.loops
+    print(f"▶️  Replayed {total} events in {elapsed:.3f}s ({total / max(elapsed, 1e-9):,.0f} ev/s), "
+          f"{fired[0]} presses dispatched")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,65 +1,406 @@
 """
 🎮 Main Application Module
 Orchestrates all components and provides the main application interface.
+
+Everything runs on one asyncio event loop: MIDI input is bridged in from
+rtmidi's thread, aliases run as subprocess tasks, and LED frames, timers and
+shutdown are scheduled on the same loop.
 """
 
+import asyncio
 import logging
-from typing import List, Tuple
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import signal
+import sys
 from .config.config_manager import ConfigManager
+from .config.mapping_file import MappingFileError, MappingSpec
+from .managers.device_manager import LaunchpadDevice
 from .managers.midi_manager import MIDIManager
+from .managers.midi_backend import MidiBackend
 from .managers.mapping_manager import MappingManager
+from .managers.execution_manager import AsyncExecutionManager, ExecutionManager
+from .managers.led_scheduler import LEDScheduler, StatusLights
 from .handlers.button_handler import ButtonHandler  # Fixed class name
 from .handlers.alias_handler import AliasHandler
+from .handlers.shell_pool import ShellPool
+from .handlers.alias_resolver import AliasResolver
+from .models.launch_policy import LaunchPolicy
+from .models.pipeline import Pipeline
+from .models.press_policy import PressPolicy
+from .utils.metrics import LatencyMetrics
+from .managers.port_resolver import PortCache
+from .managers.port_watcher import PortWatcher
+from .managers.result_cache import ResultCache
+from .utils.constants import DEFAULT_DEVICE
+from .utils.debugger import LaunchpadDebugger
+from .utils.history import ExecutionHistory
+from .utils.logger import setup_logging, stop_logging
+
+if TYPE_CHECKING:
+    from .managers.control_server import ControlServer
+    from .utils.file_watcher import FileWatcher
 
 logger = logging.getLogger(__name__)
 
+SHUTDOWN_GRACE = 2.0  # Seconds running aliases get to finish before they're cancelled
+
+
+def _use_pidfd_child_watcher(loop: asyncio.AbstractEventLoop):
+    """🐧 Reap subprocesses with pidfds instead of a thread per child (Python < 3.12)"""
+    if not hasattr(asyncio, 'PidfdChildWatcher') or sys.version_info >= (3, 12):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except (AttributeError, OSError):
+        return
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(loop)
+    asyncio.set_child_watcher(watcher)
+
 class LaunchpadApp:
-    def __init__(self):
+    def __init__(self, midi_backend: Optional[MidiBackend] = None,
+                 device_backends: Optional[Dict[str, MidiBackend]] = None):
+        """
+        Args:
+            midi_backend: Backend for the first device (tests, benchmarks)
+            device_backends: Backends by device name, for the rest
+        """
         # Initialize components
         self.config_manager = ConfigManager()
         self.config = self.config_manager.get_config()
         
-        # Set up logging based on config
-        logging.getLogger().setLevel(self.config.log_level)
+        # Set up logging based on config: records are written by a background thread
+        log_config = self.config.log
+        setup_logging(
+            self.config.log_level, log_config.format, log_config.levels,
+            log_config.sample, log_config.file, log_config.queue_size
+        )
         
-        # Initialize handlers and managers
-        self.midi_manager = MIDIManager()
-        self.alias_handler = AliasHandler()
-        self.mapping_manager = MappingManager(alias_handler=self.alias_handler)
-        self.button_handler = ButtonHandler(
-            debug_mode=self.config.launchpad.debug_mode
+        # Initialize shared handlers and managers
+        self.metrics = LatencyMetrics(enabled=self.config.metrics.enabled)
+        self.metrics.add_counters(
+            "launchpad_presses_limited_total",
+            "Presses held back by policies or backpressure (or restarted), by reason",
+            "reason",
+            self.press_stats
+        )
+        self.metrics.add_counters(
+            "launchpad_midi_reconnects_total",
+            "Times a controller was reopened after being unplugged or reset",
+            "device",
+            lambda: {name: device.midi_manager.reconnects for name, device in self.devices.items()}
+        )
+        shell = self.config.shell
+        self.shell_pool = ShellPool(
+            shell_path=shell.shell_path,
+            size=shell.pool_size,
+            max_commands=shell.pool_max_commands,
+            work_dir=shell.work_dir,
+            health_interval=shell.pool_health_interval
+        ) if shell.pool_size > 0 else None
+        self.alias_resolver = AliasResolver(
+            shell_path=shell.shell_path,
+            cache_dir=self.config.cache_dir
+        ) if shell.alias_cache else None
+        self.alias_handler = AliasHandler(
+            shell_path=shell.shell_path,
+            timeout=shell.timeout,
+            work_dir=shell.work_dir,
+            shell_pool=self.shell_pool,
+            resolver=self.alias_resolver,
+            output_buffer=self.config.output.buffer_kb * 1024,
+            log_dir=self.config.output.log_dir,
+            log_max_bytes=self.config.output.log_max_kb * 1024,
+            log_backups=self.config.output.log_backups
+        )
+        # Every finished run is appended to a memory-mapped ring (python main.py history)
+        history = self.config.history
+        self.history = ExecutionHistory(history.file, history.size) if history.file else None
+        if self.history and self.history.open():
+            self.alias_handler.add_listener(self.history)
+        execution = self.config.execution
+        if execution.runtime == 'threads':
+            self.execution_manager = ExecutionManager(
+                pool_size=execution.pool_size,
+                queue_size=execution.queue_size,
+                default_limit=execution.mapping_limit
+            )
+        else:
+            self.execution_manager = AsyncExecutionManager(
+                max_inflight=execution.max_inflight,
+                queue_size=execution.queue_size,
+                default_limit=execution.mapping_limit
+            )
+        self.result_cache = ResultCache(
+            max_entries=execution.result_cache_size,
+            max_bytes=execution.result_cache_kb * 1024
+        )
+        self.metrics.add_counters(
+            "launchpad_result_cache_total",
+            "Idempotent mapping presses by outcome (hits, misses, shared, evictions)",
+            "outcome",
+            self.result_cache_stats
         )
         
-        # Setup signal handlers
+        # One LaunchpadDevice per controller; the first is the default for mappings
+        self._port_cache = PortCache(f"{self.config.cache_dir}/ports.json")
+        ports = self.config.launchpad.devices or {DEFAULT_DEVICE: self.config.launchpad.port_name}
+        backends = dict(device_backends or {})
+        if midi_backend is not None:
+            backends[next(iter(ports))] = midi_backend
+        self.devices: Dict[str, LaunchpadDevice] = {
+            name: self._create_device(name, port, backends.get(name), len(ports) > 1)
+            for name, port in ports.items()
+        }
+        self.device = next(iter(self.devices.values()))
+        
+        # Setup signal handlers (run() replaces these with event loop handlers)
         signal.signal(signal.SIGINT, self._handle_shutdown)
         signal.signal(signal.SIGTERM, self._handle_shutdown)
+        # SIGUSR1 / SIGUSR2 toggle a CPU profile / allocation window; idle until then
+        profile = self.config.profile
+        self.debugger = LaunchpadDebugger(
+            profile.directory, profile.interval_ms / 1000, profile.trace_frames
+        ) if profile.directory else None
+        if self.debugger:
+            self.debugger.install()
         
         self._running = False
+        self._closed = False
+        self._mapping_watcher: Optional['FileWatcher'] = None
+        self._port_watcher: Optional[PortWatcher] = None
+        self.control_server: Optional['ControlServer'] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._stopping: Optional[asyncio.Event] = None
+    
+    def _create_device(self, name: str, port_name: str,
+                       backend: Optional[MidiBackend], shared: bool) -> LaunchpadDevice:
+        """🎛️ Build the per-controller managers around the shared execution engine"""
+        midi_manager = MIDIManager(backend=backend, port_cache=self._port_cache)
+        recording = self.config.recording
+        if recording.enabled:
+            from .utils.session_recorder import SessionRecorder
+            directory = recording.directory if not shared else f"{recording.directory}/{name}"
+            midi_manager.recorder = SessionRecorder(
+                directory=directory,
+                segment_size=recording.segment_kb * 1024,
+                max_files=recording.max_files
+            )
+        led_scheduler = LEDScheduler(
+            midi_manager,
+            max_fps=self.config.launchpad.led_max_fps
+        )
+        device = LaunchpadDevice(
+            name=name,
+            port_name=port_name,
+            midi_manager=midi_manager,
+            led_scheduler=led_scheduler,
+            mapping_manager=MappingManager(
+                alias_handler=self.alias_handler,
+                executor=self.execution_manager,
+                device=name,
+                results=self.result_cache
+            ),
+            button_handler=ButtonHandler(
+                debug_mode=self.config.launchpad.debug_mode
+            ),
+            metrics=self.metrics,
+            chord_window=self.config.launchpad.chord_window_ms / 1000,
+            sequence_timeout=self.config.launchpad.sequence_timeout_ms / 1000
+        )
+        if self.config.launchpad.status_lights:
+            self.alias_handler.add_listener(StatusLights(led_scheduler, visible=device.shows))
+        return device
+    
+    # 🎛️ The first device, for single-controller setups
+    
+    @property
+    def midi_manager(self) -> MIDIManager:
+        return self.device.midi_manager
+    
+    @property
+    def led_scheduler(self) -> LEDScheduler:
+        return self.device.led_scheduler
+    
+    @property
+    def mapping_manager(self) -> MappingManager:
+        return self.device.mapping_manager
+    
+    @property
+    def button_handler(self) -> ButtonHandler:
+        return self.device.button_handler
+    
+    def get_device(self, name: Optional[str] = None) -> LaunchpadDevice:
+        """🎛️ Look up a device by name ('' or None is the first device)"""
+        if not name:
+            return self.device
+        device = self.devices.get(name)
+        if device is None:
+            raise KeyError(f"unknown device {name!r}")
+        return device
+    
+    def press_stats(self) -> Dict[str, int]:
+        """🚦 Presses that didn't run, by reason, across devices and the executor"""
+        counts: Dict[str, int] = {}
+        for device in self.devices.values():
+            for reason, count in device.mapping_manager.press_counts.items():
+                counts[reason] = counts.get(reason, 0) + count
+        stats = self.execution_manager.stats()
+        for reason in ('rejected', 'dropped', 'coalesced'):
+            counts[reason] = stats[reason]
+        return counts
+    
+    def result_cache_stats(self) -> Dict[str, int]:
+        """🧊 Result cache counters (current size left out, it's not a counter)"""
+        stats = self.result_cache.stats()
+        return {outcome: stats[outcome] for outcome in ('hits', 'misses', 'shared', 'evictions')}
     
     def setup_midi_callback(self):
-        """🎹 Setup MIDI event callback"""
-        self.midi_manager.set_callback(
-            lambda event, _: self.button_handler.handle_event(event[0])
+        """🎹 Route every connected device's input to the dispatcher"""
+        for device in self.devices.values():
+            if device.running:
+                device.listen(self._on_midi_event, self._loop)
+    
+    def _on_midi_event(self, device: LaunchpadDevice, event, data=None):
+        """🎹 rtmidi input callback for any device: hand (message, delta_time) to the loop"""
+        message, delta = event
+        received = time.perf_counter() if self.metrics.enabled else None
+        self._loop.call_soon_threadsafe(self._dispatch, device, message, delta, received)
+    
+    def _dispatch(self, device: LaunchpadDevice, message, delta: float,
+                  received: Optional[float]):
+        """🎯 Handle one input event on the loop (events are handled one at a time)"""
+        if received is not None:
+            self.metrics.begin(delta, received)
+        device.button_handler.handle_event(message)
+    
+    def add_mapping(self, x: int, y: int, color: int, alias: str,
+                    max_concurrent: Optional[int] = None, page: int = 0,
+                    device: Optional[str] = None, policy: Optional[PressPolicy] = None,
+                    pipeline: Optional[Pipeline] = None, launch: Optional[LaunchPolicy] = None):
+        """➕ Add new button mapping (alias names the pipeline, if one is given)"""
+        self.get_device(device).add_mapping(
+            x, y, color, alias, max_concurrent, page, policy, pipeline, launch
         )
     
-    def add_mapping(self, x: int, y: int, color: int, alias: str):
-        """➕ Add new button mapping"""
-        mapping = self.mapping_manager.create_mapping(x, y, color, alias)
-        self.midi_manager.set_button_color(x, y, color)
-        # Register callback
-        self.button_handler.register_callback(
-            mapping.button.note,
-            lambda: self.mapping_manager.execute_mapping(x, y)
+    def add_gesture(self, gesture: str, pads: List[Tuple[int, int]], alias: str,
+                    max_concurrent: Optional[int] = None, page: int = 0,
+                    device: Optional[str] = None, policy: Optional[PressPolicy] = None,
+                    window_ms: int = 0, pipeline: Optional[Pipeline] = None,
+                    launch: Optional[LaunchPolicy] = None):
+        """➕ Bind an alias to a chord ('chord') or sequence ('sequence') of pads"""
+        if gesture == 'chord':
+            pads = sorted(pads)
+        self.get_device(device).add_gesture(
+            gesture, tuple(pads), alias, max_concurrent, page, policy, window_ms, pipeline,
+            launch
         )
-        logger.info(f"✨ Added mapping: ({x}, {y}) -> {alias}")
     
-    def start(self) -> bool:
-        """�� Start the application"""
+    def add_mappings(self, mappings: List[Tuple[int, int, int, str]],
+                     device: Optional[str] = None):
+        """➕ Add several mappings, lighting them with a single LED write"""
+        target = self.get_device(device)
+        target.edit([
+            MappingSpec(x, y, color, alias, device=target.name)
+            for x, y, color, alias in mappings
+        ])
+    
+    def remove_mapping(self, x: int, y: int, page: int = 0, device: Optional[str] = None):
+        """➖ Remove a button mapping and turn its LED off"""
+        self.get_device(device).remove_mapping(x, y, page)
+    
+    def switch_page(self, page: int, device: Optional[str] = None) -> bool:
+        """📑 Show another page on a device"""
+        return self.get_device(device).switch_page(page)
+    
+    def apply_mappings(self, specs: List[MappingSpec]):
+        """🔀 Bring every device's mappings in line with specs, touching only what changed"""
+        by_device: Dict[str, List[MappingSpec]] = {name: [] for name in self.devices}
+        for spec in specs:
+            name = spec.device or self.device.name
+            if name not in by_device:
+                logger.warning(f"⚠️ Skipping mapping for unknown device {name!r}: {spec.alias}")
+                continue
+            by_device[name].append(spec)
+        
+        changed = False
+        for name, device_specs in by_device.items():
+            changed |= self.devices[name].apply(device_specs)
+        if not changed:
+            logger.debug("🗂️ Mappings unchanged")
+    
+    def load_mappings(self, path: Optional[str] = None) -> bool:
+        """
+        🗂️ Load mappings from the mapping file and optionally watch it for edits
+        
+        Returns:
+            bool: True if the file was loaded
+        """
+        path = path or self.config.mappings.file
+        try:
+            self.apply_mappings(self.config_manager.load_mappings(path))
+        except (OSError, MappingFileError) as e:
+            logger.error(f"❌ Failed to load mappings: {e}")
+            return False
+        
+        if self.config.mappings.watch and self._mapping_watcher is None:
+            from .utils.file_watcher import FileWatcher
+            self._mapping_watcher = FileWatcher(path, lambda: self._reload_mappings(path))
+            self._mapping_watcher.start()
+        return True
+    
+    def _reload_mappings(self, path: str):
+        """🔄 Apply an edited mapping file, keeping the old mappings if it's invalid"""
+        try:
+            specs = self.config_manager.load_mappings(path)
+        except (OSError, MappingFileError) as e:
+            logger.error(f"❌ Ignoring mapping file change: {e}")
+            return
+        # Parse on the watcher thread, apply between input events on the loop
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self.apply_mappings, specs)
+        else:
+            self.apply_mappings(specs)
+    
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
+        """
+        🚀 Start the application
+        
+        Args:
+            loop: Event loop to run on; without one (scripts, benchmarks) a
+                loop is started on a background thread
+        """
         try:
-            # Connect to Launchpad
-            if not self.midi_manager.connect(self.config.launchpad.port_name):
+            if loop is None:
+                loop = self._start_loop_thread()
+            self._loop = loop
+            
+            # Connect to every Launchpad; carry on as long as one answers
+            connected = [device.name for device in self.devices.values() if device.connect(loop)]
+            if not connected:
                 return False
+            if len(connected) < len(self.devices):
+                logger.warning(
+                    f"⚠️ Running with {len(connected)}/{len(self.devices)} devices: "
+                    f"{', '.join(connected)}"
+                )
+            
+            # Start workers before input can arrive
+            if self.execution_manager.asynchronous:
+                self.execution_manager.start(loop)
+            else:
+                self.execution_manager.start()
+            self._start_metrics()
+            self._start_port_watcher()
+            self._start_control(loop)
+            if self.shell_pool:
+                self.shell_pool.start()
+            if self.alias_resolver:
+                self.alias_resolver.start()
             
             # Setup MIDI callback
             self.setup_midi_callback()
@@ -72,22 +413,136 @@ class LaunchpadApp:
             logger.error(f"❌ Failed to start application: {e}")
             return False
     
-    def _handle_shutdown(self, *args):
-        """💫 Handle graceful shutdown"""
+    def _start_loop_thread(self) -> asyncio.AbstractEventLoop:
+        """🧵 Run an event loop on a daemon thread for callers that aren't async"""
+        loop = asyncio.new_event_loop()
+        _use_pidfd_child_watcher(loop)
+        self._loop_thread = threading.Thread(
+            target=loop.run_forever, name="launchpad-loop", daemon=True
+        )
+        self._loop_thread.start()
+        return loop
+    
+    def _start_port_watcher(self):
+        """🔌 Reconnect controllers that get unplugged or reset, without restarting"""
+        interval = self.config.launchpad.reconnect_interval
+        connected = [device.midi_manager for device in self.devices.values() if device.running]
+        if interval <= 0 or not connected:
+            return
+        self._port_watcher = PortWatcher(connected, interval)
+        self._port_watcher.start()
+    
+    def _start_control(self, loop: asyncio.AbstractEventLoop):
+        """🎛️ Serve the JSON control API on loop, if a socket is configured"""
+        path = self.config.control.socket
+        if not path:
+            return
+        from .managers.control_server import ControlServer
+        server = ControlServer(self, path)
+        if server.start(loop):
+            self.control_server = server
+    
+    def _start_metrics(self):
+        """📈 Start latency metrics export if configured"""
+        metrics_config = self.config.metrics
+        if not metrics_config.enabled:
+            return
+        if metrics_config.dump_file:
+            self.metrics.start_dump(
+                metrics_config.dump_file, metrics_config.dump_interval, loop=self._loop
+            )
+        if metrics_config.http_port:
+            self.metrics.start_http(metrics_config.http_port)
+    
+    async def shutdown_async(self):
+        """💫 Graceful shutdown on the event loop: let running aliases finish briefly, cancel the rest, then close"""
+        if self._closed:
+            return
+        self._closed = True
         logger.info("🔄 Shutting down...")
         self._running = False
-        self.midi_manager.cleanup()
+        if self._mapping_watcher:
+            self._mapping_watcher.stop()
+        if self.control_server:
+            await self.control_server.close()
+        if self.execution_manager.asynchronous:
+            await self.execution_manager.drain(SHUTDOWN_GRACE)
+        self.execution_manager.shutdown(wait=False)
+        # Aliases that outlived their timeout (stream mode) are still followed by tasks
+        stragglers = self.alias_handler.cancel_all()
+        if stragglers:
+            await asyncio.wait(stragglers, timeout=SHUTDOWN_GRACE)
+        # Stopping the metrics server and warm shells blocks, so keep it off the loop
+        await asyncio.get_running_loop().run_in_executor(None, self._stop_services)
+        for device in self.devices.values():
+            device.close()
         logger.info("👋 Shutdown complete")
     
-    def run(self):
-        """🔄 Main application loop"""
-        if not self.start():
+    def _stop_services(self):
+        if self._port_watcher:
+            self._port_watcher.stop()
+        # Commands on worker threads would otherwise outlive us (detached ones are meant to)
+        self.alias_handler.terminate_all()
+        self.alias_handler.close()
+        self.metrics.stop()
+        if self.shell_pool:
+            self.shell_pool.close()
+        if self.history:
+            self.history.close()
+        if self.debugger:
+            self.debugger.close()  # Write out a window left open
+    
+    def _handle_shutdown(self, *args):
+        """💫 Handle graceful shutdown from outside the event loop (signals, scripts)"""
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            if self._closed:
+                return
+            self._closed = True
+            self._running = False
+            if self._mapping_watcher:
+                self._mapping_watcher.stop()
+            if self.control_server:
+                self.control_server.unlink()
+            self.execution_manager.shutdown(wait=False)
+            self._stop_services()
+            for device in self.devices.values():
+                device.close()
+            stop_logging()
+            return
+        if self._stopping is not None:
+            # run() owns the loop; let it shut down in order
+            loop.call_soon_threadsafe(self._stopping.set)
+            return
+        asyncio.run_coroutine_threadsafe(self.shutdown_async(), loop).result()
+        if self._loop_thread:
+            loop.call_soon_threadsafe(loop.stop)
+            self._loop_thread.join(1.0)
+            self._loop_thread = None
+        stop_logging()
+    
+    async def run_async(self):
+        """🔄 Run on the current event loop until SIGINT/SIGTERM"""
+        loop = asyncio.get_running_loop()
+        _use_pidfd_child_watcher(loop)
+        if not self.start(loop):
             return
         
-        logger.info("⌨️  Ready for input (Press Ctrl+C to exit)")
+        self._stopping = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stopping.set)
         
+        logger.info("⌨️  Ready for input (Press Ctrl+C to exit)")
+        try:
+            await self._stopping.wait()
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
+            await self.shutdown_async()
+    
+    def run(self):
+        """🔄 Main application loop"""
         try:
-            while self._running:
-                signal.pause()
-        except KeyboardInterrupt:
-            self._handle_shutdown()
+            asyncio.run(self.run_async())
+        finally:
+            stop_logging()  # Write out whatever is still queued
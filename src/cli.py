@@ -0,0 +1,263 @@
+"""
+⌨️ Command Line Module
+Subcommands behind main.py; heavy modules are imported only by the command that needs them.
+
+Flow:
+1. run (default): load mappings, start the app and wait for Ctrl+C
+   --profile-startup: start, report time spent per phase up to the first LED write, exit
+2. detect: list MIDI ports once and show what LAUNCHPAD_PORT resolves to
+3. ctl: send requests to a running app's control socket and print the replies
+4. history: slowest aliases, failure rates and per-pad percentiles from the history ring
+"""
+
+import argparse
+import logging
+from typing import List, Optional
+
+from .utils.startup_profile import StartupProfile
+
+logger = logging.getLogger(__name__)
+
+LAUNCHPAD_HINTS = ('launchpad', 'lpminimk3')
+
+
+def profile_startup(started: Optional[float] = None, midi_backend=None) -> StartupProfile:
+    """
+    ⏱️ Start the app, stamp each phase up to the first LED write, then shut down
+
+    Args:
+        started: perf_counter() at process entry (defaults to now)
+        midi_backend: Backend for the first device (tests)
+    """
+    profile = StartupProfile(started)
+    from .app import LaunchpadApp
+    profile.mark('imports')
+
+    app = LaunchpadApp(midi_backend=midi_backend)
+    profile.mark('app')
+    if not app.load_mappings():
+        return profile
+    profile.mark('mappings')
+
+    try:
+        if app.start():
+            profile.mark('started')
+            sends = [device.midi_manager.first_send for device in app.devices.values()
+                     if device.midi_manager.first_send is not None]
+            if sends:
+                profile.mark('first_led', min(sends))
+    finally:
+        app._handle_shutdown()
+    return profile
+
+
+def _run(args, started: Optional[float]) -> int:
+    """🚀 Run the controller until interrupted"""
+    if args.profile_startup:
+        profile = profile_startup(started)
+        print(profile.report())
+        return 0 if profile.elapsed('first_led') is not None else 1
+
+    from .app import LaunchpadApp
+    from .config.mapping_file import describe_gesture
+    app = LaunchpadApp()
+
+    # Register all mappings (edits to the file are applied while running)
+    if not app.load_mappings():
+        return 1
+
+    # Print startup message
+    print("\n🎹 Launchpad Shell Controller")
+    print("=============================")
+    print("🔵 Debug Mode:", "Enabled" if app.config.launchpad.debug_mode else "Disabled")
+    print("\n📍 Mapped Buttons:")
+    for mapping in app.mapping_manager.list_mappings():
+        if mapping['gesture']:
+            where = describe_gesture(mapping['gesture'], mapping['pads'])
+        else:
+            where = "({}, {})".format(*mapping['coordinates'])
+        steps = f" [{', '.join(mapping['steps'])}]" if mapping['steps'] else ""
+        launch = f" ({mapping['launch']})" if mapping['launch'] != 'wait' else ""
+        print(f"  • {where}: {mapping['alias']}{steps}{launch}")
+    print("\n⌨️  Press any unmapped button to see its coordinates")
+    print("👋 Press Ctrl+C to exit\n")
+
+    app.run()
+    return 0
+
+
+def _print_ports(title: str, ports: List[str]):
+    print(f"\n{title}")
+    if not ports:
+        print("  (none)")
+    for i, port in enumerate(ports):
+        marker = "  ✨" if any(hint in port.lower() for hint in LAUNCHPAD_HINTS) else ""
+        print(f"  {i}: {port}{marker}")
+
+
+def _detect(args) -> int:
+    """🔍 List MIDI ports and refresh the port cache"""
+    from .config.config_manager import ConfigManager
+    from .managers.midi_backend import RtMidiBackend
+    from .managers.port_resolver import PortCache, match_ports
+    from .utils.constants import DEFAULT_DEVICE
+
+    backend = RtMidiBackend()
+    in_ports, out_ports = backend.get_input_ports(), backend.get_output_ports()
+    print("\n🎹 Available MIDI Ports:")
+    _print_ports("📥 Input Ports:", in_ports)
+    _print_ports("📤 Output Ports:", out_ports)
+
+    launchpads = [port for port in in_ports if any(hint in port.lower() for hint in LAUNCHPAD_HINTS)]
+    if launchpads:
+        print("\n✨ Launchpad detected! Use this name in your .env file:")
+        for port in launchpads:
+            print(f"  LAUNCHPAD_PORT=\"{port}\"")
+
+    config = ConfigManager().get_config()
+    wanted = config.launchpad.devices or {DEFAULT_DEVICE: config.launchpad.port_name}
+    cache = PortCache(f"{config.cache_dir}/ports.json")
+    print("\n🔎 Configured devices:")
+    found = True
+    for name, port_name in wanted.items():
+        resolved = match_ports(port_name, in_ports, out_ports)
+        if resolved is None:
+            found = False
+            print(f"  ❌ {name}: {port_name!r} not found")
+            continue
+        cache.put(port_name, resolved)
+        print(f"  ✅ {name}: {port_name!r} -> in {resolved.in_index} {resolved.in_name!r}, "
+              f"out {resolved.out_index} {resolved.out_name!r}")
+    return 0 if found else 1
+
+
+def _ctl(args) -> int:
+    """🎛️ Send JSON requests (or bare op names) to the control socket, one reply per line"""
+    import json
+    import socket
+    import sys
+    from pathlib import Path
+
+    path = args.socket
+    if not path:
+        from .config.config_manager import ConfigManager
+        path = ConfigManager().get_config().control.socket
+    if not path:
+        logger.error("❌ No control socket: set CONTROL_SOCKET or pass --socket")
+        return 1
+
+    requests = args.requests or [line for line in sys.stdin.read().splitlines() if line.strip()]
+    lines = []
+    for request in requests:
+        if not request.lstrip().startswith('{'):
+            request = json.dumps({'op': request})
+        lines.append(request.strip() + "\n")
+
+    ok = True
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(Path(path).expanduser()))
+        replies = sock.makefile('rb')
+        for line in lines:
+            sock.sendall(line.encode())
+            reply = replies.readline()
+            if not reply:
+                logger.error("❌ Control socket closed the connection")
+                return 1
+            ok &= json.loads(reply).get('ok', False)
+            print(reply.decode().rstrip())
+    return 0 if ok else 1
+
+
+def _seconds(value: float) -> str:
+    return f"{value * 1000:.0f}ms" if value < 1 else f"{value:.2f}s"
+
+
+def _history(args) -> int:
+    """📜 Summarize the execution history ring, one record at a time"""
+    import time
+    from .utils.history import read_history, summarize
+
+    path = args.file
+    if not path:
+        from .config.config_manager import ConfigManager
+        path = ConfigManager().get_config().history.file
+    if not path:
+        logger.error("❌ No execution history: set HISTORY_FILE or pass --file")
+        return 1
+
+    since = time.time() - args.hours * 3600 if args.hours else 0.0
+    try:
+        summary = summarize(read_history(path), since, args.alias)
+    except FileNotFoundError:
+        logger.error(f"❌ {path} doesn't exist yet: nothing has run")
+        return 1
+    if not summary['runs']:
+        print("📜 No runs recorded" + (" in that window" if since or args.alias else ""))
+        return 0
+
+    when = lambda stamp: time.strftime('%Y-%m-%d %H:%M', time.localtime(stamp))
+    print(f"\n📜 {summary['runs']} runs, {when(summary['first'])} → {when(summary['last'])}")
+
+    aliases = summary['aliases']
+    slowest = sorted(aliases.items(), key=lambda item: item[1]['mean'], reverse=True)
+    print("\n🐢 Slowest aliases (by mean duration):")
+    print(f"  {'alias':<28} {'runs':>6} {'mean':>9} {'p50':>9} {'p99':>9} {'max':>9}")
+    for name, stats in slowest[:args.top]:
+        print(f"  {name:<28} {stats['runs']:>6} {_seconds(stats['mean']):>9} "
+              f"{_seconds(stats['p50']):>9} {_seconds(stats['p99']):>9} {_seconds(stats['max']):>9}")
+
+    failing = sorted(
+        ((name, stats) for name, stats in aliases.items() if stats['failures']),
+        key=lambda item: (item[1]['failure_rate'], item[1]['failures']), reverse=True
+    )
+    print("\n❌ Failure rate:")
+    if not failing:
+        print("  (no failures)")
+    for name, stats in failing[:args.top]:
+        print(f"  {name:<28} {stats['failures']:>5}/{stats['runs']:<6} "
+              f"{stats['failure_rate']:>6.1%}  ({stats['timeouts']} timed out)")
+
+    pads = sorted(summary['pads'].items(), key=lambda item: item[1]['p99'], reverse=True)
+    print("\n🎹 Pads (by p99 duration):")
+    print(f"  {'pad':<16} {'alias':<24} {'runs':>6} {'p50':>9} {'p99':>9} {'wait p99':>9}")
+    for pad, stats in pads[:args.top]:
+        print(f"  {pad:<16} {stats['alias']:<24} {stats['runs']:>6} {_seconds(stats['p50']):>9} "
+              f"{_seconds(stats['p99']):>9} {_seconds(stats['wait_p99']):>9}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None, started: Optional[float] = None) -> int:
+    """🎯 Parse arguments and run a subcommand"""
+    parser = argparse.ArgumentParser(prog='launchpad', description="Launchpad Shell Controller")
+    commands = parser.add_subparsers(dest='command')
+    run = commands.add_parser('run', help="run the controller (default)")
+    commands.add_parser('detect', help="list MIDI ports and check LAUNCHPAD_PORT")
+    ctl = commands.add_parser('ctl', help="talk to a running app over its control socket")
+    ctl.add_argument('requests', nargs='*',
+                     help='JSON requests such as \'{"op": "stats"}\', or bare op names '
+                          '(default: one request per line on stdin)')
+    ctl.add_argument('--socket', help="socket path (default: CONTROL_SOCKET)")
+    history = commands.add_parser('history', help="summarize past runs from the history ring")
+    history.add_argument('--file', help="history file (default: HISTORY_FILE)")
+    history.add_argument('--hours', type=float, default=0,
+                         help="only runs started in the last N hours (default: all kept)")
+    history.add_argument('--alias', help="only this alias")
+    history.add_argument('--top', type=int, default=10, help="rows per table (default: 10)")
+    for target, default in ((parser, False), (run, argparse.SUPPRESS)):
+        target.add_argument(
+            '--profile-startup', action='store_true', default=default,
+            help="time startup up to the first LED write, then exit"
+        )
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'detect':
+            return _detect(args)
+        if args.command == 'ctl':
+            return _ctl(args)
+        if args.command == 'history':
+            return _history(args)
+        return _run(args, started)
+    except Exception as e:
+        logger.error(f"💥 Application error: {e}")
+        return 1
@@ -12,9 +12,9 @@ Flow:
 
 import os
 from pathlib import Path
-from typing import Optional
-from dataclasses import dataclass
-from dotenv import load_dotenv
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from .mapping_file import MappingSpec, load_mapping_file
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,12 @@ class LaunchpadConfig:
     port_name: str
     debug_mode: bool
     grid_size: int = 8
+    led_max_fps: int = 30
+    status_lights: bool = True
+    reconnect_interval: float = 0.25  # Seconds between hot-plug checks (0 disables)
+    chord_window_ms: int = 80         # Time to press every pad of a chord
+    sequence_timeout_ms: int = 500    # Max gap between the steps of a sequence
+    devices: Dict[str, str] = field(default_factory=dict)  # name -> port; empty uses port_name
 
 @dataclass
 class ShellConfig:
@@ -32,6 +38,80 @@ class ShellConfig:
     shell_path: str
     timeout: int
     work_dir: Optional[str]
+    pool_size: int = 2
+    pool_max_commands: int = 100
+    pool_health_interval: float = 30.0
+    alias_cache: bool = True
+
+@dataclass
+class ExecutionConfig:
+    """⚙️ Execution pool configuration"""
+    pool_size: int = 4
+    queue_size: int = 64
+    mapping_limit: int = 1
+    runtime: str = 'asyncio'    # 'asyncio' (one event loop) or 'threads' (worker pool)
+    max_inflight: int = 256     # asyncio runtime: max aliases running at once
+    result_cache_size: int = 128   # Results of idempotent mappings kept...
+    result_cache_kb: int = 1024    # ...and the output bytes they may hold
+
+@dataclass
+class MetricsConfig:
+    """📈 Latency metrics configuration"""
+    enabled: bool = False
+    dump_file: Optional[str] = None
+    dump_interval: float = 60.0
+    http_port: int = 0
+
+@dataclass
+class RecordingConfig:
+    """📼 MIDI session recording configuration"""
+    enabled: bool = False
+    directory: str = '~/.cache/launchpad-shell/sessions'
+    segment_kb: int = 1024
+    max_files: int = 10
+
+@dataclass
+class OutputConfig:
+    """📤 Command output capture configuration"""
+    buffer_kb: int = 16
+    log_dir: Optional[str] = '~/.cache/launchpad-shell/logs'
+    log_max_kb: int = 1024
+    log_backups: int = 3
+
+@dataclass
+class MappingsConfig:
+    """🗂️ Mapping file configuration"""
+    file: str = 'mappings.toml'
+    watch: bool = True
+
+@dataclass
+class LogConfig:
+    """📝 Logging pipeline settings (the root level is AppConfig.log_level)"""
+    format: str = 'text'    # 'text' or 'json' lines
+    file: Optional[str] = None  # Log file (None writes to stderr)
+    levels: Dict[str, str] = field(default_factory=dict)   # logger name -> level
+    sample: Dict[str, float] = field(default_factory=lambda: {
+        'src.handlers.button_handler': 20.0
+    })  # logger name -> max records per second
+    queue_size: int = 10000
+
+@dataclass
+class HistoryConfig:
+    """📜 Execution history ring file"""
+    file: Optional[str] = '~/.cache/launchpad-shell/history.ring'  # None disables
+    size: int = 50000   # Records kept (96 bytes each); the oldest are overwritten
+
+@dataclass
+class ProfileConfig:
+    """🔬 On-demand profiling (SIGUSR1: CPU profile, SIGUSR2: allocations)"""
+    directory: Optional[str] = '~/.cache/launchpad-shell/profiles'  # None disables the signals
+    interval_ms: float = 10.0   # Time between stack samples
+    trace_frames: int = 25      # Traceback depth recorded per allocation
+
+@dataclass
+class ControlConfig:
+    """🎛️ Control socket settings"""
+    socket: Optional[str] = None  # UNIX socket path for the JSON control API (None disables)
 
 @dataclass
 class AppConfig:
@@ -39,6 +119,16 @@ class AppConfig:
     launchpad: LaunchpadConfig
     shell: ShellConfig
     log_level: str
+    execution: ExecutionConfig = field(default_factory=ExecutionConfig)
+    cache_dir: str = '~/.cache/launchpad-shell'
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
+    recording: RecordingConfig = field(default_factory=RecordingConfig)
+    output: OutputConfig = field(default_factory=OutputConfig)
+    mappings: MappingsConfig = field(default_factory=MappingsConfig)
+    control: ControlConfig = field(default_factory=ControlConfig)
+    log: LogConfig = field(default_factory=LogConfig)
+    history: HistoryConfig = field(default_factory=HistoryConfig)
+    profile: ProfileConfig = field(default_factory=ProfileConfig)
 
 class ConfigManager:
     """
@@ -52,6 +142,7 @@ class ConfigManager:
         """📥 Load environment variables from file"""
         env_path = Path(env_file)
         if env_path.exists():
+            from dotenv import load_dotenv  # Only needed when there is a file to read
             load_dotenv(env_path)
             logger.info(f"✅ Loaded environment from {env_file}")
         else:
@@ -62,25 +153,137 @@ class ConfigManager:
         launchpad_config = LaunchpadConfig(
             port_name=os.getenv('LAUNCHPAD_PORT', 'Launchpad Mini MK3'),
             debug_mode=os.getenv('DEBUG_MODE', 'True').lower() == 'true',
-            grid_size=int(os.getenv('GRID_SIZE', '8'))
+            grid_size=int(os.getenv('GRID_SIZE', '8')),
+            led_max_fps=int(os.getenv('LED_MAX_FPS', '30')),
+            status_lights=os.getenv('STATUS_LIGHTS', 'True').lower() == 'true',
+            reconnect_interval=float(os.getenv('LAUNCHPAD_RECONNECT_INTERVAL', '0.25')),
+            chord_window_ms=int(os.getenv('CHORD_WINDOW_MS', '80')),
+            sequence_timeout_ms=int(os.getenv('SEQUENCE_TIMEOUT_MS', '500')),
+            devices=self._parse_devices(os.getenv('LAUNCHPAD_DEVICES', ''))
         )
         
         shell_config = ShellConfig(
             shell_path=os.getenv('SHELL_PATH', '/bin/zsh'),
             timeout=int(os.getenv('SHELL_TIMEOUT', '5')),
-            work_dir=os.getenv('WORK_DIR')
+            work_dir=os.getenv('WORK_DIR'),
+            pool_size=int(os.getenv('SHELL_POOL_SIZE', '2')),
+            pool_max_commands=int(os.getenv('SHELL_POOL_MAX_COMMANDS', '100')),
+            pool_health_interval=float(os.getenv('SHELL_POOL_HEALTH_INTERVAL', '30')),
+            alias_cache=os.getenv('ALIAS_CACHE', 'True').lower() == 'true'
         )
         
+        execution_config = ExecutionConfig(
+            pool_size=int(os.getenv('EXEC_POOL_SIZE', '4')),
+            queue_size=int(os.getenv('EXEC_QUEUE_SIZE', '64')),
+            mapping_limit=int(os.getenv('EXEC_MAPPING_LIMIT', '1')),
+            runtime=os.getenv('EXEC_RUNTIME', 'asyncio').lower(),
+            max_inflight=int(os.getenv('EXEC_MAX_INFLIGHT', '256')),
+            result_cache_size=int(os.getenv('RESULT_CACHE_SIZE', '128')),
+            result_cache_kb=int(os.getenv('RESULT_CACHE_KB', '1024'))
+        )
+
+        metrics_config = MetricsConfig(
+            enabled=os.getenv('METRICS_ENABLED', 'False').lower() == 'true',
+            dump_file=os.getenv('METRICS_FILE') or None,
+            dump_interval=float(os.getenv('METRICS_DUMP_INTERVAL', '60')),
+            http_port=int(os.getenv('METRICS_PORT', '0'))
+        )
+
+        recording_config = RecordingConfig(
+            enabled=os.getenv('RECORD_SESSIONS', 'False').lower() == 'true',
+            directory=os.getenv('RECORD_DIR', '~/.cache/launchpad-shell/sessions'),
+            segment_kb=int(os.getenv('RECORD_SEGMENT_KB', '1024')),
+            max_files=int(os.getenv('RECORD_MAX_FILES', '10'))
+        )
+
+        output_config = OutputConfig(
+            buffer_kb=int(os.getenv('OUTPUT_BUFFER_KB', '16')),
+            log_dir=os.getenv('OUTPUT_LOG_DIR', '~/.cache/launchpad-shell/logs') or None,
+            log_max_kb=int(os.getenv('OUTPUT_LOG_MAX_KB', '1024')),
+            log_backups=int(os.getenv('OUTPUT_LOG_BACKUPS', '3'))
+        )
+
+        mappings_config = MappingsConfig(
+            file=os.getenv('MAPPINGS_FILE', 'mappings.toml'),
+            watch=os.getenv('MAPPINGS_WATCH', 'True').lower() == 'true'
+        )
+
+        log_config = LogConfig(
+            format=os.getenv('LOG_FORMAT', 'text').lower(),
+            file=os.getenv('LOG_FILE') or None,
+            levels=self._parse_pairs(os.getenv('LOG_LEVELS', ''), 'LOG_LEVELS'),
+            sample={
+                name: float(rate) for name, rate in self._parse_pairs(
+                    os.getenv('LOG_SAMPLE', 'src.handlers.button_handler=20'), 'LOG_SAMPLE'
+                ).items()
+            },
+            queue_size=int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+        )
+
+        history_config = HistoryConfig(
+            file=os.getenv('HISTORY_FILE', '~/.cache/launchpad-shell/history.ring') or None,
+            size=int(os.getenv('HISTORY_SIZE', '50000'))
+        )
+
+        profile_config = ProfileConfig(
+            directory=os.getenv('PROFILE_DIR', '~/.cache/launchpad-shell/profiles') or None,
+            interval_ms=float(os.getenv('PROFILE_INTERVAL_MS', '10')),
+            trace_frames=int(os.getenv('PROFILE_TRACE_FRAMES', '25'))
+        )
+
+        control_config = ControlConfig(
+            socket=os.getenv('CONTROL_SOCKET') or None
+        )
+
         return AppConfig(
             launchpad=launchpad_config,
             shell=shell_config,
-            log_level=os.getenv('LOG_LEVEL', 'INFO')
+            log_level=os.getenv('LOG_LEVEL', 'INFO'),
+            execution=execution_config,
+            cache_dir=os.getenv('CACHE_DIR', '~/.cache/launchpad-shell'),
+            metrics=metrics_config,
+            recording=recording_config,
+            output=output_config,
+            mappings=mappings_config,
+            control=control_config,
+            log=log_config,
+            history=history_config,
+            profile=profile_config
         )
     
+    @staticmethod
+    def _parse_devices(value: str) -> Dict[str, str]:
+        """🎛️ Parse LAUNCHPAD_DEVICES: name=port pairs separated by ';'"""
+        return ConfigManager._parse_pairs(value, 'LAUNCHPAD_DEVICES')
+    
+    @staticmethod
+    def _parse_pairs(value: str, variable: str) -> Dict[str, str]:
+        """🔑 Parse name=value pairs separated by ';'"""
+        pairs = {}
+        for entry in value.split(';'):
+            if not entry.strip():
+                continue
+            name, sep, setting = entry.partition('=')
+            if not sep or not name.strip() or not setting.strip():
+                logger.warning(f"⚠️ Ignoring malformed {variable} entry: {entry!r}")
+                continue
+            pairs[name.strip()] = setting.strip()
+        return pairs
+    
     def get_config(self) -> AppConfig:
         """📋 Get current configuration"""
         return self.config
     
+    def load_mappings(self, path: Optional[str] = None) -> List[MappingSpec]:
+        """
+        🗂️ Load button mappings from the mapping file
+        
+        Raises:
+            OSError: The file can't be read
+            MappingFileError: The file is malformed
+        """
+        return load_mapping_file(path or self.config.mappings.file, self.config.cache_dir)
+    
     def validate_config(self) -> bool:
         """
         ✅ Validate current configuration
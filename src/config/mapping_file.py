@@ -0,0 +1,571 @@
+"""
+🗂️ Mapping File Module
+Loads button mappings from a TOML or JSON file, validates them and keeps a
+compiled binary copy so unchanged files skip parsing on startup.
+
+Flow:
+1. Hash the mapping file's contents
+2. If the compiled cache carries the same hash, unpack it directly
+3. Otherwise parse and validate the file, then rewrite the cache
+4. Callers diff the resulting MappingSpec list against what is live
+
+File format (TOML):
+    [[mapping]]
+    x = 0
+    y = 0
+    color = "RED"          # Colors name or a raw 0-127 palette index
+    alias = "open_chrome"
+    max_concurrent = 2     # optional
+    page = 0               # optional, for layouts with more than one page
+    device = "left"        # optional, see LAUNCHPAD_DEVICES (default: first device)
+    debounce_ms = 250      # optional, ignore presses closer together than this
+    rate = 0.5             # optional, token bucket: presses per second...
+    burst = 2              #   ...with bursts of up to this many
+    on_busy = "single"     # optional while running: queue (default), single or restart
+    queue = 1              # optional, presses allowed to wait in queue mode
+    idempotent = true      # optional, read-only (not with the keys above): one shared run...
+    cache_ttl = 10         #   ...and reuse its result for this many seconds
+
+    [[mapping]]            # a chord: pads pressed together
+    chord = [[0, 0], [1, 0]]
+    alias = "lock_screen"
+    window_ms = 80         # optional, time to press all of them (CHORD_WINDOW_MS)
+
+    [[mapping]]            # a sequence: pads pressed one after another
+    sequence = [[0, 7], [1, 7], [2, 7]]
+    alias = "deploy_app"
+    window_ms = 500        # optional, max gap between presses (SEQUENCE_TIMEOUT_MS)
+
+    [[mapping]]            # a pipeline: aliases run as a dependency graph
+    x = 3
+    y = 0
+    alias = "ship"         # the pipeline's name
+    on_failure = "fail_fast"   # optional: stop everything (default) or "continue"
+    steps = [
+        { name = "test", alias = "run_tests" },
+        { name = "lint", alias = "lint" },
+        { name = "build", alias = "build", after = ["test", "lint"], timeout = 300 },
+    ]                      # name defaults to the alias; timeout 0 waits for the exit
+
+    [[mapping]]            # how the command runs (all optional)
+    x = 4
+    y = 0
+    alias = "backup_db"
+    launch = "stream"      # wait (default): stopped at the timeout; stream: keeps running
+                           # and is reported on exit; detach: reported once started
+    timeout = 600          # seconds (default SHELL_TIMEOUT, 0 = no limit)
+    nice = 15              # 0-19, lower priority
+    cpus = [2, 3]          # CPU affinity
+    rlimits = { cpu = 3600, memory_mb = 4096, nofile = 1024 }
+
+JSON uses the same keys: {"mapping": [{"x": 0, "y": 0, ...}]}
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from ..models.launch_policy import LAUNCH_MODES, RLIMITS, LaunchPolicy
+from ..models.pipeline import ON_FAILURE_MODES, Pipeline, PipelineError, PipelineStep
+from ..models.press_policy import ON_BUSY_MODES, PressPolicy
+from ..utils.constants import (
+    Colors, GESTURE_KINDS, LED_GRID_SIZE, MAX_CHORD_PADS, MAX_SEQUENCE_PADS, MAX_VELOCITY,
+    PAGE_CONTROLS
+)
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"LPMAP\x00\x08\x00"
+# magic, sha256 of the source file, record count
+HEADER = struct.Struct('<8s32sI')
+# page, x, y, color, max_concurrent (0 = pool default), device length, alias length,
+# debounce ms, rate, burst, on_busy index, queue (NO_QUEUE_LIMIT = unbounded),
+# idempotent, cache ttl, gesture (0 = single pad, else GESTURE_KINDS index + 1),
+# window ms, pad count (each pad follows the alias as x, y bytes),
+# pipeline length (0 = none, else JSON after the pads),
+# launch length (0 = defaults, else JSON after the pipeline)
+RECORD = struct.Struct('<HBBBBBHHdBBB?dBHBII')
+MAX_PAGES = 256
+NO_QUEUE_LIMIT = 255
+POLICY_KEYS = {'debounce_ms', 'rate', 'burst', 'on_busy', 'queue', 'idempotent', 'cache_ttl'}
+GESTURE_KEYS = set(GESTURE_KINDS) | {'window_ms'}
+MAX_WINDOW_MS = 10000
+PIPELINE_KEYS = {'steps', 'on_failure'}
+STEP_KEYS = {'name', 'alias', 'after', 'timeout'}
+MAX_PIPELINE_STEPS = 32
+MAX_STEP_TIMEOUT = 86400
+LAUNCH_KEYS = {'launch', 'timeout', 'nice', 'cpus', 'rlimits'}
+ISOLATION_KEYS = {'nice', 'cpus', 'rlimits'}
+MAX_CPUS = 1024
+
+
+class MappingFileError(ValueError):
+    """❌ The mapping file can't be parsed or fails validation"""
+
+
+@dataclass(frozen=True)
+class MappingSpec:
+    """📝 One button mapping as declared in the mapping file"""
+    x: int
+    y: int
+    color: int
+    alias: str
+    max_concurrent: Optional[int] = None
+    page: int = 0
+    device: str = ''    # '' means the first configured device
+    policy: PressPolicy = PressPolicy()
+    gesture: str = ''   # 'chord' or 'sequence' for multi-pad triggers ('' = the pad at x, y)
+    pads: Tuple[Tuple[int, int], ...] = ()
+    window_ms: int = 0  # 0 uses CHORD_WINDOW_MS / SEQUENCE_TIMEOUT_MS
+    pipeline: Optional[Pipeline] = None  # steps to run instead of the alias
+    launch: LaunchPolicy = LaunchPolicy()
+    
+    @property
+    def cell(self) -> tuple:
+        """📍 What the mapping is bound to: (page, x, y), or (page, gesture, pads)"""
+        if self.gesture:
+            return (self.page, self.gesture, self.pads)
+        return (self.page, self.x, self.y)
+
+
+def _parse(path: Path, data: bytes) -> dict:
+    if path.suffix == '.json':
+        return json.loads(data)
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise MappingFileError(
+                "reading TOML on Python < 3.11 needs the tomli package "
+                "(pip install -r requirements.txt), or use a .json mappings file"
+            ) from None
+    return tomllib.loads(data.decode())
+
+
+def _color(value, where: str) -> int:
+    if isinstance(value, str):
+        color = getattr(Colors, value.upper(), None)
+        if not isinstance(color, int):
+            raise MappingFileError(f"{where}: unknown color {value!r}")
+        return color
+    if isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= MAX_VELOCITY:
+        return value
+    raise MappingFileError(f"{where}: color must be a name or 0-{MAX_VELOCITY}")
+
+
+def _policy(entry: dict, where: str) -> PressPolicy:
+    """🚦 Press policy from a mapping entry's optional keys"""
+    if not POLICY_KEYS & set(entry):
+        return PressPolicy()
+
+    def number(name, low, high, default, kinds=(int,)):
+        value = entry.get(name, default)
+        if not isinstance(value, kinds) or isinstance(value, bool) or not low <= value <= high:
+            raise MappingFileError(f"{where}: {name} must be {low}-{high}")
+        return value
+
+    on_busy = entry.get('on_busy', 'queue')
+    if on_busy not in ON_BUSY_MODES:
+        raise MappingFileError(f"{where}: on_busy must be one of {', '.join(ON_BUSY_MODES)}")
+    queue = entry.get('queue')
+    idempotent = entry.get('idempotent', False)
+    if not isinstance(idempotent, bool):
+        raise MappingFileError(f"{where}: idempotent must be true or false")
+    if 'cache_ttl' in entry and not idempotent:
+        raise MappingFileError(f"{where}: cache_ttl needs idempotent = true")
+    ignored = sorted(POLICY_KEYS & set(entry) - {'idempotent', 'cache_ttl'})
+    if idempotent and ignored:
+        raise MappingFileError(
+            f"{where}: {', '.join(ignored)} don't apply to idempotent = true "
+            f"(presses share one run instead)"
+        )
+    return PressPolicy(
+        debounce_ms=number('debounce_ms', 0, 60000, 0),
+        rate=float(number('rate', 0, 1000, 0, (int, float))),
+        burst=number('burst', 1, 255, 1),
+        on_busy=on_busy,
+        queue=None if queue is None else number('queue', 0, NO_QUEUE_LIMIT - 1, None),
+        idempotent=idempotent,
+        cache_ttl=float(number('cache_ttl', 0, 86400, 0, (int, float)))
+    )
+
+
+def _gesture(entry: dict, where: str) -> Tuple[str, Tuple[Tuple[int, int], ...], int]:
+    """🎹 (kind, pads, window ms) of a chord/sequence entry, or ('', (), 0) for a single pad"""
+    kinds = [kind for kind in GESTURE_KINDS if kind in entry]
+    if not kinds:
+        if 'window_ms' in entry:
+            raise MappingFileError(f"{where}: window_ms only applies to a chord or sequence")
+        return '', (), 0
+    if len(kinds) > 1 or 'x' in entry or 'y' in entry:
+        raise MappingFileError(f"{where}: use one of x/y, chord or sequence")
+
+    kind = kinds[0]
+    most = MAX_CHORD_PADS if kind == 'chord' else MAX_SEQUENCE_PADS
+    value = entry[kind]
+    if not isinstance(value, list) or not 2 <= len(value) <= most:
+        raise MappingFileError(f"{where}: {kind} must list 2-{most} pads")
+    pads = []
+    for pad in value:
+        if not isinstance(pad, list) or len(pad) != 2 or not all(
+                isinstance(v, int) and not isinstance(v, bool) and 0 <= v < LED_GRID_SIZE
+                for v in pad):
+            raise MappingFileError(
+                f"{where}: {kind} pads must be [x, y] pairs of 0-{LED_GRID_SIZE - 1}"
+            )
+        pads.append((pad[0], pad[1]))
+    if kind == 'chord':
+        if len(set(pads)) != len(pads):
+            raise MappingFileError(f"{where}: chord pads must all be different")
+        pads.sort()  # Order doesn't matter in a chord
+
+    window_ms = entry.get('window_ms', 0)
+    if not isinstance(window_ms, int) or isinstance(window_ms, bool) or \
+            not 0 <= window_ms <= MAX_WINDOW_MS:
+        raise MappingFileError(f"{where}: window_ms must be 0-{MAX_WINDOW_MS}")
+    return kind, tuple(pads), window_ms
+
+
+def _pipeline(entry: dict, where: str) -> Optional[Pipeline]:
+    """🧬 Pipeline from an entry's steps, or None for a plain alias"""
+    if 'steps' not in entry:
+        if 'on_failure' in entry:
+            raise MappingFileError(f"{where}: on_failure only applies to a pipeline (steps)")
+        return None
+    value = entry['steps']
+    if not isinstance(value, list) or not 1 <= len(value) <= MAX_PIPELINE_STEPS:
+        raise MappingFileError(f"{where}: steps must list 1-{MAX_PIPELINE_STEPS} steps")
+    on_failure = entry.get('on_failure', 'fail_fast')
+    if on_failure not in ON_FAILURE_MODES:
+        raise MappingFileError(f"{where}: on_failure must be one of {', '.join(ON_FAILURE_MODES)}")
+
+    steps = []
+    for i, step in enumerate(value):
+        at = f"{where} step #{i + 1}"
+        if not isinstance(step, dict):
+            raise MappingFileError(f"{at}: expected a table")
+        unknown = set(step) - STEP_KEYS
+        if unknown:
+            raise MappingFileError(f"{at}: unknown keys {sorted(unknown)}")
+        alias = step.get('alias')
+        if not isinstance(alias, str) or not alias.strip():
+            raise MappingFileError(f"{at}: alias must be a non-empty string")
+        name = step.get('name', alias)
+        if not isinstance(name, str) or not name.strip():
+            raise MappingFileError(f"{at}: name must be a non-empty string")
+        after = step.get('after', [])
+        if not isinstance(after, list) or not all(isinstance(dep, str) for dep in after):
+            raise MappingFileError(f"{at}: after must list step names")
+        timeout = step.get('timeout', 0)
+        if not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or \
+                not 0 <= timeout <= MAX_STEP_TIMEOUT:
+            raise MappingFileError(f"{at}: timeout must be 0-{MAX_STEP_TIMEOUT}")
+        steps.append(PipelineStep(name, alias, tuple(after), float(timeout)))
+    try:
+        return Pipeline(tuple(steps), on_failure)
+    except PipelineError as e:
+        raise MappingFileError(f"{where}: {e}") from None
+
+
+def _launch(entry: dict, where: str) -> LaunchPolicy:
+    """🚀 Launch policy from a mapping entry's optional keys"""
+    keys = LAUNCH_KEYS & set(entry)
+    if not keys:
+        return LaunchPolicy()
+    if 'steps' in entry and keys - ISOLATION_KEYS:
+        raise MappingFileError(
+            f"{where}: launch and timeout don't apply to a pipeline (steps have their own timeout)"
+        )
+
+    mode = entry.get('launch', 'wait')
+    if mode not in LAUNCH_MODES:
+        raise MappingFileError(f"{where}: launch must be one of {', '.join(LAUNCH_MODES)}")
+    timeout = entry.get('timeout')
+    if timeout is not None and (not isinstance(timeout, (int, float)) or
+                                isinstance(timeout, bool) or not 0 <= timeout <= MAX_STEP_TIMEOUT):
+        raise MappingFileError(f"{where}: timeout must be 0-{MAX_STEP_TIMEOUT}")
+    if timeout is not None and mode == 'detach':
+        raise MappingFileError(f"{where}: timeout doesn't apply to launch = \"detach\"")
+    nice = entry.get('nice', 0)
+    if not isinstance(nice, int) or isinstance(nice, bool) or not 0 <= nice <= 19:
+        raise MappingFileError(f"{where}: nice must be 0-19")
+    cpus = entry.get('cpus', [])
+    if not isinstance(cpus, list) or not all(
+            isinstance(cpu, int) and not isinstance(cpu, bool) and 0 <= cpu < MAX_CPUS
+            for cpu in cpus):
+        raise MappingFileError(f"{where}: cpus must list CPU numbers 0-{MAX_CPUS - 1}")
+    rlimits = entry.get('rlimits', {})
+    if not isinstance(rlimits, dict):
+        raise MappingFileError(f"{where}: rlimits must be a table")
+    for name, value in rlimits.items():
+        if name not in RLIMITS:
+            raise MappingFileError(f"{where}: rlimits keys are {', '.join(RLIMITS)}")
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise MappingFileError(f"{where}: rlimits.{name} must be a positive integer")
+    return LaunchPolicy(
+        mode=mode,
+        timeout=None if timeout is None else float(timeout),
+        nice=nice,
+        cpus=tuple(sorted(set(cpus))),
+        rlimits=tuple(sorted(rlimits.items()))
+    )
+
+
+def _pack_launch(launch: LaunchPolicy) -> bytes:
+    if launch == LaunchPolicy():
+        return b''
+    return json.dumps([
+        launch.mode, launch.timeout, launch.nice, list(launch.cpus),
+        [list(pair) for pair in launch.rlimits]
+    ], separators=(',', ':')).encode()
+
+
+def _unpack_launch(data: bytes) -> LaunchPolicy:
+    if not data:
+        return LaunchPolicy()
+    mode, timeout, nice, cpus, rlimits = json.loads(data)
+    return LaunchPolicy(mode, timeout, nice, tuple(cpus),
+                        tuple((name, value) for name, value in rlimits))
+
+
+def _pack_pipeline(pipeline: Optional[Pipeline]) -> bytes:
+    if pipeline is None:
+        return b''
+    return json.dumps({
+        'on_failure': pipeline.on_failure,
+        'steps': [[step.name, step.alias, list(step.after), step.timeout]
+                  for step in pipeline.steps]
+    }, separators=(',', ':')).encode()
+
+
+def _unpack_pipeline(data: bytes) -> Optional[Pipeline]:
+    if not data:
+        return None
+    document = json.loads(data)
+    return Pipeline(
+        tuple(PipelineStep(name, alias, tuple(after), timeout)
+              for name, alias, after, timeout in document['steps']),
+        document['on_failure']
+    )
+
+
+def describe_gesture(gesture: str, pads: Tuple[Tuple[int, int], ...]) -> str:
+    """🏷️ Label such as 'chord (0, 0)+(1, 0)' or 'sequence (0, 7)>(1, 7)'"""
+    joiner = '+' if gesture == 'chord' else '>'
+    return f"{gesture} " + joiner.join(f"({x}, {y})" for x, y in pads)
+
+
+def describe(spec: MappingSpec) -> str:
+    """🏷️ What triggers a mapping: "(x, y)" or its chord/sequence"""
+    return describe_gesture(spec.gesture, spec.pads) if spec.gesture else f"({spec.x}, {spec.y})"
+
+
+def _trigger(entry: dict, where: str) -> MappingSpec:
+    """📍 A spec holding only what triggers an entry: device, page and pad or gesture"""
+    gesture, pads, window_ms = _gesture(entry, where)
+    x, y = pads[0] if gesture else (entry.get('x'), entry.get('y'))
+    page = entry.get('page', 0)
+    device = entry.get('device', '')
+    if not isinstance(device, str) or len(device.encode()) > 255:
+        raise MappingFileError(f"{where}: device must be a name")
+    for name, value, limit in (('x', x, LED_GRID_SIZE), ('y', y, LED_GRID_SIZE),
+                               ('page', page, MAX_PAGES)):
+        if not isinstance(value, int) or isinstance(value, bool) or not 0 <= value < limit:
+            raise MappingFileError(f"{where}: {name} must be 0-{limit - 1}")
+    return MappingSpec(x, y, 0, '', page=page, device=device, gesture=gesture, pads=pads,
+                       window_ms=window_ms)
+
+
+def parse_cell(entry: dict, where: str = "cell") -> Tuple[str, tuple]:
+    """
+    📍 (device, cell) named by an entry's x/y or chord/sequence, plus optional page and device
+
+    Raises:
+        MappingFileError: The entry doesn't name a valid pad or gesture
+    """
+    if not isinstance(entry, dict):
+        raise MappingFileError(f"{where}: expected a table")
+    trigger = _trigger(entry, where)
+    return trigger.device, trigger.cell
+
+
+def parse_mappings(entries: list) -> List[MappingSpec]:
+    """
+    ✅ Validate mapping entries given as dicts (the same keys as the file)
+
+    Raises:
+        MappingFileError: An entry is malformed
+    """
+    return _validate({'mapping': entries})
+
+
+def _validate(document: dict) -> List[MappingSpec]:
+    """✅ Turn a parsed document into specs, rejecting anything malformed"""
+    entries = document.get('mapping', []) if isinstance(document, dict) else None
+    if not isinstance(entries, list):
+        raise MappingFileError("expected a list of [[mapping]] tables")
+
+    specs = []
+    seen = {}
+    for i, entry in enumerate(entries):
+        where = f"mapping #{i + 1}"
+        if not isinstance(entry, dict):
+            raise MappingFileError(f"{where}: expected a table")
+        unknown = set(entry) - {'x', 'y', 'color', 'alias', 'max_concurrent', 'page', 'device'} \
+            - POLICY_KEYS - GESTURE_KEYS - PIPELINE_KEYS - LAUNCH_KEYS
+        if unknown:
+            raise MappingFileError(f"{where}: unknown keys {sorted(unknown)}")
+
+        trigger = _trigger(entry, where)
+        cell = (trigger.device,) + trigger.cell
+        if cell in seen:
+            raise MappingFileError(
+                f"{where}: {describe(trigger)} on page {trigger.page} "
+                f"already mapped by #{seen[cell]}"
+            )
+        seen[cell] = i + 1
+
+        alias = entry.get('alias')
+        if not isinstance(alias, str) or not alias.strip():
+            raise MappingFileError(f"{where}: alias must be a non-empty string")
+
+        limit = entry.get('max_concurrent')
+        if limit is not None and (not isinstance(limit, int) or not 1 <= limit <= 255):
+            raise MappingFileError(f"{where}: max_concurrent must be 1-255")
+
+        color = _color(entry.get('color', 'WHITE'), where)
+        specs.append(replace(
+            trigger, color=color, alias=alias, max_concurrent=limit,
+            policy=_policy(entry, where), pipeline=_pipeline(entry, where),
+            launch=_launch(entry, where)
+        ))
+
+    paged = {spec.device for spec in specs if spec.page}
+    for spec in specs:
+        if spec.device not in paged:
+            continue
+        for x, y in spec.pads or ((spec.x, spec.y),):
+            if is_page_control(x, y):
+                raise MappingFileError(
+                    f"({x}, {y}) is reserved for page switching in multi-page layouts"
+                )
+    return specs
+
+
+def is_page_control(x: int, y: int) -> bool:
+    """📑 True for pads that switch pages in a multi-page layout"""
+    return (x, y) in PAGE_CONTROLS
+
+
+def _pack(digest: bytes, specs: List[MappingSpec]) -> bytes:
+    parts = [HEADER.pack(MAGIC, digest, len(specs))]
+    for spec in specs:
+        device, alias = spec.device.encode(), spec.alias.encode()
+        pipeline = _pack_pipeline(spec.pipeline)
+        launch = _pack_launch(spec.launch)
+        policy = spec.policy
+        parts.append(RECORD.pack(
+            spec.page, spec.x, spec.y, spec.color, spec.max_concurrent or 0,
+            len(device), len(alias),
+            policy.debounce_ms, policy.rate, policy.burst,
+            ON_BUSY_MODES.index(policy.on_busy),
+            NO_QUEUE_LIMIT if policy.queue is None else policy.queue,
+            policy.idempotent, policy.cache_ttl,
+            GESTURE_KINDS.index(spec.gesture) + 1 if spec.gesture else 0,
+            spec.window_ms, len(spec.pads), len(pipeline), len(launch)
+        ))
+        parts.append(
+            device + alias + bytes(v for pad in spec.pads for v in pad) + pipeline + launch
+        )
+    return b''.join(parts)
+
+
+def _unpack(data: bytes, digest: bytes) -> Optional[List[MappingSpec]]:
+    """📦 Specs from a compiled cache, or None if it doesn't match digest"""
+    if len(data) < HEADER.size:
+        return None
+    magic, cached_digest, count = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or cached_digest != digest:
+        return None
+    specs = []
+    offset = HEADER.size
+    for _ in range(count):
+        (page, x, y, color, limit, device_length, length,
+         debounce_ms, rate, burst, on_busy, queue,
+         idempotent, cache_ttl, gesture, window_ms, pad_count,
+         pipeline_length, launch_length) = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        device = data[offset:offset + device_length].decode()
+        offset += device_length
+        alias = data[offset:offset + length].decode()
+        offset += length
+        pads = tuple(
+            (data[offset + 2 * i], data[offset + 2 * i + 1]) for i in range(pad_count)
+        )
+        offset += 2 * pad_count
+        pipeline = _unpack_pipeline(data[offset:offset + pipeline_length])
+        offset += pipeline_length
+        launch = _unpack_launch(data[offset:offset + launch_length])
+        offset += launch_length
+        policy = PressPolicy(
+            debounce_ms, rate, burst, ON_BUSY_MODES[on_busy],
+            None if queue == NO_QUEUE_LIMIT else queue, idempotent, cache_ttl
+        )
+        specs.append(MappingSpec(
+            x, y, color, alias, limit or None, page, device, policy,
+            GESTURE_KINDS[gesture - 1] if gesture else '', pads, window_ms, pipeline, launch
+        ))
+    return specs
+
+
+def cache_path(path: Path, cache_dir: str) -> Path:
+    """💾 Where the compiled form of a mapping file is kept"""
+    key = hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:12]
+    return Path(cache_dir).expanduser() / f"mappings-{key}.bin"
+
+
+def load_mapping_file(path: str, cache_dir: Optional[str] = None) -> List[MappingSpec]:
+    """
+    📥 Load and validate a mapping file, using the compiled cache when current
+
+    Raises:
+        OSError: The file can't be read
+        MappingFileError: The file is malformed
+    """
+    path = Path(path).expanduser()
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).digest()
+
+    compiled = cache_path(path, cache_dir) if cache_dir else None
+    if compiled is not None:
+        try:
+            specs = _unpack(compiled.read_bytes(), digest)
+        except (OSError, struct.error, IndexError, KeyError, ValueError):  # incl. bad JSON/UTF-8
+            specs = None
+        if specs is not None:
+            logger.debug(f"💾 Loaded {len(specs)} mappings from {compiled}")
+            return specs
+
+    try:
+        specs = _validate(_parse(path, data))
+    except MappingFileError as e:
+        raise MappingFileError(f"{path}: {e}") from None
+    except ValueError as e:  # JSON/TOML syntax errors
+        raise MappingFileError(f"{path}: {e}") from e
+
+    if compiled is not None:
+        try:
+            compiled.parent.mkdir(parents=True, exist_ok=True)
+            tmp = compiled.with_suffix('.tmp')
+            tmp.write_bytes(_pack(digest, specs))
+            os.replace(tmp, compiled)
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to write mapping cache {compiled}: {e}")
+    return specs
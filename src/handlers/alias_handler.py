@@ -1,66 +1,757 @@
 """
 🔧 Alias Handler Module
 Handles the execution of shell aliases in a controlled environment.
+
+Output is streamed as it is produced into a bounded in-memory tail and a
+rotating per-alias log file; the outcome is reported when the process exits.
+
+Each mapping's LaunchPolicy picks the lifecycle: wait (the process group is
+stopped at the timeout), stream (it keeps running and is reported on exit)
+or detach (reported as soon as it started). Commands are started in their
+own session, so stopping one stops everything it spawned; isolated commands
+(nice, CPU affinity, rlimits) skip the warm shells and are set up in the
+child before exec.
+
+Pipelines run their steps the same way, starting every step whose
+dependencies have succeeded at once, and report one summed-up result.
 """
 
+import asyncio
+import signal
 import subprocess
 import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, TimeoutError as FutureTimeout, wait
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 import os
+from ..models.execution import ExecutionResult
+from ..models.launch_policy import LaunchPolicy
+from ..models.pipeline import Pipeline, PipelineRun, PipelineStep
+from ..utils.metrics import PressTrace
+from .alias_resolver import AliasResolver
+from .output_capture import LogWriter, OutputSink, RingBuffer, RotatingLog, log_name, run_header
+from .process_watcher import TERMINATE_GRACE, ProcessFuture, ProcessWatcher
+from .shell_pool import ShellPool
 
 logger = logging.getLogger(__name__)
 
+PIPE_GRACE = 0.05   # Seconds to drain output after exit before reporting
+DEFAULT_LAUNCH = LaunchPolicy()
+
+
+def _waited(started: float, queued: Optional[float]) -> float:
+    """⏳ Seconds between a press being queued and its run starting (0 if unknown)"""
+    return max(0.0, started - queued) if queued else 0.0
+
+
+class _OutputProtocol(asyncio.SubprocessProtocol):
+    """📡 Hands a spawned process's output to its sink as the loop reads it"""
+    
+    def __init__(self, sink: OutputSink, loop: asyncio.AbstractEventLoop):
+        self.sink = sink
+        self.exited = loop.create_future()   # The process exited
+        self.drained = loop.create_future()  # Its output pipe closed
+    
+    def pipe_data_received(self, fd: int, data: bytes):
+        self.sink(data)
+    
+    def pipe_connection_lost(self, fd: int, exc: Optional[Exception]):
+        if not self.drained.done():
+            self.drained.set_result(None)
+    
+    def process_exited(self):
+        if not self.exited.done():
+            self.exited.set_result(None)
+
+
 class AliasHandler:
     """Handles shell alias execution and management"""
     
-    def __init__(self, shell_path: str = '/bin/zsh'):
+    def __init__(self, shell_path: str = '/bin/zsh', timeout: float = 5,
+                 work_dir: Optional[str] = None,
+                 shell_pool: Optional[ShellPool] = None,
+                 resolver: Optional[AliasResolver] = None,
+                 output_buffer: int = 16 * 1024,
+                 log_dir: Optional[str] = None,
+                 log_max_bytes: int = 1024 * 1024,
+                 log_backups: int = 3):
         self.home = str(Path.home())
         self.shell_path = shell_path
+        self.timeout = timeout
+        self.work_dir = work_dir
+        self.shell_pool = shell_pool
+        self.resolver = resolver
+        self.output_buffer = output_buffer
+        self.log_dir = Path(log_dir).expanduser() if log_dir else None
+        self.log_max_bytes = log_max_bytes
+        self.log_backups = log_backups
+        self._listeners: List[Any] = []
+        self._watcher = ProcessWatcher()
+        self._logs: Dict[str, RotatingLog] = {}
+        self._log_writer = LogWriter()
+        self._results: Dict[str, ExecutionResult] = {}
+        self._live: Dict[int, int] = {}
+        self._completions: Dict[int, Set[Union[asyncio.Future, ProcessFuture]]] = {}
+        self._lock = threading.Lock()
+    
+    def add_listener(self, listener: Any):
+        """
+        👂 Register an execution lifecycle listener
+        
+        Listeners implement execution_started(alias, context) and
+        execution_finished(alias, context, result), the latter called with an
+        ExecutionResult once the process has actually exited. Listeners may
+        also implement pipeline_progress(alias, context, done, total, result),
+        called as each step of a pipeline finishes.
+        """
+        self._listeners.append(listener)
+    
+    def _notify(self, event: str, *args):
+        for listener in self._listeners:
+            handler = getattr(listener, event, None)
+            if handler is None:
+                continue
+            try:
+                handler(*args)
+            except Exception as e:
+                logger.error(f"❌ Listener {event} failed: {e}")
+    
+    def last_result(self, alias_name: str) -> Optional[ExecutionResult]:
+        """📋 Outcome (with output tail) of the alias's most recent finished run"""
+        with self._lock:
+            return self._results.get(alias_name)
+    
+    def running(self, context: Any) -> int:
+        """🏃 Runs started for context (e.g. a mapping) that haven't exited yet"""
+        with self._lock:
+            return self._live.get(id(context), 0)
+    
+    def cancel(self, context: Any) -> int:
+        """
+        🛑 Stop every live run started for context
+        
+        asyncio runs are cancelled (call from the loop); runs on worker
+        threads have their process group terminated.
+        
+        Returns:
+            int: Number of runs stopped
+        """
+        with self._lock:
+            completions = list(self._completions.get(id(context), ()))
+        stopped = 0
+        for completion in completions:
+            if isinstance(completion, ProcessFuture):
+                stopped += completion.terminate()
+            else:
+                stopped += completion.cancel()
+        return stopped
+    
+    def cancel_all(self) -> List[asyncio.Future]:
+        """
+        🛑 Cancel every run still going on the event loop (call from the loop)
+        
+        Returns:
+            list: The cancelled runs, to await while they stop their process groups
+        """
+        with self._lock:
+            runs = {
+                completion for completions in self._completions.values()
+                for completion in completions if isinstance(completion, asyncio.Future)
+            }
+        for run in runs:
+            run.cancel()
+        return list(runs)
+    
+    def terminate_all(self) -> int:
+        """
+        🛑 Stop every command still running on a worker thread (detached ones excepted)
+        
+        Commands on the asyncio runtime are stopped by cancelling their tasks.
+        
+        Returns:
+            int: Process groups signalled
+        """
+        return self._watcher.terminate_all()
+    
+    def close(self):
+        """💾 Write out queued output and close the per-alias logs"""
+        self._log_writer.close()
+        with self._lock:
+            logs = list(self._logs.values())
+            self._logs.clear()
+        for log in logs:
+            log.close()
+    
+    def _timeout(self, policy: LaunchPolicy) -> float:
+        return self.timeout if policy.timeout is None else policy.timeout
+    
+    def _log_for(self, alias_name: str) -> Optional[RotatingLog]:
+        if self.log_dir is None:
+            return None
+        with self._lock:
+            log = self._logs.get(alias_name)
+            if log is None:
+                log = self._logs[alias_name] = RotatingLog(
+                    self.log_dir / f"{log_name(alias_name)}.log",
+                    self.log_max_bytes,
+                    self.log_backups,
+                    self._log_writer
+                )
+            return log
         
-    def execute(self, alias_name: str) -> bool:
+    def execute(self, alias_name: str, context: Any = None,
+                trace: Optional[PressTrace] = None,
+                launch: Optional[LaunchPolicy] = None,
+                queued: Optional[float] = None) -> ExecutionResult:
         """
         🚀 Execute a shell alias
         
+        Waits up to the timeout for the command to exit. In wait mode a
+        command still running then is stopped (its whole process group); in
+        stream mode it keeps running and its outcome is logged and sent to
+        listeners when it exits. Detached commands return once started.
+        
         Args:
             alias_name: Name of the alias to execute
+            context: Passed through to lifecycle listeners (e.g. the mapping)
+            trace: Latency trace to stamp, if metrics are enabled
+            launch: Lifecycle and isolation (default: wait mode, the handler's timeout)
+            queued: Wall-clock time the press was queued, for result.queue_wait
             
         Returns:
-            bool: True if execution successful
+            ExecutionResult: The outcome, or a timed_out snapshot
         """
+        policy = launch or DEFAULT_LAUNCH
+        if policy.mode == 'detach':
+            return self._detach(alias_name, policy, context, trace, queued)
+        timeout = self._timeout(policy)
+        outcome, completion, result, ring, began = self._start(
+            alias_name, context, trace, timeout, policy, queued
+        )
         try:
-            command = f"{self.shell_path} -i -c '{alias_name}'"
-            
-            logger.debug(f"🔄 Executing: {alias_name}")
-            
-            process = subprocess.Popen(
-                command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                executable=self.shell_path,
-                env=os.environ.copy(),
-                start_new_session=True
+            return outcome.result(
+                timeout=max(0.0, began + timeout - time.monotonic()) if timeout else None
             )
-            
-            stdout, stderr = process.communicate(timeout=5)
-            
-            if stdout:
-                logger.debug(f"📤 Output: {stdout.decode().strip()}")
-            if stderr:
-                logger.warning(f"⚠️ Error: {stderr.decode().strip()}")
-                
-            success = process.returncode == 0
-            if success:
-                logger.info(f"✅ Successfully executed: {alias_name}")
-            else:
-                logger.error(f"❌ Failed to execute: {alias_name}")
-                
-            return success
-                
-        except subprocess.TimeoutExpired:
-            logger.error(f"⏰ Timeout executing: {alias_name}")
-            return False
+        except FutureTimeout:
+            if policy.mode == 'stream':
+                return self._still_running(result, ring, began)
+        if self._expire(completion, result, timeout):
+            try:
+                return outcome.result(timeout=TERMINATE_GRACE + 1.0)
+            except FutureTimeout:
+                return self._still_running(result, ring, began)  # Not even SIGKILL took
+        return outcome.result()  # Exited just in time
+    
+    def _start(self, alias_name: str, context: Any, trace: Optional[PressTrace],
+               wait: Optional[float] = None, policy: LaunchPolicy = DEFAULT_LAUNCH,
+               queued: Optional[float] = None, owner: Any = None):
+        """
+        🛫 Launch a run; its outcome future resolves once the process exits
+        
+        owner, when given, is the context cancel() reaches the run through
+        (a pipeline step is reported for the step, stopped for the pipeline).
+        """
+        result, ring, sink, began = self._begin(alias_name, context, trace, queued)
+        try:
+            completion = self._launch(alias_name, sink, trace, wait, policy)
         except Exception as e:
-            logger.error(f"💥 Error executing {alias_name}: {e}")
+            completion = ProcessFuture()
+            completion.set_exception(e)
+        self._track(context if owner is None else owner, completion)
+        
+        outcome: Future = Future()
+        completion.add_done_callback(
+            lambda done: outcome.set_result(
+                self._finished(done, result, ring, began, context, trace)
+            )
+        )
+        return outcome, completion, result, ring, began
+    
+    def _expire(self, completion: ProcessFuture, result: ExecutionResult,
+                timeout: float) -> bool:
+        """⏰ Stop a run that outlived its timeout; False if it exited meanwhile"""
+        if completion.done():
             return False
+        logger.warning("⏰ %s timed out after %gs, stopping it", result.alias, timeout)
+        result.timed_out = True
+        result.error = f"timed out after {timeout:g}s"
+        if completion.terminate():
+            return True
+        result.timed_out, result.error = False, None
+        return False
+    
+    async def execute_async(self, alias_name: str, context: Any = None,
+                            trace: Optional[PressTrace] = None,
+                            launch: Optional[LaunchPolicy] = None,
+                            queued: Optional[float] = None,
+                            timeout: Optional[float] = None) -> ExecutionResult:
+        """
+        🚀 Execute a shell alias as a task on the running event loop
+        
+        Same contract as execute().
+        
+        Args:
+            launch: Lifecycle and isolation (default: wait mode, the handler's timeout)
+            timeout: Overrides the launch timeout (0 = until it exits)
+        """
+        policy = launch or DEFAULT_LAUNCH
+        if policy.mode == 'detach':
+            # Forking can take a few ms; keep it off the loop
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._detach, alias_name, policy, context, trace, queued
+            )
+        wait_for = self._timeout(policy) if timeout is None else timeout
+        result, ring, sink, began = self._begin(alias_name, context, trace, queued)
+        completion = asyncio.ensure_future(self._launch_async(alias_name, sink, trace, policy))
+        self._track(context, completion)
+        try:
+            await asyncio.wait_for(asyncio.shield(completion), wait_for or None)
+        except asyncio.TimeoutError:
+            if completion.done():
+                pass  # Exited just in time
+            elif policy.mode == 'stream':
+                completion.add_done_callback(
+                    lambda done: self._finished(done, result, ring, began, context, trace)
+                )
+                return self._still_running(result, ring, began)
+            else:
+                result.timed_out = True
+                result.error = f"timed out after {wait_for:g}s"
+                logger.warning("⏰ %s timed out after %gs, stopping it", alias_name, wait_for)
+                completion.cancel()  # Stops the process group (see _spawn_async)
+                await asyncio.wait([completion])
+        except asyncio.CancelledError:
+            # Let the process group be stopped before reporting and freeing the slot
+            completion.cancel()
+            await asyncio.wait([completion])
+            self._finished(completion, result, ring, began, context, trace)
+            raise
+        except Exception:
+            pass  # Reported by _finished
+        return self._finished(completion, result, ring, began, context, trace)
+    
+    def execute_pipeline(self, alias_name: str, pipeline: Pipeline, context: Any = None,
+                         trace: Optional[PressTrace] = None,
+                         launch: Optional[LaunchPolicy] = None,
+                         queued: Optional[float] = None) -> ExecutionResult:
+        """
+        🧬 Run a pipeline's steps as their dependencies allow, as many at once as possible
+        
+        Steps are processes, so one worker thread drives them all. A step
+        that fails or times out stops the pipeline (fail_fast) or skips what
+        depends on it (continue). Timed-out steps, and with fail_fast the
+        steps still running, are stopped and reported when they exit.
+        
+        Args:
+            launch: Isolation applied to every step (steps keep their own timeouts)
+            queued: Wall-clock time the press was queued, for result.queue_wait
+        
+        Returns:
+            ExecutionResult: One result for the whole pipeline (see PipelineRun.summary)
+        """
+        began = self._announce(alias_name, context, trace)
+        started = time.time()
+        run = PipelineRun(pipeline)
+        policy = replace(launch or DEFAULT_LAUNCH, mode='wait', timeout=0)
+        pending: Dict[Future, tuple] = {}
+        
+        def start(steps: List[PipelineStep]):
+            for step in steps:
+                outcome, completion, result, ring, step_began = self._start(
+                    step.alias, step, None, 0, policy, owner=context
+                )
+                deadline = step_began + step.timeout if step.timeout else float('inf')
+                pending[outcome] = (step, deadline, completion, result, ring, step_began)
+        
+        start(run.ready())
+        while pending and not run.stopped:
+            deadline = min(entry[1] for entry in pending.values())
+            remaining = None if deadline == float('inf') else max(0.0, deadline - time.monotonic())
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for outcome in done:
+                step = pending.pop(outcome)[0]
+                start(self._step_done(run, alias_name, context, step, outcome.result()))
+            now = time.monotonic()
+            for outcome, entry in list(pending.items()):
+                step, deadline, completion, result, ring, step_began = entry
+                if deadline <= now and not outcome.done():
+                    del pending[outcome]
+                    self._expire(completion, result, step.timeout)
+                    timed_out = replace(
+                        result, output=ring.getvalue(), output_bytes=ring.total,
+                        duration=now - step_began, timed_out=True,
+                        error=f"timed out after {step.timeout:g}s"
+                    )
+                    start(self._step_done(run, alias_name, context, step, timed_out))
+        for entry in pending.values():
+            entry[2].terminate()  # fail_fast: stop the steps still running
+        
+        result = run.summary(alias_name, started, time.monotonic() - began)
+        result.queue_wait = _waited(started, queued)
+        self._pipeline_finished(result, context, trace)
+        return result
+    
+    async def execute_pipeline_async(self, alias_name: str, pipeline: Pipeline,
+                                     context: Any = None,
+                                     trace: Optional[PressTrace] = None,
+                                     launch: Optional[LaunchPolicy] = None,
+                                     queued: Optional[float] = None) -> ExecutionResult:
+        """
+        🧬 Event-loop counterpart of execute_pipeline
+        
+        Here cancel(context) also stops the lot.
+        """
+        began = self._announce(alias_name, context, trace)
+        started = time.time()
+        run = PipelineRun(pipeline)
+        policy = replace(launch or DEFAULT_LAUNCH, mode='wait', timeout=0)
+        driver = asyncio.ensure_future(self._drive_pipeline(alias_name, run, context, policy))
+        self._track(context, driver)
+        error = None
+        try:
+            await asyncio.shield(driver)
+        except asyncio.CancelledError:
+            driver.cancel()
+            await asyncio.wait([driver])
+            error = "cancelled"
+        result = run.summary(alias_name, started, time.monotonic() - began, error)
+        result.queue_wait = _waited(started, queued)
+        self._pipeline_finished(result, context, trace)
+        if error:
+            raise asyncio.CancelledError()
+        return result
+    
+    async def _drive_pipeline(self, alias_name: str, run: PipelineRun, context: Any,
+                              policy: LaunchPolicy):
+        """🚦 Start ready steps as tasks, feeding each outcome back into the run"""
+        running: Dict[asyncio.Future, PipelineStep] = {}
+        
+        def launch(steps: List[PipelineStep]):
+            for step in steps:
+                step_run = self.execute_async(step.alias, step, launch=policy)
+                if step.timeout:
+                    step_run = asyncio.wait_for(step_run, step.timeout)
+                running[asyncio.ensure_future(step_run)] = step
+        
+        launch(run.ready())
+        try:
+            while running and not run.stopped:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    result = self._step_result(step, task)
+                    launch(self._step_done(run, alias_name, context, step, result))
+        finally:
+            # fail_fast or cancelled: stop whatever is still going
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.wait(running)
+    
+    @staticmethod
+    def _step_result(step: PipelineStep, task: asyncio.Future) -> ExecutionResult:
+        if task.cancelled():
+            return ExecutionResult(alias=step.alias, error="cancelled")
+        error = task.exception()
+        if isinstance(error, asyncio.TimeoutError):
+            return ExecutionResult(
+                alias=step.alias, duration=step.timeout, timed_out=True,
+                error=f"timed out after {step.timeout:g}s"
+            )
+        if error is not None:
+            return ExecutionResult(alias=step.alias, error=str(error))
+        return task.result()
+    
+    def _step_done(self, run: PipelineRun, alias_name: str, context: Any,
+                   step: PipelineStep, result: ExecutionResult) -> List[PipelineStep]:
+        """📈 Record a finished step, report progress; returns the steps it unblocked"""
+        ready = run.finish(step, result)
+        mark = "✅" if result.success else "❌"
+        logger.info(f"🧬 {alias_name}: {mark} {step.name} ({run.done}/{run.total})")
+        if run.stopped:
+            logger.warning(f"🛑 {alias_name}: stopping after {step.name} failed")
+        self._notify('pipeline_progress', alias_name, context, run.done, run.total, result)
+        return ready
+    
+    def _pipeline_finished(self, result: ExecutionResult, context: Any,
+                           trace: Optional[PressTrace]):
+        if result.success:
+            logger.info(f"✅ Pipeline {result.alias} finished ({result.duration:.2f}s)")
+        else:
+            logger.error(f"❌ Pipeline {result.alias}: {result.error}")
+        self._settle(result, context, trace)
+    
+    def _track(self, context: Any, completion: Union[asyncio.Future, ProcessFuture]):
+        """📌 Remember a run's completion so cancel(context) can reach it"""
+        key = id(context)
+        with self._lock:
+            self._completions.setdefault(key, set()).add(completion)
+        
+        def forget(done):
+            with self._lock:
+                live = self._completions.get(key)
+                if live is not None:
+                    live.discard(done)
+                    if not live:
+                        del self._completions[key]
+        
+        completion.add_done_callback(forget)
+    
+    def _begin(self, alias_name: str, context: Any, trace: Optional[PressTrace],
+               queued: Optional[float] = None):
+        """🎬 Announce a run and set up its output capture"""
+        began = self._announce(alias_name, context, trace)
+        started = time.time()
+        result = ExecutionResult(alias=alias_name, started=started,
+                                 queue_wait=_waited(started, queued))
+        ring = RingBuffer(self.output_buffer)
+        log = self._log_for(alias_name)
+        if log:
+            log.write(run_header(alias_name))
+        logger.debug("🔄 Executing: %s", alias_name)
+        return result, ring, OutputSink(ring, log, trace), began
+    
+    def _announce(self, alias_name: str, context: Any, trace: Optional[PressTrace]) -> float:
+        """📣 Count a run as live for context and tell listeners; returns its start time"""
+        if trace:
+            trace.mark('start')
+        self._notify('execution_started', alias_name, context)
+        with self._lock:
+            self._live[id(context)] = self._live.get(id(context), 0) + 1
+        return time.monotonic()
+    
+    def _still_running(self, result: ExecutionResult, ring: RingBuffer,
+                       began: float) -> ExecutionResult:
+        duration = time.monotonic() - began
+        logger.warning(
+            f"⏰ {result.alias} still running after {duration:.1f}s; "
+            f"outcome will be reported when it exits"
+        )
+        return replace(
+            result,
+            output=ring.getvalue(),
+            output_bytes=ring.total,
+            duration=duration,
+            timed_out=True
+        )
+    
+    def _finished(self, completion, result: ExecutionResult, ring: RingBuffer,
+                  began: float, context: Any,
+                  trace: Optional[PressTrace]) -> ExecutionResult:
+        """🏁 Record, log and announce a run once its process has exited"""
+        try:
+            result.returncode = completion.result()
+        except asyncio.CancelledError:
+            result.error = result.error or "cancelled"
+        except Exception as e:
+            result.error = str(e)
+        result.duration = time.monotonic() - began
+        result.output = ring.getvalue()
+        result.output_bytes = ring.total
+        
+        if result.success:
+            logger.info("✅ Successfully executed: %s (%.2fs)", result.alias, result.duration)
+        elif result.error:
+            logger.error("💥 Error executing %s: %s", result.alias, result.error)
+        else:
+            logger.error("❌ Failed to execute: %s (exit %s)", result.alias, result.returncode)
+        if result.output and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📤 Output (%d bytes, last %d): %s", result.output_bytes,
+                         len(result.output), result.output.decode(errors='replace').strip())
+        
+        self._settle(result, context, trace)
+        return result
+    
+    def _settle(self, result: ExecutionResult, context: Any, trace: Optional[PressTrace]):
+        """📬 Keep a finished run's result, release its live count and tell listeners"""
+        if trace:
+            trace.mark('exit')
+            trace.finish()
+        with self._lock:
+            self._results[result.alias] = result
+            live = self._live.get(id(context), 1) - 1
+            if live > 0:
+                self._live[id(context)] = live
+            else:
+                self._live.pop(id(context), None)
+        self._notify('execution_finished', result.alias, context, result)
+    
+    def _launch(self, alias_name: str, sink: OutputSink,
+                trace: Optional[PressTrace] = None, wait: Optional[float] = None,
+                policy: LaunchPolicy = DEFAULT_LAUNCH) -> ProcessFuture:
+        """
+        🛫 Start the alias by the fastest available path; resolves to its exit code
+        
+        A warm shell blocks the caller for up to wait seconds (default: the timeout).
+        Isolated commands skip the warm shells, which can't be set up per command.
+        """
+        preexec = policy.preexec()
+        argv = self.resolver.resolve(alias_name) if self.resolver else None
+        if argv is not None:
+            return self._execute_direct(argv, sink, trace, preexec)
+        if self.shell_pool and preexec is None:
+            completion = self.shell_pool.run(
+                alias_name, self.timeout if wait is None else wait, trace, sink
+            )
+            if completion is not None:
+                return completion
+        return self._execute_cold(alias_name, sink, trace, preexec)
+    
+    def _execute_direct(self, argv: List[str], sink: OutputSink,
+                        trace: Optional[PressTrace] = None,
+                        preexec: Optional[Callable[[], None]] = None) -> ProcessFuture:
+        """⚡ Exec a resolved alias without any shell"""
+        logger.debug("⚡ Direct exec: %s", argv)
+        return self._run_process(
+            argv, sink, trace, env=self.resolver.exec_env(), preexec_fn=preexec
+        )
+    
+    def _execute_cold(self, alias_name: str, sink: OutputSink,
+                      trace: Optional[PressTrace] = None,
+                      preexec: Optional[Callable[[], None]] = None) -> ProcessFuture:
+        """🧊 Spawn a fresh interactive shell for one command"""
+        command = f"{self.shell_path} -i -c '{alias_name}'"
+        return self._run_process(
+            command,
+            sink,
+            trace,
+            shell=True,
+            executable=self.shell_path,
+            env=os.environ.copy(),
+            preexec_fn=preexec
+        )
+    
+    def _run_process(self, args, sink: OutputSink,
+                     trace: Optional[PressTrace] = None, **popen_kwargs) -> ProcessFuture:
+        """▶️ Spawn a process whose output streams into sink"""
+        process = subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=self.work_dir or None,
+            start_new_session=True,
+            **popen_kwargs
+        )
+        if trace:
+            trace.mark('spawn')
+        return self._watcher.watch(process, sink)
+    
+    def _detach(self, alias_name: str, policy: LaunchPolicy, context: Any,
+                trace: Optional[PressTrace], queued: Optional[float] = None) -> ExecutionResult:
+        """🪁 Start a command that outlives the press (GUI apps): done once it's running"""
+        began = self._announce(alias_name, context, trace)
+        started = time.time()
+        result = ExecutionResult(alias=alias_name, started=started,
+                                 queue_wait=_waited(started, queued))
+        argv = self.resolver.resolve(alias_name) if self.resolver else None
+        env = self.resolver.exec_env() if argv is not None else os.environ.copy()
+        try:
+            process = subprocess.Popen(
+                argv or [self.shell_path, '-i', '-c', alias_name],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=self.work_dir or None,
+                start_new_session=True,
+                env=env,
+                preexec_fn=policy.preexec()
+            )
+        except Exception as e:
+            result.error = str(e)
+        else:
+            if trace:
+                trace.mark('spawn')
+            result.returncode = 0
+            # Still reaped when it exits, so it never lingers as a zombie
+            self._watcher.watch(process, detached=True).add_done_callback(
+                lambda done: logger.debug(
+                    "🪁 %s (pid %d) exited with %s", alias_name, process.pid, done.result()
+                )
+            )
+        result.duration = time.monotonic() - began
+        if result.success:
+            logger.info("🪁 Launched %s (pid %d)", alias_name, process.pid)
+        else:
+            logger.error("💥 Error executing %s: %s", alias_name, result.error)
+        self._settle(result, context, trace)
+        return result
+    
+    async def _launch_async(self, alias_name: str, sink: OutputSink,
+                            trace: Optional[PressTrace] = None,
+                            policy: LaunchPolicy = DEFAULT_LAUNCH) -> int:
+        """🛫 Event-loop counterpart of _launch; returns the exit code"""
+        preexec = policy.preexec()
+        argv = self.resolver.resolve(alias_name) if self.resolver else None
+        if argv is not None:
+            logger.debug("⚡ Direct exec: %s", argv)
+            return await self._spawn_async(
+                argv, sink, trace, self.resolver.exec_env(), preexec
+            )
+        if self.shell_pool and preexec is None:
+            # Warm shells are driven with blocking reads: hand the command over off
+            # the loop and let the pool follow it on its own thread
+            loop = asyncio.get_running_loop()
+            completion = await loop.run_in_executor(
+                None, self.shell_pool.run, alias_name, 0, trace, sink
+            )
+            if completion is not None:
+                waiter = asyncio.wrap_future(completion)
+                try:
+                    return await asyncio.shield(waiter)
+                except asyncio.CancelledError:
+                    completion.terminate()  # The shell goes with it; the pool replaces it
+                    await asyncio.wait([waiter], timeout=TERMINATE_GRACE + 1.0)
+                    raise
+        return await self._spawn_async(
+            [self.shell_path, '-i', '-c', alias_name], sink, trace, os.environ.copy(), preexec
+        )
+    
+    async def _spawn_async(self, argv: List[str], sink: OutputSink,
+                           trace: Optional[PressTrace], env: Dict[str, str],
+                           preexec: Optional[Callable[[], None]] = None) -> int:
+        """▶️ Spawn a process on the event loop, streaming its output into sink"""
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.subprocess_exec(
+            lambda: _OutputProtocol(sink, loop),
+            *argv,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=self.work_dir or None,
+            start_new_session=True,
+            env=env,
+            preexec_fn=preexec
+        )
+        if trace:
+            trace.mark('spawn')
+        try:
+            await asyncio.shield(protocol.exited)
+            # Background children may hold the pipe open; report on exit regardless
+            await asyncio.wait([protocol.drained], timeout=PIPE_GRACE)
+            return transport.get_returncode()
+        except asyncio.CancelledError:
+            await self._terminate(transport, protocol)
+            raise
+        finally:
+            # Stop following a pipe a background child still holds, and release it
+            transport.close()
+    
+    @staticmethod
+    async def _terminate(transport: asyncio.SubprocessTransport, protocol: '_OutputProtocol'):
+        """🛑 Stop a cancelled command's whole process group"""
+        if protocol.exited.done():
+            return
+        try:
+            os.killpg(transport.get_pid(), signal.SIGTERM)
+            try:
+                await asyncio.wait_for(asyncio.shield(protocol.exited), TERMINATE_GRACE)
+                return
+            except asyncio.TimeoutError:
+                os.killpg(transport.get_pid(), signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await asyncio.shield(protocol.exited)
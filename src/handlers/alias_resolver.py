@@ -0,0 +1,264 @@
+"""
+🔎 Alias Resolver Module
+Harvests the user's alias table once and resolves simple aliases to argv lists,
+so they can be exec'd directly without starting a shell.
+
+Flow:
+1. Run the configured shell once to dump PATH, aliases and function names
+2. Cache the result on disk, keyed by the rc files' mtimes and content hash
+3. Resolve aliases without shell syntax to an argv with an absolute executable
+4. Re-harvest in the background whenever the rc files change
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shlex
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..utils.rc_files import rc_files_for, rc_fingerprint
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+# Anything in here means the expansion needs a real shell
+SHELL_SYNTAX = set('|&;<>()$`\\*?[]{}~!#\n')
+MAX_ALIAS_DEPTH = 10
+
+_PATH_MARK = '__LP_PATH__'
+_ALIAS_MARK = '__LP_ALIASES__'
+_FUNC_MARK = '__LP_FUNCTIONS__'
+
+
+class AliasResolver:
+    """Caches alias expansions and turns simple ones into exec-able argv"""
+
+    def __init__(self, shell_path: str = '/bin/zsh',
+                 cache_dir: str = '~/.cache/launchpad-shell',
+                 timeout: float = 15.0, rc_check_interval: float = 1.0):
+        self.shell_path = shell_path
+        self.timeout = timeout
+        self.rc_check_interval = rc_check_interval
+        shell_key = hashlib.sha1(shell_path.encode()).hexdigest()[:12]
+        self.cache_file = Path(cache_dir).expanduser() / f"aliases-{shell_key}.json"
+
+        self.path: Optional[str] = None
+        self._aliases: Dict[str, str] = {}
+        self._functions: set = set()
+        self._resolved: Dict[str, Optional[List[str]]] = {}
+        self._fingerprint: Tuple = ()
+        self._ready = False
+        self._rc_checked_at = 0.0
+
+        self._lock = threading.Lock()
+        self._harvesting = False
+        self.hits = 0
+        self.misses = 0
+        self.harvests = 0
+
+    def start(self):
+        """📥 Load the disk cache, harvesting in the background if it's stale"""
+        if not self._load_cache():
+            self._harvest_async()
+
+    def resolve(self, alias_name: str) -> Optional[List[str]]:
+        """
+        🎯 Resolve an alias to an argv that can be exec'd directly
+
+        Returns:
+            list: argv with an absolute executable, or None if a shell is needed
+        """
+        self._check_rc_files()
+        argv = self._resolved.get(alias_name) if self._ready else None
+        if argv is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return list(argv)
+
+    def exec_env(self) -> Dict[str, str]:
+        """🌍 Environment for direct execs, using the PATH the rc files set up"""
+        env = os.environ.copy()
+        if self.path:
+            env['PATH'] = self.path
+        return env
+
+    def stats(self) -> dict:
+        """📊 Cache effectiveness"""
+        lookups = self.hits + self.misses
+        return {
+            'aliases': len(self._aliases),
+            'direct': sum(1 for argv in self._resolved.values() if argv),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'harvests': self.harvests,
+        }
+
+    def _content_hash(self) -> str:
+        digest = hashlib.sha256(self.shell_path.encode())
+        for path in rc_files_for(self.shell_path):
+            try:
+                digest.update(str(path).encode())
+                digest.update(path.read_bytes())
+            except OSError:
+                continue
+        return digest.hexdigest()
+
+    def _check_rc_files(self):
+        """🔄 Invalidate the cache when an rc file changes"""
+        now = time.monotonic()
+        if now - self._rc_checked_at < self.rc_check_interval:
+            return
+        self._rc_checked_at = now
+        if not self._ready or rc_fingerprint(self.shell_path) == self._fingerprint:
+            return
+        if self._load_cache():
+            return
+        logger.info("📜 Shell rc files changed, refreshing alias cache")
+        self._ready = False
+        self._harvest_async()
+
+    def _load_cache(self) -> bool:
+        """💾 Load cached aliases if they still match the rc files"""
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != CACHE_VERSION or data.get('shell') != self.shell_path:
+            return False
+
+        fingerprint = rc_fingerprint(self.shell_path)
+        if [list(f) for f in fingerprint] != data.get('fingerprint'):
+            # mtimes moved; the contents may still be identical (e.g. a touch)
+            if self._content_hash() != data.get('content_hash'):
+                return False
+            data['fingerprint'] = [list(f) for f in fingerprint]
+            self._write_cache(data)
+
+        self._apply(data, fingerprint)
+        logger.debug(f"💾 Loaded {len(self._aliases)} aliases from {self.cache_file}")
+        return True
+
+    def _write_cache(self, data: dict):
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_file.with_suffix('.tmp')
+            tmp.write_text(json.dumps(data))
+            tmp.replace(self.cache_file)
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to write alias cache: {e}")
+
+    def _harvest_async(self):
+        with self._lock:
+            if self._harvesting:
+                return
+            self._harvesting = True
+        threading.Thread(target=self._harvest, name="launchpad-alias-harvest", daemon=True).start()
+
+    def _harvest_script(self) -> str:
+        if Path(self.shell_path).name == 'zsh':
+            functions = 'print -rl -- ${(k)functions}'
+        else:
+            functions = "declare -F | cut -d' ' -f3"
+        return (
+            f"printf '%s\\n' {_PATH_MARK} \"$PATH\" {_ALIAS_MARK}; alias; "
+            f"printf '%s\\n' {_FUNC_MARK}; {functions}"
+        )
+
+    def _harvest(self):
+        """🐚 Run the shell once to dump its alias table"""
+        try:
+            fingerprint = rc_fingerprint(self.shell_path)
+            content_hash = self._content_hash()
+            process = subprocess.run(
+                [self.shell_path, '-i', '-c', self._harvest_script()],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=self.timeout,
+                start_new_session=True
+            )
+            data = self._parse(process.stdout.decode(errors='replace'))
+            data.update(
+                version=CACHE_VERSION,
+                shell=self.shell_path,
+                fingerprint=[list(f) for f in fingerprint],
+                content_hash=content_hash,
+            )
+            self._write_cache(data)
+            self._apply(data, fingerprint)
+            self.harvests += 1
+            logger.info(f"🔎 Harvested {len(self._aliases)} aliases from {self.shell_path}")
+        except Exception as e:
+            logger.warning(f"⚠️ Alias harvest failed, using the shell for everything: {e}")
+        finally:
+            with self._lock:
+                self._harvesting = False
+
+    @staticmethod
+    def _parse(output: str) -> dict:
+        """🧩 Split harvest output into PATH, aliases and function names"""
+        _, _, rest = output.partition(_PATH_MARK + '\n')
+        path, _, rest = rest.partition('\n' + _ALIAS_MARK + '\n')
+        alias_text, _, func_text = rest.partition(_FUNC_MARK + '\n')
+
+        aliases = {}
+        try:
+            # `alias` output is valid shell input: `name='value'` or `alias name='value'`
+            tokens = shlex.split(alias_text)
+        except ValueError:
+            tokens = []
+        for token in tokens:
+            if token == 'alias' or '=' not in token:
+                continue
+            name, value = token.split('=', 1)
+            aliases[name] = value
+
+        return {
+            'path': path.strip(),
+            'aliases': aliases,
+            'functions': func_text.split(),
+        }
+
+    def _apply(self, data: dict, fingerprint: Tuple):
+        self.path = data.get('path') or None
+        self._aliases = data.get('aliases', {})
+        self._functions = set(data.get('functions', []))
+        self._resolved = {name: self._to_argv(name) for name in self._aliases}
+        self._fingerprint = fingerprint
+        self._ready = True
+
+    def _to_argv(self, name: str) -> Optional[List[str]]:
+        """🧮 Expand an alias to argv, or None if it needs a shell"""
+        argv = [name]
+        seen = set()
+        while argv[0] in self._aliases and argv[0] not in seen:
+            if len(seen) >= MAX_ALIAS_DEPTH:
+                return None
+            seen.add(argv[0])
+            expansion = self._aliases[argv[0]]
+            if SHELL_SYNTAX.intersection(expansion):
+                return None
+            try:
+                words = shlex.split(expansion)
+            except ValueError:
+                return None
+            if not words:
+                return None
+            argv = words + argv[1:]
+
+        command = argv[0]
+        if '=' in command or command in self._functions:
+            return None
+        executable = shutil.which(command, path=self.path)
+        if not executable:
+            # Builtins and anything we can't find stay with the shell
+            return None
+        return [executable] + argv[1:]
@@ -1,27 +1,49 @@
 """
 🎮 Button Handler Module
 Processes MIDI button events and manages button states.
+
+Flow:
+1. Per-note state lives in preallocated 128-slot arrays
+2. Coordinates and callbacks are looked up by note in precomputed tables
+3. Debug logging is checked before any message is formatted
+4. Presses and releases also feed the gesture matcher, which runs pad callbacks
+   straight away unless the pad may start a chord or sequence
 """
 
 import logging
-from typing import Dict, Optional, Callable
+from array import array
+from typing import Any, Dict, List, Optional, Callable
 from dataclasses import dataclass
-from ..models.button import LaunchpadButton
-from ..utils.constants import MIDI_NOTE_ON, MIDI_NOTE_OFF
+from .gesture_matcher import GestureMatcher, GestureTrie
+from ..utils.constants import (
+    MIDI_NOTE_OFF, MIDI_POLY_AFTERTOUCH, MIDI_STATUS_MASK, MIDI_NOTE_COUNT
+)
 
 logger = logging.getLogger(__name__)
 
 @dataclass
 class ButtonState:
-    """📊 Tracks button state"""
+    """📊 Snapshot of a button's state"""
     is_pressed: bool = False
     press_count: int = 0
     last_velocity: int = 0
 
 class ButtonHandler:
     def __init__(self, debug_mode: bool = False):
-        self.button_states: Dict[int, ButtonState] = {}
-        self.callbacks: Dict[int, Callable] = {}
+        # 📋 Dispatch tables, indexed by MIDI note
+        self._callbacks: List[Optional[Callable]] = [None] * MIDI_NOTE_COUNT
+        self._coords = tuple(self._get_xy(note) for note in range(MIDI_NOTE_COUNT))
+        
+        # 📊 Compact per-note state
+        self._seen = bytearray(MIDI_NOTE_COUNT)
+        self._pressed = bytearray(MIDI_NOTE_COUNT)
+        self._velocity = bytearray(MIDI_NOTE_COUNT)
+        self._press_counts = array('L', [0]) * MIDI_NOTE_COUNT
+        
+        # 🎹 Chords and sequences on the visible page
+        self._matcher = GestureMatcher()
+        self._gesture_starts = self._matcher.trie.starts
+        
         self.debug_mode = debug_mode
         
     def _get_xy(self, note: int) -> tuple[int, int]:
@@ -30,9 +52,46 @@ class ButtonHandler:
         y = note // 10
         return x, y
     
+    @property
+    def callbacks(self) -> Dict[int, Callable]:
+        """🎯 Registered callbacks by note"""
+        return {note: cb for note, cb in enumerate(self._callbacks) if cb is not None}
+    
+    @property
+    def button_states(self) -> Dict[int, ButtonState]:
+        """📊 State snapshots for every button seen so far"""
+        return {
+            note: self._state(note)
+            for note in range(MIDI_NOTE_COUNT) if self._seen[note]
+        }
+    
+    def _state(self, note: int) -> ButtonState:
+        return ButtonState(
+            is_pressed=bool(self._pressed[note]),
+            press_count=self._press_counts[note],
+            last_velocity=self._velocity[note]
+        )
+    
     def register_callback(self, note: int, callback: Callable):
         """🎯 Register callback for button"""
-        self.callbacks[note] = callback
+        self._callbacks[note] = callback
+    
+    def unregister_callback(self, note: int):
+        """🗑️ Remove the callback for a button"""
+        self._callbacks[note] = None
+    
+    def set_gestures(self, trie: GestureTrie):
+        """🎹 Match these chords and sequences from now on"""
+        self._matcher.set_trie(trie)
+        self._gesture_starts = trie.starts
+    
+    def set_timer(self, call_later: Callable[[float, Callable], Any]):
+        """⏲️ How gesture timeouts are scheduled (e.g. loop.call_later)"""
+        self._matcher.call_later = call_later
+    
+    def flush_gestures(self):
+        """🏁 Settle a half-entered gesture now (before switching pages)"""
+        self._matcher.flush()
         
     def handle_event(self, message: list):
         """
@@ -41,47 +100,55 @@ class ButtonHandler:
         Args:
             message: [status_byte, note, velocity]
         """
-        if len(message) != 3:
+        try:
+            status, note, velocity = message
+            pressed = self._pressed[note]
+        except (ValueError, IndexError):
             return
-            
-        status, note, velocity = message
-        x, y = self._get_xy(note)
-        
-        # Initialize button state if needed
-        if note not in self.button_states:
-            self.button_states[note] = ButtonState()
         
-        state = self.button_states[note]
+        kind = status & MIDI_STATUS_MASK
+        if kind == MIDI_POLY_AFTERTOUCH:
+            # Pressure updates on a held pad never trigger anything
+            self._velocity[note] = velocity
+            return
+        if kind == MIDI_NOTE_OFF:
+            velocity = 0
         
         # Debug output
-        if self.debug_mode:
+        if self.debug_mode and logger.isEnabledFor(logging.INFO):
+            x, y = self._coords[note]
             logger.info(
-                f"🔔 Button Event: ({x}, {y}) - "
-                f"{'Pressed' if velocity > 0 else 'Released'} "
-                f"[Note: {note}, Velocity: {velocity}]"
+                "🔔 Button Event: (%d, %d) - %s [Note: %d, Velocity: %d]",
+                x, y, 'Pressed' if velocity > 0 else 'Released', note, velocity
             )
         
+        self._seen[note] = 1
+        self._velocity[note] = velocity
+        
         # Handle button press/release
         if velocity > 0:  # Button Press
-            if not state.is_pressed:  # Avoid repeat triggers
-                state.is_pressed = True
-                state.press_count += 1
-                if note in self.callbacks:
-                    self.callbacks[note]()
+            if not pressed:  # Avoid repeat triggers
+                self._pressed[note] = 1
+                self._press_counts[note] += 1
+                callback = self._callbacks[note]
+                matcher = self._matcher
+                if matcher.active or self._gesture_starts[note]:
+                    matcher.press(note, callback)
+                elif callback is not None:
+                    callback()
         else:  # Button Release
-            state.is_pressed = False
-        
-        state.last_velocity = velocity
+            self._pressed[note] = 0
+            if self._matcher.active:
+                self._matcher.release(note)
     
     def get_button_info(self, note: int) -> Optional[dict]:
         """ℹ️ Get debug information about button"""
-        if note in self.button_states:
-            x, y = self._get_xy(note)
-            state = self.button_states[note]
+        if 0 <= note < MIDI_NOTE_COUNT and self._seen[note]:
+            state = self._state(note)
             return {
-                'coordinates': (x, y),
+                'coordinates': self._coords[note],
                 'press_count': state.press_count,
                 'is_pressed': state.is_pressed,
-                'has_callback': note in self.callbacks
+                'has_callback': self._callbacks[note] is not None
             }
         return None
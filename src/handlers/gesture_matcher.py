@@ -0,0 +1,232 @@
+"""
+🎹 Gesture Matcher Module
+Recognises chords (pads pressed together) and sequences (pads pressed in turn)
+in the press/release stream, one event at a time.
+
+Flow:
+1. Gestures are compiled into a trie whose edges are steps: a set of pads
+   (a chord) or a single pad (one sequence step)
+2. Each node also knows every partial chord leading to its children, so a
+   press is matched with one set lookup however many gestures exist
+3. Presses that can't start a gesture run their pad's action straight away;
+   presses that can are held back until the gesture completes, breaks or times out
+4. An unfinished chord that is also a step of its own (a pad that starts both
+   a chord and a sequence) moves on to that step when it is released, broken
+   or times out
+5. A broken or timed-out attempt runs the deepest gesture matched so far, or
+   else the held-back pad actions, so no press is lost
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from ..utils.constants import MIDI_NOTE_COUNT
+
+logger = logging.getLogger(__name__)
+
+Action = Callable[[], Any]
+Step = FrozenSet[int]
+
+
+class GestureNode:
+    """One point in the trie: what has been pressed so far"""
+    __slots__ = ('children', 'partials', 'action', 'timeout', 'chord_window')
+
+    def __init__(self):
+        self.children: Dict[Step, 'GestureNode'] = {}
+        self.partials: set = set()     # Incomplete chords leading to a child
+        self.action: Optional[Action] = None
+        self.timeout = 0.0             # Seconds allowed until the next step
+        self.chord_window = 0.0        # Seconds allowed to finish a chord step
+
+
+class GestureTrie:
+    """Compiled chords and sequences for one page"""
+
+    def __init__(self):
+        self.root = GestureNode()
+        self.starts = bytearray(MIDI_NOTE_COUNT)  # Notes that may begin a gesture
+        self.count = 0
+
+    def add(self, kind: str, notes: Sequence[int], window: float, action: Action):
+        """
+        ➕ Add a gesture
+
+        Args:
+            kind: 'chord' (notes pressed together) or 'sequence' (in order)
+            notes: Pads as MIDI notes
+            window: Seconds to press all of a chord, or allowed between sequence steps
+            action: Run when the gesture completes
+        """
+        steps: List[Step] = [frozenset(notes)] if kind == 'chord' else \
+            [frozenset((note,)) for note in notes]
+        node = self.root
+        for step in steps:
+            node.timeout = max(node.timeout, window)
+            if len(step) > 1:
+                node.chord_window = max(node.chord_window, window)
+                node.partials.update(_subsets(step))
+            node = node.children.setdefault(step, GestureNode())
+        node.action = action
+        for note in steps[0]:
+            self.starts[note] = 1
+        self.count += 1
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+
+def _subsets(step: Step) -> List[Step]:
+    """Every non-empty proper subset of a chord (chords are a few pads, so this stays small)"""
+    notes = sorted(step)
+    return [
+        frozenset(note for bit, note in enumerate(notes) if mask >> bit & 1)
+        for mask in range(1, (1 << len(notes)) - 1)
+    ]
+
+
+class GestureMatcher:
+    """Incremental matcher state for one device"""
+
+    def __init__(self, trie: Optional[GestureTrie] = None,
+                 call_later: Optional[Callable[[float, Callable], Any]] = None):
+        self.trie = trie or GestureTrie()
+        self.call_later = call_later  # e.g. loop.call_later; without it timeouts apply on the next event
+        self._reset()
+
+    def _reset(self):
+        self._node = self.trie.root
+        self._partial: Step = frozenset()
+        self._matched: Optional[Action] = None   # Deepest completed gesture in this attempt
+        self._held: List[Action] = []            # Pad actions held back since then
+        self._deadline = 0.0
+        self._attempt = getattr(self, '_attempt', 0) + 1
+        self._timer = None
+        self.active = False  # A gesture is in progress (plain attribute, read per event)
+
+    @property
+    def idle(self) -> bool:
+        """💤 True when no gesture is in progress"""
+        return not self.active
+
+    def set_trie(self, trie: GestureTrie):
+        """🔄 Swap the compiled gestures (page switch or reload), running anything held back"""
+        self.flush()
+        self.trie = trie
+        self._node = trie.root
+
+    def press(self, note: int, action: Optional[Action]):
+        """
+        🎯 Feed a press; action is the pad's own callback (run now, later or never)
+        """
+        if self.idle and not self.trie.starts[note]:
+            # Fast path: nothing to wait for
+            if action is not None:
+                action()
+            return
+
+        now = time.monotonic()
+        if not self.idle and now > self._deadline:
+            self._descend()
+            if now > self._deadline:
+                self.flush()
+
+        node = self._node
+        candidate = self._partial | {note}
+        child = node.children.get(candidate)
+        if candidate in node.partials:
+            # Part of a (bigger) chord: wait for the rest of it
+            if child is not None and child.action is not None:
+                self._matched, self._held = child.action, []
+            elif action is not None:
+                self._held.append(action)
+            if not self._partial:
+                self._arm(now + node.chord_window)
+            self._partial = candidate
+            self.active = True
+            return
+
+        if child is not None:
+            self._partial = frozenset()
+            if child.action is not None:
+                self._matched, self._held = child.action, []
+            elif action is not None:
+                self._held.append(action)
+            if not child.children:
+                self.flush()
+                return
+            self._node = child
+            self.active = True
+            self._arm(now + child.timeout)
+            return
+
+        if self.idle:
+            if action is not None:
+                action()
+            return
+        # The chord broke; if what was pressed is a step, carry on from there
+        if not self._descend():
+            # The attempt broke: settle it, then let this press start afresh
+            self.flush()
+        self.press(note, action)
+
+    def release(self, note: int):
+        """🔓 Feed a release; letting go of part of an unfinished chord breaks it"""
+        if note in self._partial and not self._descend():
+            self.flush()
+
+    def _descend(self) -> bool:
+        """↪️ Settle an unfinished chord that is a step itself by moving on to it"""
+        child = self._node.children.get(self._partial) if self._partial else None
+        if child is None:
+            return False
+        pressed = self._deadline - self._node.chord_window  # When the chord was begun
+        self._partial = frozenset()
+        if not child.children:
+            self.flush()
+            return True
+        self._node = child
+        self._arm(pressed + child.timeout)
+        return True
+
+    def flush(self):
+        """🏁 End the current attempt: run the deepest match, or else the held-back pad actions"""
+        if self.idle and self._matched is None and not self._held:
+            return
+        matched, held, timer = self._matched, self._held, self._timer
+        self._reset()
+        if timer is not None:
+            timer.cancel()
+        for action in ([matched] if matched else []) + held:
+            try:
+                action()
+            except Exception as e:
+                logger.error(f"❌ Gesture action failed: {e}")
+
+    def _arm(self, deadline: float):
+        """⏲️ Expire the attempt at deadline"""
+        self._deadline = deadline
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.call_later is not None:
+            attempt = self._attempt
+            self._timer = self.call_later(
+                max(0.0, deadline - time.monotonic()), lambda: self._expire(attempt)
+            )
+
+    def _expire(self, attempt: int):
+        # Ignore timers left over from attempts that already ended
+        if attempt == self._attempt:
+            self._timer = None
+            if not self._descend():
+                self.flush()
+
+
+def compile_gestures(gestures: Iterable[Tuple[str, Sequence[int], float, Action]]) -> GestureTrie:
+    """🛠️ Build a trie from (kind, notes, window seconds, action) tuples"""
+    trie = GestureTrie()
+    for kind, notes, window, action in gestures:
+        trie.add(kind, notes, window, action)
+    return trie
@@ -0,0 +1,178 @@
+"""
+📤 Output Capture Module
+Streams command output into bounded memory and rotating per-alias log files.
+
+Flow:
+1. Each run gets an OutputSink fed chunk by chunk as output arrives
+2. The sink keeps only the last N bytes in a RingBuffer
+3. Every chunk is appended to the alias's RotatingLog on disk by the LogWriter
+   thread, so the event loop reading the output never waits on the file system
+"""
+
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RingBuffer:
+    """🔁 Keeps the most recent `capacity` bytes written to it"""
+
+    def __init__(self, capacity: int = 16 * 1024):
+        self.capacity = max(1, capacity)
+        self.total = 0
+        self._buffer = bytearray()
+
+    def write(self, data: bytes):
+        self.total += len(data)
+        self._buffer += data[-self.capacity:]
+        overflow = len(self._buffer) - self.capacity
+        if overflow > 0:
+            del self._buffer[:overflow]
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buffer)
+
+
+class LogWriter:
+    """🧵 Background thread doing the file I/O of every RotatingLog handed to it"""
+
+    def __init__(self, max_pending: int = 4 * 1024 * 1024):
+        """
+        Args:
+            max_pending: Bytes allowed to wait for the disk; output past that is dropped
+        """
+        self.max_pending = max_pending
+        self.dropped = 0  # Bytes not logged because the disk fell behind
+        self._queue: 'queue.SimpleQueue[Optional[Tuple[RotatingLog, bytes]]]' = queue.SimpleQueue()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, log: 'RotatingLog', data: bytes):
+        """📨 Queue data for log without blocking"""
+        with self._lock:
+            if self._pending + len(data) > self.max_pending:
+                self.dropped += len(data)
+                return
+            self._pending += len(data)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="launchpad-output-log",
+                                                daemon=True)
+                self._thread.start()
+        self._queue.put((log, data))
+
+    def _run(self):
+        reported = 0
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            log, data = item
+            log.write_now(data)
+            with self._lock:
+                self._pending -= len(data)
+                dropped = self.dropped
+            if dropped != reported:
+                logger.warning(f"⚠️ Output logs fell behind; {dropped - reported} bytes not logged")
+                reported = dropped
+
+    def close(self, timeout: float = 5.0):
+        """💾 Write out what is queued and stop the thread"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+
+class RotatingLog:
+    """📜 Append-only byte log rotated to .1 .. .N once it grows past max_bytes"""
+
+    def __init__(self, path: Path, max_bytes: int = 1024 * 1024, backups: int = 3,
+                 writer: Optional[LogWriter] = None):
+        """
+        Args:
+            writer: Does the writes on its thread (None: write() writes right away)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.writer = writer
+        self._file = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def write(self, data: bytes):
+        """✍️ Append data, on the writer's thread if there is one"""
+        if self.writer is not None:
+            self.writer.submit(self, data)
+        else:
+            self.write_now(data)
+
+    def write_now(self, data: bytes):
+        """✍️ Append data on the calling thread"""
+        with self._lock:
+            try:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, 'ab')
+                    self._size = self._file.tell()
+                if self._size + len(data) > self.max_bytes and self._size:
+                    self._rotate()
+                self._file.write(data)
+                self._file.flush()
+                self._size += len(data)
+            except OSError as e:
+                logger.warning(f"⚠️ Failed to write {self.path}: {e}")
+
+    def _rotate(self):
+        self._file.close()
+        for i in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{i}")
+            if older.exists():
+                os.replace(older, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backups:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._file = open(self.path, 'ab')
+        self._size = 0
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+class OutputSink:
+    """🚰 Receives one run's output: ring buffer in memory, log file on disk"""
+
+    def __init__(self, ring: RingBuffer, log: Optional[RotatingLog] = None, trace=None):
+        self.ring = ring
+        self.log = log
+        self.trace = trace
+
+    def __call__(self, data: bytes):
+        if self.trace and not self.ring.total:
+            self.trace.mark('first_output')
+        self.ring.write(data)
+        if self.log:
+            self.log.write(data)
+
+
+def log_name(alias: str) -> str:
+    """🏷️ File-system safe log name for an alias"""
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', alias).strip('_')[:80] or 'alias'
+
+
+def run_header(alias: str) -> bytes:
+    """🪧 Separator written to the log before each run"""
+    return f"\n=== {time.strftime('%Y-%m-%d %H:%M:%S')} {alias} ===\n".encode()
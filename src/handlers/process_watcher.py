@@ -0,0 +1,224 @@
+"""
+👀 Process Watcher Module
+One background thread that streams output from every running process,
+notices when each one exits and reaps it.
+
+Flow:
+1. watch() registers a process's output pipe and an exit handle
+2. A selector loop forwards output chunks to the process's sink as they arrive
+3. Exits are detected via pidfd; without pidfd (Linux < 5.3) a helper thread
+   blocks in waitpid and reports through the wakeup pipe, so nothing polls
+4. The returned ProcessFuture resolves with the exit code once the process
+   exits, and can stop the process's whole group before that
+"""
+
+import logging
+import os
+import queue
+import selectors
+import signal
+import subprocess
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 65536
+TERMINATE_GRACE = 1.0  # Seconds between SIGTERM and SIGKILL
+
+
+class ProcessFuture(Future):
+    """⏳ A process's exit code, plus a way to stop its process group meanwhile"""
+
+    def __init__(self, pid: Optional[int] = None):
+        super().__init__()
+        self.pid = pid  # Leader of the process group (started with start_new_session)
+
+    def terminate(self, grace: float = TERMINATE_GRACE) -> bool:
+        """
+        🛑 SIGTERM the process group, then SIGKILL it if it outlives grace
+
+        Returns:
+            bool: False if there was nothing left to stop
+        """
+        if self.pid is None or self.done():
+            return False
+        try:
+            os.killpg(self.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return False
+        timer = threading.Timer(grace, self._kill)
+        timer.daemon = True
+        timer.start()
+        self.add_done_callback(lambda _: timer.cancel())
+        return True
+
+    def cancel(self) -> bool:
+        """🛑 Stop the process group; the future resolves once it's reaped, never cancelled"""
+        if self.pid is None:
+            return super().cancel()
+        return self.terminate()
+
+    def _kill(self):
+        if not self.done():
+            try:
+                os.killpg(self.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+
+class _Watched:
+    __slots__ = ('process', 'sink', 'future', 'pidfd', 'pipe_open', 'detached')
+
+    def __init__(self, process: subprocess.Popen, sink: Optional[Callable[[bytes], None]],
+                 detached: bool):
+        self.process = process
+        self.sink = sink
+        self.future = ProcessFuture(process.pid)
+        self.pidfd: Optional[int] = None
+        self.pipe_open = process.stdout is not None
+        self.detached = detached
+
+
+class ProcessWatcher:
+    """Multiplexes output and exit notifications for spawned processes"""
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ, ('wakeup', None))
+        self._incoming: "queue.SimpleQueue[_Watched]" = queue.SimpleQueue()
+        self._reaped: "queue.SimpleQueue[_Watched]" = queue.SimpleQueue()
+        self._live: Dict[int, _Watched] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, process: subprocess.Popen, sink: Optional[Callable[[bytes], None]] = None,
+              detached: bool = False) -> ProcessFuture:
+        """
+        👀 Stream a process's stdout into sink until it exits, then reap it
+
+        Args:
+            process: Started in its own session, so its pid is its process group
+            sink: Receives output chunks (the process may have no stdout pipe)
+            detached: Left running by terminate_all()
+
+        Returns:
+            ProcessFuture: Resolves with the process's exit code
+        """
+        watched = _Watched(process, sink, detached)
+        with self._lock:
+            self._live[process.pid] = watched
+        watched.future.add_done_callback(lambda _: self._forget(process.pid))
+        self._incoming.put(watched)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="launchpad-process-watcher", daemon=True
+                )
+                self._thread.start()
+        os.write(self._wakeup_w, b'\0')
+        return watched.future
+
+    def _forget(self, pid: int):
+        with self._lock:
+            self._live.pop(pid, None)
+
+    @property
+    def live(self) -> int:
+        """🏃 Processes started and not reaped yet"""
+        with self._lock:
+            return len(self._live)
+
+    def terminate_all(self, grace: float = TERMINATE_GRACE) -> int:
+        """
+        🛑 Stop the process group of every live process that isn't detached
+
+        Returns:
+            int: Groups signalled
+        """
+        with self._lock:
+            watched = [w for w in self._live.values() if not w.detached]
+        return sum(w.future.terminate(grace) for w in watched)
+
+    def _register(self, watched: _Watched):
+        if watched.pipe_open:
+            fd = watched.process.stdout.fileno()
+            os.set_blocking(fd, False)
+            self._selector.register(fd, selectors.EVENT_READ, ('output', watched))
+        try:
+            watched.pidfd = os.pidfd_open(watched.process.pid)
+        except (AttributeError, OSError):
+            threading.Thread(
+                target=self._reap, args=(watched,), name="launchpad-process-reaper", daemon=True
+            ).start()
+            return
+        self._selector.register(watched.pidfd, selectors.EVENT_READ, ('exit', watched))
+
+    def _reap(self, watched: _Watched):
+        """⚰️ No pidfd: block in waitpid on a helper thread, then hand the exit to the loop"""
+        watched.process.wait()
+        self._reaped.put(watched)
+        os.write(self._wakeup_w, b'\0')
+
+    def _read(self, watched: _Watched) -> bool:
+        """📥 Forward available output; returns False once the pipe hits EOF"""
+        fd = watched.process.stdout.fileno()
+        while True:
+            try:
+                chunk = os.read(fd, CHUNK_SIZE)
+            except BlockingIOError:
+                return True
+            except OSError:
+                chunk = b''
+            if not chunk:
+                self._selector.unregister(fd)
+                watched.process.stdout.close()
+                watched.pipe_open = False
+                return False
+            if watched.sink is None:
+                continue
+            try:
+                watched.sink(chunk)
+            except Exception as e:
+                logger.error(f"❌ Output sink failed: {e}")
+
+    def _exited(self, watched: _Watched):
+        """🏁 Collect the exit code after draining output already in the pipe"""
+        if watched.pidfd is not None:
+            self._selector.unregister(watched.pidfd)
+            os.close(watched.pidfd)
+            watched.pidfd = None
+        if watched.pipe_open:
+            # Background children may keep the pipe open; keep streaming it, just report now
+            self._read(watched)
+        returncode = watched.process.wait()
+        if not watched.future.done():
+            watched.future.set_result(returncode)
+
+    def _loop(self):
+        while True:
+            for key, _ in self._selector.select():
+                kind, watched = key.data
+                if kind == 'wakeup':
+                    try:
+                        os.read(self._wakeup_r, 4096)
+                    except BlockingIOError:
+                        pass
+                    while True:
+                        try:
+                            self._register(self._incoming.get_nowait())
+                        except queue.Empty:
+                            break
+                    while True:
+                        try:
+                            self._exited(self._reaped.get_nowait())
+                        except queue.Empty:
+                            break
+                elif kind == 'output':
+                    if watched.pipe_open:  # An exit earlier in this batch may have closed it
+                        self._read(watched)
+                elif kind == 'exit':
+                    self._exited(watched)
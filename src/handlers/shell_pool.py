@@ -0,0 +1,426 @@
+"""
+🔥 Shell Pool Module
+Keeps interactive shells warm so a button press doesn't pay for sourcing the rc files.
+
+Flow:
+1. Start N long-lived `<shell> -i` processes in the background
+2. Hand each command to an idle shell over stdin
+3. Read stdout until a sentinel line carrying the exit status
+4. Recycle shells after N commands, on rc file changes, or when unhealthy
+5. A maintenance thread pings idle shells every health interval, replacing
+   the ones that stopped answering before a press lands on them
+"""
+
+import logging
+import os
+import secrets
+import select
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Set
+
+from ..utils.metrics import PressTrace
+from ..utils.rc_files import rc_fingerprint
+from .process_watcher import ProcessFuture
+
+logger = logging.getLogger(__name__)
+
+# Silence prompts so they never end up in captured output
+_SHELL_SETUP = "PS1=''; PS2=''; PROMPT=''; RPROMPT=''; PROMPT_COMMAND=''\n"
+
+
+@dataclass
+class ShellResult:
+    """📤 Outcome of a command run in a warm shell"""
+    returncode: int
+    output: bytes
+
+
+class WarmShell:
+    """A single long-lived interactive shell speaking a sentinel protocol"""
+
+    def __init__(self, shell_path: str, work_dir: Optional[str] = None):
+        self.shell_path = shell_path
+        self.work_dir = work_dir
+        self.commands_run = 0
+        self.fingerprint = rc_fingerprint(shell_path)
+        self._marker = f"__LP_DONE_{secrets.token_hex(8)}__".encode()
+        self._process: Optional[subprocess.Popen] = None
+        self._pending = bytearray()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    def start(self, timeout: float = 15.0):
+        """🚀 Spawn the shell and wait until it answers"""
+        self._process = subprocess.Popen(
+            [self.shell_path, '-i'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.work_dir or None,
+            env=os.environ.copy(),
+            start_new_session=True
+        )
+        self._write(_SHELL_SETUP.encode())
+        self.run(':', timeout)
+        self.commands_run = 0
+
+    def is_alive(self) -> bool:
+        """💓 True while the shell process is running"""
+        return self._process is not None and self._process.poll() is None
+
+    def ping(self, timeout: float = 1.0) -> bool:
+        """🩺 Health check: round-trip a no-op command (not counted toward commands_run)"""
+        commands_run = self.commands_run
+        try:
+            return self.run(':', timeout).returncode == 0
+        except Exception:
+            return False
+        finally:
+            self.commands_run = commands_run
+
+    def run(self, command: str, timeout: float,
+            trace: Optional[PressTrace] = None) -> ShellResult:
+        """
+        ▶️ Run a command and wait for its sentinel, buffering the output
+
+        Raises:
+            subprocess.TimeoutExpired: The command didn't finish in time (shell is killed)
+            BrokenPipeError: The shell died before the command was sent
+        """
+        output = bytearray()
+        self.send(command, trace)
+        status = self.collect(output.extend, time.monotonic() + timeout)
+        if status is None:
+            self.kill()
+            raise subprocess.TimeoutExpired(command, timeout)
+        return ShellResult(returncode=status, output=bytes(output))
+
+    def send(self, command: str, trace: Optional[PressTrace] = None):
+        """
+        📨 Hand a command to the shell without waiting for it
+
+        Raises:
+            BrokenPipeError: The shell died before the command was sent
+        """
+        self._drain()
+        # Braces keep alias expansion intact while the redirections cover the whole command
+        payload = (
+            f"{{ {command}\n}} </dev/null 2>&1\n"
+            f"printf '\\n%s %d\\n' '{self._marker.decode()}' \"$?\"\n"
+        )
+        self._write(payload.encode())
+        self._pending = bytearray()
+        self.commands_run += 1
+        if trace:
+            trace.mark('spawn')
+
+    def _write(self, data: bytes):
+        if not self.is_alive():
+            raise BrokenPipeError("shell is not running")
+        self._process.stdin.write(data)
+        self._process.stdin.flush()
+
+    def _drain(self):
+        """🚿 Discard stray output (e.g. from background jobs) left in the pipe"""
+        fd = self._process.stdout.fileno()
+        while select.select([fd], [], [], 0)[0]:
+            if not os.read(fd, 65536):
+                break
+
+    def collect(self, sink: Callable[[bytes], None],
+                deadline: Optional[float] = None) -> Optional[int]:
+        """
+        📥 Stream the running command's output into sink until its sentinel
+
+        Only a marker-sized tail is held back, so output never accumulates here.
+        Can be called again after a missed deadline to keep waiting.
+
+        Returns:
+            int: Exit status (-1 if the shell died), or None if the deadline passed first
+        """
+        fd = self._process.stdout.fileno()
+        marker = b"\n" + self._marker + b" "
+        # Longest sentinel line: marker, status digits, newline
+        hold = len(marker) + 16
+        pending = self._pending
+
+        while True:
+            idx = pending.find(marker)
+            if idx != -1:
+                if idx:
+                    sink(bytes(pending[:idx]))
+                    del pending[:idx]
+                end = pending.find(b"\n", len(marker))
+                if end != -1:
+                    status = int(pending[len(marker):end] or b"1")
+                    del pending[:]
+                    return status
+            elif len(pending) > hold:
+                sink(bytes(pending[:-hold]))
+                del pending[:-hold]
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+
+            if select.select([fd], [], [], remaining)[0]:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    if pending:
+                        sink(bytes(pending))
+                        del pending[:]
+                    self.kill()
+                    return -1
+                pending += chunk
+
+    def close(self, timeout: float = 1.0):
+        """👋 Ask the shell to exit, killing it if it doesn't"""
+        if not self._process:
+            return
+        try:
+            if self.is_alive():
+                self._process.stdin.write(b"exit\n")
+                self._process.stdin.close()
+                self._process.wait(timeout)
+        except Exception:
+            self.kill()
+
+    def kill(self):
+        """💀 Kill the shell process (background jobs it started are left alone)"""
+        if self._process and self._process.poll() is None:
+            try:
+                self._process.send_signal(signal.SIGKILL)
+                self._process.wait(1.0)
+            except Exception as e:
+                logger.debug(f"⚠️ Failed to kill shell {self.pid}: {e}")
+
+
+class ShellPool:
+    """Pool of warm interactive shells with recycling and health checks"""
+
+    def __init__(self, shell_path: str = '/bin/zsh', size: int = 2,
+                 max_commands: int = 100, work_dir: Optional[str] = None,
+                 rc_check_interval: float = 1.0, health_interval: float = 30.0):
+        """
+        Args:
+            health_interval: Seconds between health checks of idle shells (0 disables)
+        """
+        self.shell_path = shell_path
+        self.size = size
+        self.max_commands = max_commands
+        self.work_dir = work_dir
+        self.rc_check_interval = rc_check_interval
+        self.health_interval = health_interval
+
+        self._idle: List[WarmShell] = []
+        self._busy: Set[ProcessFuture] = set()  # Commands running now
+        self._lock = threading.Lock()
+        self._spawning = 0
+        self._closed = False
+        self._fingerprint = rc_fingerprint(shell_path)
+        self._rc_checked_at = time.monotonic()
+        self._stop = threading.Event()
+
+    def start(self):
+        """🔥 Warm up shells in the background and start the health checks"""
+        for _ in range(self.size):
+            self._spawn_async()
+        if self.health_interval > 0:
+            threading.Thread(target=self._maintain, name="launchpad-shell-health",
+                             daemon=True).start()
+
+    def _maintain(self):
+        """🩺 Health-check idle shells every health_interval until closed"""
+        while not self._stop.wait(self.health_interval):
+            try:
+                healthy = self.health_check()
+            except Exception as e:
+                logger.warning(f"⚠️ Shell health check failed: {e}")
+                continue
+            logger.debug(f"🩺 {healthy} warm shell(s) healthy")
+
+    def _spawn_async(self):
+        with self._lock:
+            if self._closed or len(self._idle) + self._spawning >= self.size:
+                return
+            self._spawning += 1
+        threading.Thread(target=self._spawn, name="launchpad-shell-warmup", daemon=True).start()
+
+    def _spawn(self):
+        shell = WarmShell(self.shell_path, self.work_dir)
+        try:
+            shell.start()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to warm up {self.shell_path}: {e}")
+            shell.kill()
+            with self._lock:
+                self._spawning -= 1
+            return
+
+        with self._lock:
+            self._spawning -= 1
+            pooled = not self._closed
+            if pooled:
+                self._idle.append(shell)
+        if pooled:
+            logger.debug(f"🔥 Warm shell ready (pid {shell.pid})")
+        else:
+            shell.close()
+
+    def _check_rc_files(self):
+        """🔄 Retire every idle shell once the rc files change"""
+        now = time.monotonic()
+        if now - self._rc_checked_at < self.rc_check_interval:
+            return
+        self._rc_checked_at = now
+        fingerprint = rc_fingerprint(self.shell_path)
+        if fingerprint == self._fingerprint:
+            return
+        logger.info("📜 Shell rc files changed, recycling warm shells")
+        self._fingerprint = fingerprint
+        with self._lock:
+            stale, self._idle = self._idle, []
+        for shell in stale:
+            shell.close()
+
+    def _is_reusable(self, shell: WarmShell) -> bool:
+        return (
+            shell.is_alive()
+            and shell.commands_run < self.max_commands
+            and shell.fingerprint == self._fingerprint
+        )
+
+    def acquire(self) -> Optional[WarmShell]:
+        """📥 Take an idle shell, or None if none is ready"""
+        self._check_rc_files()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                shell = self._idle.pop()
+            if shell.is_alive():
+                return shell
+            shell.kill()
+        self._spawn_async()
+        return None
+
+    def release(self, shell: WarmShell):
+        """📤 Return a shell, recycling it if it's spent or stale (or the pool is full)"""
+        if self._is_reusable(shell):
+            with self._lock:
+                # Shells spawned for a burst of presses are let go once it's over
+                if not self._closed and len(self._idle) < self.size:
+                    self._idle.append(shell)
+                    return
+        shell.close()
+        self._spawn_async()
+
+    def run(self, command: str, timeout: float,
+            trace: Optional[PressTrace] = None,
+            sink: Optional[Callable[[bytes], None]] = None) -> Optional[ProcessFuture]:
+        """
+        ▶️ Run a command in a warm shell, streaming its output into sink
+
+        Waits up to timeout on the calling thread; a command still running
+        after that is followed on a background thread and its shell is
+        returned to the pool once it finishes. Terminating the returned
+        future stops the shell's process group, command included.
+
+        Returns:
+            ProcessFuture resolving to the exit status, or None when no warm
+            shell could take the command
+        """
+        shell = self.acquire()
+        if shell is None:
+            return None
+        try:
+            shell.send(command, trace)
+        except BrokenPipeError:
+            # Nothing was sent, so the caller can safely fall back
+            shell.kill()
+            self._spawn_async()
+            return None
+
+        sink = sink or (lambda data: None)
+        completion = ProcessFuture(shell.pid)
+        with self._lock:
+            self._busy.add(completion)
+        completion.add_done_callback(self._done)
+        self._collect(shell, completion, sink, time.monotonic() + timeout)
+        if not completion.done():
+            threading.Thread(
+                target=self._collect,
+                args=(shell, completion, sink, None),
+                name="launchpad-shell-follow",
+                daemon=True
+            ).start()
+        return completion
+
+    def _done(self, completion: ProcessFuture):
+        with self._lock:
+            self._busy.discard(completion)
+
+    def _collect(self, shell: WarmShell, completion: ProcessFuture,
+                 sink: Callable[[bytes], None], deadline: Optional[float]):
+        try:
+            status = shell.collect(sink, deadline)
+        except Exception as e:
+            shell.kill()
+            self._spawn_async()
+            completion.set_exception(e)
+            return
+        if status is None:
+            return
+        self.release(shell)
+        completion.set_result(status)
+
+    def health_check(self) -> int:
+        """
+        🩺 Ping idle shells one at a time, replacing unresponsive ones
+
+        Only the shell being pinged is out of the pool, so presses meanwhile
+        still find a warm shell.
+
+        Returns:
+            int: Shells that answered
+        """
+        with self._lock:
+            shells = list(self._idle)
+        healthy = 0
+        for shell in shells:
+            with self._lock:
+                if self._closed:
+                    break
+                if shell not in self._idle:
+                    continue  # Taken by a press meanwhile
+                self._idle.remove(shell)
+            if shell.ping():
+                healthy += 1
+                self.release(shell)
+            else:
+                shell.kill()
+                self._spawn_async()
+        return healthy
+
+    def stats(self) -> dict:
+        """📊 Pool occupancy"""
+        with self._lock:
+            return {'idle': len(self._idle), 'spawning': self._spawning, 'size': self.size}
+
+    def close(self):
+        """🧹 Shut down all shells, stopping commands still running in them"""
+        self._stop.set()
+        with self._lock:
+            self._closed = True
+            shells, self._idle = self._idle, []
+            busy = list(self._busy)
+        for shell in shells:
+            shell.close()
+        for completion in busy:
+            completion.terminate()
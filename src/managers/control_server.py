@@ -0,0 +1,334 @@
+"""
+🎛️ Control Server Module
+Line-delimited JSON over a UNIX socket, so scripts can change mappings, press
+pads and read stats while the app runs.
+
+Flow:
+1. The socket is bound when the app starts (mode 0600) and served on the app's event loop
+2. Each line is one request {"id": ..., "op": ..., ...}; each gets one line back:
+   {"id": ..., "ok": true, "result": ...} or {"id": ..., "ok": false, "error": "..."}
+3. Requests run on the loop between MIDI events, so a batch is applied whole
+   before the next press is seen, with one LED write per device
+4. Only "run" waits (for the command to finish); other clients keep being served
+
+Operations:
+    ping                          -> "pong"
+    list                          -> mappings of every device
+    batch  ops=[...]              -> every op validated first, then all applied:
+           {"op": "add", "mapping": {...same keys as the mapping file...}}
+           {"op": "remove", "x": 0, "y": 0}   (or chord/sequence; page, device optional)
+           {"op": "toggle", "x": 0, "y": 0}
+    press  x, y (or pads=[[x, y], ...] held together), device
+    run    x, y, device           -> the ExecutionResult once the command exits
+    button x, y, device           -> ButtonHandler.get_button_info
+    stats                         -> executor queue, press/result-cache counters,
+                                     latency summary and seen buttons
+
+Mappings changed here last until the mapping file is next (re)loaded.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import stat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ..config.mapping_file import MappingFileError, MappingSpec, parse_cell, parse_mappings
+from ..models.execution import ExecutionResult
+from ..utils.constants import MIDI_NOTE_OFF, MIDI_NOTE_ON, MAX_VELOCITY
+
+if TYPE_CHECKING:
+    from ..app import LaunchpadApp
+    from .device_manager import LaunchpadDevice
+
+logger = logging.getLogger(__name__)
+
+MAX_REQUEST_BYTES = 1024 * 1024
+MAX_OUTPUT_CHARS = 4096  # Output tail returned by "run"
+
+
+class ControlError(Exception):
+    """❌ A request that can't be carried out; sent back as the error"""
+
+
+class ControlServer:
+    """Serves control requests for one LaunchpadApp on its event loop"""
+
+    def __init__(self, app: 'LaunchpadApp', path: str):
+        self.app = app
+        self.path = Path(path).expanduser()
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._handlers = {
+            'ping': self._ping,
+            'list': self._list,
+            'batch': self._batch,
+            'press': self._press,
+            'run': self._run,
+            'button': self._button,
+            'stats': self._stats,
+        }
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """
+        ▶️ Bind the socket now and start serving it on loop
+
+        Returns:
+            bool: False if the socket couldn't be bound (e.g. another instance owns it)
+        """
+        try:
+            sock = self._bind()
+        except OSError as e:
+            logger.error(f"❌ Control socket {self.path} unavailable: {e}")
+            return False
+        asyncio.run_coroutine_threadsafe(self._serve(sock), loop)
+        logger.info(f"🎛️ Control socket listening on {self.path}")
+        return True
+
+    def _bind(self) -> socket.socket:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            if not stat.S_ISSOCK(self.path.stat().st_mode):
+                raise OSError(f"{self.path} exists and isn't a socket")
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.path))
+            except OSError:
+                self.path.unlink()  # Left behind by an instance that didn't shut down
+            else:
+                raise OSError("another instance is serving it")
+            finally:
+                probe.close()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)  # Nobody else may drive our shell
+        try:
+            sock.bind(str(self.path))
+        except OSError:
+            sock.close()
+            raise
+        finally:
+            os.umask(umask)
+        sock.listen(16)
+        sock.setblocking(False)
+        return sock
+
+    async def _serve(self, sock: socket.socket):
+        self._server = await asyncio.start_unix_server(
+            self._client, sock=sock, limit=MAX_REQUEST_BYTES
+        )
+
+    async def close(self):
+        """🛑 Stop serving (on the loop) and remove the socket"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        # Hang up on connected clients so their handlers end on EOF rather than by cancellation
+        clients = list(self._clients.items())
+        for writer, _ in clients:
+            writer.close()
+        if clients:
+            await asyncio.wait([task for _, task in clients], timeout=1.0)
+        self.unlink()
+
+    def unlink(self):
+        """🧹 Remove the socket file"""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    async def _client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._clients[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # Longer than MAX_REQUEST_BYTES
+                    writer.write(self._encode(None, error="request too long"))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                writer.write(await self.handle(line))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._clients[writer]
+            writer.close()
+
+    async def handle(self, line: bytes) -> bytes:
+        """🎯 Answer one request line with one response line"""
+        self.requests += 1
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ControlError("request must be a JSON object")
+            request_id = request.get('id')
+            handler = self._handlers.get(request.get('op'))
+            if handler is None:
+                raise ControlError(f"unknown op {request.get('op')!r}; "
+                                   f"expected one of {', '.join(self._handlers)}")
+            result = handler(request)
+            if asyncio.iscoroutine(result):
+                result = await result
+            return self._encode(request_id, result)
+        except (ControlError, MappingFileError, KeyError) as e:
+            message = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+            return self._encode(request_id, error=message)
+        except ValueError as e:
+            return self._encode(request_id, error=f"bad request: {e}")
+        except Exception as e:
+            logger.error(f"❌ Control request failed: {e}")
+            return self._encode(request_id, error=f"internal error: {e}")
+
+    @staticmethod
+    def _encode(request_id: Any, result: Any = None, error: Optional[str] = None) -> bytes:
+        response: Dict[str, Any] = {'id': request_id, 'ok': error is None}
+        if error is None:
+            response['result'] = result
+        else:
+            response['error'] = error
+        return (json.dumps(response, default=str) + "\n").encode()
+
+    # 🧰 Operations
+
+    def _ping(self, request: dict) -> str:
+        return 'pong'
+
+    def _list(self, request: dict) -> Dict[str, List[dict]]:
+        return {
+            name: device.mapping_manager.list_mappings()
+            for name, device in self.app.devices.items()
+        }
+
+    def _batch(self, request: dict) -> Dict[str, int]:
+        """📦 Validate every op, then apply them all with one LED write per device"""
+        ops = request.get('ops')
+        if not isinstance(ops, list) or not ops:
+            raise ControlError("batch needs a non-empty ops list")
+
+        added: Dict[str, List[MappingSpec]] = {}
+        removed: Dict[str, List[tuple]] = {}
+        toggled: List[Tuple['LaunchpadDevice', tuple]] = []
+        entries = []
+        for i, op in enumerate(ops):
+            where = f"op #{i + 1}"
+            kind = op.get('op') if isinstance(op, dict) else None
+            if kind == 'add':
+                entries.append(op.get('mapping'))
+            elif kind in ('remove', 'toggle'):
+                device, cell = self._cell(op, where)
+                if device.mapping_manager.lookup(cell) is None:
+                    raise ControlError(f"{where}: nothing mapped there")
+                if kind == 'remove':
+                    removed.setdefault(device.name, []).append(cell)
+                else:
+                    toggled.append((device, cell))
+            else:
+                raise ControlError(f"{where}: op must be add, remove or toggle")
+        for spec in parse_mappings(entries) if entries else ():
+            added.setdefault(self._device(spec.device).name, []).append(spec)
+
+        for name in set(added) | set(removed):
+            self.app.devices[name].check(added.get(name, ()), removed.get(name, ()))
+
+        # Everything checked out: apply in one go (nothing else runs on the loop meanwhile)
+        for name in set(added) | set(removed):
+            self.app.devices[name].edit(added.get(name, ()), removed.get(name, ()))
+        for device, cell in toggled:
+            device.toggle(cell)
+        return {
+            'added': sum(len(specs) for specs in added.values()),
+            'removed': sum(len(cells) for cells in removed.values()),
+            'toggled': len(toggled),
+        }
+
+    def _press(self, request: dict) -> int:
+        """👆 Press (then release) pads as if on the hardware, gestures included"""
+        device = self._device(request.get('device'))
+        pads = request['pads'] if 'pads' in request else [[request.get('x'), request.get('y')]]
+        if not isinstance(pads, list) or not pads or \
+                not all(isinstance(pad, list) and len(pad) == 2 for pad in pads):
+            raise ControlError("pads must list [x, y] pairs")
+        notes = [self._note(x, y) for x, y in pads]
+        handle = device.button_handler.handle_event
+        for note in notes:
+            handle([MIDI_NOTE_ON, note, MAX_VELOCITY])
+        for note in notes:
+            handle([MIDI_NOTE_OFF, note, 0])
+        return len(notes)
+
+    async def _run(self, request: dict) -> Optional[dict]:
+        """▶️ Run the pad's mapping on the visible page and wait for its outcome"""
+        device = self._device(request.get('device'))
+        note = self._note(request.get('x'), request.get('y'))
+        mapping = device.mapping_manager.get_mapping(note % 10, note // 10)
+        if mapping is None:
+            raise ControlError("nothing mapped there")
+        result = await asyncio.wrap_future(device.mapping_manager.execute(mapping))
+        return None if result is None else self._result(result)
+
+    def _button(self, request: dict) -> Optional[dict]:
+        device = self._device(request.get('device'))
+        return device.button_handler.get_button_info(self._note(request.get('x'), request.get('y')))
+
+    def _stats(self, request: dict) -> dict:
+        return {
+            'executor': self.app.execution_manager.stats(),
+            'presses': self.app.press_stats(),
+            'result_cache': self.app.result_cache.stats(),
+            'latency': self.app.metrics.summary(),
+            'devices': {
+                name: {
+                    'connected': device.midi_manager.connected,
+                    'page': device.mapping_manager.page,
+                    'buttons': [
+                        device.button_handler.get_button_info(note)
+                        for note in device.button_handler.button_states
+                    ],
+                }
+                for name, device in self.app.devices.items()
+            },
+            'requests': self.requests,
+        }
+
+    # 🔎 Request helpers
+
+    def _device(self, name: Any) -> 'LaunchpadDevice':
+        if name is not None and not isinstance(name, str):
+            raise ControlError("device must be a name")
+        return self.app.get_device(name)
+
+    def _cell(self, op: dict, where: str) -> Tuple['LaunchpadDevice', tuple]:
+        entry = {key: value for key, value in op.items() if key != 'op'}
+        device, cell = parse_cell(entry, where)
+        return self._device(device), cell
+
+    @staticmethod
+    def _note(x: Any, y: Any) -> int:
+        for value in (x, y):
+            if not isinstance(value, int) or isinstance(value, bool) or not 0 <= value <= 9:
+                raise ControlError("x and y must be 0-9")
+        return x + y * 10
+
+    @staticmethod
+    def _result(result: ExecutionResult) -> dict:
+        return {
+            'alias': result.alias,
+            'returncode': result.returncode,
+            'success': result.success,
+            'duration': result.duration,
+            'timed_out': result.timed_out,
+            'error': result.error,
+            'output': result.output.decode(errors='replace')[-MAX_OUTPUT_CHARS:],
+            'output_bytes': result.output_bytes,
+        }
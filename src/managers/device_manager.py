@@ -0,0 +1,286 @@
+"""
+🎛️ Device Manager Module
+Per-controller state, so one app can drive several Launchpads at once.
+
+Flow:
+1. Each LaunchpadDevice owns its MIDI port, LED framebuffer/scheduler,
+   mapping pages and button state
+2. Execution, alias caches, shell pool and metrics stay shared in LaunchpadApp
+3. Every device's input is routed to one dispatcher tagged with the device
+"""
+
+import asyncio
+import logging
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from ..config.mapping_file import MappingFileError, MappingSpec, is_page_control
+from ..handlers.button_handler import ButtonHandler
+from ..handlers.gesture_matcher import compile_gestures
+from ..models.launch_policy import LaunchPolicy
+from ..models.pipeline import Pipeline
+from ..models.press_policy import PressPolicy
+from ..utils.constants import Colors, DEFAULT_DEVICE, PAGE_CONTROLS, PAGE_NEXT, PAGE_PREV
+from ..utils.metrics import LatencyMetrics
+from .led_scheduler import LEDScheduler
+from .mapping_manager import MappingManager
+from .midi_manager import MIDIManager
+
+logger = logging.getLogger(__name__)
+
+
+class LaunchpadDevice:
+    """One connected controller: port, LEDs, pages and pad callbacks"""
+
+    def __init__(self, name: str, port_name: str, midi_manager: MIDIManager,
+                 led_scheduler: LEDScheduler, mapping_manager: MappingManager,
+                 button_handler: ButtonHandler, metrics: LatencyMetrics,
+                 chord_window: float = 0.08, sequence_timeout: float = 0.5):
+        self.name = name
+        self.port_name = port_name
+        self.midi_manager = midi_manager
+        self.led_scheduler = led_scheduler
+        self.mapping_manager = mapping_manager
+        self.button_handler = button_handler
+        self.metrics = metrics
+        self.chord_window = chord_window          # Defaults for gestures without window_ms
+        self.sequence_timeout = sequence_timeout
+        self.running = False
+
+    def connect(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
+        """🔌 Open the port and start LED rendering (on loop, if given)"""
+        if not self.midi_manager.connect(self.port_name):
+            return False
+        self.led_scheduler.start(loop)
+        self.running = True
+        return True
+
+    def listen(self, dispatch: Callable, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """🎹 Route this device's input to dispatch(device, event, data); gesture timeouts run on loop"""
+        if loop is not None:
+            self.button_handler.set_timer(loop.call_later)
+        self.midi_manager.set_callback(lambda event, data=None: dispatch(self, event, data))
+
+    def close(self):
+        """🧹 Stop LED rendering, blank the pads and close the port"""
+        self.running = False
+        self.led_scheduler.stop()
+        self.midi_manager.cleanup()
+
+    # 🗺️ Mappings
+
+    def add_mapping(self, x: int, y: int, color: int, alias: str,
+                    max_concurrent: Optional[int] = None, page: int = 0,
+                    policy: Optional[PressPolicy] = None,
+                    pipeline: Optional[Pipeline] = None,
+                    launch: Optional[LaunchPolicy] = None):
+        """➕ Add new button mapping (raises MappingFileError on a reserved page control pad)"""
+        self.edit([MappingSpec(
+            x, y, color, alias, max_concurrent, page, self.name, policy or PressPolicy(),
+            pipeline=pipeline, launch=launch or LaunchPolicy()
+        )])
+
+    def _add_mapping(self, spec: MappingSpec):
+        mapping = self.mapping_manager.create_mapping(
+            spec.x, spec.y, spec.color, spec.alias, spec.max_concurrent, spec.page,
+            spec.policy, spec.pipeline, spec.launch
+        )
+        x, y = spec.x, spec.y
+        if spec.page == self.mapping_manager.page:
+            self.set_led(x, y, spec.color)
+        # Register callback (shared by every page; the active page decides what runs)
+        self.button_handler.register_callback(
+            mapping.button.note,
+            lambda: self.mapping_manager.execute_mapping(x, y, self.metrics.take())
+        )
+        logger.info(f"✨ Added mapping: {self._where(x, y)} -> {spec.alias}")
+
+    def add_gesture(self, gesture: str, pads: Tuple[Tuple[int, int], ...], alias: str,
+                    max_concurrent: Optional[int] = None, page: int = 0,
+                    policy: Optional[PressPolicy] = None, window_ms: int = 0,
+                    pipeline: Optional[Pipeline] = None,
+                    launch: Optional[LaunchPolicy] = None):
+        """➕ Add a chord or sequence mapping"""
+        pads = tuple(tuple(pad) for pad in pads)
+        self.edit([MappingSpec(
+            pads[0][0], pads[0][1], Colors.OFF, alias, max_concurrent, page, self.name,
+            policy or PressPolicy(), gesture, pads, window_ms, pipeline, launch or LaunchPolicy()
+        )])
+        return self.mapping_manager.lookup((page, gesture, pads))
+    
+    def remove_gesture(self, cell: tuple):
+        """➖ Remove a chord or sequence mapping"""
+        self.edit(removed=[cell])
+    
+    def sync_gestures(self):
+        """🎹 Recompile the visible page's chords and sequences for the matcher"""
+        self.button_handler.set_gestures(compile_gestures(
+            (
+                mapping.gesture,
+                [x + y * 10 for x, y in mapping.pads],
+                self._window(mapping),
+                lambda mapping=mapping: self.mapping_manager.execute(mapping, self.metrics.take())
+            )
+            for mapping in self.mapping_manager.gestures()
+        ))
+    
+    def _window(self, mapping) -> float:
+        """⏱️ Seconds a gesture allows: its own window_ms, else the device default"""
+        if mapping.window_ms:
+            return mapping.window_ms / 1000
+        return self.chord_window if mapping.gesture == 'chord' else self.sequence_timeout
+    
+    def remove_mapping(self, x: int, y: int, page: int = 0):
+        """➖ Remove a button mapping and turn its LED off"""
+        self.edit(removed=[(page, x, y)])
+
+    def _remove_mapping(self, x: int, y: int, page: int):
+        mapping = self.mapping_manager.remove_mapping(x, y, page)
+        if mapping:
+            if not self.mapping_manager.is_mapped(x, y):
+                self.button_handler.unregister_callback(mapping.button.note)
+            if page == self.mapping_manager.page:
+                self.set_led(x, y, Colors.OFF)
+
+    def apply(self, specs: List[MappingSpec]) -> bool:
+        """
+        🔀 Bring this device's mappings in line with specs, touching only what changed
+
+        Returns:
+            bool: True if anything changed
+        """
+        changes = self.mapping_manager.diff(specs)
+        if not changes:
+            return False
+        self.edit(changes.added + changes.changed, changes.removed)
+        logger.info(
+            f"🗂️ {self.name}: {len(changes.added)} added, "
+            f"{len(changes.changed)} changed, {len(changes.removed)} removed"
+        )
+        return True
+
+    def check(self, specs: Iterable[MappingSpec] = (), removed: Iterable[tuple] = ()):
+        """
+        🚧 Raise MappingFileError if, after edit(specs, removed), the layout would have
+        several pages and a mapping on one of the pads that switch between them
+        """
+        removed = set(removed)
+        cells = {
+            mapping.cell: mapping.pads or ((mapping.button.x, mapping.button.y),)
+            for mapping in self.mapping_manager.mappings() if mapping.cell not in removed
+        }
+        for spec in specs:
+            cells[spec.cell] = spec.pads or ((spec.x, spec.y),)
+        if len({0} | {cell[0] for cell in cells}) < 2:
+            return
+        for pads in cells.values():
+            for x, y in pads:
+                if is_page_control(x, y):
+                    raise MappingFileError(
+                        f"({x}, {y}) is reserved for page switching in multi-page layouts"
+                    )
+
+    def edit(self, specs: Iterable[MappingSpec] = (), removed: Iterable[tuple] = ()):
+        """
+        ✏️ Remove mappings by cell, then create or replace specs, in one LED write
+
+        Every change to the mappings goes through here, so the page controls
+        follow the number of pages. Nothing changes if check() fails.
+        """
+        specs, removed = list(specs), list(removed)
+        self.check(specs, removed)
+        with self.led_batch():
+            for cell in removed:
+                if isinstance(cell[1], str):
+                    self.mapping_manager.remove_gesture(cell)
+                else:
+                    page, x, y = cell
+                    self._remove_mapping(x, y, page)
+            for spec in specs:
+                if spec.gesture:
+                    self.mapping_manager.create_gesture(
+                        spec.gesture, spec.pads, spec.alias, spec.max_concurrent, spec.page,
+                        spec.policy, spec.window_ms, spec.pipeline, spec.launch
+                    )
+                    continue
+                self._add_mapping(spec)
+            # Don't leave the pad showing a page that no longer has anything on it
+            if self.mapping_manager.page and self.mapping_manager.page_empty:
+                self.switch_page(0)
+            self.sync_page_controls()
+            self.sync_gestures()
+
+    def toggle(self, cell: tuple) -> Optional[bool]:
+        """🔄 Enable or disable the mapping at a cell; returns its new state (None if unmapped)"""
+        mapping = self.mapping_manager.lookup(cell)
+        if mapping is None:
+            return None
+        mapping.active = not mapping.active
+        logger.info(f"{'🟢' if mapping.active else '🔴'} {mapping.alias} "
+                    f"{'activated' if mapping.active else 'deactivated'}")
+        return mapping.active
+
+    # 📑 Pages
+
+    def switch_page(self, page: int) -> bool:
+        """📑 Show another page: swaps the dispatch table and pushes its frame in one write"""
+        self.button_handler.flush_gestures()
+        frame = self.mapping_manager.switch_page(page)
+        if frame is None:
+            return False
+        self.show_frame(frame)
+        self.sync_gestures()
+        return True
+
+    def step_page(self, step: int) -> bool:
+        """⏭️ Show the next (1) or previous (-1) page"""
+        self.button_handler.flush_gestures()
+        frame = self.mapping_manager.step_page(step)
+        if frame is None:
+            return False
+        self.show_frame(frame)
+        self.sync_gestures()
+        return True
+
+    def sync_page_controls(self):
+        """📚 Claim the page control pads while more than one page exists, release them otherwise"""
+        multi_page = self.mapping_manager.multi_page
+        frame = self.mapping_manager.page_frame()
+        for x, y in PAGE_CONTROLS:
+            note = x + y * 10
+            if multi_page:
+                if (x, y) == PAGE_PREV:
+                    callback = lambda: self.step_page(-1)
+                elif (x, y) == PAGE_NEXT:
+                    callback = lambda: self.step_page(1)
+                else:
+                    callback = lambda page=y: self.switch_page(page)
+                self.button_handler.register_callback(note, callback)
+            elif not self.mapping_manager.is_mapped(x, y):
+                self.button_handler.unregister_callback(note)
+            self.set_led(x, y, frame[note])
+
+    # 💡 LEDs
+
+    def set_led(self, x: int, y: int, color: int):
+        # Once running, go through the scheduler so status effects don't restore a stale colour
+        if self.running:
+            self.led_scheduler.set_color(x, y, color)
+        else:
+            self.midi_manager.set_button_color(x, y, color)
+
+    def show_frame(self, frame: bytes):
+        if self.running:
+            self.led_scheduler.show_frame(frame)
+        else:
+            self.midi_manager.set_frame(frame)
+
+    def led_batch(self):
+        # Once running, LED changes go through the scheduler, so batch there instead
+        return self.led_scheduler.batch() if self.running else self.midi_manager.batch()
+
+    def shows(self, mapping) -> bool:
+        """👀 True if a mapping's pad is on this device's visible page"""
+        return mapping.device == self.name and mapping.page == self.mapping_manager.page
+
+    def _where(self, x: int, y: int) -> str:
+        return f"({x}, {y})" if self.name == DEFAULT_DEVICE else f"{self.name} ({x}, {y})"
@@ -0,0 +1,432 @@
+"""
+⚙️ Execution Manager Module
+Runs mapped actions off the MIDI callback so it never blocks.
+
+Flow:
+1. The MIDI callback submits a job and gets a Future back immediately
+2. Jobs wait in a bounded submission queue
+3. Worker threads (ExecutionManager) or event-loop tasks (AsyncExecutionManager)
+   pick jobs up and run them
+4. Per-mapping limits defer extra jobs until a running one finishes
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionRejected(RuntimeError):
+    """🚫 Set on a job's future when it could not be accepted"""
+
+
+@dataclass
+class ExecutionJob:
+    """📦 A unit of work waiting for a worker"""
+    key: Hashable
+    func: Callable[..., Any]
+    args: tuple
+    future: Future
+
+
+class _KeyedLimits:
+    """
+    🎚️ Admission shared by both executors: a bounded backlog, per-key
+    concurrency limits and per-key waiting queues
+
+    Backpressure counters:
+        rejected   backlog full, press dropped
+        dropped    the key's own queue was full
+        coalesced  backlog past its high-water mark and the key already has a
+                   press waiting, so the new one is folded into it
+    """
+
+    def __init__(self, queue_size: int, default_limit: int):
+        self.queue_size = max(1, queue_size)
+        self.default_limit = max(1, default_limit)
+        self.high_water = max(1, self.queue_size * 3 // 4)
+
+        self._lock = threading.Lock()
+        self._limits: Dict[Hashable, int] = {}
+        self._queue_limits: Dict[Hashable, int] = {}
+        self._active: Dict[Hashable, int] = {}
+        self._deferred: Dict[Hashable, Deque[ExecutionJob]] = {}
+        self._backlog = 0
+        self._running = 0
+        self._closed = False
+        self.completed = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def set_limit(self, key: Hashable, limit: Optional[int],
+                  queue_limit: Optional[int] = None):
+        """
+        🎚️ Set max concurrent jobs for a key (None restores the default)
+
+        Args:
+            queue_limit: Max jobs waiting for the key (None = bounded by queue_size)
+        """
+        with self._lock:
+            if limit is None:
+                self._limits.pop(key, None)
+            else:
+                self._limits[key] = max(1, limit)
+            if queue_limit is None:
+                self._queue_limits.pop(key, None)
+            else:
+                self._queue_limits[key] = max(0, queue_limit)
+
+    def load(self, key: Hashable) -> int:
+        """🔢 Jobs for key that are running or waiting"""
+        with self._lock:
+            return self._active.get(key, 0) + len(self._deferred.get(key, ()))
+
+    def _admit_locked(self, job: ExecutionJob) -> bool:
+        """
+        🚪 Account for a new job (call with _lock held)
+
+        Returns:
+            bool: True if the job may start now; otherwise it was deferred
+            or its future already settled
+        """
+        key, future = job.key, job.future
+        if self._closed:
+            future.set_exception(ExecutionRejected("execution manager is shut down"))
+            return False
+        if self._backlog >= self.queue_size:
+            self.rejected += 1
+            logger.warning(f"🚦 Execution queue full, dropping job for {key}")
+            future.set_exception(ExecutionRejected("execution queue is full"))
+            return False
+
+        active = self._active.get(key, 0)
+        if active < self._limits.get(key, self.default_limit):
+            self._backlog += 1
+            self._active[key] = active + 1
+            return True
+
+        waiting = len(self._deferred.get(key, ()))
+        if waiting >= self._queue_limits.get(key, self.queue_size):
+            self.dropped += 1
+            logger.debug(f"🚦 Queue for {key} full ({waiting} waiting), dropping job")
+            future.set_exception(ExecutionRejected(f"queue for {key} is full"))
+            return False
+        if waiting and self._backlog >= self.high_water:
+            self.coalesced += 1
+            logger.debug(f"🫧 Backlog high, folding job for {key} into the waiting one")
+            future.set_result(None)
+            return False
+
+        self._backlog += 1
+        self._deferred.setdefault(key, deque()).append(job)
+        logger.debug(f"⏳ Deferred job for {key} ({active} running)")
+        return False
+
+    def _next_locked(self, key: Hashable) -> Optional[ExecutionJob]:
+        """🔓 Free a slot for key, returning a deferred job to start in its place"""
+        deferred = self._deferred.get(key)
+        if deferred and not self._closed:
+            job = deferred.popleft()
+            if not deferred:
+                del self._deferred[key]
+            return job
+        remaining = self._active.get(key, 1) - 1
+        if remaining > 0:
+            self._active[key] = remaining
+        else:
+            self._active.pop(key, None)
+        return None
+
+    def _stats_locked(self) -> dict:
+        return {
+            'queue_depth': self._backlog,
+            'running': self._running,
+            'deferred': sum(len(d) for d in self._deferred.values()),
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'dropped': self.dropped,
+            'coalesced': self.coalesced,
+        }
+
+
+class ExecutionManager(_KeyedLimits):
+    """Bounded worker pool with per-key concurrency limits"""
+
+    # Jobs are plain callables run on worker threads
+    asynchronous = False
+
+    def __init__(self, pool_size: int = 4, queue_size: int = 64,
+                 default_limit: int = 1):
+        super().__init__(queue_size, default_limit)
+        self.pool_size = max(1, pool_size)
+        self._queue: "queue.SimpleQueue[Optional[ExecutionJob]]" = queue.SimpleQueue()
+        self._workers: List[threading.Thread] = []
+
+    def start(self):
+        """🚀 Start worker threads (idempotent)"""
+        with self._lock:
+            self._start_locked()
+
+    def _start_locked(self):
+        if self._workers or self._closed:
+            return
+        for i in range(self.pool_size):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"launchpad-exec-{i}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+        logger.debug(f"✅ Started {self.pool_size} execution workers")
+
+    def submit(self, key: Hashable, func: Callable[..., Any], *args) -> Future:
+        """
+        📥 Queue a job without blocking
+
+        Args:
+            key: Concurrency key (usually the mapping coordinates)
+            func: Callable to run on a worker
+            *args: Arguments for func
+
+        Returns:
+            Future: Resolves with func's return value
+        """
+        future: Future = Future()
+        job = ExecutionJob(key=key, func=func, args=args, future=future)
+
+        with self._lock:
+            self._start_locked()
+            if not self._admit_locked(job):
+                return future
+
+        self._queue.put(job)
+        return future
+
+    def _worker_loop(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+
+            with self._lock:
+                self._backlog -= 1
+                self._running += 1
+
+            try:
+                if job.future.set_running_or_notify_cancel():
+                    try:
+                        result = job.func(*job.args)
+                    except BaseException as e:
+                        logger.error(f"💥 Job for {job.key} raised: {e}")
+                        job.future.set_exception(e)
+                    else:
+                        job.future.set_result(result)
+            finally:
+                self._release(job.key)
+
+    def _release(self, key: Hashable):
+        """🔓 Free a slot for key and promote a deferred job if any"""
+        with self._lock:
+            self._running -= 1
+            self.completed += 1
+            next_job = self._next_locked(key)
+
+        if next_job is not None:
+            self._queue.put(next_job)
+
+    def stats(self) -> dict:
+        """📊 Current queue and worker state"""
+        with self._lock:
+            return {'workers': len(self._workers), **self._stats_locked()}
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None):
+        """🧹 Stop accepting jobs, cancel pending ones and stop workers"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending = [job for jobs in self._deferred.values() for job in jobs]
+            self._deferred.clear()
+            self._backlog -= len(pending)
+            workers = list(self._workers)
+
+        for job in pending:
+            job.future.cancel()
+
+        # Drain queued jobs so workers reach the stop sentinels quickly
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job.future.cancel()
+                with self._lock:
+                    self._backlog -= 1
+
+        for _ in workers:
+            self._queue.put(None)
+
+        if wait:
+            for worker in workers:
+                worker.join(timeout)
+        logger.debug("👋 Execution workers stopped")
+
+
+class AsyncExecutionManager(_KeyedLimits):
+    """
+    Runs jobs as tasks on one asyncio loop, with the same limits as ExecutionManager
+
+    Coroutine functions run on the loop itself, so hundreds of in-flight
+    aliases cost no threads; plain callables go to the loop's default executor.
+    """
+
+    asynchronous = True
+
+    def __init__(self, max_inflight: int = 256, queue_size: int = 64,
+                 default_limit: int = 1):
+        super().__init__(queue_size, default_limit)
+        self.max_inflight = max(1, max_inflight)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """🚀 Attach to the loop jobs will run on (defaults to the running loop)"""
+        with self._lock:
+            if self._loop is not None or self._closed:
+                return
+            self._loop = loop or asyncio.get_running_loop()
+            self._slots = asyncio.Semaphore(self.max_inflight)
+        logger.debug(f"✅ Running up to {self.max_inflight} jobs on the event loop")
+
+    def submit(self, key: Hashable, func: Callable[..., Any], *args) -> Future:
+        """
+        📥 Queue a job without blocking (safe from any thread)
+
+        Args:
+            key: Concurrency key (usually the mapping coordinates)
+            func: Coroutine function or callable to run
+            *args: Arguments for func
+
+        Returns:
+            Future: Resolves with func's return value
+        """
+        future: Future = Future()
+        job = ExecutionJob(key=key, func=func, args=args, future=future)
+
+        with self._lock:
+            if self._loop is None and not self._closed:
+                future.set_exception(ExecutionRejected("execution manager is not running"))
+                return future
+            if not self._admit_locked(job):
+                return future
+
+        if self._on_loop():
+            self._spawn(job)
+        else:
+            self._loop.call_soon_threadsafe(self._spawn, job)
+        return future
+
+    def _on_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _spawn(self, job: ExecutionJob):
+        task = self._loop.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job: ExecutionJob):
+        started = False
+        try:
+            async with self._slots:
+                with self._lock:
+                    self._backlog -= 1
+                    self._running += 1
+                started = True
+                if not job.future.set_running_or_notify_cancel():
+                    return
+                try:
+                    if asyncio.iscoroutinefunction(job.func):
+                        result = await job.func(*job.args)
+                    else:
+                        result = await self._loop.run_in_executor(None, job.func, *job.args)
+                except asyncio.CancelledError:
+                    job.future.set_exception(ExecutionRejected("cancelled at shutdown"))
+                    raise
+                except Exception as e:
+                    logger.error(f"💥 Job for {job.key} raised: {e}")
+                    job.future.set_exception(e)
+                else:
+                    job.future.set_result(result)
+        except asyncio.CancelledError:
+            if not started:
+                job.future.cancel()
+            raise
+        finally:
+            self._release(job.key, started)
+
+    def _release(self, key: Hashable, started: bool):
+        """🔓 Free a slot for key and promote a deferred job if any"""
+        with self._lock:
+            if started:
+                self._running -= 1
+                self.completed += 1
+            else:
+                self._backlog -= 1
+            next_job = self._next_locked(key)
+
+        if next_job is not None:
+            self._spawn(next_job)
+
+    def stats(self) -> dict:
+        """📊 Current queue and task state"""
+        with self._lock:
+            return {'workers': 1 if self._loop else 0, **self._stats_locked()}
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None):
+        """🧹 Stop accepting jobs and cancel pending ones; in-flight tasks are cancelled unless wait"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending = [job for jobs in self._deferred.values() for job in jobs]
+            self._deferred.clear()
+            self._backlog -= len(pending)
+            loop = self._loop
+
+        for job in pending:
+            job.future.cancel()
+        if loop is None or loop.is_closed():
+            return
+
+        if wait and loop.is_running() and not self._on_loop():
+            asyncio.run_coroutine_threadsafe(self.drain(timeout), loop).result()
+        else:
+            loop.call_soon_threadsafe(self._cancel_tasks)
+        logger.debug("👋 Execution tasks stopped")
+
+    def _cancel_tasks(self):
+        for task in list(self._tasks):
+            task.cancel()
+
+    async def drain(self, timeout: Optional[float] = None):
+        """⏳ Wait for in-flight tasks, cancelling whatever still runs after timeout"""
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(list(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
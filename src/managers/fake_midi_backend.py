@@ -0,0 +1,160 @@
+"""
+🧪 Fake MIDI Backend Module
+In-memory MIDI backend for benchmarks and hardware-free runs.
+
+Flow:
+1. Pretends a Launchpad port exists and opens instantly (unplug()/plug() simulate hot-plug)
+2. Records every outgoing message (LED traffic) with a timestamp
+3. Injects synthetic input streams on its own thread, like rtmidi does
+"""
+
+import random
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..utils.constants import MIDI_NOTE_ON, MIDI_POLY_AFTERTOUCH
+from .midi_backend import MidiBackend, MidiCallback
+
+# (message, delta seconds since the previous event), as rtmidi delivers them
+MidiEvent = Tuple[List[int], float]
+
+GRID_NOTES = tuple(x + y * 10 for y in range(8) for x in range(8))
+
+
+class FakeMidiBackend(MidiBackend):
+    """Records LED output and replays synthetic input"""
+
+    def __init__(self, port_name: str = 'Launchpad Mini MK3'):
+        self.ports = [port_name]
+        self.port_name = port_name
+        self.is_open = False
+        self.sent: List[Tuple[float, List[int]]] = []
+        self._callback: Optional[MidiCallback] = None
+        self._lock = threading.Lock()
+
+    def get_input_ports(self) -> List[str]:
+        return list(self.ports)
+
+    def get_output_ports(self) -> List[str]:
+        return list(self.ports)
+
+    def open_ports(self, in_index: int, out_index: int):
+        self.is_open = True
+
+    def close_ports(self):
+        self.is_open = False
+
+    def set_callback(self, callback: MidiCallback):
+        self._callback = callback
+
+    def send_message(self, message: List[int]):
+        if not self.ports:
+            raise OSError("device unplugged")
+        with self._lock:
+            self.sent.append((time.perf_counter(), list(message)))
+
+    # 🔌 Hot-plug simulation
+
+    def unplug(self):
+        """🔌 Make the port vanish, as if the USB cable was pulled"""
+        self.ports = []
+        self.is_open = False
+
+    def plug(self, port_name: Optional[str] = None):
+        """🔌 Bring the port back, optionally under a new name (new ALSA client number)"""
+        self.port_name = port_name or self.port_name
+        self.ports = [self.port_name]
+
+    # 📊 Output inspection
+
+    def sent_since(self, index: int = 0) -> List[List[int]]:
+        """📤 Messages sent after the first `index` ones"""
+        with self._lock:
+            return [message for _, message in self.sent[index:]]
+
+    def sent_bytes(self, index: int = 0) -> int:
+        return sum(len(message) for message in self.sent_since(index))
+
+    # 🎹 Input injection
+
+    def inject(self, message: List[int], delta: float = 0.0):
+        """🎯 Deliver one event to the callback on the calling thread"""
+        if self._callback is not None:
+            self._callback((message, delta), None)
+
+    def play(self, events: Iterable[MidiEvent], realtime: bool = True) -> List[float]:
+        """
+        ▶️ Feed events to the callback, honouring their deltas if realtime
+
+        Returns:
+            list: Seconds spent inside the callback for each event
+        """
+        durations = []
+        inject = self.inject
+        perf_counter = time.perf_counter
+        next_at = perf_counter()
+        for message, delta in events:
+            if realtime and delta > 0:
+                next_at += delta
+                wait = next_at - perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+            start = perf_counter()
+            inject(message, delta)
+            durations.append(perf_counter() - start)
+        return durations
+
+    def play_async(self, events: Iterable[MidiEvent], realtime: bool = True) -> threading.Thread:
+        """🧵 play() on a background thread, like rtmidi's input thread"""
+        thread = threading.Thread(
+            target=self.play, args=(events, realtime), name="fake-midi-in", daemon=True
+        )
+        thread.start()
+        return thread
+
+
+# 🥁 Synthetic input streams
+
+def steady(rate: float, count: int, notes: Sequence[int] = GRID_NOTES) -> Iterator[MidiEvent]:
+    """Evenly spaced press/release pairs cycling over notes"""
+    interval = 1.0 / rate
+    for i in range(count // 2):
+        note = notes[i % len(notes)]
+        yield [MIDI_NOTE_ON, note, 127], interval
+        yield [MIDI_NOTE_ON, note, 0], interval
+
+
+def burst(size: int, bursts: int, gap: float = 0.25,
+          notes: Sequence[int] = GRID_NOTES) -> Iterator[MidiEvent]:
+    """Groups of simultaneous presses separated by quiet gaps"""
+    for b in range(bursts):
+        chosen = [notes[(b * size + i) % len(notes)] for i in range(size)]
+        for i, note in enumerate(chosen):
+            yield [MIDI_NOTE_ON, note, 127], gap if i == 0 and b else 0.0
+        for note in chosen:
+            yield [MIDI_NOTE_ON, note, 0], 0.0
+
+
+def drum_roll(rate: float, count: int, notes: Sequence[int] = GRID_NOTES[:4],
+              seed: int = 0) -> Iterator[MidiEvent]:
+    """Fast alternating hits on a few pads with slightly jittered timing"""
+    rng = random.Random(seed)
+    interval = 1.0 / rate
+    for i in range(count // 2):
+        note = notes[i % len(notes)]
+        yield [MIDI_NOTE_ON, note, rng.randint(60, 127)], interval * rng.uniform(0.8, 1.2)
+        yield [MIDI_NOTE_ON, note, 0], interval * rng.uniform(0.8, 1.2)
+
+
+def aftertouch_flood(rate: float, count: int,
+                     notes: Sequence[int] = GRID_NOTES[:8]) -> Iterator[MidiEvent]:
+    """Held pads streaming polyphonic pressure updates"""
+    interval = 1.0 / rate
+    for note in notes:
+        yield [MIDI_NOTE_ON, note, 100], 0.0
+    for i in range(max(0, count - 2 * len(notes))):
+        note = notes[i % len(notes)]
+        yield [MIDI_POLY_AFTERTOUCH, note, 40 + i % 80], interval
+    for note in notes:
+        yield [MIDI_NOTE_ON, note, 0], 0.0
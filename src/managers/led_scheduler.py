@@ -0,0 +1,261 @@
+"""
+🎞️ LED Scheduler Module
+Coalesces LED changes into rate-limited frames and drives status animations.
+
+Flow:
+1. Callers request colours or effects (pulse, flash, blip) for buttons
+2. Requests made within one frame window overwrite each other
+3. A timer (its own thread, or call_later on the app's event loop) renders
+   at most max_fps frames per second
+4. Each frame is pushed as one batched MIDIManager write
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..models.execution import ExecutionResult
+from ..utils.constants import Colors
+from .midi_manager import MIDIManager
+
+logger = logging.getLogger(__name__)
+
+Cell = Tuple[int, int]
+
+
+@dataclass
+class LEDEffect:
+    """✨ Time-based colour for one button"""
+    color: int
+    restore: int
+    period: float = 0.0            # > 0 blinks between color and OFF
+    until: Optional[float] = None  # None runs until replaced or cleared
+    started: float = field(default_factory=time.monotonic)
+    resume: Optional['LEDEffect'] = None  # Effect to go back to once until passes
+
+    def color_at(self, now: float) -> int:
+        if self.period and int((now - self.started) * 2 / self.period) % 2:
+            return Colors.OFF
+        return self.color
+
+
+class LEDScheduler:
+    """Renders LED frames on its own thread or an event loop, capped at max_fps"""
+
+    def __init__(self, midi_manager: MIDIManager, max_fps: float = 30):
+        self.midi_manager = midi_manager
+        self.frame_interval = 1.0 / max(1.0, max_fps)
+
+        self._pending: Dict[Cell, int] = {}
+        self._effects: Dict[Cell, LEDEffect] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._armed = False
+        self._next_frame = 0.0
+        self._running = False
+        self.frames = 0
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """🚀 Start rendering: on loop's timers if given, otherwise on a frame thread"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._loop = loop
+        if loop is None:
+            self._thread = threading.Thread(
+                target=self._run_thread, name="launchpad-led-frames", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """🛑 Stop rendering and settle every cell on its resting colour"""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(1.0)
+        if self._timer:
+            self._timer.cancel()
+        with self._cond:
+            for cell, effect in self._effects.items():
+                self._pending[cell] = effect.restore
+            self._effects.clear()
+            self._render(time.monotonic())
+
+    def set_color(self, x: int, y: int, color: int):
+        """🎨 Request a static colour on the next frame"""
+        with self._cond:
+            self._effects.pop((x, y), None)
+            self._pending[(x, y)] = color
+            self._wake()
+
+    @contextmanager
+    def batch(self):
+        """📦 Hold rendering so every change made inside lands in the same frame"""
+        with self._cond:
+            yield self
+
+    def show_frame(self, frame: bytes):
+        """🖼️ Replace the whole frame now, dropping effects and pending colours"""
+        with self._cond:
+            self._effects.clear()
+            self._pending.clear()
+            self.midi_manager.set_frame(frame)
+
+    def pulse(self, x: int, y: int, color: int, period: float = 0.6):
+        """💓 Blink a button until it's given another colour or effect"""
+        self._start_effect(x, y, LEDEffect(color=color, restore=0, period=period))
+
+    def flash(self, x: int, y: int, color: int, duration: float = 0.4):
+        """⚡ Show a colour briefly, then restore the resting colour"""
+        until = time.monotonic() + duration
+        self._start_effect(x, y, LEDEffect(color=color, restore=0, until=until))
+
+    def blip(self, x: int, y: int, color: int, duration: float = 0.25):
+        """✨ Flash a colour briefly, then carry on with the running effect (if any)"""
+        until = time.monotonic() + duration
+        with self._cond:
+            resume = self._effects.get((x, y))
+            while resume is not None and resume.until is not None:
+                resume = resume.resume  # Don't come back to a finished flash
+        self._start_effect(x, y, LEDEffect(color=color, restore=0, until=until, resume=resume))
+    
+    def clear_effect(self, x: int, y: int):
+        """🧹 Cancel any effect and restore the resting colour"""
+        with self._cond:
+            effect = self._effects.pop((x, y), None)
+            if effect:
+                self._pending[(x, y)] = effect.restore
+                self._wake()
+
+    def _start_effect(self, x: int, y: int, effect: LEDEffect):
+        cell = (x, y)
+        with self._cond:
+            previous = self._effects.get(cell)
+            if previous:
+                effect.restore = previous.restore
+            else:
+                effect.restore = self._pending.get(cell, self.midi_manager.get_button_color(x, y))
+            self._pending.pop(cell, None)
+            self._effects[cell] = effect
+            self._wake()
+
+    def _render(self, now: float):
+        """🖼️ Apply pending changes and effects as one batched write"""
+        changes = self._pending
+        self._pending = {}
+        for cell, effect in list(self._effects.items()):
+            if effect.until is not None and now >= effect.until:
+                if effect.resume is not None:
+                    self._effects[cell] = effect.resume
+                    changes[cell] = effect.resume.color_at(now)
+                    continue
+                del self._effects[cell]
+                changes[cell] = effect.restore
+            else:
+                changes[cell] = effect.color_at(now)
+
+        if changes:
+            with self.midi_manager.batch():
+                for (x, y), color in changes.items():
+                    self.midi_manager.set_button_color(x, y, color)
+        self.frames += 1
+
+    def _wake(self):
+        """⏰ Make sure a frame is coming (call with _cond held)"""
+        if self._loop is None:
+            self._cond.notify()
+        elif self._running and not self._armed:
+            self._armed = True
+            self._loop.call_soon_threadsafe(self._arm)
+
+    def _arm(self):
+        """📆 Schedule the next frame on the event loop"""
+        delay = max(0.0, self._next_frame - time.monotonic())
+        self._timer = self._loop.call_later(delay, self._tick)
+
+    def _tick(self):
+        with self._cond:
+            self._timer = None
+            if not self._running:
+                self._armed = False
+                return
+            now = time.monotonic()
+            try:
+                self._render(now)
+            except Exception as e:
+                logger.error(f"❌ LED frame failed: {e}")
+            self._next_frame = now + self.frame_interval
+            # Effects keep animating; anything requested during the render arms again
+            self._armed = bool(self._effects or self._pending)
+        if self._armed:
+            self._arm()
+
+    def _run_thread(self):
+        next_frame = time.monotonic()
+        while True:
+            with self._cond:
+                while self._running and not (self._pending or self._effects):
+                    self._cond.wait()
+                if not self._running:
+                    return
+
+                delay = next_frame - time.monotonic()
+                if delay > 0:
+                    # Let more requests pile into this frame
+                    self._cond.wait(delay)
+                    if not self._running:
+                        return
+
+                now = time.monotonic()
+                try:
+                    self._render(now)
+                except Exception as e:
+                    logger.error(f"❌ LED frame failed: {e}")
+            next_frame = now + self.frame_interval
+
+
+class StatusLights:
+    """🚦 Execution listener that shows command status on the mapped button"""
+
+    def __init__(self, scheduler: LEDScheduler,
+                 success_color: int = Colors.GREEN,
+                 failure_color: int = Colors.RED,
+                 visible: Optional[Callable[[Any], bool]] = None):
+        self.scheduler = scheduler
+        self.success_color = success_color
+        self.failure_color = failure_color
+        # Whether a context's button is currently on screen (e.g. on the shown page)
+        self.visible = visible or (lambda context: True)
+
+    def _button(self, context: Any):
+        button = getattr(context, 'button', None)
+        return button if button is not None and self.visible(context) else None
+
+    def execution_started(self, alias: str, context: Any):
+        button = self._button(context)
+        if button is not None:
+            self.scheduler.pulse(button.x, button.y, button.color)
+
+    def execution_finished(self, alias: str, context: Any, result: ExecutionResult):
+        button = self._button(context)
+        if button is not None:
+            color = self.success_color if result.success else self.failure_color
+            self.scheduler.flash(button.x, button.y, color)
+    
+    def pipeline_progress(self, alias: str, context: Any, done: int, total: int,
+                          result: ExecutionResult):
+        # Blip each finished step over the pipeline's pulse
+        button = self._button(context)
+        if button is not None and done < total:
+            color = self.success_color if result.success else self.failure_color
+            self.scheduler.blip(button.x, button.y, color)
@@ -1,32 +1,187 @@
 """
 🗺️ Mapping Manager Module
 Manages relationships between buttons and shell aliases.
+
+Mappings are organised in pages. Each page owns a note-indexed dispatch
+table and an LED frame kept up to date as mappings change, so switching
+pages is a pointer swap plus a single frame write.
+
+Chords and sequences (gesture mappings) live next to each page's table,
+keyed by their pads; the device compiles the visible page's gestures for
+ButtonHandler's matcher.
+
+Pipeline mappings run a dependency graph of aliases instead of one alias;
+the whole pipeline is one job on the executor.
+
+Each press passes its mapping's PressPolicy (debounce, token bucket,
+single-flight/restart) before it is queued on the executor. Presses on
+idempotent mappings skip it and go through the shared ResultCache instead. The job
+carries the mapping's LaunchPolicy (wait/stream/detach, timeout, isolation).
 """
 
 import logging
-from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
+import time
+from collections import Counter
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from ..config.mapping_file import MappingSpec, describe_gesture
 from ..models.button import LaunchpadButton
+from ..models.launch_policy import LaunchPolicy
+from ..models.pipeline import Pipeline
+from ..models.press_policy import PressPolicy
 from ..handlers.alias_handler import AliasHandler
-from ..utils.constants import Colors
+from ..utils.metrics import PressTrace
+from .execution_manager import AsyncExecutionManager, ExecutionManager
+from .result_cache import ResultCache
+from ..utils.constants import (
+    Colors, DEFAULT_DEVICE, PAGE_CONTROLS, PAGE_NEXT, PAGE_PREV, PAGE_SELECT_X
+)
 
 logger = logging.getLogger(__name__)
 
+def _ran_nothing() -> Future:
+    """🚫 An already-resolved future for presses that don't start anything"""
+    future: Future = Future()
+    future.set_result(None)
+    return future
+
+class PressGate:
+    """🚪 Debounce and token-bucket state for one mapping"""
+    __slots__ = ('policy', 'last', 'tokens', 'refilled')
+    
+    def __init__(self, policy: PressPolicy):
+        self.policy = policy
+        self.last = float('-inf')
+        self.tokens = float(policy.burst)
+        self.refilled = time.monotonic()
+    
+    def admit(self, now: float) -> Optional[str]:
+        """
+        🎫 Let a press through or say why not
+        
+        Returns:
+            Optional[str]: None if admitted, else 'debounced' or 'rate_limited'
+        """
+        policy = self.policy
+        if policy.debounce_ms and (now - self.last) * 1000 < policy.debounce_ms:
+            return 'debounced'
+        if policy.rate:
+            self.tokens = min(policy.burst, self.tokens + (now - self.refilled) * policy.rate)
+            self.refilled = now
+            if self.tokens < 1:
+                return 'rate_limited'
+            self.tokens -= 1
+        self.last = now
+        return None
+
 @dataclass
 class ButtonMapping:
     """🔗 Represents button-to-alias mapping"""
     button: LaunchpadButton
     alias: str
     active: bool = True
+    max_concurrent: Optional[int] = None
+    page: int = 0
+    device: str = DEFAULT_DEVICE
+    policy: PressPolicy = PressPolicy()
+    gesture: str = ''   # 'chord' or 'sequence'; button is then the first pad
+    pads: Tuple[Tuple[int, int], ...] = ()
+    window_ms: int = 0
+    pipeline: Optional[Pipeline] = None  # steps run instead of the alias
+    launch: LaunchPolicy = LaunchPolicy()
+    gate: Optional[PressGate] = field(default=None, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.gate is None and self.policy.gated:
+            self.gate = PressGate(self.policy)
+    
+    @property
+    def cell(self) -> tuple:
+        """📍 (page, x, y), or (page, gesture, pads) for chords and sequences"""
+        if self.gesture:
+            return (self.page, self.gesture, self.pads)
+        return (self.page, self.button.x, self.button.y)
+    
+    @property
+    def key(self) -> tuple:
+        """🔑 Execution pool key: (device, page, x, y) or (device, page, gesture, pads)"""
+        return (self.device,) + self.cell
+    
+    @property
+    def result_key(self) -> tuple:
+        """🧊 Result cache key: pads running the same command this way share results"""
+        return (self.alias, self.pipeline, self.launch, self.policy.cache_ttl)
+
+@dataclass
+class MappingDiff:
+    """🔀 What changed between the live mappings and a new set"""
+    added: List[MappingSpec] = field(default_factory=list)
+    changed: List[MappingSpec] = field(default_factory=list)
+    removed: List[tuple] = field(default_factory=list)  # cells: (page, x, y) or (page, gesture, pads)
+    
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+# Framebuffer cells, addressed as x + y * 10 like the notes
+FRAME_SIZE = 100
+
+@dataclass
+class Page:
+    """📑 One page of mappings: note-indexed dispatch table plus its LED frame"""
+    index: int
+    table: List[Optional[ButtonMapping]] = field(default_factory=lambda: [None] * FRAME_SIZE)
+    frame: bytearray = field(default_factory=lambda: bytearray(FRAME_SIZE))
+    gestures: Dict[tuple, ButtonMapping] = field(default_factory=dict)  # by cell
+    count: int = 0
 
 class MappingManager:
     """Manages button-to-alias mappings and their states"""
     
-    def __init__(self, alias_handler: Optional[AliasHandler] = None):
-        self._mappings: Dict[Tuple[int, int], ButtonMapping] = {}
+    # 💡 Page indicator colours on the control pads
+    CURRENT_PAGE_COLOR = Colors.WHITE
+    OTHER_PAGE_COLOR = Colors.BLUE_DIM
+    PAGE_STEP_COLOR = Colors.WHITE
+    
+    def __init__(self, alias_handler: Optional[AliasHandler] = None,
+                 executor: Optional[Union[ExecutionManager, AsyncExecutionManager]] = None,
+                 device: str = DEFAULT_DEVICE,
+                 results: Optional[ResultCache] = None):
+        self.device = device
+        self._pages: Dict[int, Page] = {0: Page(0)}
+        self._active = self._pages[0]
         self._alias_handler = alias_handler or AliasHandler()
+        self._executor = executor or ExecutionManager()
+        self._results = results or ResultCache()
+        # Presses stopped by policies: debounced, rate_limited, busy, restarted
+        self.press_counts: Counter = Counter()
+    
+    @property
+    def page(self) -> int:
+        """📑 Index of the page currently dispatching presses"""
+        return self._active.index
+    
+    @property
+    def pages(self) -> List[int]:
+        """📚 Indexes of all pages that exist"""
+        return sorted(self._pages)
+    
+    @property
+    def page_empty(self) -> bool:
+        """🫙 True when the page being shown has no mappings"""
+        return not self._active.count
+    
+    @property
+    def multi_page(self) -> bool:
+        """📚 True when page controls are in use"""
+        return len(self._pages) > 1
         
-    def create_mapping(self, x: int, y: int, color: int, alias: str) -> ButtonMapping:
+    def create_mapping(self, x: int, y: int, color: int, alias: str,
+                       max_concurrent: Optional[int] = None,
+                       page: int = 0,
+                       policy: Optional[PressPolicy] = None,
+                       pipeline: Optional[Pipeline] = None,
+                       launch: Optional[LaunchPolicy] = None) -> ButtonMapping:
         """
         ➕ Create new button mapping
         
@@ -34,30 +189,261 @@ class MappingManager:
             x: X coordinate
             y: Y coordinate
             color: Button color
-            alias: Shell alias to execute
+            alias: Shell alias to execute (a pipeline's name)
+            max_concurrent: Max simultaneous runs (None uses the pool default)
+            page: Page the mapping lives on
+            policy: How rapid or overlapping presses are handled
+            pipeline: Aliases to run as a dependency graph instead of alias
+            launch: How the command is started, how long it may run, what it may use
         """
         button = LaunchpadButton(x=x, y=y, color=color)
-        mapping = ButtonMapping(button=button, alias=alias)
-        self._mappings[(x, y)] = mapping
-        logger.info(f"✨ Created mapping: ({x}, {y}) -> {alias}")
+        mapping = ButtonMapping(
+            button=button, alias=alias, max_concurrent=max_concurrent,
+            page=page, device=self.device, policy=policy or PressPolicy(),
+            pipeline=pipeline, launch=launch or LaunchPolicy()
+        )
+        target = self._page(page)
+        note = button.note
+        if target.table[note] is None:
+            target.count += 1
+        target.table[note] = mapping
+        target.frame[note] = color & 0x7F
+        self._set_limits(mapping)
+        logger.info(f"✨ Created mapping: {self._where(x, y, page)} -> {alias}")
+        return mapping
+    
+    def create_gesture(self, gesture: str, pads: Tuple[Tuple[int, int], ...], alias: str,
+                       max_concurrent: Optional[int] = None,
+                       page: int = 0,
+                       policy: Optional[PressPolicy] = None,
+                       window_ms: int = 0,
+                       pipeline: Optional[Pipeline] = None,
+                       launch: Optional[LaunchPolicy] = None) -> ButtonMapping:
+        """
+        ➕ Create a chord or sequence mapping
+        
+        Args:
+            gesture: 'chord' (pads pressed together) or 'sequence' (in order)
+            pads: (x, y) of each pad
+            window_ms: Chord window or max gap between steps (0 = device default)
+        """
+        x, y = pads[0]
+        mapping = ButtonMapping(
+            button=LaunchpadButton(x=x, y=y, color=Colors.OFF), alias=alias,
+            max_concurrent=max_concurrent, page=page, device=self.device,
+            policy=policy or PressPolicy(), gesture=gesture, pads=tuple(pads),
+            window_ms=window_ms, pipeline=pipeline, launch=launch or LaunchPolicy()
+        )
+        target = self._page(page)
+        if mapping.cell not in target.gestures:
+            target.count += 1
+        target.gestures[mapping.cell] = mapping
+        self._set_limits(mapping)
+        logger.info(f"✨ Created mapping: {self._describe(mapping)} -> {alias}")
         return mapping
     
-    def get_mapping(self, x: int, y: int) -> Optional[ButtonMapping]:
-        """📍 Get mapping for coordinates"""
-        return self._mappings.get((x, y))
+    def _page(self, page: int) -> Page:
+        target = self._pages.get(page)
+        if target is None:
+            target = self._pages[page] = Page(page)
+        return target
     
-    def execute_mapping(self, x: int, y: int) -> bool:
+    def _set_limits(self, mapping: ButtonMapping):
+        queue_limit = mapping.policy.queue if mapping.policy.on_busy == 'queue' else None
+        self._executor.set_limit(mapping.key, mapping.max_concurrent, queue_limit)
+    
+    def remove_mapping(self, x: int, y: int, page: int = 0) -> Optional[ButtonMapping]:
+        """➖ Remove a mapping, returning it if it existed"""
+        target = self._pages.get(page)
+        note = x + y * 10
+        mapping = target.table[note] if target else None
+        if mapping is None:
+            return None
+        target.table[note] = None
+        target.frame[note] = Colors.OFF
+        self._forget(target, mapping)
+        logger.info(f"🗑️ Removed mapping: {self._where(x, y, page)} -> {mapping.alias}")
+        return mapping
+    
+    def remove_gesture(self, cell: tuple) -> Optional[ButtonMapping]:
+        """➖ Remove a chord or sequence by its cell, returning it if it existed"""
+        target = self._pages.get(cell[0])
+        mapping = target.gestures.pop(cell, None) if target else None
+        if mapping is None:
+            return None
+        self._forget(target, mapping)
+        logger.info(f"🗑️ Removed mapping: {self._describe(mapping)} -> {mapping.alias}")
+        return mapping
+    
+    def _forget(self, target: Page, mapping: ButtonMapping):
+        target.count -= 1
+        # Empty pages disappear, except page 0 and the one being shown
+        if not target.count and target.index != 0 and target is not self._active:
+            del self._pages[target.index]
+        self._executor.set_limit(mapping.key, None)
+    
+    def is_mapped(self, x: int, y: int) -> bool:
+        """🔍 True if any page maps this pad"""
+        note = x + y * 10
+        return any(page.table[note] is not None for page in self._pages.values())
+    
+    def diff(self, specs: Iterable[MappingSpec]) -> MappingDiff:
+        """🔀 Compare a new set of mappings against the live ones"""
+        result = MappingDiff()
+        wanted = {spec.cell: spec for spec in specs}
+        for cell, spec in wanted.items():
+            mapping = self.lookup(cell)
+            if mapping is None:
+                result.added.append(spec)
+            elif (mapping.button.color, mapping.alias, mapping.max_concurrent, mapping.policy,
+                  mapping.window_ms, mapping.pipeline, mapping.launch) != \
+                    (spec.color, spec.alias, spec.max_concurrent, spec.policy, spec.window_ms,
+                     spec.pipeline, spec.launch):
+                result.changed.append(spec)
+        result.removed = [
+            mapping.cell for mapping in self._iter_mappings() if mapping.cell not in wanted
+        ]
+        return result
+    
+    def lookup(self, cell: tuple) -> Optional[ButtonMapping]:
+        """📍 Mapping bound to a cell (see ButtonMapping.cell), on any page"""
+        target = self._pages.get(cell[0])
+        if target is None:
+            return None
+        if isinstance(cell[1], str):
+            return target.gestures.get(cell)
+        return target.table[cell[1] + cell[2] * 10]
+    
+    def gestures(self) -> List[ButtonMapping]:
+        """🎹 Chords and sequences on the current page"""
+        return list(self._active.gestures.values())
+    
+    def get_mapping(self, x: int, y: int,
+                    page: Optional[int] = None) -> Optional[ButtonMapping]:
+        """📍 Get mapping for coordinates (on the current page unless given)"""
+        target = self._active if page is None else self._pages.get(page)
+        return target.table[x + y * 10] if target else None
+    
+    def execute_mapping(self, x: int, y: int,
+                        trace: Optional[PressTrace] = None) -> Future:
         """
-        🎯 Execute mapping's alias
+        🎯 Queue the current page's alias for this pad on the executor
+        
+        Args:
+            trace: Latency trace for this press, if metrics are enabled
         
         Returns:
-            bool: True if execution successful
+            Future: Resolves to the ExecutionResult, or None if nothing ran
         """
-        mapping = self.get_mapping(x, y)
-        if mapping and mapping.active:
-            logger.debug(f"🔄 Executing alias for button ({x}, {y})")
-            return self._alias_handler.execute(mapping.alias)
-        return False
+        mapping = self._active.table[x + y * 10]
+        return self.execute(mapping, trace) if mapping else _ran_nothing()
+    
+    def execute(self, mapping: ButtonMapping, trace: Optional[PressTrace] = None) -> Future:
+        """🎯 Queue a mapping's alias (pads and gestures alike)"""
+        if not mapping.active:
+            return _ran_nothing()
+        if mapping.policy.idempotent:
+            return self._results.run(
+                mapping.result_key, mapping.policy.cache_ttl, lambda: self._start(mapping, trace)
+            )
+        return self._start(mapping, trace)
+    
+    def _start(self, mapping: ButtonMapping, trace: Optional[PressTrace]) -> Future:
+        """🚀 Queue a mapping's alias if its press policy lets the press through"""
+        # Idempotent presses were already folded into one run by the ResultCache
+        if mapping.policy.idempotent or self._admit(mapping):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🔄 Queueing alias for %s", self._describe(mapping))
+            if trace:
+                if mapping.gesture:
+                    trace.mapping = ('+' if mapping.gesture == 'chord' else '>').join(
+                        f"{x},{y}" for x, y in mapping.pads
+                    )
+                else:
+                    trace.mapping = f"{mapping.button.x},{mapping.button.y}"
+                if mapping.page:
+                    trace.mapping = f"{mapping.page}:{trace.mapping}"
+                if self.device != DEFAULT_DEVICE:
+                    trace.mapping = f"{self.device}/{trace.mapping}"
+                trace.alias = mapping.alias
+                trace.mark('queued')
+            # The asyncio runtime runs aliases as tasks on its loop
+            handler = self._alias_handler
+            queued = time.time()  # For the result's queue_wait
+            if mapping.pipeline is not None:
+                run = handler.execute_pipeline_async if self._executor.asynchronous \
+                    else handler.execute_pipeline
+                return self._executor.submit(
+                    mapping.key, run, mapping.alias, mapping.pipeline, mapping, trace,
+                    mapping.launch, queued
+                )
+            execute = handler.execute_async if self._executor.asynchronous else handler.execute
+            return self._executor.submit(
+                mapping.key, execute, mapping.alias, mapping, trace, mapping.launch, queued
+            )
+        return _ran_nothing()
+    
+    def _admit(self, mapping: ButtonMapping) -> bool:
+        """🚦 Apply the mapping's press policy; False if the press should be ignored"""
+        if mapping.gate is not None:
+            reason = mapping.gate.admit(time.monotonic())
+            if reason:
+                self.press_counts[reason] += 1
+                logger.debug("🚦 %s: press %s", mapping.alias, reason.replace('_', ' '))
+                return False
+        
+        on_busy = mapping.policy.on_busy
+        if on_busy == 'queue':
+            return True
+        if not (self._executor.load(mapping.key) or self._alias_handler.running(mapping)):
+            return True
+        if on_busy == 'single':
+            self.press_counts['busy'] += 1
+            logger.debug("🚦 %s: already running, press ignored", mapping.alias)
+            return False
+        # restart: stop what's running; the new run starts once its slot frees up
+        if self._alias_handler.cancel(mapping):
+            self.press_counts['restarted'] += 1
+            logger.info("🔁 Restarting %s", mapping.alias)
+        return True
+    
+    def switch_page(self, page: int) -> Optional[bytes]:
+        """
+        📑 Make another page the one receiving presses
+        
+        Returns:
+            bytes: The page's LED frame to push, or None if nothing changed
+        """
+        target = self._pages.get(page)
+        if target is None or target is self._active:
+            return None
+        previous, self._active = self._active, target
+        if not previous.count and previous.index != 0:
+            del self._pages[previous.index]
+        logger.info(f"📑 Page {page} ({self.pages.index(page) + 1}/{len(self._pages)})")
+        return self.page_frame()
+    
+    def step_page(self, step: int) -> Optional[bytes]:
+        """⏭️ Switch to the next (step=1) or previous (step=-1) page, wrapping around"""
+        pages = self.pages
+        position = pages.index(self._active.index)
+        return self.switch_page(pages[(position + step) % len(pages)])
+    
+    def page_frame(self) -> bytes:
+        """🖼️ The current page's LED frame with the page controls drawn in"""
+        frame = bytearray(self._active.frame)
+        if self.multi_page:
+            for x, y in PAGE_CONTROLS:
+                frame[x + y * 10] = Colors.OFF
+            for index in self._pages:
+                if index < PAGE_SELECT_X:
+                    frame[PAGE_SELECT_X + index * 10] = (
+                        self.CURRENT_PAGE_COLOR if index == self._active.index
+                        else self.OTHER_PAGE_COLOR
+                    )
+            for x, y in (PAGE_PREV, PAGE_NEXT):
+                frame[x + y * 10] = self.PAGE_STEP_COLOR
+        return bytes(frame)
     
     def toggle_mapping(self, x: int, y: int) -> bool:
         """🔄 Toggle mapping active state"""
@@ -73,9 +459,37 @@ class MappingManager:
         """📋 List all current mappings"""
         return [
             {
-                'coordinates': (x, y),
+                'coordinates': (mapping.button.x, mapping.button.y),
+                'page': mapping.page,
                 'alias': mapping.alias,
-                'active': mapping.active
+                'active': mapping.active,
+                'gesture': mapping.gesture,
+                'pads': mapping.pads,
+                'steps': [step.name for step in mapping.pipeline.steps] if mapping.pipeline else [],
+                'launch': mapping.launch.mode
             }
-            for (x, y), mapping in self._mappings.items()
+            for mapping in self._iter_mappings()
         ]
+    
+    def mappings(self) -> List[ButtonMapping]:
+        """📋 Every mapping on every page, gestures included"""
+        return list(self._iter_mappings())
+    
+    def _iter_mappings(self) -> Iterable[ButtonMapping]:
+        for index in self.pages:
+            for mapping in self._pages[index].table:
+                if mapping is not None:
+                    yield mapping
+            yield from self._pages[index].gestures.values()
+    
+    def _describe(self, mapping: ButtonMapping) -> str:
+        if not mapping.gesture:
+            return self._where(mapping.button.x, mapping.button.y, mapping.page)
+        where = describe_gesture(mapping.gesture, mapping.pads)
+        if mapping.page:
+            where = f"{where} on page {mapping.page}"
+        return where if self.device == DEFAULT_DEVICE else f"{self.device} {where}"
+    
+    def _where(self, x: int, y: int, page: int) -> str:
+        where = f"({x}, {y})" if not page else f"({page}:{x}, {y})"
+        return where if self.device == DEFAULT_DEVICE else f"{self.device} {where}"
@@ -0,0 +1,98 @@
+"""
+🔌 MIDI Backend Module
+Pluggable interface between MIDIManager and the MIDI driver.
+
+Flow:
+1. MIDIManager talks to a MidiBackend, never to rtmidi directly
+2. RtMidiBackend wraps python-rtmidi for real hardware
+3. FakeMidiBackend (fake_midi_backend.py) stands in for benchmarks and headless runs
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
+
+# rtmidi-style input callback: callback((message, delta_time), data)
+MidiCallback = Callable[[tuple, object], None]
+
+
+class MidiBackend(ABC):
+    """Minimal port API MIDIManager needs from a MIDI driver"""
+
+    @abstractmethod
+    def get_input_ports(self) -> List[str]:
+        """📥 Names of available input ports"""
+
+    @abstractmethod
+    def get_output_ports(self) -> List[str]:
+        """📤 Names of available output ports"""
+
+    def get_input_port_name(self, index: int) -> Optional[str]:
+        """📥 Name of one input port, or None (drivers can answer without enumerating)"""
+        ports = self.get_input_ports()
+        return ports[index] if 0 <= index < len(ports) else None
+
+    def get_output_port_name(self, index: int) -> Optional[str]:
+        """📤 Name of one output port, or None"""
+        ports = self.get_output_ports()
+        return ports[index] if 0 <= index < len(ports) else None
+
+    @abstractmethod
+    def open_ports(self, in_index: int, out_index: int):
+        """🔌 Open input and output ports by index"""
+
+    @abstractmethod
+    def close_ports(self):
+        """🔌 Close both ports"""
+
+    @abstractmethod
+    def set_callback(self, callback: MidiCallback):
+        """🎯 Set the input callback"""
+
+    @abstractmethod
+    def send_message(self, message: List[int]):
+        """📤 Send one MIDI message (including SysEx)"""
+
+
+class RtMidiBackend(MidiBackend):
+    """python-rtmidi backend for real devices"""
+
+    def __init__(self):
+        # Imported here so fake backends work without ALSA/rtmidi installed
+        import rtmidi
+        self.midi_in = rtmidi.MidiIn()
+        self.midi_out = rtmidi.MidiOut()
+
+    def get_input_ports(self) -> List[str]:
+        return self.midi_in.get_ports()
+
+    def get_output_ports(self) -> List[str]:
+        return self.midi_out.get_ports()
+
+    def get_input_port_name(self, index: int) -> Optional[str]:
+        return self._port_name(self.midi_in, index)
+
+    def get_output_port_name(self, index: int) -> Optional[str]:
+        return self._port_name(self.midi_out, index)
+
+    @staticmethod
+    def _port_name(port, index: int) -> Optional[str]:
+        if not 0 <= index < port.get_port_count():
+            return None
+        try:
+            return port.get_port_name(index) or None
+        except Exception:
+            return None
+
+    def open_ports(self, in_index: int, out_index: int):
+        self.midi_in.open_port(in_index)
+        self.midi_out.open_port(out_index)
+
+    def close_ports(self):
+        self.midi_in.close_port()
+        self.midi_out.close_port()
+
+    def set_callback(self, callback: MidiCallback):
+        self.midi_in.set_callback(callback)
+
+    def send_message(self, message: List[int]):
+        self.midi_out.send_message(message)
@@ -1,27 +1,56 @@
 """
 🎼 MIDI Manager Module
 Handles MIDI device connection and communication.
+
+While the device is unplugged LED writes only update the framebuffer;
+reconnect() reopens the ports and pushes the whole frame in one batch.
 """
 
-import rtmidi
 import logging
-from typing import Callable, Optional, List, Dict
-from ..utils.constants import MIDI_NOTE_ON, Colors
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Optional, List, Dict, Tuple
+from ..utils.constants import (
+    MIDI_NOTE_ON, Colors, SYSEX_HEADER, SYSEX_END, SYSEX_LED_LIGHTING,
+    LED_SPEC_STATIC, MAX_LED_SPECS, LED_GRID_SIZE, LED_NOTES
+)
+from .midi_backend import MidiBackend, RtMidiBackend
+from .port_resolver import PortCache, ResolvedPorts, resolve_ports
+
+if TYPE_CHECKING:  # Only imported when recording is enabled (see LaunchpadApp)
+    from ..utils.session_recorder import SessionRecorder
 
 logger = logging.getLogger(__name__)
 
+# Marks a framebuffer cell whose device state we don't know
+UNKNOWN_COLOR = 0xFF
+
 class MIDIManager:
     """Manages MIDI device connections and communications"""
     
-    def __init__(self):
-        self.midi_in = rtmidi.MidiIn()
-        self.midi_out = rtmidi.MidiOut()
+    def __init__(self, backend: Optional[MidiBackend] = None,
+                 port_cache: Optional[PortCache] = None):
+        self.backend = backend or RtMidiBackend()
+        self.port_cache = port_cache
+        self.recorder: Optional['SessionRecorder'] = None
         self.port_name: Optional[str] = None
+        self.ports: Optional[ResolvedPorts] = None
+        self.connected = False  # False while the device is unplugged; LED writes are buffered
+        self.reconnects = 0
         self.callbacks: Dict[int, Callable] = {}
+        self.first_send: Optional[float] = None  # perf_counter() of the first LED write
+        
+        # 🖼️ LED framebuffer: desired colours vs. what the device last received
+        self._frame = bytearray(100)
+        self._pushed = bytearray([UNKNOWN_COLOR] * 100)
+        self._frame_lock = threading.RLock()
+        self._batch_depth = 0
+        self._input_callback: Optional[Callable] = None
         
     def list_devices(self) -> List[str]:
         """📋 List available MIDI devices"""
-        input_ports = self.midi_in.get_ports()
+        input_ports = self.backend.get_input_ports()
         logger.info("🔍 Available MIDI Ports:")
         for i, port in enumerate(input_ports):
             logger.info(f"  {i}: {port}")
@@ -35,54 +64,198 @@ class MIDIManager:
             port_name: Name of the MIDI port to connect to
         """
         try:
-            in_ports = self.midi_in.get_ports()
-            out_ports = self.midi_out.get_ports()
+            ports = resolve_ports(self.backend, port_name, self.port_cache)
+            if ports is None:
+                logger.error(f"❌ Port not found: {port_name}")
+                return False
             
-            in_port_idx = in_ports.index(port_name)
-            out_port_idx = out_ports.index(port_name)
+            with self._frame_lock:
+                self._open(ports)
+                self.port_name = port_name
             
-            self.midi_in.open_port(in_port_idx)
-            self.midi_out.open_port(out_port_idx)
-            self.port_name = port_name
-            
-            logger.info(f"✅ Connected to: {port_name}")
+            logger.info(f"✅ Connected to: {ports.in_name}")
             return True
             
-        except ValueError:
-            logger.error(f"❌ Port not found: {port_name}")
-            return False
         except Exception as e:
             logger.error(f"💥 Connection error: {e}")
             return False
     
+    def _open(self, ports: ResolvedPorts):
+        """🔌 Open ports and push the whole frame, since the device state is unknown"""
+        self.backend.open_ports(ports.in_index, ports.out_index)
+        self.ports = ports
+        self.connected = True
+        self._pushed[:] = bytes([UNKNOWN_COLOR] * len(self._pushed))
+        self.flush()
+    
+    def is_present(self) -> bool:
+        """👀 True if the connected ports still carry the device's names"""
+        ports = self.ports
+        if ports is None:
+            return False
+        try:
+            return self.backend.get_input_port_name(ports.in_index) == ports.in_name and \
+                self.backend.get_output_port_name(ports.out_index) == ports.out_name
+        except Exception:
+            return False
+    
+    def disconnected(self, reason: str = "port disappeared"):
+        """🔌 Note that the device went away; LED writes are buffered until reconnect()"""
+        with self._frame_lock:
+            if not self.connected:
+                return
+            self.connected = False
+        logger.warning(f"🔌 Lost {self.port_name}: {reason}")
+    
+    def reconnect(self) -> bool:
+        """
+        🔁 Reopen the ports of a device that came back and replay the framebuffer
+        
+        Returns:
+            bool: True if the device is connected again
+        """
+        if not self.port_name:
+            return False
+        with self._frame_lock:
+            if self.connected:
+                return True
+            try:
+                self.backend.close_ports()
+            except Exception:
+                pass
+            try:
+                ports = resolve_ports(self.backend, self.port_name, self.port_cache)
+                if ports is None:
+                    return False
+                self._open(ports)
+                if self._input_callback is not None:
+                    self.backend.set_callback(self._input_callback)
+            except Exception as e:
+                self.connected = False
+                logger.debug(f"🔁 Reconnect to {self.port_name} failed: {e}")
+                return False
+            self.reconnects += 1
+        logger.info(f"🔁 Reconnected to: {ports.in_name}")
+        return True
+    
     def set_callback(self, callback: Callable):
         """🎯 Set MIDI input callback"""
         if self.port_name:
-            self.midi_in.set_callback(callback)
+            if self.recorder:
+                callback = self._recording_callback(callback)
+            self._input_callback = callback
+            self.backend.set_callback(callback)
             logger.debug("✅ Callback set")
     
+    def _recording_callback(self, callback: Callable) -> Callable:
+        """📼 Wrap an input callback so every raw message is recorded first"""
+        write = self.recorder.write
+        
+        def recording(event, data=None):
+            message, delta = event
+            write(message, delta)
+            callback(event, data)
+        
+        return recording
+    
     def send_message(self, message: List[int]):
         """📤 Send MIDI message"""
+        if self.first_send is None:
+            self.first_send = time.perf_counter()
         try:
-            self.midi_out.send_message(message)
+            self.backend.send_message(message)
         except Exception as e:
             logger.error(f"❌ Failed to send MIDI message: {e}")
+            self.disconnected(str(e))
     
     def set_button_color(self, x: int, y: int, color: int):
-        """🎨 Set button color"""
-        note = x + (y * 10)
-        self.send_message([MIDI_NOTE_ON, note, color])
+        """🎨 Set button color (flushed immediately unless inside batch())"""
+        if not (0 <= x < LED_GRID_SIZE and 0 <= y < LED_GRID_SIZE):
+            logger.warning(f"⚠️ Button ({x}, {y}) is outside the LED grid")
+            return
+        with self._frame_lock:
+            self._frame[x + (y * 10)] = color & 0x7F
+            if not self._batch_depth:
+                self.flush()
+    
+    def set_frame(self, frame: bytes):
+        """🖼️ Replace every LED colour at once (one write for all changed cells)"""
+        with self._frame_lock:
+            self._frame[:] = frame
+            if not self._batch_depth:
+                self.flush()
+    
+    def get_button_color(self, x: int, y: int) -> int:
+        """🎨 Get the desired color of a button"""
+        return self._frame[x + (y * 10)]
+    
+    @contextmanager
+    def batch(self):
+        """📦 Defer LED writes until the outermost batch exits, then flush once"""
+        with self._frame_lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+    
+    def _dirty_cells(self) -> List[Tuple[int, int]]:
+        """🔍 Cells whose desired color differs from the device"""
+        frame, pushed = self._frame, self._pushed
+        return [(note, frame[note]) for note in LED_NOTES if frame[note] != pushed[note]]
+    
+    def flush(self) -> int:
+        """
+        📤 Push changed cells to the device
+        
+        A single change goes out as a Note-On, anything more as one
+        multi-LED SysEx lighting message.
+        
+        Returns:
+            int: Number of MIDI messages sent
+        """
+        with self._frame_lock:
+            if not self.connected:
+                return 0
+            changes = self._dirty_cells()
+            if not changes:
+                return 0
+            
+            if len(changes) == 1:
+                note, color = changes[0]
+                messages = [[MIDI_NOTE_ON, note, color]]
+            else:
+                messages = []
+                for i in range(0, len(changes), MAX_LED_SPECS):
+                    message = list(SYSEX_HEADER)
+                    message.append(SYSEX_LED_LIGHTING)
+                    for note, color in changes[i:i + MAX_LED_SPECS]:
+                        message += (LED_SPEC_STATIC, note, color)
+                    message.append(SYSEX_END)
+                    messages.append(message)
+            
+            for message in messages:
+                self.send_message(message)
+                if not self.connected:
+                    return 0  # Unplugged mid-write; reconnect() replays everything
+            for note, color in changes:
+                self._pushed[note] = color
+            return len(messages)
     
     def reset_colors(self):
         """🧹 Reset all button colors"""
-        for x in range(8):
-            for y in range(8):
-                self.set_button_color(x, y, Colors.OFF)
+        with self.batch():
+            self._frame[:] = bytes([Colors.OFF] * len(self._frame))
     
     def cleanup(self):
         """🧹 Clean up MIDI connections"""
         if self.port_name:
-            self.reset_colors()
-            self.midi_in.close_port()
-            self.midi_out.close_port()
+            if self.connected:
+                self.reset_colors()
+            self.connected = False
+            self.backend.close_ports()
             logger.info("👋 MIDI connections closed")
+        if self.recorder:
+            self.recorder.close()
@@ -0,0 +1,131 @@
+"""
+🔎 Port Resolver Module
+Finds a Launchpad's input/output port indices quickly and tolerantly.
+
+Flow:
+1. Check cached indices by asking the driver for just those two port names
+2. Otherwise enumerate each direction once and match the wanted name: exactly,
+   then ignoring the ALSA client:port numbers, then by closest name
+3. Remember the result so the next start skips enumeration
+"""
+
+import difflib
+import json
+import logging
+import os
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .midi_backend import MidiBackend
+
+logger = logging.getLogger(__name__)
+
+# "Launchpad Mini MK3:Launchpad Mini MK3 LPMiniMK3 MI 20:1" -> drop " 20:1"
+ALSA_SUFFIX = re.compile(r'\s+\d+:\d+$')
+FUZZY_CUTOFF = 0.75
+
+
+@dataclass(frozen=True)
+class ResolvedPorts:
+    """🎯 Where a configured port name was found"""
+    in_index: int
+    out_index: int
+    in_name: str
+    out_name: str
+
+
+def normalize(name: str) -> str:
+    """🧽 Port name without the ALSA client:port numbers, which change between boots"""
+    return ALSA_SUFFIX.sub('', name).strip().lower()
+
+
+def match_port(wanted: str, ports: List[str]) -> Optional[int]:
+    """
+    🔍 Index of the port matching wanted, or None
+
+    Normalised and fuzzy matches must be unambiguous, so two identical
+    controllers are never confused with each other.
+    """
+    if wanted in ports:
+        return ports.index(wanted)
+    key = normalize(wanted)
+    names = [normalize(port) for port in ports]
+    if names.count(key) == 1:
+        return names.index(key)
+    close = difflib.get_close_matches(key, names, n=1, cutoff=FUZZY_CUTOFF)
+    if close and names.count(close[0]) == 1:
+        return names.index(close[0])
+    return None
+
+
+class PortCache:
+    """💾 Resolved port indices by configured name, kept in a small JSON file"""
+
+    def __init__(self, path: str):
+        self.path = Path(path).expanduser()
+        self._entries: Optional[Dict[str, dict]] = None
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, port_name: str) -> Optional[ResolvedPorts]:
+        entry = self._load().get(port_name)
+        try:
+            return ResolvedPorts(**entry) if entry else None
+        except TypeError:
+            return None
+
+    def put(self, port_name: str, ports: ResolvedPorts):
+        entries = self._load()
+        if entries.get(port_name) == asdict(ports):
+            return
+        entries[port_name] = asdict(ports)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix('.tmp')
+            tmp.write_text(json.dumps(entries, indent=2))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to write port cache {self.path}: {e}")
+
+
+def resolve_ports(backend: MidiBackend, port_name: str,
+                  cache: Optional[PortCache] = None) -> Optional[ResolvedPorts]:
+    """
+    🔎 Find the input and output ports for a configured name
+
+    Returns:
+        ResolvedPorts, or None if either direction has no match
+    """
+    cached = cache.get(port_name) if cache else None
+    if cached is not None and \
+            backend.get_input_port_name(cached.in_index) == cached.in_name and \
+            backend.get_output_port_name(cached.out_index) == cached.out_name:
+        logger.debug(f"💾 Using cached ports for {port_name!r}")
+        return cached
+
+    resolved = match_ports(port_name, backend.get_input_ports(), backend.get_output_ports())
+    if resolved is not None and cache:
+        cache.put(port_name, resolved)
+    return resolved
+
+
+def match_ports(port_name: str, in_ports: List[str],
+                out_ports: List[str]) -> Optional[ResolvedPorts]:
+    """🔍 Match a configured name against already-enumerated port lists"""
+    in_index = match_port(port_name, in_ports)
+    out_index = match_port(port_name, out_ports)
+    if in_index is None or out_index is None:
+        return None
+
+    resolved = ResolvedPorts(in_index, out_index, in_ports[in_index], out_ports[out_index])
+    if resolved.in_name != port_name:
+        logger.info(f"🔎 Matched {port_name!r} to {resolved.in_name!r}")
+    return resolved
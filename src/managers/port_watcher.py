@@ -0,0 +1,58 @@
+"""
+🔌 Port Watcher Module
+Notices when a Launchpad is unplugged (or its USB hub resets) and reconnects it
+without restarting the app.
+
+Flow:
+1. Every interval, check that each connected device's ports still carry its names
+2. A missing port marks the device disconnected; LED writes keep landing in its framebuffer
+3. Disconnected devices are re-resolved each interval; once found, the ports are
+   reopened, the input callback reattached and the whole frame replayed in one write
+"""
+
+import logging
+import threading
+from typing import Iterable, Optional
+
+from .midi_manager import MIDIManager
+
+logger = logging.getLogger(__name__)
+
+
+class PortWatcher:
+    """Background poller reconnecting MIDI devices that went away"""
+
+    def __init__(self, managers: Iterable[MIDIManager], interval: float = 0.25):
+        self.managers = list(managers)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """▶️ Begin watching on a daemon thread"""
+        self._thread = threading.Thread(target=self._run, name="launchpad-port-watcher", daemon=True)
+        self._thread.start()
+        logger.debug(f"🔌 Watching {len(self.managers)} MIDI device(s) every {self.interval}s")
+
+    def stop(self):
+        """🛑 Stop watching"""
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(self.interval + 1.0)
+        self._thread = None
+
+    def check(self):
+        """🔍 One pass: mark vanished devices, reconnect returning ones"""
+        for manager in self.managers:
+            if manager.connected:
+                if not manager.is_present():
+                    manager.disconnected()
+            else:
+                manager.reconnect()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"❌ Port watcher error: {e}")
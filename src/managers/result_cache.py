@@ -0,0 +1,148 @@
+"""
+🧊 Result Cache Module
+Shares and remembers the results of idempotent mappings (status checks and the like).
+
+Flow:
+1. A fresh cached result for the same command is returned without running anything
+   (keyed by ButtonMapping.result_key: alias, pipeline, launch policy and TTL)
+2. A press while the same command is already running shares that run's future (single-flight)
+3. Otherwise the run is started and, once it completes cleanly, its exit code and
+   output are kept for the mapping's TTL
+4. Least recently used results are evicted past max_entries or max_bytes of output
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional
+
+from ..models.execution import ExecutionResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResult:
+    """🧊 One remembered result and when it goes stale"""
+    result: ExecutionResult
+    expires: float
+    size: int
+
+
+class ResultCache:
+    """LRU of completed runs keyed by what ran, plus the runs still in flight"""
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Hashable, CachedResult]' = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evictions = 0
+
+    def run(self, key: Hashable, ttl: float, start: Callable[[], Future]) -> Future:
+        """
+        🎯 Serve key from the cache, join its in-flight run, or start() a new one
+
+        Args:
+            key: What identifies the result (ButtonMapping.result_key)
+            ttl: Seconds a completed result stays fresh (0 = single-flight only)
+            start: Begins the run and returns its future; not called on a hit
+
+        Returns:
+            Future: Resolves to the ExecutionResult (or None if nothing ran)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    future: Future = Future()
+                    future.set_result(entry.result)
+                    return future
+                self._discard(key)
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self.shared += 1
+                return inflight
+            self.misses += 1
+            # Claimed before start() so a concurrent press can't start a second run
+            shared = self._inflight[key] = Future()
+
+        try:
+            started = start()
+        except BaseException as e:
+            self._finish(key, 0, shared, None, e)
+            raise
+        started.add_done_callback(lambda done: self._finish(key, ttl, shared, done))
+        return shared
+
+    def _finish(self, key: Hashable, ttl: float, shared: Future, done: Optional[Future],
+                error: Optional[BaseException] = None):
+        """🏁 Settle the shared future from the real run, caching its result if clean"""
+        with self._lock:
+            if self._inflight.get(key) is shared:
+                del self._inflight[key]
+            if done is not None:
+                self._store_locked(key, ttl, done)
+        if done is None:
+            shared.set_exception(error)
+        elif done.cancelled():
+            shared.cancel()
+        elif done.exception() is not None:
+            shared.set_exception(done.exception())
+        else:
+            shared.set_result(done.result())
+
+    def _store_locked(self, key: Hashable, ttl: float, future: Future):
+        """💾 Keep a cleanly completed result; anything else isn't worth repeating"""
+        if ttl <= 0 or future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        if not isinstance(result, ExecutionResult) or result.returncode is None \
+                or result.timed_out or result.error:
+            return
+        size = len(result.output)
+        if size > self.max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = CachedResult(result, time.monotonic() + ttl, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _discard(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """🧹 Forget one key's result, or all of them"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._bytes = 0
+            else:
+                self._discard(key)
+
+    def stats(self) -> Dict[str, int]:
+        """📊 Hit/miss counters and current size"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'shared': self.shared,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
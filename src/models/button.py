@@ -29,4 +29,4 @@ class LaunchpadButton:
         🧮 Automatically calculate MIDI note number from x,y coordinates
         Formula: note = x + (y * 10)
         """
-        self.note = self.x + (y * 10)
\ No newline at end of file
+        self.note = self.x + (self.y * 10)
\ No newline at end of file
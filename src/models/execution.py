@@ -0,0 +1,34 @@
+# Path: src/models/execution.py
+"""
+📦 Execution Model Module
+Defines the outcome of running a mapped alias.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class ExecutionResult:
+    # 🏷️ What ran
+    alias: str
+    
+    # 🏁 How it ended (None while still running or if it never started)
+    returncode: Optional[int] = None
+    
+    # 📤 Output: the last few KB plus the total size produced
+    output: bytes = b""
+    output_bytes: int = 0
+    
+    # ⏱️ Timing (wall-clock start, seconds spent, seconds queued before it started)
+    started: float = 0.0
+    duration: float = 0.0
+    queue_wait: float = 0.0
+    
+    # ⚠️ Abnormal endings
+    timed_out: bool = False
+    error: Optional[str] = None
+    
+    @property
+    def success(self) -> bool:
+        """✅ True if the command exited with status 0"""
+        return self.returncode == 0
@@ -0,0 +1,70 @@
+"""
+🚀 Launch Policy Model
+Defines how a mapping's command is started, how long it may run and what it
+may use while it does.
+
+Flow:
+1. mode picks the lifecycle: wait (stop the process group at the timeout),
+   stream (keep running past it, report when it exits) or detach (report as
+   soon as it started: GUI apps, daemons)
+2. nice, cpus and rlimits are applied in the child before it execs, so
+   everything it spawns inherits them
+"""
+
+import os
+import resource
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+LAUNCH_MODES = ('wait', 'stream', 'detach')
+
+# rlimit name in the mapping file -> (resource, units per value)
+RLIMITS: Dict[str, Tuple[int, int]] = {
+    'cpu': (resource.RLIMIT_CPU, 1),               # CPU seconds
+    'memory_mb': (resource.RLIMIT_AS, 1024 * 1024),  # address space
+    'nofile': (resource.RLIMIT_NOFILE, 1),         # open files
+    'nproc': (resource.RLIMIT_NPROC, 1),           # processes of this user
+    'fsize_mb': (resource.RLIMIT_FSIZE, 1024 * 1024),  # largest file written
+}
+
+@dataclass(frozen=True)
+class LaunchPolicy:
+    # 🚦 Lifecycle: 'wait', 'stream' or 'detach'
+    mode: str = 'wait'
+
+    # ⏱️ Seconds to wait for the exit (None = SHELL_TIMEOUT, 0 = no limit)
+    timeout: Optional[float] = None
+
+    # 🧯 Isolation: niceness increment, allowed CPUs, (rlimit name, value) pairs
+    nice: int = 0
+    cpus: Tuple[int, ...] = ()
+    rlimits: Tuple[Tuple[str, int], ...] = ()
+
+    @property
+    def isolated(self) -> bool:
+        """🧯 True if the child needs setting up before it execs"""
+        return bool(self.nice or self.cpus or self.rlimits)
+
+    def preexec(self) -> Optional[Callable[[], None]]:
+        """
+        🧬 Function to run in the child between fork and exec (None if not isolated)
+
+        Only async-signal-safe-ish system calls happen there: no locks, no logging.
+        """
+        if not self.isolated:
+            return None
+        nice, cpus = self.nice, self.cpus
+        limits = [(RLIMITS[name][0], value * RLIMITS[name][1]) for name, value in self.rlimits]
+
+        def setup():
+            if nice:
+                os.nice(nice)
+            if cpus:
+                os.sched_setaffinity(0, cpus)
+            for limit, value in limits:
+                _, hard = resource.getrlimit(limit)
+                if hard != resource.RLIM_INFINITY:
+                    value = min(value, hard)
+                resource.setrlimit(limit, (value, value))
+
+        return setup
@@ -0,0 +1,178 @@
+"""
+🧬 Pipeline Model Module
+Defines a mapping that runs several aliases as a dependency graph (DAG).
+
+Flow:
+1. Each step names an alias and the steps it has to wait for
+2. Steps whose dependencies have all succeeded start together
+3. A failed step stops the pipeline (fail_fast), or only the steps that
+   depend on it (continue)
+4. The run is summed up as one ExecutionResult for the mapping
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from .execution import ExecutionResult
+
+ON_FAILURE_MODES = ('fail_fast', 'continue')
+
+
+class PipelineError(ValueError):
+    """❌ Steps that don't form a valid graph"""
+
+
+@dataclass(frozen=True)
+class PipelineStep:
+    # 🏷️ Name other steps refer to, and the alias it runs
+    name: str
+    alias: str
+
+    # 🔗 Steps that must succeed before this one starts
+    after: Tuple[str, ...] = ()
+
+    # ⏱️ Seconds before the step counts as failed (0 = wait until it exits)
+    timeout: float = 0.0
+
+
+@dataclass(frozen=True)
+class Pipeline:
+    steps: Tuple[PipelineStep, ...]
+    on_failure: str = 'fail_fast'
+
+    def __post_init__(self):
+        topological_order(self.steps)
+
+
+def topological_order(steps: Sequence[PipelineStep]) -> List[PipelineStep]:
+    """
+    📐 Steps ordered so each comes after its dependencies
+
+    Raises:
+        PipelineError: Duplicate names, unknown dependencies or a cycle
+    """
+    by_name: Dict[str, PipelineStep] = {}
+    for step in steps:
+        if step.name in by_name:
+            raise PipelineError(f"step {step.name!r} is defined twice")
+        by_name[step.name] = step
+    for step in steps:
+        for name in step.after:
+            if name not in by_name:
+                raise PipelineError(f"step {step.name!r} runs after unknown step {name!r}")
+
+    ordered: List[PipelineStep] = []
+    state: Dict[str, int] = {}  # 1 = being visited, 2 = done
+
+    def visit(step: PipelineStep, path: List[str]):
+        if state.get(step.name) == 2:
+            return
+        if state.get(step.name) == 1:
+            cycle = path[path.index(step.name):] + [step.name]
+            raise PipelineError(f"steps form a cycle: {' -> '.join(cycle)}")
+        state[step.name] = 1
+        for name in step.after:
+            visit(by_name[name], path + [step.name])
+        state[step.name] = 2
+        ordered.append(step)
+
+    for step in steps:
+        visit(step, [])
+    return ordered
+
+
+class PipelineRun:
+    """📋 Bookkeeping for one execution: what may start, what finished, what was skipped"""
+
+    def __init__(self, pipeline: Pipeline):
+        self.pipeline = pipeline
+        self.total = len(pipeline.steps)
+        self.results: Dict[str, ExecutionResult] = {}
+        self.skipped: List[str] = []
+        self.started: Set[str] = set()
+        self.stopped = False  # fail_fast tripped: start nothing more
+        self._waiting: Dict[str, Set[str]] = {step.name: set(step.after) for step in pipeline.steps}
+        self._dependents: Dict[str, List[PipelineStep]] = {step.name: [] for step in pipeline.steps}
+        for step in pipeline.steps:
+            for name in step.after:
+                self._dependents[name].append(step)
+
+    @property
+    def done(self) -> int:
+        """🔢 Steps that finished or will never run"""
+        return len(self.results) + len(self.skipped)
+
+    @property
+    def failed(self) -> List[str]:
+        return [name for name, result in self.results.items() if not result.success]
+
+    def ready(self) -> List[PipelineStep]:
+        """🚦 Steps with nothing left to wait for (the roots, before anything ran)"""
+        return self._claim([step for step in self.pipeline.steps if not self._waiting[step.name]])
+
+    def finish(self, step: PipelineStep, result: ExecutionResult) -> List[PipelineStep]:
+        """
+        🏁 Record a step's outcome
+
+        Returns:
+            List[PipelineStep]: Steps that can start now
+        """
+        self.results[step.name] = result
+        if not result.success:
+            if self.pipeline.on_failure == 'fail_fast':
+                self.stopped = True
+            else:
+                self._skip_dependents(step)
+            return []
+        if self.stopped:
+            return []
+        ready = []
+        for dependent in self._dependents[step.name]:
+            waiting = self._waiting[dependent.name]
+            waiting.discard(step.name)
+            if not waiting:
+                ready.append(dependent)
+        return self._claim(ready)
+
+    def _claim(self, steps: List[PipelineStep]) -> List[PipelineStep]:
+        steps = [step for step in steps if step.name not in self.started]
+        self.started.update(step.name for step in steps)
+        return steps
+
+    def _skip_dependents(self, step: PipelineStep):
+        for dependent in self._dependents[step.name]:
+            if dependent.name not in self.started and dependent.name not in self.skipped:
+                self.skipped.append(dependent.name)
+                self._skip_dependents(dependent)
+
+    def summary(self, alias: str, started: float, duration: float,
+                error: Optional[str] = None) -> ExecutionResult:
+        """📦 One result for the whole pipeline: exit 0 only if every step succeeded"""
+        lines = []
+        for step in topological_order(self.pipeline.steps):
+            result = self.results.get(step.name)
+            if result is None:
+                state = "⏹️ unfinished" if step.name in self.started else "⏭️ skipped"
+                lines.append(f"{state} {step.name}")
+            elif result.success:
+                lines.append(f"✅ {step.name} ({result.duration:.2f}s)")
+            else:
+                reason = result.error or f"exit {result.returncode}"
+                lines.append(f"❌ {step.name}: {reason} ({result.duration:.2f}s)")
+        output = ("\n".join(lines) + "\n").encode()
+
+        failed = self.failed
+        complete = len(self.results) == self.total
+        if error is None and failed:
+            error = f"failed: {', '.join(failed)}"
+        returncode = 0 if complete and not failed else 1
+        return ExecutionResult(
+            alias=alias,
+            returncode=None if error == "cancelled" else returncode,
+            output=output,
+            output_bytes=len(output),
+            started=started,
+            duration=duration,
+            timed_out=any(result.timed_out for result in self.results.values()),
+            error=error
+        )
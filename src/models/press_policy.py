@@ -0,0 +1,38 @@
+"""
+🚦 Press Policy Model
+Defines how a mapping reacts to rapid or overlapping presses.
+
+Flow:
+1. Debounce and the token bucket decide whether a press counts at all
+2. on_busy decides what a counted press does while the mapping is running:
+   queue (wait, up to `queue` presses), single (ignore) or restart (stop it, start fresh)
+3. Idempotent mappings skip both: presses share a run in flight or reuse its
+   result for cache_ttl seconds
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+ON_BUSY_MODES = ('queue', 'single', 'restart')
+
+@dataclass(frozen=True)
+class PressPolicy:
+    # ⏱️ Presses within this many ms of the last accepted one are ignored
+    debounce_ms: int = 0
+
+    # 🪣 Token bucket: sustained presses per second (0 = unlimited) and burst size
+    rate: float = 0.0
+    burst: int = 1
+
+    # 🏃 What a press does while the mapping is already running
+    on_busy: str = 'queue'
+    queue: Optional[int] = None  # max presses waiting (None = bounded by EXEC_QUEUE_SIZE)
+
+    # 🧊 Read-only commands: share runs in flight, reuse results for cache_ttl seconds
+    idempotent: bool = False
+    cache_ttl: float = 0.0
+
+    @property
+    def gated(self) -> bool:
+        """🚪 True if presses need a debounce/rate check before dispatch (never for idempotent ones)"""
+        return bool(self.debounce_ms or self.rate) and not self.idempotent
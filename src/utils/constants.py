@@ -6,6 +6,9 @@ Define MIDI constants and color codes.
 # MIDI message types
 MIDI_NOTE_ON = 0x90
 MIDI_NOTE_OFF = 0x80
+MIDI_POLY_AFTERTOUCH = 0xA0
+MIDI_STATUS_MASK = 0xF0
+MIDI_NOTE_COUNT = 128
 
 class Colors:
     """🎨 Color constants for Launchpad buttons"""
@@ -26,3 +29,29 @@ class Colors:
 # Grid configuration
 GRID_SIZE = 8
 MAX_VELOCITY = 127
+
+# Launchpad Mini MK3 SysEx (programmer reference: F0 00 20 29 02 0D <cmd> ... F7)
+SYSEX_HEADER = (0xF0, 0x00, 0x20, 0x29, 0x02, 0x0D)
+SYSEX_END = 0xF7
+SYSEX_LED_LIGHTING = 0x03
+LED_SPEC_STATIC = 0
+MAX_LED_SPECS = 81     # One lighting message can address every LED
+
+# LED framebuffer: 8x8 pads plus the edge row/column, addressed as x + y * 10
+LED_GRID_SIZE = 9
+LED_NOTES = tuple(x + y * 10 for y in range(LED_GRID_SIZE) for x in range(LED_GRID_SIZE))
+
+# Page controls (used once more than one page is mapped):
+# the right-hand edge column (8, y) jumps to page y, (0, 8)/(1, 8) step back/forward
+PAGE_SELECT_X = 8
+PAGE_PREV = (0, 8)
+PAGE_NEXT = (1, 8)
+PAGE_CONTROLS = tuple((PAGE_SELECT_X, y) for y in range(GRID_SIZE)) + (PAGE_PREV, PAGE_NEXT)
+
+# Multi-pad triggers: pads pressed together, or one after another
+GESTURE_KINDS = ('chord', 'sequence')
+MAX_CHORD_PADS = 4
+MAX_SEQUENCE_PADS = 8
+
+# Name of the controller when only LAUNCHPAD_PORT is configured
+DEFAULT_DEVICE = 'main'
@@ -1 +1,264 @@
-# LaunchpadDebugger class
\ No newline at end of file
+"""
+🔬 Debugger Module
+On-demand profiling of a running controller, toggled by signals, for when the
+pads feel sluggish and a debugger can't be attached.
+
+Flow:
+1. LaunchpadDebugger.install() makes SIGUSR1 toggle a CPU profile and SIGUSR2
+   an allocation window; until then (and between windows) nothing runs
+2. CPU: a sampler thread reads every thread's Python stack each PROFILE_INTERVAL_MS
+   (wall-clock: threads waiting in select or a lock show up too)
+3. Stopping writes cpu-<time>-<pid>.folded (flame graph input: one stack per line
+   with its sample count) and cpu-<time>-<pid>.txt (top functions by own and total samples)
+4. Allocations: tracemalloc runs for the window; stopping writes alloc-<time>-<pid>.txt,
+   what was allocated meanwhile and is still alive, by line and by traceback
+5. The signal handlers only hand the toggle to a short-lived thread, so reports
+   are written off the main thread and the event loop
+
+Usage:
+    kill -USR1 <pid>   # start CPU profile ... kill -USR1 <pid> again to write it
+    kill -USR2 <pid>   # start allocation window ... again to write the diff
+"""
+
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from types import CodeType
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_DEPTH = 64      # Frames kept per sampled stack
+TOP_FUNCTIONS = 40  # Rows in the CPU report
+TOP_ALLOCATIONS = 40
+TOP_TRACEBACKS = 5
+
+# Allocations made by the profiling itself and by imports aren't interesting
+ALLOCATION_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+class _Sampler:
+    """🧵 One CPU profile window: counts every thread's stacks until stopped"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples = 0
+        self.started = time.time()
+        self.stacks: Counter = Counter()  # (thread id, innermost-first code objects) -> samples
+        self.threads: Dict[int, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="cpu-profiler", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        own = threading.get_ident()
+        current_frames = sys._current_frames
+        stacks = self.stacks
+        while not self._stop.wait(self.interval):
+            for ident, frame in current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < MAX_DEPTH:
+                    stack.append(frame.f_code)
+                    frame = frame.f_back
+                stacks[(ident, tuple(stack))] += 1
+                if ident not in self.threads:
+                    self.threads.update((t.ident, t.name) for t in threading.enumerate())
+            self.samples += 1
+
+    def stop(self) -> float:
+        """⏹️ Stop sampling; returns the window's length in seconds"""
+        self._stop.set()
+        self._thread.join()
+        return time.time() - self.started
+
+
+def _label(code: CodeType, labels: Dict[CodeType, str]) -> str:
+    label = labels.get(code)
+    if label is None:
+        path = Path(code.co_filename)
+        where = path.name if path.parent.name in ('', '.') else f"{path.parent.name}/{path.name}"
+        label = labels[code] = f"{code.co_name} ({where}:{code.co_firstlineno})"
+    return label
+
+
+class LaunchpadDebugger:
+    """🔬 Signal-driven CPU profiles and allocation diffs, written to a directory"""
+
+    def __init__(self, directory: str = '~/.cache/launchpad-shell/profiles',
+                 interval: float = 0.01, frames: int = 25):
+        """
+        Args:
+            directory: Where reports are written
+            interval: Seconds between stack samples
+            frames: Traceback depth tracemalloc records per allocation
+        """
+        self.directory = Path(directory).expanduser()
+        self.interval = max(0.001, interval)
+        self.frames = max(1, frames)
+        self._lock = threading.Lock()
+        self._sampler: Optional[_Sampler] = None
+        self._tracing_since: Optional[float] = None
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._owns_tracing = False
+
+    @property
+    def profiling(self) -> bool:
+        return self._sampler is not None
+
+    @property
+    def tracing(self) -> bool:
+        return self._tracing_since is not None
+
+    def install(self):
+        """📡 SIGUSR1 toggles the CPU profile, SIGUSR2 the allocation window (main thread only)"""
+        signal.signal(signal.SIGUSR1, self._on_signal)
+        signal.signal(signal.SIGUSR2, self._on_signal)
+        logger.debug(f"🔬 Profiling on demand: kill -USR1 / -USR2 {os.getpid()}")
+
+    def _on_signal(self, signum, frame):
+        # Runs on the main thread between bytecodes: don't take locks or write files here
+        toggle = self.toggle_profile if signum == signal.SIGUSR1 else self.toggle_allocations
+        threading.Thread(target=toggle, name="debugger-toggle", daemon=True).start()
+
+    # 🔥 CPU profile
+
+    def toggle_profile(self) -> Optional[Path]:
+        """🔁 Start a CPU profile, or stop the running one and return its report"""
+        with self._lock:
+            if self._sampler is None:
+                self._sampler = _Sampler(self.interval)
+                logger.info(f"🔬 CPU profile started ({self.interval * 1000:g} ms samples)")
+                return None
+            return self._stop_profile_locked()
+
+    def _stop_profile_locked(self) -> Optional[Path]:
+        sampler, self._sampler = self._sampler, None
+        duration = sampler.stop()
+        try:
+            report = self._write_profile(sampler, duration)
+        except OSError as e:
+            logger.error(f"❌ Couldn't write CPU profile: {e}")
+            return None
+        logger.info(f"🔬 CPU profile: {sampler.samples} samples over {duration:.1f}s -> {report}")
+        return report
+
+    def _write_profile(self, sampler: _Sampler, duration: float) -> Path:
+        stamp = self._stamp(sampler.started)
+        labels: Dict[CodeType, str] = {}
+        own: Counter = Counter()
+        total: Counter = Counter()
+        folded: List[str] = []
+        for (ident, stack), count in sampler.stacks.items():
+            names = [_label(code, labels) for code in stack]
+            if names:
+                own[names[0]] += count
+            for name in set(names):
+                total[name] += count
+            thread = sampler.threads.get(ident, str(ident))
+            folded.append(f"{';'.join([thread] + names[::-1])} {count}")
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / f"cpu-{stamp}.folded").write_text("\n".join(sorted(folded)) + "\n")
+
+        samples = max(1, sampler.samples)
+        lines = [
+            f"CPU profile of pid {os.getpid()}: {duration:.1f}s, {sampler.samples} samples "
+            f"every {self.interval * 1000:g} ms, {len(set(i for i, _ in sampler.stacks))} threads",
+            "Wall-clock samples of every thread; % is per sampling round, so a function "
+            "several threads wait in can pass 100%",
+        ]
+        for title, counts in (("Own samples (innermost frame)", own),
+                              ("Total samples (anywhere on the stack)", total)):
+            lines += ["", title]
+            lines += [f"  {count / samples:7.1%} {count:>8}  {name}"
+                      for name, count in counts.most_common(TOP_FUNCTIONS)]
+        report = self.directory / f"cpu-{stamp}.txt"
+        report.write_text("\n".join(lines) + "\n")
+        return report
+
+    # 🧠 Allocations
+
+    def toggle_allocations(self) -> Optional[Path]:
+        """🔁 Start an allocation window, or end the open one and return its diff report"""
+        with self._lock:
+            if self._tracing_since is None:
+                self._owns_tracing = not tracemalloc.is_tracing()
+                if self._owns_tracing:
+                    tracemalloc.start(self.frames)
+                    self._baseline = None  # Nothing was traced before now
+                else:
+                    self._baseline = tracemalloc.take_snapshot()
+                self._tracing_since = time.time()
+                logger.info(f"🔬 Allocation tracing started ({self.frames} frames)")
+                return None
+            return self._stop_allocations_locked()
+
+    def _stop_allocations_locked(self) -> Optional[Path]:
+        since, self._tracing_since = self._tracing_since, None
+        baseline, self._baseline = self._baseline, None
+        snapshot = tracemalloc.take_snapshot().filter_traces(ALLOCATION_FILTERS)
+        current, peak = tracemalloc.get_traced_memory()
+        if self._owns_tracing:
+            tracemalloc.stop()
+        try:
+            report = self._write_allocations(snapshot, baseline, since, current, peak)
+        except OSError as e:
+            logger.error(f"❌ Couldn't write allocation report: {e}")
+            return None
+        logger.info(f"🔬 Allocations over {time.time() - since:.1f}s -> {report}")
+        return report
+
+    def _write_allocations(self, snapshot: tracemalloc.Snapshot,
+                           baseline: Optional[tracemalloc.Snapshot], since: float,
+                           current: int, peak: int) -> Path:
+        if baseline is not None:
+            baseline = baseline.filter_traces(ALLOCATION_FILTERS)
+            by_line = snapshot.compare_to(baseline, 'lineno')
+            by_traceback = snapshot.compare_to(baseline, 'traceback')
+        else:
+            by_line = snapshot.statistics('lineno')
+            by_traceback = snapshot.statistics('traceback')
+
+        lines = [
+            f"Allocations of pid {os.getpid()} still alive after {time.time() - since:.1f}s "
+            f"(traced now {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB)",
+            "",
+            "By line",
+        ]
+        lines += [f"  {stat}" for stat in by_line[:TOP_ALLOCATIONS]]
+        for stat in by_traceback[:TOP_TRACEBACKS]:
+            lines += ["", f"{stat}"]
+            lines += [f"  {line}" for line in stat.traceback.format(most_recent_first=True)]
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        report = self.directory / f"alloc-{self._stamp(since)}.txt"
+        report.write_text("\n".join(lines) + "\n")
+        return report
+
+    # 🛑 Shutdown
+
+    def close(self):
+        """💾 Write out any window still open"""
+        with self._lock:
+            if self._sampler is not None:
+                self._stop_profile_locked()
+            if self._tracing_since is not None:
+                self._stop_allocations_locked()
+
+    @staticmethod
+    def _stamp(started: float) -> str:
+        return f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(started))}-{os.getpid()}"
@@ -0,0 +1,135 @@
+"""
+👁️ File Watcher Module
+Calls back when a file changes, using inotify on Linux and polling elsewhere.
+
+Flow:
+1. Watch the file's directory, so editors that save by rename are caught too
+2. Collapse bursts of events (write + rename + chmod) with a short settle delay
+3. Invoke the callback on the watcher thread once the file's contents settle
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+EVENT = struct.Struct('iIII')
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class FileWatcher:
+    """Background watcher for a single file"""
+
+    def __init__(self, path: str, callback: Callable[[], None],
+                 settle: float = 0.1, poll_interval: float = 1.0):
+        self.path = Path(path).expanduser().absolute()
+        self.callback = callback
+        self.settle = settle
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._fd: Optional[int] = None
+        self._last = _stat_key(self.path)
+
+    def start(self):
+        """▶️ Begin watching on a daemon thread"""
+        self._fd = self._inotify_fd()
+        target = self._inotify_loop if self._fd is not None else self._poll_loop
+        self._thread = threading.Thread(target=target, name="launchpad-file-watcher", daemon=True)
+        self._thread.start()
+        mode = "inotify" if self._fd is not None else "polling"
+        logger.debug(f"👁️ Watching {self.path} ({mode})")
+
+    def stop(self):
+        """🛑 Stop watching"""
+        self._stop.set()
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            os.close(fd)
+
+    def _inotify_fd(self) -> Optional[int]:
+        """🐧 An inotify fd watching the file's directory, or None if unavailable"""
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, str(self.path.parent).encode(), WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    def _fire(self):
+        """🔔 Invoke the callback if the file really changed"""
+        key = _stat_key(self.path)
+        if key == self._last or key is None:
+            return
+        self._last = key
+        try:
+            self.callback()
+        except Exception as e:
+            logger.error(f"❌ File watcher callback failed for {self.path}: {e}")
+
+    def _inotify_loop(self):
+        name = self.path.name.encode()
+        while not self._stop.is_set():
+            fd = self._fd
+            try:
+                readable = select.select([fd], [], [], 1.0)[0]
+                if not readable:
+                    continue
+                data = os.read(fd, 65536)
+            except (OSError, ValueError, TypeError):
+                return
+
+            relevant = False
+            offset = 0
+            while offset + EVENT.size <= len(data):
+                _, _, _, length = EVENT.unpack_from(data, offset)
+                start = offset + EVENT.size
+                if data[start:start + length].rstrip(b'\0') == name:
+                    relevant = True
+                offset = start + length
+            if not relevant:
+                continue
+
+            # Let the rest of an editor's save sequence arrive before reloading
+            if self._stop.wait(self.settle):
+                return
+            try:
+                while os.read(fd, 65536):
+                    pass
+            except (BlockingIOError, OSError, TypeError):
+                pass
+            self._fire()
+
+    def _poll_loop(self):
+        while not self._stop.wait(self.poll_interval):
+            self._fire()
@@ -0,0 +1,298 @@
+"""
+📜 Execution History Module
+Every finished run, appended to a fixed-size ring file that is memory-mapped,
+so the app's memory and disk use stay constant however long it runs.
+
+Flow:
+1. The file is a header plus HISTORY_SIZE fixed-width records, created at its
+   full size once and reused across restarts
+2. ExecutionHistory listens for execution_finished and packs one record straight
+   into the mapping: no file growth, no write() call, no per-event buffers
+3. The header's write counter is bumped after the record is in place, so a
+   crash loses at most the run being written; the oldest record is overwritten
+   once the ring is full
+4. Readers (python main.py history) map the same file read-only and unpack one
+   record at a time, while the app keeps writing
+
+File layout:
+    header  8s magic, I record size, I capacity, Q records written (padded to 64 bytes)
+    record  d wall-clock start, f queue wait s, f duration s, i exit code, I output bytes,
+            B note, B flags, H page, 16s device, 52s alias (names truncated, NUL-padded)
+"""
+
+import logging
+import mmap
+import os
+import random
+import struct
+import threading
+from collections import namedtuple
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..models.execution import ExecutionResult
+from .constants import DEFAULT_DEVICE
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"LPHIS\x00\x01\x00"
+HEADER = struct.Struct('<8sIIQ')
+HEADER_SIZE = 64  # Records start cache-line aligned
+RECORD = struct.Struct('<dffiIBBH16s52s')
+NO_EXIT = -2 ** 31  # returncode None: never started, cancelled or still running
+
+# 🚩 Record flags
+TIMED_OUT = 0x01
+ERROR = 0x02
+CHORD = 0x04
+SEQUENCE = 0x08
+PIPELINE = 0x10
+
+MAX_NAMES = 4096  # Encoded device/alias names kept for reuse
+RESERVOIR_SIZE = 1024  # Samples kept per group for percentiles (exact up to this many runs)
+
+HistoryEntry = namedtuple('HistoryEntry', (
+    'started', 'queue_wait', 'duration', 'returncode', 'output_bytes',
+    'note', 'flags', 'page', 'device', 'alias',
+))
+
+
+def _file_size(capacity: int) -> int:
+    return HEADER_SIZE + capacity * RECORD.size
+
+
+class ExecutionHistory:
+    """📜 Execution listener that appends each finished run to the ring file"""
+
+    def __init__(self, path: str, capacity: int = 50000):
+        self.path = Path(path).expanduser()
+        self.capacity = max(1, capacity)
+        self._lock = threading.Lock()
+        self._names: Dict[str, bytes] = {}
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._written = 0
+
+    def open(self) -> bool:
+        """
+        📂 Map the ring file, creating (or, if its layout changed, recreating) it
+
+        Returns:
+            bool: False if the file couldn't be opened; runs are then not recorded
+        """
+        size = _file_size(self.capacity)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._file = os.fdopen(fd, 'r+b')
+            header = self._file.read(HEADER.size)
+            fresh = len(header) < HEADER.size or \
+                HEADER.unpack(header)[:3] != (MAGIC, RECORD.size, self.capacity)
+            if fresh:
+                if header:
+                    logger.warning(f"📜 {self.path} has a different layout or size; starting over")
+                self._file.truncate(0)
+            self._file.truncate(size)
+            self._map = mmap.mmap(self._file.fileno(), size)
+        except (OSError, ValueError) as e:
+            logger.error(f"❌ Execution history {self.path} unavailable: {e}")
+            self.close()
+            return False
+        if fresh:
+            HEADER.pack_into(self._map, 0, MAGIC, RECORD.size, self.capacity, 0)
+        self._written = HEADER.unpack_from(self._map)[3]
+        logger.info(f"📜 Execution history: {self.path} "
+                    f"({min(self._written, self.capacity)}/{self.capacity} records)")
+        return True
+
+    def close(self):
+        """💾 Flush the mapping and close the file"""
+        with self._lock:
+            if self._map is not None:
+                self._map.flush()
+                self._map.close()
+                self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _name(self, value: str) -> bytes:
+        encoded = self._names.get(value)
+        if encoded is None:
+            if len(self._names) >= MAX_NAMES:
+                self._names.clear()
+            encoded = self._names[value] = value.encode()
+        return encoded
+
+    def record(self, result: ExecutionResult, device: str = '', note: int = 0,
+               page: int = 0, flags: int = 0):
+        """✍️ Append one run, overwriting the oldest record once the ring is full"""
+        if result.timed_out:
+            flags |= TIMED_OUT
+        if result.error:
+            flags |= ERROR
+        returncode = NO_EXIT if result.returncode is None else result.returncode
+        with self._lock:
+            if self._map is None:
+                return
+            offset = HEADER_SIZE + (self._written % self.capacity) * RECORD.size
+            RECORD.pack_into(
+                self._map, offset, result.started, result.queue_wait, result.duration,
+                returncode, min(result.output_bytes, 0xFFFFFFFF), note, flags, page,
+                self._name(device), self._name(result.alias)
+            )
+            self._written += 1
+            HEADER.pack_into(self._map, 0, MAGIC, RECORD.size, self.capacity, self._written)
+
+    # 🎧 AliasHandler listener
+
+    def execution_started(self, alias: str, context: Any):
+        pass
+
+    def execution_finished(self, alias: str, context: Any, result: ExecutionResult):
+        # Mapped pads and gestures only: pipeline steps roll up into their pipeline's run
+        button = getattr(context, 'button', None)
+        if button is None:
+            return
+        flags = 0
+        gesture = getattr(context, 'gesture', '')
+        if gesture:
+            flags |= CHORD if gesture == 'chord' else SEQUENCE
+        if getattr(context, 'pipeline', None) is not None:
+            flags |= PIPELINE
+        self.record(result, context.device, button.note, context.page, flags)
+
+    def pipeline_progress(self, alias: str, context: Any, done: int, total: int,
+                          result: ExecutionResult):
+        pass
+
+
+def read_history(path: str) -> Iterator[HistoryEntry]:
+    """
+    📖 Yield the records in a ring file, oldest first
+
+    The file is mapped read-only and unpacked one record at a time, so this
+    works on a file the app is still writing.
+    """
+    with open(Path(path).expanduser(), 'rb') as file:
+        if os.fstat(file.fileno()).st_size < HEADER_SIZE:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            magic, record_size, capacity, written = HEADER.unpack_from(view)
+            if magic != MAGIC or record_size != RECORD.size or \
+                    len(view) < _file_size(capacity):
+                raise ValueError(f"{path} isn't an execution history file")
+            count = min(written, capacity)
+            first = written - count
+            for i in range(first, written):
+                fields = RECORD.unpack_from(view, HEADER_SIZE + (i % capacity) * RECORD.size)
+                yield HistoryEntry(
+                    *fields[:3],
+                    None if fields[3] == NO_EXIT else fields[3],
+                    *fields[4:8],
+                    fields[8].rstrip(b'\0').decode(errors='ignore'),
+                    fields[9].rstrip(b'\0').decode(errors='ignore'),
+                )
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """📐 Nearest-rank percentile of sorted values"""
+    return values[min(len(values) - 1, int(q * len(values)))] if values else 0.0
+
+
+class _Reservoir:
+    """🎲 A uniform sample of at most size values, however many are added"""
+
+    __slots__ = ('size', 'seen', 'samples', '_random')
+
+    def __init__(self, rng: random.Random, size: int = RESERVOIR_SIZE):
+        self.size = size
+        self.seen = 0
+        self.samples: List[float] = []
+        self._random = rng
+
+    def add(self, value: float):
+        self.seen += 1
+        if len(self.samples) < self.size:
+            self.samples.append(value)
+            return
+        slot = self._random.randrange(self.seen)
+        if slot < self.size:
+            self.samples[slot] = value
+
+    def percentiles(self, *qs: float) -> List[float]:
+        ordered = sorted(self.samples)
+        return [_percentile(ordered, q) for q in qs]
+
+
+def pad_label(entry: HistoryEntry) -> str:
+    """📍 Where a run came from: [device/][page:]x,y (chords and sequences by their first pad)"""
+    label = f"{entry.note % 10},{entry.note // 10}"
+    if entry.flags & CHORD:
+        label = f"chord@{label}"
+    elif entry.flags & SEQUENCE:
+        label = f"sequence@{label}"
+    if entry.page:
+        label = f"{entry.page}:{label}"
+    if entry.device and entry.device != DEFAULT_DEVICE:
+        label = f"{entry.device}/{label}"
+    return label
+
+
+def summarize(entries: Iterator[HistoryEntry], since: float = 0.0,
+              alias: Optional[str] = None) -> Dict[str, Any]:
+    """
+    📊 Fold records into per-alias and per-pad statistics
+
+    Counts, mean and max are exact; percentiles come from a sample of at most
+    RESERVOIR_SIZE runs per group, so memory stays flat however long the history.
+
+    Args:
+        entries: Records, e.g. from read_history()
+        since: Skip runs started before this wall-clock time
+        alias: Only this alias
+
+    Returns:
+        dict: 'runs', 'first', 'last', plus 'aliases' and 'pads', each mapping a
+              name to runs, failures, timeouts, mean/p50/p99/max duration and
+              p50/p99 queue wait
+    """
+    groups: Dict[str, Dict[str, dict]] = {'aliases': {}, 'pads': {}}
+    rng = random.Random(0)  # Same history, same summary
+    runs, first, last = 0, 0.0, 0.0
+    for entry in entries:
+        if entry.started < since or (alias is not None and entry.alias != alias):
+            continue
+        runs += 1
+        first = entry.started if not first else min(first, entry.started)
+        last = max(last, entry.started)
+        failed = entry.returncode != 0
+        for kind, key in (('aliases', entry.alias), ('pads', pad_label(entry))):
+            group = groups[kind].get(key)
+            if group is None:
+                group = groups[kind][key] = {
+                    'alias': entry.alias, 'runs': 0, 'failures': 0, 'timeouts': 0,
+                    'total': 0.0, 'max': 0.0,
+                    'durations': _Reservoir(rng), 'waits': _Reservoir(rng),
+                }
+            group['runs'] += 1
+            group['failures'] += failed
+            group['timeouts'] += bool(entry.flags & TIMED_OUT)
+            group['total'] += entry.duration
+            group['max'] = max(group['max'], entry.duration)
+            group['durations'].add(entry.duration)
+            group['waits'].add(entry.queue_wait)
+
+    for kind in groups.values():
+        for group in kind.values():
+            p50, p99 = group.pop('durations').percentiles(0.5, 0.99)
+            wait_p50, wait_p99 = group.pop('waits').percentiles(0.5, 0.99)
+            group.update(
+                failure_rate=group['failures'] / group['runs'],
+                mean=group.pop('total') / group['runs'],
+                p50=p50,
+                p99=p99,
+                wait_p50=wait_p50,
+                wait_p99=wait_p99,
+            )
+    return {'runs': runs, 'first': first, 'last': last, **groups}
@@ -0,0 +1,278 @@
+"""
+📈 Metrics Module
+Low-overhead press-to-exec latency histograms with file and Prometheus export.
+
+Flow:
+1. The MIDI callback opens a PressTrace for each incoming event
+2. Each stage (dispatch, queued, start, spawn, first_output, exit) is stamped
+3. Finished traces are folded into per-mapping, per-stage histograms
+4. Histograms are dumped to a file periodically and/or served on localhost
+"""
+
+import asyncio
+import bisect
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Bucket upper bounds in seconds (+Inf is implicit)
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class LatencyHistogram:
+    """📊 Fixed-bucket cumulative histogram"""
+    __slots__ = ('counts', 'total', 'count')
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """📐 Upper bucket bound containing quantile q"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, bucket in zip(LATENCY_BUCKETS, self.counts):
+            seen += bucket
+            if seen >= target:
+                return bound
+        return float('inf')
+
+
+class PressTrace:
+    """⏱️ Stage timestamps for one button press"""
+    __slots__ = ('metrics', 'received', 'midi_delta', 'mapping', 'alias', 'marks')
+
+    def __init__(self, metrics: 'LatencyMetrics', midi_delta: float,
+                 received: Optional[float] = None):
+        self.metrics = metrics
+        self.received = received if received is not None else time.perf_counter()
+        self.midi_delta = midi_delta
+        self.mapping = ''
+        self.alias = ''
+        self.marks: List[Tuple[str, float]] = []
+
+    def mark(self, stage: str):
+        """📍 Stamp a stage (first stamp wins)"""
+        self.marks.append((stage, time.perf_counter()))
+
+    def finish(self):
+        """🏁 Fold this trace into the histograms"""
+        self.metrics.record(self)
+
+
+class LatencyMetrics:
+    """Registry of per-mapping stage histograms"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._current: Optional[PressTrace] = None
+        self._histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self._intervals = LatencyHistogram()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server: Optional['ThreadingHTTPServer'] = None
+        self._dump_path: Optional[str] = None
+        self._counters: List[Tuple[str, str, str, Callable[[], Dict[str, int]]]] = []
+
+    def begin(self, midi_delta: float, received: Optional[float] = None):
+        """
+        🎹 Called at MIDI callback entry; opens a trace for this event
+
+        Args:
+            received: perf_counter() at callback entry, when the event is
+                handed to another thread before dispatch
+        """
+        self._current = PressTrace(self, midi_delta, received)
+
+    def take(self) -> Optional[PressTrace]:
+        """🎯 Claim the current event's trace at dispatch time"""
+        trace = self._current
+        if trace is None:
+            return None
+        self._current = None
+        trace.mark('dispatch')
+        return trace
+
+    def add_counters(self, name: str, help_text: str, label: str,
+                     source: Callable[[], Dict[str, int]]):
+        """🔢 Export a family of counters read from source() at render time"""
+        self._counters.append((name, help_text, label, source))
+
+    def reset(self):
+        """🧹 Drop all recorded samples"""
+        with self._lock:
+            self._histograms.clear()
+            self._intervals = LatencyHistogram()
+
+    def stage_histogram(self, stage: str) -> LatencyHistogram:
+        """📊 One stage's samples merged across all mappings"""
+        merged = LatencyHistogram()
+        with self._lock:
+            for (_, _, name), histogram in self._histograms.items():
+                if name != stage:
+                    continue
+                merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+                merged.total += histogram.total
+                merged.count += histogram.count
+        return merged
+
+    def record(self, trace: PressTrace):
+        with self._lock:
+            self._intervals.observe(trace.midi_delta)
+            seen = set()
+            for stage, stamp in trace.marks:
+                if stage in seen:
+                    continue
+                seen.add(stage)
+                key = (trace.mapping, trace.alias, stage)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = LatencyHistogram()
+                histogram.observe(stamp - trace.received)
+
+    def summary(self) -> Dict[str, Dict[str, dict]]:
+        """📋 p50/p99/mean per mapping and stage, in milliseconds"""
+        with self._lock:
+            result: Dict[str, Dict[str, dict]] = {}
+            for (mapping, alias, stage), histogram in self._histograms.items():
+                result.setdefault(f"{mapping} {alias}", {})[stage] = {
+                    'count': histogram.count,
+                    'mean_ms': histogram.total / histogram.count * 1000,
+                    'p50_ms': histogram.quantile(0.5) * 1000,
+                    'p99_ms': histogram.quantile(0.99) * 1000,
+                }
+            return result
+
+    def render_prometheus(self) -> str:
+        """📝 Prometheus text exposition of all histograms"""
+        lines = [
+            "# HELP launchpad_press_latency_seconds Time from MIDI callback to each stage",
+            "# TYPE launchpad_press_latency_seconds histogram",
+        ]
+        with self._lock:
+            items = sorted(self._histograms.items())
+            series = [
+                (f'mapping="{_escape(m)}",alias="{_escape(a)}",stage="{s}",', h)
+                for (m, a, s), h in items
+            ]
+            for labels, histogram in series:
+                self._render_histogram(lines, "launchpad_press_latency_seconds", labels, histogram)
+            lines += [
+                "# HELP launchpad_midi_event_interval_seconds rtmidi delta time between input events",
+                "# TYPE launchpad_midi_event_interval_seconds histogram",
+            ]
+            self._render_histogram(lines, "launchpad_midi_event_interval_seconds", "", self._intervals)
+        for name, help_text, label, source in self._counters:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for value, count in sorted(source().items()):
+                lines.append(f'{name}{{{label}="{_escape(value)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histogram(lines: List[str], name: str, labels: str, histogram: LatencyHistogram):
+        cumulative = 0
+        for bound, bucket in zip(LATENCY_BUCKETS, histogram.counts):
+            cumulative += bucket
+            lines.append(f'{name}_bucket{{{labels}le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels}le="+Inf"}} {histogram.count}')
+        bare = labels.rstrip(',')
+        lines.append(f'{name}_sum{{{bare}}} {histogram.total}')
+        lines.append(f'{name}_count{{{bare}}} {histogram.count}')
+
+    def dump(self, path: str):
+        """💾 Atomically write the Prometheus text to a file"""
+        path = os.path.expanduser(path)
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w') as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp, path)
+
+    def start_dump(self, path: str, interval: float = 60.0,
+                   loop: Optional[asyncio.AbstractEventLoop] = None):
+        """⏲️ Dump to path every interval seconds, on loop's timers or a background thread"""
+        self._dump_path = path
+
+        def dump():
+            try:
+                self.dump(path)
+            except OSError as e:
+                logger.warning(f"⚠️ Failed to dump metrics to {path}: {e}")
+
+        if loop is not None:
+            def tick():
+                if not self._stop.is_set():
+                    dump()
+                    loop.call_later(interval, tick)
+
+            loop.call_soon_threadsafe(loop.call_later, interval, tick)
+        else:
+            def run():
+                while not self._stop.wait(interval):
+                    dump()
+
+            threading.Thread(target=run, name="launchpad-metrics-dump", daemon=True).start()
+        logger.info(f"📈 Dumping latency metrics to {path} every {interval:g}s")
+
+    def start_http(self, port: int, host: str = '127.0.0.1'):
+        """🌐 Serve /metrics on localhost"""
+        # Imported here so startup without the HTTP exporter doesn't pay for it
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name="launchpad-metrics-http", daemon=True
+        ).start()
+        logger.info(f"📈 Serving latency metrics on http://{host}:{port}/metrics")
+
+    def stop(self):
+        """🛑 Stop background export, writing a final dump"""
+        self._stop.set()
+        if self._dump_path:
+            try:
+                self.dump(self._dump_path)
+            except OSError as e:
+                logger.warning(f"⚠️ Failed to dump metrics to {self._dump_path}: {e}")
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
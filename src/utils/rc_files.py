@@ -0,0 +1,37 @@
+"""
+📜 Shell RC Files Module
+Locates the startup files a shell sources and fingerprints them for change detection.
+"""
+
+import os
+from pathlib import Path
+from typing import List, Tuple
+
+# Startup files sourced by interactive shells, relative to $HOME (or $ZDOTDIR for zsh)
+RC_FILES = {
+    'zsh': ['.zshenv', '.zprofile', '.zshrc', '.zlogin'],
+    'bash': ['.bashrc', '.bash_profile', '.bash_aliases', '.profile'],
+}
+
+
+def rc_files_for(shell_path: str) -> List[Path]:
+    """📂 List rc files that may affect an interactive shell"""
+    shell = Path(shell_path).name
+    home = Path.home()
+    if shell == 'zsh':
+        base = Path(os.environ.get('ZDOTDIR', home))
+    else:
+        base = home
+    return [base / name for name in RC_FILES.get(shell, ['.profile'])]
+
+
+def rc_fingerprint(shell_path: str) -> Tuple[Tuple[str, int, int], ...]:
+    """🔏 Cheap (path, mtime, size) fingerprint of the shell's rc files"""
+    fingerprint = []
+    for path in rc_files_for(shell_path):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        fingerprint.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(fingerprint)
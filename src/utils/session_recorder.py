@@ -0,0 +1,131 @@
+"""
+📼 Session Recorder Module
+Compact binary recording of raw MIDI input for reproducing "the pad lagged" reports.
+
+Flow:
+1. Each segment file is preallocated and memory-mapped
+2. Every input message is appended as a packed (length, delta, bytes) record
+3. Full segments are trimmed and a new one is started; old ones are rotated out
+4. read_session() yields (message, delta) pairs ready for replay
+
+File layout:
+    header  8s magic, d wall-clock start time
+    record  B message length (0 marks the end), f rtmidi delta seconds, message bytes
+"""
+
+import glob
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"LPREC\x00\x01\x00"
+HEADER = struct.Struct('<8sd')
+RECORD = struct.Struct('<Bf')
+FILE_PATTERN = "session-*.lprec"
+
+
+class SessionRecorder:
+    """Append-only, memory-mapped, rotating MIDI input log"""
+
+    def __init__(self, directory: str = '~/.cache/launchpad-shell/sessions',
+                 segment_size: int = 1024 * 1024, max_files: int = 10):
+        self.directory = Path(directory).expanduser()
+        self.segment_size = max(segment_size, HEADER.size + RECORD.size + 255 + 1)
+        self.max_files = max(1, max_files)
+        self.records = 0
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._offset = 0
+        self._segment = 0
+        self.path: Optional[Path] = None
+
+    def _open_segment(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        self.path = self.directory / f"session-{stamp}-{os.getpid()}-{self._segment:04d}.lprec"
+        self._segment += 1
+
+        self._file = open(self.path, 'w+b')
+        self._file.truncate(self.segment_size)
+        self._map = mmap.mmap(self._file.fileno(), self.segment_size)
+        HEADER.pack_into(self._map, 0, MAGIC, time.time())
+        self._offset = HEADER.size
+        self._rotate()
+        logger.debug(f"📼 Recording MIDI input to {self.path}")
+
+    def _close_segment(self):
+        if self._map is None:
+            return
+        used = self._offset
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(used)
+        self._file.close()
+        self._map = None
+        self._file = None
+
+    def _rotate(self):
+        """🗑️ Keep only the newest max_files segments"""
+        files = list_sessions(str(self.directory))
+        for old in files[:-self.max_files]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+    def write(self, message: List[int], delta: float):
+        """✍️ Append one input message (called from the MIDI callback)"""
+        length = len(message)
+        if not 0 < length <= 255:
+            return
+        with self._lock:
+            if self._map is None or self._offset + RECORD.size + length >= self.segment_size:
+                self._close_segment()
+                self._open_segment()
+            RECORD.pack_into(self._map, self._offset, length, delta)
+            start = self._offset + RECORD.size
+            self._map[start:start + length] = bytes(message)
+            self._offset = start + length
+            self.records += 1
+
+    def close(self):
+        """💾 Trim and close the current segment"""
+        with self._lock:
+            self._close_segment()
+
+
+def read_session(path: str) -> Iterator[Tuple[List[int], float]]:
+    """📖 Yield (message, delta) pairs from one recording"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < HEADER.size or HEADER.unpack_from(data, 0)[0] != MAGIC:
+        raise ValueError(f"{path} is not a Launchpad session recording")
+
+    offset = HEADER.size
+    limit = len(data) - RECORD.size
+    while offset <= limit:
+        length, delta = RECORD.unpack_from(data, offset)
+        if length == 0:
+            break
+        start = offset + RECORD.size
+        message = list(data[start:start + length])
+        if len(message) < length:
+            break
+        yield message, delta
+        offset = start + length
+
+
+def list_sessions(directory: str = '~/.cache/launchpad-shell/sessions') -> List[str]:
+    """📋 Recordings in a directory, oldest first"""
+    pattern = str(Path(directory).expanduser() / FILE_PATTERN)
+    # Names break mtime ties (coarse clocks), so the segment being written sorts last
+    return sorted(glob.glob(pattern), key=lambda path: (os.path.getmtime(path), path))
@@ -0,0 +1,43 @@
+"""
+⏱️ Startup Profile Module
+Times each startup phase up to the first LED write (--profile-startup).
+
+Flow:
+1. main.py notes perf_counter() before importing anything else
+2. Each phase is stamped as it completes
+3. report() lists per-phase and cumulative milliseconds
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+
+class StartupProfile:
+    """Phase timestamps measured from process entry"""
+
+    def __init__(self, origin: Optional[float] = None):
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+
+    def mark(self, phase: str, at: Optional[float] = None):
+        """📍 Stamp the end of a phase (now, or at a perf_counter() reading)"""
+        self.phases.append((phase, at if at is not None else time.perf_counter()))
+
+    def elapsed(self, phase: str) -> Optional[float]:
+        """⏳ Seconds from process entry to the end of phase"""
+        for name, stamp in self.phases:
+            if name == phase:
+                return stamp - self.origin
+        return None
+
+    def report(self) -> str:
+        """📋 Human-readable phase table"""
+        lines = [f"{'phase':<16}{'+ms':>10}{'total ms':>12}"]
+        previous = self.origin
+        for name, stamp in sorted(self.phases, key=lambda phase: phase[1]):
+            lines.append(
+                f"{name:<16}{(stamp - previous) * 1000:>10.1f}"
+                f"{(stamp - self.origin) * 1000:>12.1f}"
+            )
+            previous = stamp
+        return "\n".join(lines)
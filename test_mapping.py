@@ -29,7 +29,7 @@ def main():
     # Register mappings
     for x, y, color, alias in test_mappings:
         print(f"🔧 Mapping button ({x}, {y}) to '{alias}'")
-        app.add_mapping(x, y, color, alias)
+    app.add_mappings(test_mappings)
         
     print("\n🎮 Test Configuration Active")
     print("===========================")
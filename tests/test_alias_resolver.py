@@ -0,0 +1,92 @@
+# Test cases for alias resolution and its on-disk cache
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.handlers.alias_resolver import AliasResolver
+
+BASH = shutil.which('bash')
+TIMEOUT = 15.0
+
+BASHRC = """
+alias ll='ls -l'
+alias lsa='ll -a'
+alias pager='ls | less'
+greet() { echo hi; }
+alias hello=greet
+alias missing='no-such-command-anywhere'
+"""
+
+
+@unittest.skipUnless(BASH, "needs bash")
+class AliasResolverTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.home = Path(tmp.name)
+        self.rc = self.home / '.bashrc'
+        self.rc.write_text(BASHRC)
+        self.cache_dir = str(self.home / 'cache')
+        home = mock.patch.dict(os.environ, {'HOME': tmp.name})
+        home.start()
+        self.addCleanup(home.stop)
+        self.ls = shutil.which('ls')
+
+    def _resolver(self, **kwargs) -> AliasResolver:
+        resolver = AliasResolver(BASH, self.cache_dir, **kwargs)
+        resolver.start()
+        return resolver
+
+    def _wait_for(self, condition):
+        deadline = time.monotonic() + TIMEOUT
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, "timed out waiting")
+            time.sleep(0.01)
+
+    def test_simple_aliases_resolve_to_an_absolute_argv(self):
+        resolver = self._resolver()
+        self._wait_for(lambda: resolver.harvests)
+        self.assertEqual(resolver.resolve('ll'), [self.ls, '-l'])
+        self.assertEqual(resolver.resolve('lsa'), [self.ls, '-l', '-a'])  # Chained
+
+    def test_shell_syntax_functions_and_unknown_commands_need_the_shell(self):
+        resolver = self._resolver()
+        self._wait_for(lambda: resolver.harvests)
+        for name in ('pager', 'hello', 'missing', 'not-an-alias'):
+            self.assertIsNone(resolver.resolve(name), name)
+        stats = resolver.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (0, 4))
+
+    def test_second_start_loads_the_disk_cache_without_harvesting(self):
+        first = self._resolver()
+        self._wait_for(lambda: first.harvests)
+        second = self._resolver()
+        self.assertEqual(second.resolve('ll'), [self.ls, '-l'])
+        self.assertEqual(second.harvests, 0)
+
+    def test_touched_rc_file_with_the_same_content_keeps_the_cache(self):
+        first = self._resolver()
+        self._wait_for(lambda: first.harvests)
+        later = time.time() + 10
+        os.utime(self.rc, (later, later))
+        second = self._resolver()
+        self.assertEqual(second.resolve('ll'), [self.ls, '-l'])
+        self.assertEqual(second.harvests, 0)
+
+    def test_edited_rc_file_is_harvested_again(self):
+        resolver = self._resolver(rc_check_interval=0)
+        self._wait_for(lambda: resolver.harvests)
+        self.rc.write_text(BASHRC + "alias la='ls -A'\n")
+        later = time.time() + 10
+        os.utime(self.rc, (later, later))
+        self._wait_for(lambda: resolver.resolve('la') == [self.ls, '-A'])
+        self.assertEqual(resolver.harvests, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# Test cases for the asyncio runtime: presses on the loop and orderly shutdown
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src.app import LaunchpadApp
+from src.managers.fake_midi_backend import FakeMidiBackend
+from src.models.launch_policy import LaunchPolicy
+from src.utils.constants import MIDI_NOTE_ON
+
+PORT = 'Launchpad Mini MK3'
+TIMEOUT = 10.0
+
+
+class Finished:
+    """Execution listener collecting finished runs and the thread that reported them"""
+
+    def __init__(self):
+        self.runs = []
+        self.event = threading.Event()
+
+    def execution_started(self, alias, context):
+        pass
+
+    def execution_finished(self, alias, context, result):
+        self.runs.append((result, threading.current_thread().name))
+        self.event.set()
+
+    def pipeline_progress(self, *args):
+        pass
+
+
+class RuntimeTestCase(unittest.TestCase):
+    RUNTIME = 'asyncio'
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = mock.patch.dict(os.environ, dict(
+            MAPPINGS_FILE=os.path.join(tmp.name, 'mappings.toml'), MAPPINGS_WATCH='False',
+            CACHE_DIR=tmp.name, OUTPUT_LOG_DIR='', SHELL_POOL_SIZE='0', ALIAS_CACHE='False',
+            SHELL_PATH='/bin/sh', LOG_LEVEL='ERROR', LOG_FILE='', LAUNCHPAD_DEVICES='',
+            LAUNCHPAD_PORT=PORT, CONTROL_SOCKET='', HISTORY_FILE='', PROFILE_DIR='',
+            METRICS_ENABLED='False', EXEC_RUNTIME=self.RUNTIME, LAUNCHPAD_RECONNECT_INTERVAL='0'
+        ))
+        env.start()
+        self.addCleanup(env.stop)
+        self.backend = FakeMidiBackend(PORT)
+        self.app = LaunchpadApp(midi_backend=self.backend)
+        self.finished = Finished()
+        self.app.alias_handler.add_listener(self.finished)
+        self.assertTrue(self.app.start())
+        self.addCleanup(self.app._handle_shutdown)
+
+    def _press(self, x: int, y: int):
+        self.backend.inject([MIDI_NOTE_ON, x + y * 10, 127])
+        self.backend.inject([MIDI_NOTE_ON, x + y * 10, 0])
+
+    def _wait_finished(self):
+        self.assertTrue(self.finished.event.wait(TIMEOUT), "no run finished")
+        return self.finished.runs[-1]
+
+
+class AsyncRuntimeTest(RuntimeTestCase):
+    def test_presses_run_as_tasks_on_the_loop(self):
+        self.assertTrue(self.app.execution_manager.asynchronous)
+        self.app.add_mapping(0, 0, 5, 'echo hello')
+        self._press(0, 0)
+        result, thread = self._wait_finished()
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(result.output.splitlines()[-1], b'hello')  # After any -i tty notice
+        self.assertEqual(thread, 'launchpad-loop')
+
+    def test_shutdown_stops_runs_still_going(self):
+        self.app.add_mapping(0, 0, 5, 'echo $$; exec sleep 30',
+                             launch=LaunchPolicy(mode='stream', timeout=0.1))
+        self._press(0, 0)
+        mapping = self.app.mapping_manager.get_mapping(0, 0)
+        deadline = time.monotonic() + TIMEOUT
+        while not self.app.alias_handler.running(mapping):
+            self.assertLess(time.monotonic(), deadline, "run never started")
+            time.sleep(0.01)
+        time.sleep(0.3)  # Past its timeout: now only followed by a task
+
+        began = time.monotonic()
+        self.app._handle_shutdown()
+        self.assertLess(time.monotonic() - began, TIMEOUT)
+        result, _ = self._wait_finished()
+        self.assertEqual(result.error, "cancelled")
+        pid = int(result.output.splitlines()[-1])
+        with self.assertRaises(ProcessLookupError):
+            os.kill(pid, 0)
+
+
+class ThreadRuntimeTest(RuntimeTestCase):
+    RUNTIME = 'threads'
+
+    def test_presses_run_on_worker_threads(self):
+        self.assertFalse(self.app.execution_manager.asynchronous)
+        self.app.add_mapping(0, 0, 5, 'echo hello')
+        self._press(0, 0)
+        result, thread = self._wait_finished()
+        self.assertTrue(result.success, result.error)
+        self.assertNotEqual(thread, 'launchpad-loop')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# Test cases for note dispatch in the button handler
+
+import unittest
+
+from src.handlers.button_handler import ButtonHandler
+from src.utils.constants import MIDI_NOTE_OFF, MIDI_NOTE_ON, MIDI_POLY_AFTERTOUCH
+
+
+class ButtonHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self.handler = ButtonHandler()
+        self.presses = []
+        self.handler.register_callback(23, lambda: self.presses.append(23))
+        self.handler.register_callback(45, lambda: self.presses.append(45))
+
+    def test_press_runs_the_note_callback_once_until_released(self):
+        self.handler.handle_event([MIDI_NOTE_ON, 23, 100])
+        self.handler.handle_event([MIDI_NOTE_ON, 23, 90])    # Repeat: still held
+        self.handler.handle_event([MIDI_NOTE_ON, 23, 0])     # Note-On at 0 releases
+        self.handler.handle_event([MIDI_NOTE_ON, 23, 100])
+        self.handler.handle_event([MIDI_NOTE_OFF, 23, 64])   # Note-Off releases too
+        self.handler.handle_event([MIDI_NOTE_ON, 45, 100])
+        self.assertEqual(self.presses, [23, 23, 45])
+        self.assertEqual(self.handler.get_button_info(23),
+                         {'coordinates': (3, 2), 'press_count': 2,
+                          'is_pressed': False, 'has_callback': True})
+
+    def test_channel_bits_are_ignored(self):
+        self.handler.handle_event([MIDI_NOTE_ON | 0x01, 23, 100])
+        self.handler.handle_event([MIDI_NOTE_OFF | 0x01, 23, 0])
+        self.assertEqual(self.presses, [23])
+        self.assertFalse(self.handler.button_states[23].is_pressed)
+
+    def test_aftertouch_updates_pressure_without_triggering(self):
+        self.handler.handle_event([MIDI_NOTE_ON, 23, 100])
+        self.handler.handle_event([MIDI_POLY_AFTERTOUCH, 23, 30])
+        self.assertEqual(self.presses, [23])
+        state = self.handler.button_states[23]
+        self.assertEqual((state.is_pressed, state.last_velocity), (True, 30))
+
+    def test_malformed_and_out_of_range_messages_are_ignored(self):
+        for message in ([MIDI_NOTE_ON, 23], [MIDI_NOTE_ON, 200, 100], [], [0xF8, 0, 0, 0]):
+            self.handler.handle_event(message)
+        self.assertEqual(self.presses, [])
+        self.assertIsNone(self.handler.get_button_info(200))
+
+    def test_unmapped_and_unregistered_notes_are_tracked_but_do_nothing(self):
+        self.handler.unregister_callback(45)
+        self.handler.handle_event([MIDI_NOTE_ON, 45, 100])
+        self.handler.handle_event([MIDI_NOTE_ON, 11, 100])
+        self.assertEqual(self.presses, [])
+        self.assertEqual(sorted(self.handler.button_states), [11, 45])
+        self.assertEqual(sorted(self.handler.callbacks), [23])
+
+
+if __name__ == '__main__':
+    unittest.main()
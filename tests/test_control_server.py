@@ -0,0 +1,165 @@
+# Test cases for control socket batches, presses and runs
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from src.app import LaunchpadApp
+from src.managers.control_server import ControlServer
+from src.managers.fake_midi_backend import FakeMidiBackend
+
+TIMEOUT = 10.0
+
+
+class Finished:
+    """Execution listener collecting the aliases that finished"""
+
+    def __init__(self):
+        self.aliases = []
+        self.event = threading.Event()
+
+    def execution_started(self, alias, context):
+        pass
+
+    def execution_finished(self, alias, context, result):
+        self.aliases.append(alias)
+        self.event.set()
+
+    def pipeline_progress(self, *args):
+        pass
+
+
+class ControlServerTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = mock.patch.dict(os.environ, dict(
+            MAPPINGS_FILE=os.path.join(tmp.name, 'mappings.toml'), MAPPINGS_WATCH='False',
+            CACHE_DIR=tmp.name, OUTPUT_LOG_DIR='', SHELL_POOL_SIZE='0', ALIAS_CACHE='False',
+            SHELL_PATH='/bin/sh', LOG_LEVEL='ERROR', LOG_FILE='', LAUNCHPAD_DEVICES='',
+            LAUNCHPAD_PORT='Launchpad Mini MK3', CONTROL_SOCKET='', HISTORY_FILE='',
+            PROFILE_DIR='', METRICS_ENABLED='False'
+        ))
+        env.start()
+        self.addCleanup(env.stop)
+        self.app = LaunchpadApp(midi_backend=FakeMidiBackend('Launchpad Mini MK3'))
+        self.assertTrue(self.app.start())
+        self.addCleanup(self.app._handle_shutdown)
+        self.server = ControlServer(self.app, os.path.join(tmp.name, 'control.sock'))
+        self.app.add_mapping(0, 0, 5, 'echo kept')
+
+    def _request(self, **request) -> dict:
+        line = json.dumps(request).encode()
+        return json.loads(asyncio.run(self.server.handle(line)))
+
+    def _mapped(self) -> dict:
+        return {
+            (m['page'],) + tuple(m['coordinates']): m
+            for m in self.app.mapping_manager.list_mappings()
+        }
+
+
+class ControlBatchTest(ControlServerTestCase):
+    def test_applies_every_op(self):
+        response = self._request(id=1, op='batch', ops=[
+            {'op': 'add', 'mapping': {'x': 1, 'y': 0, 'alias': 'echo one'}},
+            {'op': 'add', 'mapping': {'x': 2, 'y': 0, 'alias': 'echo two', 'page': 1}},
+            {'op': 'toggle', 'x': 0, 'y': 0},
+        ])
+        self.assertTrue(response['ok'], response)
+        self.assertEqual(response['result'], {'added': 2, 'removed': 0, 'toggled': 1})
+        mapped = self._mapped()
+        self.assertEqual(set(mapped), {(0, 0, 0), (0, 1, 0), (1, 2, 0)})
+        self.assertFalse(mapped[(0, 0, 0)]['active'])
+
+        response = self._request(op='batch', ops=[{'op': 'remove', 'x': 2, 'y': 0, 'page': 1}])
+        self.assertTrue(response['ok'], response)
+        self.assertEqual(set(self._mapped()), {(0, 0, 0), (0, 1, 0)})
+
+    def test_invalid_op_applies_nothing(self):
+        response = self._request(id=2, op='batch', ops=[
+            {'op': 'add', 'mapping': {'x': 1, 'y': 0, 'alias': 'echo one'}},
+            {'op': 'toggle', 'x': 0, 'y': 0},
+            {'op': 'remove', 'x': 5, 'y': 5},
+        ])
+        self.assertEqual((response['id'], response['ok']), (2, False))
+        self.assertIn('op #3: nothing mapped there', response['error'])
+        mapped = self._mapped()
+        self.assertEqual(set(mapped), {(0, 0, 0)})
+        self.assertTrue(mapped[(0, 0, 0)]['active'])
+
+    def test_invalid_mapping_applies_nothing(self):
+        response = self._request(op='batch', ops=[
+            {'op': 'remove', 'x': 0, 'y': 0},
+            {'op': 'add', 'mapping': {'x': 1, 'y': 0, 'alias': ''}},
+        ])
+        self.assertFalse(response['ok'])
+        self.assertIn('alias must be a non-empty string', response['error'])
+        self.assertEqual(set(self._mapped()), {(0, 0, 0)})
+
+    def test_reserved_pad_in_resulting_layout_applies_nothing(self):
+        response = self._request(op='batch', ops=[
+            {'op': 'add', 'mapping': {'x': 8, 'y': 3, 'alias': 'echo edge'}},
+            {'op': 'add', 'mapping': {'x': 1, 'y': 1, 'alias': 'echo paged', 'page': 2}},
+        ])
+        self.assertFalse(response['ok'])
+        self.assertIn('reserved for page switching', response['error'])
+        self.assertEqual(set(self._mapped()), {(0, 0, 0)})
+
+    def test_rejects_unknown_op(self):
+        response = self._request(op='batch', ops=[{'op': 'rename'}])
+        self.assertFalse(response['ok'])
+        self.assertIn('op must be add, remove or toggle', response['error'])
+
+
+class ControlPressTest(ControlServerTestCase):
+    def test_press_goes_through_the_button_path(self):
+        finished = Finished()
+        self.app.alias_handler.add_listener(finished)
+        response = self._request(id=3, op='press', x=0, y=0)
+        self.assertEqual((response['id'], response['result']), (3, 1))
+        self.assertTrue(finished.event.wait(TIMEOUT), "press never ran")
+        self.assertEqual(finished.aliases, ['echo kept'])
+        info = self._request(op='button', x=0, y=0)['result']
+        self.assertEqual((info['press_count'], info['is_pressed']), (1, False))
+
+    def test_press_holds_every_pad_before_releasing(self):
+        response = self._request(op='press', pads=[[0, 0], [1, 0]])
+        self.assertEqual(response['result'], 2)
+        for x in (0, 1):
+            self.assertEqual(self._request(op='button', x=x, y=0)['result']['press_count'], 1)
+
+    def test_press_rejects_bad_pads(self):
+        for request in ({'pads': []}, {'pads': [[0]]}, {'x': 10, 'y': 0}, {'x': True, 'y': 0}):
+            response = self._request(op='press', **request)
+            self.assertFalse(response['ok'], request)
+        self.assertIsNone(self._request(op='button', x=0, y=0)['result'])
+
+
+class ControlRunTest(ControlServerTestCase):
+    def test_run_waits_for_the_outcome(self):
+        response = self._request(id=4, op='run', x=0, y=0)
+        self.assertTrue(response['ok'], response)
+        result = response['result']
+        self.assertEqual((result['alias'], result['returncode'], result['success']),
+                         ('echo kept', 0, True))
+        self.assertEqual(result['output'].splitlines()[-1], 'kept')  # After any -i tty notice
+
+    def test_run_reports_failures_as_results(self):
+        self.app.add_mapping(1, 0, 5, 'exit 3')
+        result = self._request(op='run', x=1, y=0)['result']
+        self.assertEqual((result['returncode'], result['success']), (3, False))
+
+    def test_run_needs_a_mapping(self):
+        response = self._request(op='run', x=4, y=4)
+        self.assertEqual((response['ok'], response['error']), (False, 'nothing mapped there'))
+        response = self._request(op='run', x=0, y=0, device='nowhere')
+        self.assertFalse(response['ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# Test cases for the signal-driven profiler
+
+import os
+import signal
+import tempfile
+import threading
+import time
+import tracemalloc
+import unittest
+from pathlib import Path
+
+from src.utils.debugger import LaunchpadDebugger
+
+TIMEOUT = 5.0
+
+
+def spin(until: float):
+    while time.monotonic() < until:
+        pass
+
+
+def hoard() -> list:
+    return [bytes(1024) for _ in range(2000)]
+
+
+class DebuggerTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = Path(tmp.name) / 'profiles'
+        self.debugger = LaunchpadDebugger(str(self.directory), interval=0.002)
+        self.addCleanup(self.debugger.close)
+
+    def test_cpu_profile_counts_a_busy_thread(self):
+        self.assertIsNone(self.debugger.toggle_profile())
+        self.assertTrue(self.debugger.profiling)
+        worker = threading.Thread(target=spin, args=(time.monotonic() + 0.2,), name='spinner')
+        worker.start()
+        worker.join()
+        report = self.debugger.toggle_profile()
+        self.assertFalse(self.debugger.profiling)
+
+        self.assertIn("Own samples", report.read_text())
+        self.assertIn("spin (tests/test_debugger.py", report.read_text())
+        folded = report.with_suffix('.folded').read_text().splitlines()
+        stacks = [line for line in folded if line.startswith('spinner;')]
+        self.assertTrue(stacks)
+        stack, count = stacks[0].rsplit(' ', 1)
+        self.assertIn('spin (tests/test_debugger.py', stack.split(';')[-1])
+        self.assertGreater(int(count), 0)
+
+    def test_allocation_window_reports_what_is_still_alive(self):
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIsNone(self.debugger.toggle_allocations())
+        self.assertTrue(tracemalloc.is_tracing())
+        kept = hoard()
+        report = self.debugger.toggle_allocations()
+        self.assertFalse(tracemalloc.is_tracing())  # Started here, so stopped here
+        self.assertTrue(report.name.startswith('alloc-'))
+        self.assertIn('test_debugger.py', report.read_text())
+        del kept
+
+    def test_tracing_started_elsewhere_is_left_running(self):
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        self.debugger.toggle_allocations()
+        kept = hoard()
+        report = self.debugger.toggle_allocations()
+        self.assertTrue(tracemalloc.is_tracing())
+        self.assertIn('test_debugger.py', report.read_text())
+        del kept
+
+    def test_close_writes_open_windows(self):
+        self.debugger.toggle_profile()
+        self.debugger.toggle_allocations()
+        self.debugger.close()
+        self.assertFalse(self.debugger.profiling or self.debugger.tracing)
+        names = sorted(path.name.split('-')[0] + path.suffix for path in self.directory.iterdir())
+        self.assertEqual(names, ['alloc.txt', 'cpu.folded', 'cpu.txt'])
+
+    def test_signals_toggle_the_profile(self):
+        previous = [(signum, signal.getsignal(signum)) for signum in (signal.SIGUSR1, signal.SIGUSR2)]
+        self.addCleanup(lambda: [signal.signal(signum, handler) for signum, handler in previous])
+        self.debugger.install()
+
+        os.kill(os.getpid(), signal.SIGUSR1)
+        self._wait_for(lambda: self.debugger.profiling)
+        os.kill(os.getpid(), signal.SIGUSR1)
+        self._wait_for(lambda: self.directory.exists() and any(self.directory.glob('cpu-*.txt')))
+        self.assertFalse(self.debugger.profiling)
+
+        os.kill(os.getpid(), signal.SIGUSR2)
+        self._wait_for(lambda: self.debugger.tracing)
+        os.kill(os.getpid(), signal.SIGUSR2)
+        self._wait_for(lambda: any(self.directory.glob('alloc-*.txt')))
+
+    def _wait_for(self, condition):
+        deadline = time.monotonic() + TIMEOUT
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, "timed out waiting")
+            time.sleep(0.005)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# Test cases for serving several Launchpads from one process
+
+import time
+import unittest
+from unittest import mock
+
+from src.config.mapping_file import MappingFileError
+from src.handlers.alias_handler import AliasHandler
+from src.handlers.button_handler import ButtonHandler
+from src.managers.device_manager import LaunchpadDevice
+from src.managers.execution_manager import ExecutionManager
+from src.managers.fake_midi_backend import FakeMidiBackend
+from src.managers.led_scheduler import LEDScheduler
+from src.managers.mapping_manager import MappingManager
+from src.managers.midi_manager import MIDIManager
+from src.models.execution import ExecutionResult
+from src.utils.constants import MIDI_NOTE_ON, PAGE_NEXT, Colors
+from src.utils.metrics import LatencyMetrics
+
+TIMEOUT = 5.0
+
+
+class DevicesTest(unittest.TestCase):
+    def setUp(self):
+        self.handler = mock.Mock(spec=AliasHandler)
+        self.handler.running.return_value = 0
+        self.handler.execute.side_effect = \
+            lambda alias, *args: ExecutionResult(alias=alias, returncode=0)
+        self.executor = ExecutionManager(pool_size=2)
+        self.addCleanup(self.executor.shutdown, True, TIMEOUT)
+        self.routed = []
+        self.left, self.right = self._device('left'), self._device('right')
+
+    def _device(self, name: str) -> LaunchpadDevice:
+        backend = FakeMidiBackend(f'Launchpad Mini MK3 {name}')
+        midi = MIDIManager(backend=backend)
+        device = LaunchpadDevice(
+            name, backend.port_name, midi, LEDScheduler(midi),
+            MappingManager(self.handler, self.executor, name), ButtonHandler(), LatencyMetrics()
+        )
+        self.assertTrue(midi.connect(device.port_name))
+        device.listen(self._dispatch)
+        return device
+
+    def _dispatch(self, device: LaunchpadDevice, event, data=None):
+        self.routed.append(device.name)
+        device.button_handler.handle_event(event[0])
+
+    def _press(self, device: LaunchpadDevice, x: int, y: int):
+        device.midi_manager.backend.inject([MIDI_NOTE_ON, x + y * 10, 127])
+        device.midi_manager.backend.inject([MIDI_NOTE_ON, x + y * 10, 0])
+
+    def _ran(self, count: int) -> list:
+        deadline = time.monotonic() + TIMEOUT
+        while self.handler.execute.call_count < count:
+            self.assertLess(time.monotonic(), deadline, "presses never ran")
+            time.sleep(0.01)
+        return [(call.args[1].device, call.args[0]) for call in self.handler.execute.call_args_list]
+
+    def test_same_pad_on_two_devices_runs_each_devices_alias(self):
+        self.left.add_mapping(0, 0, Colors.RED, 'build')
+        self.right.add_mapping(0, 0, Colors.GREEN, 'deploy')
+        self._press(self.right, 0, 0)
+        self.assertEqual(self._ran(1), [('right', 'deploy')])
+        self._press(self.left, 0, 0)
+        self.assertEqual(self._ran(2)[1], ('left', 'build'))
+        self.assertEqual(self.routed, ['right', 'right', 'left', 'left'])
+
+    def test_leds_go_to_the_devices_own_port(self):
+        left_backend = self.left.midi_manager.backend
+        right_backend = self.right.midi_manager.backend
+        mark = len(right_backend.sent)
+        self.left.add_mapping(1, 1, Colors.RED, 'build')
+        self.assertEqual(self.left.midi_manager.get_button_color(1, 1), Colors.RED)
+        self.assertEqual(self.right.midi_manager.get_button_color(1, 1), Colors.OFF)
+        self.assertEqual(right_backend.sent_since(mark), [])
+        self.assertIn([MIDI_NOTE_ON, 11, Colors.RED], left_backend.sent_since(0))
+
+    def test_execution_keys_keep_devices_apart(self):
+        left = self.left.mapping_manager.create_mapping(0, 0, Colors.RED, 'build')
+        right = self.right.mapping_manager.create_mapping(0, 0, Colors.RED, 'build')
+        self.assertNotEqual(left.key, right.key)
+        self.assertEqual(left.key[0], 'left')
+
+    def test_reserved_page_pad_rejects_the_whole_edit(self):
+        self.left.add_mapping(*PAGE_NEXT, Colors.RED, 'next')
+        with self.assertRaises(MappingFileError):
+            self.left.add_mapping(0, 0, Colors.GREEN, 'other', page=1)
+        self.assertEqual(self.left.mapping_manager.pages, [0])
+        self.assertIsNone(self.left.mapping_manager.get_mapping(0, 0, 1))
+
+    def test_page_switch_on_one_device_leaves_the_other_alone(self):
+        self.left.add_mapping(0, 0, Colors.RED, 'build')
+        self.left.add_mapping(0, 0, Colors.GREEN, 'deploy', page=1)
+        self.right.add_mapping(0, 0, Colors.BLUE, 'logs')
+        self._press(self.left, *PAGE_NEXT)
+        self.assertEqual(self.left.mapping_manager.page, 1)
+        self.assertEqual(self.left.midi_manager.get_button_color(0, 0), Colors.GREEN)
+        self.assertEqual(self.right.mapping_manager.page, 0)
+        self.assertEqual(self.right.midi_manager.get_button_color(0, 0), Colors.BLUE)
+
+
+if __name__ == '__main__':
+    unittest.main()
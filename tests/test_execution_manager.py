@@ -0,0 +1,163 @@
+# Test cases for the execution pools: admission, backpressure and release
+
+import asyncio
+import threading
+import unittest
+
+from src.managers.execution_manager import (
+    AsyncExecutionManager, ExecutionManager, ExecutionRejected
+)
+
+TIMEOUT = 5.0
+
+
+class ExecutionManagerTest(unittest.TestCase):
+    def _manager(self, **kwargs) -> ExecutionManager:
+        manager = ExecutionManager(**kwargs)
+        self.addCleanup(manager.shutdown, True, TIMEOUT)
+        return manager
+
+    def _blocker(self):
+        """A job that runs until its event is set, plus an event set once it started"""
+        release, started = threading.Event(), threading.Event()
+
+        def job(value=None):
+            started.set()
+            release.wait(TIMEOUT)
+            return value
+        return job, release, started
+
+    def test_runs_jobs_and_returns_their_results(self):
+        manager = self._manager(pool_size=2)
+        futures = [manager.submit(i, pow, i, 2) for i in range(5)]
+        self.assertEqual([f.result(TIMEOUT) for f in futures], [0, 1, 4, 9, 16])
+
+    def test_key_limit_defers_until_the_running_job_finishes(self):
+        manager = self._manager(pool_size=4, default_limit=1)
+        job, release, started = self._blocker()
+        first = manager.submit('pad', job, 'first')
+        self.assertTrue(started.wait(TIMEOUT))
+        second = manager.submit('pad', lambda: 'second')
+        other = manager.submit('other', lambda: 'other')
+
+        self.assertEqual(other.result(TIMEOUT), 'other')  # Other keys aren't held up
+        self.assertFalse(second.done())
+        self.assertEqual(manager.load('pad'), 2)
+        self.assertEqual(manager.stats()['deferred'], 1)
+
+        release.set()
+        self.assertEqual((first.result(TIMEOUT), second.result(TIMEOUT)), ('first', 'second'))
+
+    def test_per_key_limit_allows_concurrent_runs(self):
+        manager = self._manager(pool_size=4)
+        manager.set_limit('pad', 2)
+        both = threading.Barrier(3)  # Both jobs and the test meet only if they run together
+
+        def meet():
+            both.wait(TIMEOUT)
+            return True
+        futures = [manager.submit('pad', meet) for _ in range(2)]
+        both.wait(TIMEOUT)
+        self.assertTrue(all(f.result(TIMEOUT) for f in futures))
+
+    def test_full_queue_rejects(self):
+        manager = self._manager(pool_size=1, queue_size=2)
+        job, release, started = self._blocker()
+        manager.submit('a', job)
+        self.assertTrue(started.wait(TIMEOUT))  # Picked up: no longer in the backlog
+        queued = [manager.submit('b', job), manager.submit('c', job)]
+        rejected = manager.submit('d', job)
+        with self.assertRaises(ExecutionRejected):
+            rejected.result(TIMEOUT)
+        self.assertEqual(manager.stats()['rejected'], 1)
+        release.set()
+        for future in queued:
+            future.result(TIMEOUT)
+
+    def test_key_queue_limit_drops_extra_presses(self):
+        manager = self._manager(pool_size=2)
+        manager.set_limit('pad', 1, queue_limit=0)
+        job, release, started = self._blocker()
+        manager.submit('pad', job)
+        self.assertTrue(started.wait(TIMEOUT))
+        with self.assertRaises(ExecutionRejected):
+            manager.submit('pad', job).result(TIMEOUT)
+        self.assertEqual(manager.stats()['dropped'], 1)
+        release.set()
+
+    def test_high_backlog_coalesces_waiting_presses(self):
+        manager = self._manager(pool_size=1, queue_size=4)  # High water: 3
+        job, release, started = self._blocker()
+        manager.submit('a', job)
+        self.assertTrue(started.wait(TIMEOUT))
+        manager.submit('b', job)
+        waiting = manager.submit('a', job, 'waiting')
+        manager.submit('c', job)
+        folded = manager.submit('a', job, 'folded')
+        self.assertIsNone(folded.result(TIMEOUT))
+        self.assertEqual(manager.stats()['coalesced'], 1)
+        release.set()
+        self.assertEqual(waiting.result(TIMEOUT), 'waiting')
+
+    def test_completion_releases_slots_even_on_errors(self):
+        manager = self._manager(pool_size=1)
+
+        def fail():
+            raise ValueError("boom")
+        with self.assertRaises(ValueError):
+            manager.submit('pad', fail).result(TIMEOUT)
+        self.assertEqual(manager.submit('pad', lambda: 'next').result(TIMEOUT), 'next')
+        self.assertEqual(manager.load('pad'), 0)
+        stats = manager.stats()
+        self.assertEqual((stats['completed'], stats['queue_depth'], stats['running']), (2, 0, 0))
+
+    def test_shutdown_cancels_waiting_jobs_and_rejects_new_ones(self):
+        manager = self._manager(pool_size=1)
+        job, release, started = self._blocker()
+        running = manager.submit('pad', job)
+        self.assertTrue(started.wait(TIMEOUT))
+        waiting = manager.submit('pad', job)
+        release.set()
+        manager.shutdown(wait=True, timeout=TIMEOUT)
+        self.assertTrue(running.done())
+        self.assertTrue(waiting.cancelled())
+        with self.assertRaises(ExecutionRejected):
+            manager.submit('pad', job).result(TIMEOUT)
+
+
+class AsyncExecutionManagerTest(unittest.TestCase):
+    def test_key_limit_and_release_on_the_loop(self):
+        async def scenario():
+            manager = AsyncExecutionManager(queue_size=8)
+            manager.start()
+            gate = asyncio.Event()
+            order = []
+
+            async def job(name):
+                order.append(f"start {name}")
+                await gate.wait()
+                order.append(f"end {name}")
+                return name
+
+            first = asyncio.wrap_future(manager.submit('pad', job, 'first'))
+            second = asyncio.wrap_future(manager.submit('pad', job, 'second'))
+            await asyncio.sleep(0.01)
+            self.assertEqual(order, ['start first'])
+            self.assertEqual(manager.load('pad'), 2)
+            gate.set()
+            self.assertEqual(await asyncio.gather(first, second), ['first', 'second'])
+            self.assertEqual(order, ['start first', 'end first', 'start second', 'end second'])
+            self.assertEqual(manager.load('pad'), 0)
+            await manager.drain(TIMEOUT)
+            manager.shutdown(wait=False)
+
+        asyncio.run(scenario())
+
+    def test_rejects_when_not_started(self):
+        manager = AsyncExecutionManager()
+        with self.assertRaises(ExecutionRejected):
+            manager.submit('pad', print).result(TIMEOUT)
+
+
+if __name__ == '__main__':
+    unittest.main()
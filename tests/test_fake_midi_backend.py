@@ -0,0 +1,83 @@
+# Test cases for the in-process fake MIDI backend and its input streams
+
+import time
+import unittest
+
+from src.managers.fake_midi_backend import (
+    GRID_NOTES, FakeMidiBackend, aftertouch_flood, burst, drum_roll, steady
+)
+from src.managers.midi_manager import MIDIManager
+from src.utils.constants import MIDI_NOTE_ON, MIDI_POLY_AFTERTOUCH
+
+PORT = 'Launchpad Mini MK3'
+
+
+class FakeMidiBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = FakeMidiBackend(PORT)
+        self.midi = MIDIManager(backend=self.backend)
+        self.events = []
+        self.assertTrue(self.midi.connect(PORT))
+        self.midi.set_callback(lambda event, data=None: self.events.append(event))
+
+    def test_injected_input_reaches_the_manager_callback(self):
+        self.backend.inject([MIDI_NOTE_ON, 11, 127], 0.01)
+        self.assertEqual(self.events, [([MIDI_NOTE_ON, 11, 127], 0.01)])
+
+    def test_led_output_is_recorded(self):
+        mark = len(self.backend.sent)
+        self.midi.set_button_color(1, 1, 5)
+        self.assertEqual(self.backend.sent_since(mark), [[MIDI_NOTE_ON, 11, 5]])
+        self.assertEqual(self.backend.sent_bytes(mark), 3)
+
+    def test_unplugged_port_fails_writes_and_vanishes(self):
+        self.backend.unplug()
+        self.assertEqual(self.backend.get_input_ports(), [])
+        with self.assertRaises(OSError):
+            self.backend.send_message([MIDI_NOTE_ON, 11, 5])
+        self.backend.plug('Launchpad Mini MK3 MIDI 2')
+        self.assertEqual(self.backend.get_output_ports(), ['Launchpad Mini MK3 MIDI 2'])
+
+    def test_realtime_play_honours_deltas(self):
+        began = time.perf_counter()
+        durations = self.backend.play(steady(rate=50, count=10))
+        self.assertGreaterEqual(time.perf_counter() - began, 9 * 0.02 * 0.9)
+        self.assertEqual(len(durations), 10)
+        self.assertEqual(len(self.events), 10)
+
+    def test_play_async_delivers_on_another_thread(self):
+        thread = self.backend.play_async(burst(size=3, bursts=2), realtime=False)
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(self.events), 12)
+
+
+class InputStreamTest(unittest.TestCase):
+    def test_steady_pairs_presses_with_releases(self):
+        events = list(steady(rate=100, count=6, notes=(11, 12)))
+        self.assertEqual([m for m, _ in events], [
+            [MIDI_NOTE_ON, 11, 127], [MIDI_NOTE_ON, 11, 0],
+            [MIDI_NOTE_ON, 12, 127], [MIDI_NOTE_ON, 12, 0],
+            [MIDI_NOTE_ON, 11, 127], [MIDI_NOTE_ON, 11, 0],
+        ])
+        self.assertTrue(all(delta == 0.01 for _, delta in events))
+
+    def test_burst_presses_together_after_a_gap(self):
+        events = list(burst(size=2, bursts=2, gap=0.5))
+        self.assertEqual([delta for _, delta in events], [0.0, 0.0, 0.0, 0.0, 0.5, 0.0, 0.0, 0.0])
+        self.assertEqual([m[1] for m, _ in events[:2]], list(GRID_NOTES[:2]))
+
+    def test_drum_roll_is_reproducible(self):
+        self.assertEqual(list(drum_roll(100, 20, seed=3)), list(drum_roll(100, 20, seed=3)))
+        self.assertNotEqual(list(drum_roll(100, 20, seed=3)), list(drum_roll(100, 20, seed=4)))
+
+    def test_aftertouch_flood_holds_then_releases(self):
+        events = [m for m, _ in aftertouch_flood(1000, 20, notes=(11, 12))]
+        self.assertEqual(len(events), 20)
+        self.assertEqual(events[:2], [[MIDI_NOTE_ON, 11, 100], [MIDI_NOTE_ON, 12, 100]])
+        self.assertTrue(all(m[0] == MIDI_POLY_AFTERTOUCH for m in events[2:-2]))
+        self.assertEqual(events[-2:], [[MIDI_NOTE_ON, 11, 0], [MIDI_NOTE_ON, 12, 0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+# Test cases for chord and sequence matching
+
+import unittest
+from unittest import mock
+
+from src.handlers.gesture_matcher import GestureMatcher, compile_gestures
+
+
+class FakeTimer:
+    def __init__(self, delay, callback):
+        self.delay = delay
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class GestureMatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.ran = []
+        self.now = 100.0
+        clock = mock.patch('src.handlers.gesture_matcher.time.monotonic', lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+        self.timers = []
+
+    def _action(self, name):
+        return lambda: self.ran.append(name)
+
+    def _matcher(self, *gestures, timers=False) -> GestureMatcher:
+        trie = compile_gestures(
+            (kind, notes, window, self._action(name)) for kind, notes, window, name in gestures
+        )
+        return GestureMatcher(trie, self._call_later if timers else None)
+
+    def _call_later(self, delay, callback):
+        timer = FakeTimer(delay, callback)
+        self.timers.append(timer)
+        return timer
+
+    def _press(self, matcher, note):
+        matcher.press(note, self._action(f"pad{note}"))
+
+    def _fire(self):
+        for timer in [t for t in self.timers if not t.cancelled]:
+            timer.callback()
+
+    def test_pads_outside_gestures_run_immediately(self):
+        matcher = self._matcher(('chord', (11, 12), 0.08, 'chord'))
+        self._press(matcher, 55)
+        self.assertEqual(self.ran, ['pad55'])
+        self.assertTrue(matcher.idle)
+
+    def test_chord_in_any_order(self):
+        matcher = self._matcher(('chord', (11, 12, 13), 0.08, 'chord'))
+        for note in (13, 11, 12):
+            self._press(matcher, note)
+        self.assertEqual(self.ran, ['chord'])
+        self.assertTrue(matcher.idle)
+
+    def test_sequence_runs_once_complete(self):
+        matcher = self._matcher(('sequence', (11, 12, 13), 0.5, 'seq'))
+        self._press(matcher, 11)
+        self._press(matcher, 12)
+        self.assertEqual(self.ran, [])
+        self.assertFalse(matcher.idle)
+        self._press(matcher, 13)
+        self.assertEqual(self.ran, ['seq'])
+
+    def test_shared_prefix_picks_the_right_sequence(self):
+        matcher = self._matcher(
+            ('sequence', (11, 12, 13), 0.5, 'abc'),
+            ('sequence', (11, 12, 14), 0.5, 'abd'),
+        )
+        for note in (11, 12, 14):
+            self._press(matcher, note)
+        self.assertEqual(self.ran, ['abd'])
+
+    def test_broken_attempt_replays_held_presses(self):
+        matcher = self._matcher(('sequence', (11, 12, 13), 0.5, 'seq'))
+        self._press(matcher, 11)
+        self._press(matcher, 55)
+        self.assertEqual(self.ran, ['pad11', 'pad55'])
+        self.assertTrue(matcher.idle)
+
+    def test_broken_attempt_restarts_on_a_gesture_pad(self):
+        matcher = self._matcher(('sequence', (11, 12), 0.5, 'seq'))
+        self._press(matcher, 11)
+        self._press(matcher, 11)
+        self.assertEqual(self.ran, ['pad11'])
+        self._press(matcher, 12)
+        self.assertEqual(self.ran, ['pad11', 'seq'])
+
+    def test_deepest_match_wins_when_a_longer_gesture_breaks(self):
+        matcher = self._matcher(
+            ('sequence', (11, 12), 0.5, 'short'),
+            ('sequence', (11, 12, 13), 0.5, 'long'),
+        )
+        self._press(matcher, 11)
+        self._press(matcher, 12)
+        self.assertEqual(self.ran, [])
+        self._press(matcher, 55)
+        self.assertEqual(self.ran, ['short', 'pad55'])
+
+    def test_releasing_part_of_a_chord_breaks_it(self):
+        matcher = self._matcher(('chord', (11, 12, 13), 0.08, 'chord'))
+        self._press(matcher, 11)
+        self._press(matcher, 12)
+        matcher.release(11)
+        self.assertEqual(self.ran, ['pad11', 'pad12'])
+        self.assertTrue(matcher.idle)
+
+    def test_timeout_applies_on_next_event_without_timers(self):
+        matcher = self._matcher(('sequence', (11, 12), 0.5, 'seq'))
+        self._press(matcher, 11)
+        self.now += 0.6
+        self._press(matcher, 12)
+        self.assertEqual(self.ran, ['pad11', 'pad12'])
+
+    def test_press_within_timeout_completes(self):
+        matcher = self._matcher(('sequence', (11, 12), 0.5, 'seq'))
+        self._press(matcher, 11)
+        self.now += 0.4
+        self._press(matcher, 12)
+        self.assertEqual(self.ran, ['seq'])
+
+    def test_timer_expires_a_stalled_attempt(self):
+        matcher = self._matcher(('sequence', (11, 12), 0.5, 'seq'), timers=True)
+        self._press(matcher, 11)
+        self.assertEqual([t.delay for t in self.timers], [0.5])
+        self._fire()
+        self.assertEqual(self.ran, ['pad11'])
+        self.assertTrue(matcher.idle)
+
+    def test_stale_timer_is_ignored(self):
+        matcher = self._matcher(('sequence', (11, 12), 0.5, 'seq'), timers=True)
+        self._press(matcher, 11)
+        stale = self.timers[0]
+        self._press(matcher, 12)
+        self.assertTrue(stale.cancelled)
+        self._press(matcher, 11)
+        stale.callback()  # Fired anyway: belongs to the finished attempt
+        self.assertEqual(self.ran, ['seq'])
+        self.assertFalse(matcher.idle)
+
+    def test_sequence_sharing_its_first_pad_with_a_chord(self):
+        gestures = (('sequence', (11, 12), 0.5, 'seq'), ('chord', (11, 13), 0.08, 'chord'))
+        matcher = self._matcher(*gestures)
+        self._press(matcher, 11)
+        matcher.release(11)
+        self._press(matcher, 12)
+        self.assertEqual(self.ran, ['seq'])
+
+        matcher = self._matcher(*gestures)
+        self._press(matcher, 11)
+        self._press(matcher, 12)  # Still holding 11
+        self.assertEqual(self.ran, ['seq', 'seq'])
+
+        matcher = self._matcher(*gestures)
+        self._press(matcher, 13)
+        self._press(matcher, 11)
+        self.assertEqual(self.ran, ['seq', 'seq', 'chord'])
+
+    def test_chord_window_expiry_moves_on_to_the_sequence(self):
+        gestures = (('sequence', (11, 12), 0.5, 'seq'), ('chord', (11, 13), 0.08, 'chord'))
+        matcher = self._matcher(*gestures, timers=True)
+        self._press(matcher, 11)
+        self._fire()
+        self.assertEqual(self.ran, [])
+        self.assertFalse(matcher.idle)
+        self.assertAlmostEqual(self.timers[-1].delay, 0.5)
+        self._press(matcher, 12)
+        self.assertEqual(self.ran, ['seq'])
+
+        matcher = self._matcher(*gestures)
+        self._press(matcher, 11)
+        self.now += 0.6  # Past both the chord window and the sequence timeout
+        self._press(matcher, 12)
+        self.assertEqual(self.ran, ['seq', 'pad11', 'pad12'])
+
+    def test_set_trie_flushes_held_presses(self):
+        matcher = self._matcher(('sequence', (11, 12), 0.5, 'seq'))
+        self._press(matcher, 11)
+        matcher.set_trie(compile_gestures([]))
+        self.assertEqual(self.ran, ['pad11'])
+        self._press(matcher, 11)
+        self.assertEqual(self.ran, ['pad11', 'pad11'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+# Test cases for the execution history ring file
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.models.execution import ExecutionResult
+from src.utils import history as history_module
+from src.utils.history import (
+    HEADER, HEADER_SIZE, RECORD, RESERVOIR_SIZE, TIMED_OUT, ExecutionHistory, HistoryEntry,
+    read_history, summarize
+)
+
+
+def _result(i: int, **kwargs) -> ExecutionResult:
+    return ExecutionResult(alias=f"alias{i}", returncode=0, started=1000.0 + i,
+                           duration=0.1 * i, **kwargs)
+
+
+class ExecutionHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / 'history.bin'
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _open(self, capacity: int = 4) -> ExecutionHistory:
+        history = ExecutionHistory(str(self.path), capacity)
+        self.assertTrue(history.open())
+        self.addCleanup(history.close)
+        return history
+
+    def _written(self) -> int:
+        with open(self.path, 'rb') as file:
+            return HEADER.unpack(file.read(HEADER.size))[3]
+
+    def test_wraps_around_keeping_newest_records_oldest_first(self):
+        history = self._open(capacity=4)
+        for i in range(10):
+            history.record(_result(i), device='main', note=11 + i, page=1)
+        history.close()
+
+        entries = list(read_history(str(self.path)))
+        self.assertEqual([e.alias for e in entries], ['alias6', 'alias7', 'alias8', 'alias9'])
+        self.assertEqual([e.note for e in entries], [17, 18, 19, 20])
+        self.assertEqual(entries[0].device, 'main')
+        self.assertEqual(entries[0].page, 1)
+        self.assertAlmostEqual(entries[-1].duration, 0.9, places=5)
+        self.assertEqual(self.path.stat().st_size, HEADER_SIZE + 4 * RECORD.size)
+
+    def test_header_counts_every_record_and_survives_reopening(self):
+        history = self._open(capacity=3)
+        for i in range(5):
+            history.record(_result(i))
+        self.assertEqual(self._written(), 5)
+        history.close()
+
+        history = self._open(capacity=3)
+        history.record(_result(5))
+        history.close()
+        self.assertEqual(self._written(), 6)
+        self.assertEqual([e.alias for e in read_history(str(self.path))],
+                         ['alias3', 'alias4', 'alias5'])
+
+    def test_capacity_change_starts_over(self):
+        history = self._open(capacity=3)
+        history.record(_result(0))
+        history.close()
+
+        history = self._open(capacity=5)
+        history.close()
+        self.assertEqual(self._written(), 0)
+        self.assertEqual(list(read_history(str(self.path))), [])
+
+    def test_flags_and_missing_exit_code(self):
+        history = self._open()
+        history.record(_result(0, timed_out=True, error="timed out after 1s"))
+        history.record(ExecutionResult(alias='never', started=1.0))
+        history.close()
+
+        timed_out, never = read_history(str(self.path))
+        self.assertTrue(timed_out.flags & TIMED_OUT)
+        self.assertIsNone(never.returncode)
+
+    def test_long_names_are_truncated(self):
+        history = self._open()
+        history.record(ExecutionResult(alias='a' * 100, returncode=0), device='d' * 40)
+        history.close()
+
+        entry, = read_history(str(self.path))
+        self.assertEqual(entry.alias, 'a' * 52)
+        self.assertEqual(entry.device, 'd' * 16)
+
+    def test_rejects_other_files(self):
+        self.path.write_bytes(b'not a history file' * 10)
+        with self.assertRaises(ValueError):
+            list(read_history(str(self.path)))
+
+    def test_summarize_groups_by_alias(self):
+        history = self._open(capacity=8)
+        for i in range(3):
+            history.record(ExecutionResult(alias='status', returncode=i % 2, started=1.0 + i,
+                                           duration=0.5))
+        history.close()
+
+        summary = summarize(read_history(str(self.path)))
+        self.assertEqual(summary['runs'], 3)
+        status = summary['aliases']['status']
+        self.assertEqual((status['runs'], status['failures']), (3, 1))
+        self.assertAlmostEqual(status['mean'], 0.5)
+
+    def test_summarize_keeps_a_bounded_sample_for_percentiles(self):
+        runs = 20 * RESERVOIR_SIZE
+        entries = (
+            HistoryEntry(1.0 + i, i % 100 / 1000, (i * 7919) % runs / 1000, 0, 0,
+                         11, 0, 0, '', 'build')
+            for i in range(runs)
+        )
+        sizes = []
+        add = history_module._Reservoir.add
+
+        def tracked(reservoir, value):
+            add(reservoir, value)
+            sizes.append(len(reservoir.samples))
+        with mock.patch.object(history_module._Reservoir, 'add', tracked):
+            build = summarize(entries)['aliases']['build']
+        self.assertLessEqual(max(sizes), RESERVOIR_SIZE)
+        self.assertEqual(build['runs'], runs)
+        self.assertAlmostEqual(build['max'], (runs - 1) / 1000)  # Exact, not sampled
+        self.assertAlmostEqual(build['mean'], (runs - 1) / 2000)
+        self.assertAlmostEqual(build['p50'], runs / 2000, delta=runs / 1000 * 0.05)
+        self.assertAlmostEqual(build['p99'], runs * 0.99 / 1000, delta=runs / 1000 * 0.02)
+        self.assertAlmostEqual(build['wait_p50'], 0.05, delta=0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
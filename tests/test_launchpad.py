@@ -1 +1,57 @@
-# Test cases for LaunchpadShell
\ No newline at end of file
+# Test cases for LaunchpadShell
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Process entry to first LED write, with an in-memory MIDI backend
+FIRST_LED_BUDGET = 0.5
+
+PROFILE_SCRIPT = """
+import time
+started = time.perf_counter()
+import sys
+from src.cli import profile_startup
+from src.managers.fake_midi_backend import FakeMidiBackend
+profile = profile_startup(started, FakeMidiBackend('Launchpad Mini MK3'))
+print(profile.report(), file=sys.stderr)
+print(profile.elapsed('first_led'))
+"""
+
+
+class StartupTimeTest(unittest.TestCase):
+    def test_time_to_first_led(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            mappings = Path(tmp) / 'mappings.toml'
+            mappings.write_text('[[mapping]]\nx = 0\ny = 0\ncolor = "RED"\nalias = "true"\n')
+            env = dict(
+                os.environ, MAPPINGS_FILE=str(mappings), MAPPINGS_WATCH='False',
+                CACHE_DIR=tmp, OUTPUT_LOG_DIR='', SHELL_POOL_SIZE='0',
+                ALIAS_CACHE='False', LOG_LEVEL='ERROR', LAUNCHPAD_DEVICES='',
+                LAUNCHPAD_PORT='Launchpad Mini MK3'
+            )
+            result = subprocess.run(
+                [sys.executable, '-c', PROFILE_SCRIPT],
+                cwd=ROOT, env=env, capture_output=True, text=True, timeout=30
+            )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        elapsed = result.stdout.strip().splitlines()[-1]
+        self.assertNotEqual(elapsed, 'None', result.stderr)
+        self.assertLess(float(elapsed), FIRST_LED_BUDGET, result.stderr)
+
+    def test_session_recorder_stays_unimported(self):
+        # The session recorder is only loaded when recording is enabled
+        script = "import sys, src.app; print('src.utils.session_recorder' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', script], cwd=ROOT,
+                                capture_output=True, text=True, timeout=30)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
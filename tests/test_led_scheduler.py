@@ -0,0 +1,104 @@
+# Test cases for the LED frame scheduler: coalescing, rate limiting and effects
+
+import asyncio
+import time
+import unittest
+
+from src.managers.fake_midi_backend import FakeMidiBackend
+from src.managers.led_scheduler import LEDScheduler
+from src.managers.midi_manager import MIDIManager
+from src.utils.constants import MIDI_NOTE_ON, Colors
+
+PORT = 'Launchpad Mini MK3'
+
+
+class LEDSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = FakeMidiBackend(PORT)
+        self.midi = MIDIManager(backend=self.backend)
+        self.assertTrue(self.midi.connect(PORT))
+        self.midi.reset_colors()
+        self.mark = len(self.backend.sent)
+
+    def _sent(self) -> list:
+        return self.backend.sent_since(self.mark)
+
+    def test_requests_within_a_frame_overwrite_each_other(self):
+        scheduler = LEDScheduler(self.midi)
+        scheduler.set_color(0, 0, Colors.RED)
+        scheduler.set_color(0, 0, Colors.GREEN)
+        scheduler._render(time.monotonic())
+        self.assertEqual(self._sent(), [[MIDI_NOTE_ON, 0, Colors.GREEN]])
+
+    def test_a_frame_is_one_batched_write(self):
+        scheduler = LEDScheduler(self.midi)
+        self.addCleanup(scheduler.stop)
+        scheduler.start()
+        with scheduler.batch():
+            for x in range(4):
+                scheduler.set_color(x, 0, Colors.BLUE)
+        deadline = time.monotonic() + 2.0
+        while not self._sent():
+            self.assertLess(time.monotonic(), deadline, "no frame rendered")
+            time.sleep(0.005)
+        self.assertEqual(len(self._sent()), 1)  # One SysEx, not four Note-Ons
+        self.assertEqual([self.midi.get_button_color(x, 0) for x in range(4)], [Colors.BLUE] * 4)
+
+    def test_frames_are_capped_at_max_fps_on_the_event_loop(self):
+        async def scenario():
+            scheduler = LEDScheduler(self.midi, max_fps=20)
+            scheduler.start(asyncio.get_running_loop())
+            began = time.monotonic()
+            color = 0
+            while time.monotonic() - began < 0.5:
+                color = color % 100 + 1
+                scheduler.set_color(1, 1, color)
+                await asyncio.sleep(0.001)
+            await asyncio.sleep(0.1)
+            scheduler.stop()
+            return scheduler.frames, color
+
+        frames, color = asyncio.run(scenario())
+        self.assertLessEqual(frames, 0.6 * 20 + 2)
+        self.assertGreaterEqual(frames, 3)
+        self.assertEqual(self.midi.get_button_color(1, 1), color)  # The last request won
+
+    def test_flash_restores_the_resting_color(self):
+        scheduler = LEDScheduler(self.midi)
+        self.midi.set_button_color(2, 2, Colors.YELLOW)
+        scheduler.flash(2, 2, Colors.GREEN, duration=0.4)
+        now = time.monotonic()
+        scheduler._render(now)
+        self.assertEqual(self.midi.get_button_color(2, 2), Colors.GREEN)
+        scheduler._render(now + 0.5)
+        self.assertEqual(self.midi.get_button_color(2, 2), Colors.YELLOW)
+        self.assertEqual(scheduler._effects, {})
+
+    def test_pulse_blinks_and_a_blip_resumes_it(self):
+        scheduler = LEDScheduler(self.midi)
+        scheduler.pulse(3, 3, Colors.BLUE, period=1.0)
+        started = scheduler._effects[(3, 3)].started
+        scheduler._render(started + 0.1)
+        self.assertEqual(self.midi.get_button_color(3, 3), Colors.BLUE)
+        scheduler._render(started + 0.6)
+        self.assertEqual(self.midi.get_button_color(3, 3), Colors.OFF)
+
+        scheduler.blip(3, 3, Colors.GREEN, duration=0.25)
+        blipped = scheduler._effects[(3, 3)].started
+        scheduler._render(blipped + 0.1)
+        self.assertEqual(self.midi.get_button_color(3, 3), Colors.GREEN)
+        scheduler._render(blipped + 0.3)
+        self.assertEqual(scheduler._effects[(3, 3)].color, Colors.BLUE)  # Back to the pulse
+
+    def test_stop_settles_effects_on_their_resting_color(self):
+        scheduler = LEDScheduler(self.midi)
+        scheduler.start()
+        self.midi.set_button_color(4, 4, Colors.RED)
+        scheduler.pulse(4, 4, Colors.BLUE)
+        scheduler.stop()
+        self.assertEqual(self.midi.get_button_color(4, 4), Colors.RED)
+        self.assertEqual(scheduler._effects, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+# Test cases for the queued logging pipeline
+
+import json
+import logging
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from src.utils.logger import RateLimitFilter, dropped_records, setup_logging, stop_logging
+
+TIMEOUT = 5.0
+
+
+class Recorder(logging.Handler):
+    """Keeps formatted messages and the thread that wrote them; can be held shut"""
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.threads = set()
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+
+    def emit(self, record):
+        self.entered.set()
+        self.gate.wait(TIMEOUT)
+        self.lines.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+
+class Formatted:
+    """An argument that notes which thread formatted it"""
+
+    def __init__(self):
+        self.thread = None
+
+    def __str__(self):
+        self.thread = threading.current_thread()
+        return 'formatted'
+
+
+class QueuedLoggingTest(unittest.TestCase):
+    def setUp(self):
+        root = logging.getLogger()
+        level, handlers = root.level, list(root.handlers)
+        for handler in handlers:
+            root.removeHandler(handler)
+        self.recorder = Recorder()
+        root.addHandler(self.recorder)
+
+        def restore():
+            stop_logging()
+            root.removeHandler(self.recorder)
+            for handler in handlers:
+                root.addHandler(handler)
+            root.setLevel(level)
+        self.addCleanup(restore)
+        self.logger = logging.getLogger('tests.queued')
+
+    def test_records_are_formatted_and_written_off_the_calling_thread(self):
+        setup_logging('INFO')
+        argument = Formatted()
+        self.logger.info("value: %s", argument)
+        stop_logging()  # Drains the queue
+        self.assertEqual(self.recorder.lines, ["value: formatted"])
+        self.assertIsNotNone(argument.thread)
+        self.assertIsNot(argument.thread, threading.current_thread())
+        self.assertNotIn(threading.current_thread().name, self.recorder.threads)
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        setup_logging('INFO', queue_size=1)
+        self.recorder.gate.clear()
+        self.logger.info("first")  # Taken by the writer, which then blocks
+        self.assertTrue(self.recorder.entered.wait(TIMEOUT))
+        for i in range(5):
+            self.logger.info("more %d", i)
+        self.assertEqual(dropped_records()['queue_full'], 4)
+        self.recorder.gate.set()
+        stop_logging()
+        self.assertEqual(self.recorder.lines, ["first", "more 0"])
+
+    def test_json_lines_to_a_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'logs' / 'app.jsonl'
+            setup_logging('INFO', fmt='json', file=str(path))
+            self.logger.warning("disk %d%% full", 93)
+            stop_logging()
+            entry = json.loads(path.read_text())
+        self.assertEqual((entry['level'], entry['logger'], entry['message']),
+                         ('WARNING', 'tests.queued', 'disk 93% full'))
+
+    def test_module_levels_are_overridden_and_restored(self):
+        noisy = logging.getLogger('tests.queued.noisy')
+        setup_logging('WARNING', levels={'tests.queued.noisy': 'DEBUG'})
+        noisy.debug("shown")
+        self.logger.info("hidden")
+        stop_logging()
+        self.assertEqual(self.recorder.lines, ["shown"])
+        self.assertEqual(noisy.level, logging.NOTSET)
+
+    def test_sampled_logger_counts_what_it_drops(self):
+        setup_logging('INFO', sample={'tests.queued': 1000})
+        for i in range(3000):
+            self.logger.info("press %d", i)
+        self.assertGreater(dropped_records()['sampled'], 0)
+        stop_logging()
+        self.assertLess(len(self.recorder.lines), 3000)
+
+
+class RateLimitFilterTest(unittest.TestCase):
+    def _record(self, created: float, *args) -> logging.LogRecord:
+        record = logging.LogRecord('pads', logging.INFO, __file__, 1, "press %d", args, None)
+        record.created = created
+        return record
+
+    def test_bucket_limits_each_template_and_reports_the_gap(self):
+        sampler = RateLimitFilter(rate=2)
+        passed = [sampler.filter(self._record(100.0, i)) for i in range(5)]
+        self.assertEqual(passed, [True, True, False, False, False])
+        later = self._record(101.0, 5)
+        self.assertTrue(sampler.filter(later))
+        self.assertEqual(later.getMessage(), "press 5 (+3 suppressed)")
+        self.assertEqual(sampler.dropped, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
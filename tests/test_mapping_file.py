@@ -0,0 +1,171 @@
+# Test cases for mapping file validation and the compiled cache
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.config import mapping_file
+from src.config.mapping_file import (
+    MappingFileError, cache_path, load_mapping_file, parse_mappings
+)
+
+FULL = """
+[[mapping]]
+x = 0
+y = 0
+color = "RED"
+alias = "deploy"
+page = 1
+debounce_ms = 200
+rate = 0.5
+burst = 2
+on_busy = "restart"
+launch = "stream"
+timeout = 30
+nice = 10
+cpus = [3, 1]
+rlimits = { nofile = 256 }
+
+[[mapping]]
+x = 2
+y = 2
+color = 21
+alias = "status"
+idempotent = true
+cache_ttl = 5
+device = "right"
+
+[[mapping]]
+chord = [[0, 7], [1, 7]]
+window_ms = 120
+alias = "both"
+
+[[mapping]]
+x = 3
+y = 3
+alias = "ci"
+on_failure = "continue"
+steps = [
+    { name = "test", alias = "run_tests" },
+    { name = "lint", alias = "lint", timeout = 60 },
+    { name = "ship", alias = "deploy_app", after = ["test", "lint"] },
+]
+"""
+
+
+class ValidationTest(unittest.TestCase):
+    def _reject(self, entries, message):
+        with self.assertRaises(MappingFileError) as caught:
+            parse_mappings(entries)
+        self.assertIn(message, str(caught.exception))
+
+    def test_accepts_a_plain_pad(self):
+        spec, = parse_mappings([{'x': 1, 'y': 2, 'color': 'GREEN', 'alias': 'ls'}])
+        self.assertEqual((spec.x, spec.y, spec.alias, spec.page), (1, 2, 'ls', 0))
+
+    def test_rejects_unknown_keys(self):
+        self._reject([{'x': 0, 'y': 0, 'alias': 'ls', 'colour': 5}], "unknown keys ['colour']")
+
+    def test_rejects_empty_alias(self):
+        self._reject([{'x': 0, 'y': 0, 'alias': ' '}], "alias must be a non-empty string")
+
+    def test_rejects_duplicate_cells(self):
+        self._reject(
+            [{'x': 0, 'y': 0, 'alias': 'a'}, {'x': 0, 'y': 0, 'alias': 'b'}],
+            "already mapped by #1"
+        )
+
+    def test_same_cell_on_another_page_is_fine(self):
+        specs = parse_mappings([{'x': 0, 'y': 0, 'alias': 'a'},
+                                {'x': 0, 'y': 0, 'alias': 'b', 'page': 1}])
+        self.assertEqual(len(specs), 2)
+
+    def test_rejects_page_controls_in_multi_page_layouts(self):
+        self._reject(
+            [{'x': 8, 'y': 2, 'alias': 'a'}, {'x': 0, 'y': 0, 'alias': 'b', 'page': 1}],
+            "reserved for page switching"
+        )
+
+    def test_rejects_bad_press_policy(self):
+        self._reject([{'x': 0, 'y': 0, 'alias': 'a', 'on_busy': 'drop'}], "on_busy must be")
+        self._reject([{'x': 0, 'y': 0, 'alias': 'a', 'cache_ttl': 5}],
+                     "cache_ttl needs idempotent = true")
+
+    def test_rejects_press_limits_on_idempotent_mappings(self):
+        for key, value in (('debounce_ms', 100), ('rate', 1), ('burst', 2),
+                           ('on_busy', 'single'), ('queue', 1)):
+            self._reject([{'x': 0, 'y': 0, 'alias': 'a', 'idempotent': True, key: value}],
+                         f"{key} don't apply to idempotent = true")
+        spec, = parse_mappings([{'x': 0, 'y': 0, 'alias': 'a', 'idempotent': True,
+                                 'cache_ttl': 5}])
+        self.assertEqual(spec.policy.cache_ttl, 5.0)
+
+    def test_rejects_bad_launch(self):
+        self._reject([{'x': 0, 'y': 0, 'alias': 'a', 'launch': 'detach', 'timeout': 5}],
+                     "timeout doesn't apply")
+        self._reject([{'x': 0, 'y': 0, 'alias': 'a', 'nice': 20}], "nice must be 0-19")
+
+    def test_rejects_bad_pipeline(self):
+        self._reject([{'x': 0, 'y': 0, 'alias': 'a', 'steps': []}], "steps must list")
+        self._reject([{'x': 0, 'y': 0, 'alias': 'a', 'on_failure': 'continue'}],
+                     "on_failure only applies to a pipeline")
+
+    def test_rejects_a_document_without_mappings_list(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'mappings.toml'
+            path.write_text('mapping = 3\n')
+            with self.assertRaises(MappingFileError) as caught:
+                load_mapping_file(str(path))
+        self.assertIn(str(path), str(caught.exception))
+
+    def test_syntax_errors_are_mapping_file_errors(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'mappings.toml'
+            path.write_text('[[mapping]\n')
+            with self.assertRaises(MappingFileError):
+                load_mapping_file(str(path))
+
+
+class CompiledCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / 'mappings.toml'
+        self.path.write_text(FULL)
+        self.cache_dir = str(Path(self._tmp.name) / 'cache')
+
+    def test_round_trip_matches_the_parsed_file(self):
+        parsed = load_mapping_file(str(self.path))
+        first = load_mapping_file(str(self.path), self.cache_dir)
+        self.assertTrue(cache_path(self.path, self.cache_dir).exists())
+        with mock.patch.object(mapping_file, '_validate', side_effect=AssertionError("parsed")):
+            cached = load_mapping_file(str(self.path), self.cache_dir)
+        self.assertEqual(cached, parsed)
+        self.assertEqual(first, parsed)
+
+        deploy = cached[0]
+        self.assertEqual((deploy.policy.on_busy, deploy.policy.burst), ('restart', 2))
+        self.assertEqual((deploy.launch.mode, deploy.launch.cpus), ('stream', (1, 3)))
+        self.assertEqual(cached[1].policy.cache_ttl, 5.0)
+        self.assertEqual(cached[1].device, 'right')
+        self.assertEqual((cached[2].gesture, cached[2].window_ms), ('chord', 120))
+        self.assertEqual([step.name for step in cached[3].pipeline.steps],
+                         ['test', 'lint', 'ship'])
+
+    def test_edited_file_bypasses_a_stale_cache(self):
+        load_mapping_file(str(self.path), self.cache_dir)
+        self.path.write_text(FULL.replace('alias = "status"', 'alias = "uptime"'))
+        specs = load_mapping_file(str(self.path), self.cache_dir)
+        self.assertEqual(specs[1].alias, 'uptime')
+
+    def test_corrupt_cache_falls_back_to_parsing(self):
+        load_mapping_file(str(self.path), self.cache_dir)
+        compiled = cache_path(self.path, self.cache_dir)
+        compiled.write_bytes(compiled.read_bytes()[:50])
+        self.assertEqual(load_mapping_file(str(self.path), self.cache_dir),
+                         load_mapping_file(str(self.path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+# Test cases for the mapping manager: pages, press dispatch and press policies
+
+import unittest
+from unittest import mock
+
+from src.handlers.alias_handler import AliasHandler
+from src.managers.execution_manager import ExecutionManager
+from src.managers.fake_midi_backend import FakeMidiBackend
+from src.managers.mapping_manager import MappingManager, PressGate
+from src.managers.midi_manager import MIDIManager
+from src.models.execution import ExecutionResult
+from src.models.press_policy import PressPolicy
+from src.utils.constants import PAGE_NEXT, PAGE_PREV, PAGE_SELECT_X, Colors
+
+TIMEOUT = 5.0
+
+
+def _note(x: int, y: int) -> int:
+    return x + y * 10
+
+
+class MappingManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.handler = mock.Mock(spec=AliasHandler)
+        self.handler.running.return_value = 0
+        self.handler.cancel.return_value = 0
+        self.handler.execute.side_effect = \
+            lambda alias, *args: ExecutionResult(alias=alias, returncode=0)
+        self.executor = ExecutionManager(pool_size=2)
+        self.addCleanup(self.executor.shutdown, True, TIMEOUT)
+        self.manager = MappingManager(self.handler, self.executor)
+
+    def _press(self, x: int, y: int):
+        """The alias a press on the current page ran, or None"""
+        result = self.manager.execute_mapping(x, y).result(TIMEOUT)
+        return result.alias if result else None
+
+
+class PageTest(MappingManagerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.manager.create_mapping(0, 0, Colors.RED, 'build')
+        self.manager.create_mapping(0, 0, Colors.GREEN, 'deploy', page=1)
+        self.manager.create_mapping(2, 2, Colors.BLUE, 'logs', page=2)
+
+    def test_presses_go_to_the_page_being_shown(self):
+        self.assertEqual(self._press(0, 0), 'build')
+        self.manager.switch_page(1)
+        self.assertEqual(self._press(0, 0), 'deploy')
+        self.assertIsNone(self._press(2, 2))
+        self.manager.switch_page(2)
+        self.assertEqual(self._press(2, 2), 'logs')
+
+    def test_page_frame_draws_the_page_and_its_controls(self):
+        frame = self.manager.switch_page(1)
+        self.assertEqual(frame[_note(0, 0)], Colors.GREEN)
+        self.assertEqual(frame[_note(2, 2)], Colors.OFF)
+        self.assertEqual([frame[_note(PAGE_SELECT_X, y)] for y in range(4)],
+                         [MappingManager.OTHER_PAGE_COLOR, MappingManager.CURRENT_PAGE_COLOR,
+                          MappingManager.OTHER_PAGE_COLOR, Colors.OFF])
+        for x, y in (PAGE_PREV, PAGE_NEXT):
+            self.assertEqual(frame[_note(x, y)], MappingManager.PAGE_STEP_COLOR)
+
+    def test_single_page_layouts_have_no_page_controls(self):
+        manager = MappingManager(self.handler, self.executor)
+        manager.create_mapping(1, 1, Colors.RED, 'build')
+        frame = manager.page_frame()
+        self.assertFalse(manager.multi_page)
+        self.assertEqual(frame[_note(PAGE_SELECT_X, 0)], Colors.OFF)
+        self.assertEqual(frame[_note(*PAGE_NEXT)], Colors.OFF)
+
+    def test_switching_is_one_frame_write(self):
+        backend = FakeMidiBackend()
+        midi = MIDIManager(backend=backend)
+        self.assertTrue(midi.connect(backend.port_name))
+        midi.set_frame(self.manager.page_frame())
+        mark = len(backend.sent)
+        midi.set_frame(self.manager.switch_page(2))
+        self.assertEqual(len(backend.sent_since(mark)), 1)
+        self.assertEqual(midi.get_button_color(2, 2), Colors.BLUE)
+        self.assertEqual(midi.get_button_color(0, 0), Colors.OFF)
+
+    def test_step_page_wraps_around(self):
+        self.manager.step_page(-1)
+        self.assertEqual(self.manager.page, 2)
+        self.manager.step_page(1)
+        self.assertEqual(self.manager.page, 0)
+        self.assertIsNone(self.manager.switch_page(0))  # Already shown
+        self.assertIsNone(self.manager.switch_page(7))  # No such page
+
+    def test_emptied_page_disappears_once_left(self):
+        self.manager.switch_page(2)
+        self.manager.remove_mapping(2, 2, page=2)
+        self.assertEqual(self.manager.pages, [0, 1, 2])  # Still shown
+        self.assertTrue(self.manager.page_empty)
+        self.manager.switch_page(0)
+        self.assertEqual(self.manager.pages, [0, 1])
+
+    def test_mapping_edits_update_the_page_frame(self):
+        self.manager.create_mapping(3, 3, Colors.YELLOW, 'test')
+        self.assertEqual(self.manager.page_frame()[_note(3, 3)], Colors.YELLOW)
+        self.manager.remove_mapping(3, 3)
+        self.assertEqual(self.manager.page_frame()[_note(3, 3)], Colors.OFF)
+
+
+class PressGateTest(unittest.TestCase):
+    def test_debounce_ignores_presses_close_to_the_last_accepted_one(self):
+        gate = PressGate(PressPolicy(debounce_ms=50))
+        self.assertIsNone(gate.admit(10.0))
+        self.assertEqual(gate.admit(10.03), 'debounced')
+        self.assertEqual(gate.admit(10.049), 'debounced')  # Measured from the accepted press
+        self.assertIsNone(gate.admit(10.06))
+
+    def test_bucket_allows_a_burst_then_the_sustained_rate(self):
+        gate = PressGate(PressPolicy(rate=2, burst=3))
+        now = gate.refilled
+        self.assertEqual([gate.admit(now) for _ in range(4)], [None, None, None, 'rate_limited'])
+        self.assertEqual(gate.admit(now + 0.25), 'rate_limited')  # Half a token
+        self.assertIsNone(gate.admit(now + 0.5))
+        self.assertIsNone(gate.admit(now + 60))  # Refills only up to the burst
+        self.assertLess(gate.tokens, 3)
+
+    def test_ungated_policies_get_no_gate(self):
+        manager = MappingManager(mock.Mock(spec=AliasHandler), mock.Mock())
+        self.assertIsNone(manager.create_mapping(0, 0, Colors.RED, 'a').gate)
+        idempotent = PressPolicy(debounce_ms=50, idempotent=True)
+        self.assertIsNone(manager.create_mapping(1, 0, Colors.RED, 'b', policy=idempotent).gate)
+        self.assertIsNotNone(
+            manager.create_mapping(2, 0, Colors.RED, 'c', policy=PressPolicy(rate=1)).gate
+        )
+
+
+class PressPolicyTest(MappingManagerTestCase):
+    def test_rejected_presses_are_counted_and_never_run(self):
+        self.manager.create_mapping(0, 0, Colors.RED, 'build',
+                                    policy=PressPolicy(debounce_ms=10_000))
+        self.assertEqual(self._press(0, 0), 'build')
+        self.assertIsNone(self._press(0, 0))
+        self.assertEqual(self.handler.execute.call_count, 1)
+        self.assertEqual(self.manager.press_counts['debounced'], 1)
+
+    def test_single_ignores_presses_while_running(self):
+        self.manager.create_mapping(0, 0, Colors.RED, 'serve', policy=PressPolicy(on_busy='single'))
+        self.handler.running.return_value = 1
+        self.assertIsNone(self._press(0, 0))
+        self.assertEqual(self.manager.press_counts['busy'], 1)
+        self.handler.running.return_value = 0
+        self.assertEqual(self._press(0, 0), 'serve')
+
+    def test_restart_cancels_the_running_alias_first(self):
+        mapping = self.manager.create_mapping(0, 0, Colors.RED, 'serve',
+                                              policy=PressPolicy(on_busy='restart'))
+        self.handler.running.return_value = 1
+        self.handler.cancel.return_value = 1
+        self.assertEqual(self._press(0, 0), 'serve')
+        self.handler.cancel.assert_called_once_with(mapping)
+        self.assertEqual(self.manager.press_counts['restarted'], 1)
+
+    def test_queue_runs_every_press(self):
+        self.manager.create_mapping(0, 0, Colors.RED, 'build')
+        self.handler.running.return_value = 1
+        self.assertEqual([self._press(0, 0) for _ in range(3)], ['build'] * 3)
+        self.handler.cancel.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
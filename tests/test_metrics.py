@@ -0,0 +1,107 @@
+# Test cases for press latency histograms and their export
+
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from src.utils.metrics import LATENCY_BUCKETS, LatencyHistogram, LatencyMetrics
+
+
+def _trace(metrics: LatencyMetrics, mapping: str, alias: str, **stages: float):
+    """Record a trace whose stages landed the given seconds after the callback"""
+    metrics.begin(0.002, received=100.0)
+    trace = metrics.take()
+    trace.marks = [(stage, 100.0 + offset) for stage, offset in stages.items()]
+    trace.mapping, trace.alias = mapping, alias
+    trace.finish()
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_quantiles_report_the_bucket_upper_bound(self):
+        histogram = LatencyHistogram()
+        for seconds in (0.0004, 0.0004, 0.003, 20.0):
+            histogram.observe(seconds)
+        self.assertEqual(histogram.quantile(0.5), 0.0005)
+        self.assertEqual(histogram.quantile(0.75), 0.005)
+        self.assertEqual(histogram.quantile(1.0), float('inf'))
+        self.assertEqual(histogram.counts[-1], 1)
+        self.assertEqual(LatencyHistogram().quantile(0.5), 0.0)
+
+
+class LatencyMetricsTest(unittest.TestCase):
+    def test_take_claims_the_trace_once(self):
+        metrics = LatencyMetrics(enabled=True)
+        metrics.begin(0.001)
+        trace = metrics.take()
+        self.assertEqual(trace.marks[0][0], 'dispatch')
+        self.assertIsNone(metrics.take())
+
+    def test_first_stamp_of_a_stage_wins(self):
+        metrics = LatencyMetrics(enabled=True)
+        metrics.begin(0.0, received=100.0)
+        trace = metrics.take()
+        trace.marks = [('spawn', 100.001), ('spawn', 100.5)]
+        trace.finish()
+        spawn = metrics.stage_histogram('spawn')
+        self.assertEqual(spawn.count, 1)
+        self.assertAlmostEqual(spawn.total, 0.001)
+
+    def test_stage_histogram_merges_mappings(self):
+        metrics = LatencyMetrics(enabled=True)
+        _trace(metrics, '0,0', 'ls', exit=0.02)
+        _trace(metrics, '1,0', 'make', exit=0.2)
+        merged = metrics.stage_histogram('exit')
+        self.assertEqual(merged.count, 2)
+        self.assertAlmostEqual(merged.total, 0.22)
+        summary = metrics.summary()
+        self.assertEqual(summary['0,0 ls']['exit']['count'], 1)
+        self.assertEqual(summary['1,0 make']['exit']['p50_ms'], 250.0)
+
+    def test_prometheus_text_escapes_labels_and_accumulates_buckets(self):
+        metrics = LatencyMetrics(enabled=True)
+        _trace(metrics, 'pad "a"', 'echo\\n\nx', spawn=0.0003, exit=0.03)
+        metrics.add_counters('launchpad_drops_total', "Presses dropped", 'reason',
+                             lambda: {'queue "full"': 3})
+        text = metrics.render_prometheus()
+        labels = 'mapping="pad \\"a\\"",alias="echo\\\\n\\nx"'
+        self.assertIn(f'launchpad_press_latency_seconds_bucket{{{labels},stage="spawn",le="0.00025"}} 0',
+                      text)
+        self.assertIn(f'launchpad_press_latency_seconds_bucket{{{labels},stage="spawn",le="0.0005"}} 1',
+                      text)
+        self.assertIn(f'launchpad_press_latency_seconds_bucket{{{labels},stage="spawn",le="+Inf"}} 1',
+                      text)
+        self.assertIn(f'launchpad_press_latency_seconds_count{{{labels},stage="exit"}} 1', text)
+        self.assertIn('launchpad_midi_event_interval_seconds_count{} 1', text)
+        self.assertIn('launchpad_drops_total{reason="queue \\"full\\""} 3', text)
+        buckets = [line for line in text.splitlines()
+                   if line.startswith('launchpad_midi_event_interval_seconds_bucket')]
+        self.assertEqual(len(buckets), len(LATENCY_BUCKETS) + 1)
+
+    def test_dump_and_http_serve_the_same_text(self):
+        metrics = LatencyMetrics(enabled=True)
+        self.addCleanup(metrics.stop)
+        _trace(metrics, '0,0', 'ls', exit=0.01)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'metrics.prom'
+            metrics.dump(str(path))
+            self.assertEqual(path.read_text(), metrics.render_prometheus())
+
+        metrics.start_http(0)
+        port = metrics._server.server_address[1]
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}/metrics', timeout=5) as response:
+            self.assertEqual(response.read().decode(), metrics.render_prometheus())
+        with self.assertRaises(urllib.error.HTTPError):
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/other', timeout=5)
+
+    def test_reset_drops_samples(self):
+        metrics = LatencyMetrics(enabled=True)
+        _trace(metrics, '0,0', 'ls', exit=0.01)
+        metrics.reset()
+        self.assertEqual(metrics.summary(), {})
+        self.assertEqual(metrics.stage_histogram('exit').count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# Test cases for the LED framebuffer and its diffed writes
+
+import unittest
+
+from src.managers.fake_midi_backend import FakeMidiBackend
+from src.managers.midi_manager import MIDIManager
+from src.utils.constants import (
+    LED_NOTES, LED_SPEC_STATIC, MIDI_NOTE_ON, SYSEX_END, SYSEX_HEADER, SYSEX_LED_LIGHTING
+)
+
+PORT = 'Launchpad Mini MK3'
+
+
+def lighting(*cells) -> list:
+    """The SysEx message lighting (note, color) cells"""
+    message = list(SYSEX_HEADER) + [SYSEX_LED_LIGHTING]
+    for note, color in cells:
+        message += [LED_SPEC_STATIC, note, color]
+    return message + [SYSEX_END]
+
+
+class FramebufferTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = FakeMidiBackend(PORT)
+        self.midi = MIDIManager(backend=self.backend)
+        self.assertTrue(self.midi.connect(PORT))
+        self.midi.reset_colors()  # Device state known from here on
+        self.mark = len(self.backend.sent)
+
+    def _sent(self) -> list:
+        return self.backend.sent_since(self.mark)
+
+    def test_batch_sends_only_changed_cells_in_one_sysex(self):
+        with self.midi.batch():
+            self.midi.set_button_color(0, 0, 5)
+            self.midi.set_button_color(3, 2, 21)
+            self.midi.set_button_color(7, 7, 45)
+            self.midi.set_button_color(4, 4, 0)  # Already off: not sent
+        self.assertEqual(self._sent(), [lighting((0, 5), (23, 21), (77, 45))])
+
+    def test_unchanged_frame_sends_nothing(self):
+        self.midi.set_button_color(1, 1, 5)
+        self.mark = len(self.backend.sent)
+        self.midi.set_button_color(1, 1, 5)
+        with self.midi.batch():
+            self.midi.set_button_color(2, 2, 9)
+            self.midi.set_button_color(2, 2, 0)  # Changed back before the flush
+        self.assertEqual(self._sent(), [])
+
+    def test_single_change_is_a_note_on(self):
+        self.midi.set_button_color(2, 3, 13)
+        self.assertEqual(self._sent(), [[MIDI_NOTE_ON, 32, 13]])
+
+    def test_set_frame_diffs_against_the_device(self):
+        self.midi.set_button_color(0, 0, 5)
+        self.mark = len(self.backend.sent)
+        frame = bytearray(100)
+        frame[0] = 5    # Unchanged
+        frame[11] = 9
+        frame[12] = 9
+        self.midi.set_frame(bytes(frame))
+        self.assertEqual(self._sent(), [lighting((11, 9), (12, 9))])
+        self.assertEqual(self.midi.get_button_color(1, 1), 9)
+
+    def test_nested_batches_flush_once(self):
+        with self.midi.batch():
+            self.midi.set_button_color(0, 0, 5)
+            with self.midi.batch():
+                self.midi.set_button_color(1, 0, 5)
+            self.assertEqual(self._sent(), [])
+        self.assertEqual(self._sent(), [lighting((0, 5), (1, 5))])
+
+    def test_writes_while_unplugged_are_replayed_on_reconnect(self):
+        self.backend.unplug()
+        self.midi.set_button_color(0, 0, 5)  # The write fails: marked disconnected
+        self.assertFalse(self.midi.connected)
+        self.midi.set_button_color(1, 0, 6)
+        self.mark = len(self.backend.sent)
+        self.backend.plug()
+        self.assertTrue(self.midi.reconnect())
+        sent = self._sent()
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(sent[0][:len(SYSEX_HEADER) + 1], list(SYSEX_HEADER) + [SYSEX_LED_LIGHTING])
+        cells = {(sent[0][i + 1], sent[0][i + 2])
+                 for i in range(len(SYSEX_HEADER) + 1, len(sent[0]) - 1, 3)}
+        self.assertIn((0, 5), cells)
+        self.assertIn((1, 6), cells)
+        self.assertEqual({note for note, _ in cells}, set(LED_NOTES))  # The device state is unknown again
+
+
+if __name__ == '__main__':
+    unittest.main()
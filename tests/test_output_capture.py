@@ -0,0 +1,50 @@
+# Test cases for output capture
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.handlers.output_capture import LogWriter, RingBuffer, RotatingLog
+
+
+class OutputCaptureTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / 'alias.log'
+
+    def test_ring_buffer_keeps_the_tail(self):
+        ring = RingBuffer(4)
+        ring.write(b'abc')
+        ring.write(b'defg')
+        self.assertEqual((ring.getvalue(), ring.total), (b'defg', 7))
+
+    def test_writer_thread_writes_in_order(self):
+        writer = LogWriter()
+        log = RotatingLog(self.path, writer=writer)
+        for i in range(100):
+            log.write(f"{i}\n".encode())
+        writer.close()
+        log.close()
+        self.assertEqual(self.path.read_text().split(), [str(i) for i in range(100)])
+
+    def test_writer_drops_output_past_its_budget(self):
+        writer = LogWriter(max_pending=0)
+        log = RotatingLog(self.path, writer=writer)
+        log.write(b'lost')
+        writer.close()
+        self.assertEqual(writer.dropped, 4)
+        self.assertFalse(self.path.exists())
+
+    def test_rotates_past_max_bytes(self):
+        log = RotatingLog(self.path, max_bytes=10, backups=2)
+        for chunk in (b'a' * 8, b'b' * 8, b'c' * 8):
+            log.write(chunk)
+        log.close()
+        self.assertEqual(self.path.read_bytes(), b'c' * 8)
+        self.assertEqual(self.path.with_name('alias.log.1').read_bytes(), b'b' * 8)
+        self.assertEqual(self.path.with_name('alias.log.2').read_bytes(), b'a' * 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
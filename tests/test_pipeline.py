@@ -0,0 +1,123 @@
+# Test cases for pipeline runs: step ordering and failure propagation
+
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from src.handlers.alias_handler import AliasHandler
+from src.models.pipeline import Pipeline, PipelineError, PipelineStep
+
+TIMEOUT = 10.0
+
+
+def step(name: str, command: str, *after: str, timeout: float = 0.0) -> PipelineStep:
+    return PipelineStep(name=name, alias=command, after=after, timeout=timeout)
+
+
+class PipelineTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.log = Path(tmp.name) / 'order'
+        self.handler = AliasHandler(shell_path='/bin/sh', work_dir=tmp.name)
+        self.addCleanup(self.handler.close)
+        self.addCleanup(self.handler.terminate_all)
+
+    def _order(self) -> list:
+        return self.log.read_text().split() if self.log.exists() else []
+
+    def _wait_reaped(self):
+        deadline = time.monotonic() + TIMEOUT
+        while self.handler._watcher.live:
+            self.assertLess(time.monotonic(), deadline, "steps left running")
+            time.sleep(0.01)
+
+    def test_steps_start_once_their_dependencies_succeed(self):
+        pipeline = Pipeline((
+            step('slow', 'sleep 0.3; echo slow >> order'),
+            step('fast', 'echo fast >> order'),
+            step('last', 'echo last >> order', 'slow', 'fast'),
+        ))
+        result = self.handler.execute_pipeline('ci', pipeline)
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(self._order(), ['fast', 'slow', 'last'])  # Roots ran side by side
+        self.assertIn("✅ last", result.output.decode())
+
+    def test_fail_fast_stops_running_steps_and_starts_nothing_more(self):
+        pipeline = Pipeline((
+            step('broken', 'false'),
+            step('slow', 'sleep 30'),
+            step('after', 'echo after >> order', 'broken'),
+        ))
+        began = time.monotonic()
+        result = self.handler.execute_pipeline('ci', pipeline)
+        self.assertLess(time.monotonic() - began, TIMEOUT)
+        self.assertEqual((result.returncode, result.error), (1, "failed: broken"))
+        output = result.output.decode()
+        self.assertIn("⏹️ unfinished slow", output)
+        self.assertIn("⏭️ skipped after", output)
+        self.assertEqual(self._order(), [])
+        self._wait_reaped()
+
+    def test_continue_skips_only_the_dependents_of_a_failure(self):
+        pipeline = Pipeline((
+            step('broken', 'false'),
+            step('child', 'echo child >> order', 'broken'),
+            step('grandchild', 'echo grandchild >> order', 'child'),
+            step('other', 'echo other >> order'),
+        ), on_failure='continue')
+        result = self.handler.execute_pipeline('ci', pipeline)
+        self.assertEqual((result.returncode, result.error), (1, "failed: broken"))
+        self.assertEqual(self._order(), ['other'])
+        output = result.output.decode()
+        self.assertIn("⏭️ skipped child", output)
+        self.assertIn("⏭️ skipped grandchild", output)
+
+    def test_step_timeout_counts_as_a_failure(self):
+        pipeline = Pipeline((
+            step('hang', 'sleep 30', timeout=0.2),
+            step('after', 'echo after >> order', 'hang'),
+        ))
+        result = self.handler.execute_pipeline('ci', pipeline)
+        self.assertTrue(result.timed_out)
+        self.assertIn("timed out after 0.2s", result.output.decode())
+        self.assertEqual(self._order(), [])
+        self._wait_reaped()
+
+    def test_cancel_reaches_the_steps_through_the_pipeline_context(self):
+        pipeline = Pipeline((step('hang', 'sleep 30'),))
+        outcome = []
+        runner = threading.Thread(
+            target=lambda: outcome.append(self.handler.execute_pipeline('ci', pipeline, 'pad'))
+        )
+        runner.start()
+        deadline = time.monotonic() + TIMEOUT
+        while not self.handler.cancel('pad'):
+            self.assertLess(time.monotonic(), deadline, "step never tracked for the pipeline")
+            time.sleep(0.01)
+        runner.join(TIMEOUT)
+        self.assertFalse(runner.is_alive())
+        self.assertEqual(outcome[0].error, "failed: hang")
+        self._wait_reaped()
+
+    def test_async_runtime_keeps_the_same_order(self):
+        pipeline = Pipeline((
+            step('slow', 'sleep 0.3; echo slow >> order'),
+            step('fast', 'echo fast >> order'),
+            step('last', 'echo last >> order', 'slow', 'fast'),
+        ))
+        result = asyncio.run(self.handler.execute_pipeline_async('ci', pipeline))
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(self._order(), ['fast', 'slow', 'last'])
+
+    def test_rejects_cycles(self):
+        with self.assertRaises(PipelineError) as caught:
+            Pipeline((step('a', 'true', 'b'), step('b', 'true', 'a')))
+        self.assertIn("cycle", str(caught.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# Test cases for port name matching and the resolved-port cache
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List, Optional
+
+from src.managers.fake_midi_backend import FakeMidiBackend
+from src.managers.port_resolver import (
+    PortCache, ResolvedPorts, match_port, normalize, resolve_ports
+)
+
+MINI = 'Launchpad Mini MK3:Launchpad Mini MK3 LPMiniMK3 MI 20:1'
+
+
+class CountingBackend(FakeMidiBackend):
+    """Counts full enumerations; single names are looked up directly, like a real driver"""
+
+    def __init__(self, ports: List[str]):
+        super().__init__(ports[0])
+        self.ports = list(ports)
+        self.enumerations = 0
+
+    def get_input_ports(self) -> List[str]:
+        self.enumerations += 1
+        return super().get_input_ports()
+
+    def get_output_ports(self) -> List[str]:
+        self.enumerations += 1
+        return super().get_output_ports()
+
+    def get_input_port_name(self, index: int) -> Optional[str]:
+        return self.ports[index] if 0 <= index < len(self.ports) else None
+
+    get_output_port_name = get_input_port_name
+
+
+class MatchPortTest(unittest.TestCase):
+    def test_exact_name_wins(self):
+        ports = ['Midi Through 14:0', MINI, 'Launchpad Mini MK3 LPMiniMK3 MI']
+        self.assertEqual(match_port('Launchpad Mini MK3 LPMiniMK3 MI', ports), 2)
+        self.assertEqual(match_port(MINI, ports), 1)
+
+    def test_alsa_numbers_and_case_are_ignored(self):
+        self.assertEqual(normalize(MINI), 'launchpad mini mk3:launchpad mini mk3 lpminimk3 mi')
+        ports = ['Midi Through 14:0', MINI.replace('20:1', '24:1')]
+        self.assertEqual(match_port(MINI, ports), 1)
+        self.assertEqual(match_port(MINI.upper(), ports), 1)
+
+    def test_close_names_match_fuzzily(self):
+        ports = ['Midi Through 14:0', 'Launchpad Mini MK3:Launchpad Mini MK3 LPMiniMK3 MIDI 20:1']
+        self.assertEqual(match_port(MINI, ports), 1)
+        self.assertIsNone(match_port('Keystation 49', ports))
+
+    def test_identical_controllers_are_never_guessed(self):
+        ports = [MINI, MINI.replace('20:1', '24:1')]
+        self.assertIsNone(match_port(MINI.replace('20:1', '28:1'), ports))
+        self.assertEqual(match_port(ports[1], ports), 1)  # Exact names still pick one
+
+
+class PortCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / 'cache' / 'ports.json'
+
+    def test_round_trip_through_the_file(self):
+        ports = ResolvedPorts(1, 2, MINI, MINI)
+        PortCache(str(self.path)).put('Launchpad', ports)
+        self.assertEqual(PortCache(str(self.path)).get('Launchpad'), ports)
+        self.assertIsNone(PortCache(str(self.path)).get('Other'))
+
+    def test_unreadable_entries_are_misses(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text(json.dumps({'Launchpad': {'in_index': 1}}))
+        self.assertIsNone(PortCache(str(self.path)).get('Launchpad'))
+        self.path.write_text('not json')
+        self.assertIsNone(PortCache(str(self.path)).get('Launchpad'))
+
+
+class ResolvePortsTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = PortCache(str(Path(tmp.name) / 'ports.json'))
+        self.backend = CountingBackend(['Midi Through 14:0', MINI])
+
+    def test_cached_indices_skip_enumeration_while_names_match(self):
+        first = resolve_ports(self.backend, MINI, self.cache)
+        self.assertEqual((first.in_index, first.out_index), (1, 1))
+        self.assertEqual(self.backend.enumerations, 2)
+        self.assertEqual(resolve_ports(self.backend, MINI, self.cache), first)
+        self.assertEqual(self.backend.enumerations, 2)
+
+    def test_moved_port_is_found_again_and_recached(self):
+        resolve_ports(self.backend, MINI, self.cache)
+        self.backend.ports = ['Midi Through 14:0', 'Keystation 49 28:0',
+                              MINI.replace('20:1', '24:1')]
+        moved = resolve_ports(self.backend, MINI, self.cache)
+        self.assertEqual((moved.in_index, moved.in_name), (2, self.backend.ports[2]))
+        self.assertEqual(self.backend.enumerations, 4)
+        self.assertEqual(self.cache.get(MINI), moved)
+
+    def test_missing_device_resolves_to_none(self):
+        self.backend.ports = ['Midi Through 14:0']
+        self.assertIsNone(resolve_ports(self.backend, MINI, self.cache))
+        self.assertIsNone(self.cache.get(MINI))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# Test cases for hot-plug detection and reconnection
+
+import time
+import unittest
+
+from src.managers.fake_midi_backend import FakeMidiBackend
+from src.managers.midi_manager import MIDIManager
+from src.managers.port_watcher import PortWatcher
+from src.utils.constants import LED_NOTES, MIDI_NOTE_ON, SYSEX_HEADER
+
+PORT = 'Launchpad Mini MK3'
+TIMEOUT = 5.0
+
+
+class PortWatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = FakeMidiBackend(PORT)
+        self.midi = MIDIManager(backend=self.backend)
+        self.assertTrue(self.midi.connect(PORT))
+        self.events = []
+        self.midi.set_callback(lambda event, data=None: self.events.append(event[0]))
+        self.watcher = PortWatcher([self.midi], interval=0.01)
+
+    def test_check_marks_a_vanished_port_disconnected(self):
+        self.backend.unplug()
+        self.watcher.check()
+        self.assertFalse(self.midi.connected)
+        self.watcher.check()  # Still gone: stays disconnected
+        self.assertFalse(self.midi.connected)
+        self.assertEqual(self.midi.reconnects, 0)
+
+    def test_returning_port_is_reopened_and_the_frame_replayed(self):
+        self.backend.unplug()
+        self.watcher.check()
+        self.midi.set_button_color(2, 3, 21)  # Buffered while unplugged
+        self.backend.plug('Launchpad Mini MK3 MIDI 1')  # Back under a new client name
+        mark = len(self.backend.sent)
+        self.watcher.check()
+
+        self.assertTrue(self.midi.connected)
+        self.assertTrue(self.backend.is_open)
+        self.assertEqual(self.midi.reconnects, 1)
+        self.assertEqual(self.midi.ports.in_name, 'Launchpad Mini MK3 MIDI 1')
+        replay, = self.backend.sent_since(mark)
+        specs = replay[len(SYSEX_HEADER) + 1:-1]  # (spec type, note, color) per LED
+        self.assertEqual(len(specs), 3 * len(LED_NOTES))
+        self.assertIn(32, specs[1::3])
+        self.assertEqual(specs[2::3][specs[1::3].index(32)], 21)
+
+    def test_input_callback_survives_a_reconnect(self):
+        self.backend.unplug()
+        self.watcher.check()
+        self.backend.plug()
+        self.watcher.check()
+        self.backend.inject([MIDI_NOTE_ON, 11, 127])
+        self.assertEqual(self.events, [[MIDI_NOTE_ON, 11, 127]])
+
+    def test_background_thread_reconnects_on_its_own(self):
+        self.watcher.start()
+        self.addCleanup(self.watcher.stop)
+        self.backend.unplug()
+        self._wait_for(lambda: not self.midi.connected)
+        self.backend.plug()
+        self._wait_for(lambda: self.midi.connected)
+        self.assertEqual(self.midi.reconnects, 1)
+
+    def _wait_for(self, condition):
+        deadline = time.monotonic() + TIMEOUT
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, "timed out waiting")
+            time.sleep(0.005)
+
+
+if __name__ == '__main__':
+    unittest.main()
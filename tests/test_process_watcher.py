@@ -0,0 +1,116 @@
+# Test cases for process supervision: group kill, reaping and timeouts
+
+import os
+import signal
+import subprocess
+import time
+import unittest
+
+from src.handlers.alias_handler import AliasHandler
+from src.handlers.process_watcher import ProcessWatcher
+from src.models.launch_policy import LaunchPolicy
+
+TIMEOUT = 5.0
+
+
+def gone(pid: int) -> bool:
+    """True once pid has exited (a zombie awaiting another parent counts)"""
+    try:
+        with open(f'/proc/{pid}/stat') as stat:
+            return stat.read().rsplit(')', 1)[1].split()[0] in ('Z', 'X')
+    except FileNotFoundError:
+        return True
+
+
+class ProcessFutureTest(unittest.TestCase):
+    def setUp(self):
+        self.watcher = ProcessWatcher()
+
+    def _spawn(self, script: str):
+        """Run script in its own group; returns its future and the pid it backgrounds"""
+        output = []
+        process = subprocess.Popen(
+            ['/bin/sh', '-c', script], stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, start_new_session=True
+        )
+        self.addCleanup(self._kill_group, process.pid)
+        future = self.watcher.watch(process, output.append)
+        deadline = time.monotonic() + TIMEOUT
+        while b'\n' not in b''.join(output):
+            self.assertLess(time.monotonic(), deadline, "child never started")
+            time.sleep(0.01)
+        return future, int(b''.join(output))
+
+    def _kill_group(self, pgid: int):
+        try:
+            os.killpg(pgid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    def _wait_gone(self, pid: int):
+        deadline = time.monotonic() + TIMEOUT
+        while not gone(pid):
+            self.assertLess(time.monotonic(), deadline, f"{pid} outlived its group")
+            time.sleep(0.01)
+
+    def _assert_reaped(self, pid: int):
+        with self.assertRaises(ChildProcessError):
+            os.waitpid(pid, os.WNOHANG)
+
+    def test_terminate_stops_the_whole_group_and_reaps_it(self):
+        future, child = self._spawn('sleep 30 & echo $!; wait')
+        self.assertTrue(future.terminate())
+        self.assertEqual(future.result(TIMEOUT), -signal.SIGTERM)
+        self._assert_reaped(future.pid)
+        self._wait_gone(child)
+        self.assertEqual(self.watcher.live, 0)
+        self.assertFalse(future.terminate())  # Nothing left to stop
+
+    def test_cancel_terminates_instead_of_abandoning_the_process(self):
+        future, child = self._spawn('sleep 30 & echo $!; wait')
+        self.assertTrue(future.cancel())
+        self.assertEqual(future.result(TIMEOUT), -signal.SIGTERM)
+        self.assertFalse(future.cancelled())
+        self._assert_reaped(future.pid)
+        self._wait_gone(child)
+
+    def test_sigkill_follows_when_sigterm_is_ignored(self):
+        future, child = self._spawn("trap '' TERM; sleep 30 & echo $!; wait")
+        began = time.monotonic()
+        self.assertTrue(future.terminate(grace=0.2))
+        self.assertEqual(future.result(TIMEOUT), -signal.SIGKILL)
+        self.assertGreaterEqual(time.monotonic() - began, 0.2)
+        self._assert_reaped(future.pid)
+        self._wait_gone(child)
+
+
+class TimeoutTest(unittest.TestCase):
+    def test_wait_mode_stops_the_run_at_its_timeout(self):
+        handler = AliasHandler(shell_path='/bin/sh')
+        self.addCleanup(handler.close)
+        began = time.monotonic()
+        result = handler.execute('sleep 30', launch=LaunchPolicy(timeout=0.2))
+        self.assertLess(time.monotonic() - began, TIMEOUT)
+        self.assertTrue(result.timed_out)
+        self.assertFalse(result.success)
+        self.assertIn("timed out after 0.2s", result.error)
+        self.assertEqual(handler._watcher.live, 0)  # Reaped, not left behind
+
+    def test_stream_mode_leaves_the_run_going(self):
+        handler = AliasHandler(shell_path='/bin/sh')
+        self.addCleanup(handler.close)
+        self.addCleanup(handler.terminate_all)
+        result = handler.execute('sleep 30', context='pad',
+                                 launch=LaunchPolicy(mode='stream', timeout=0.1))
+        self.assertIsNone(result.returncode)  # A snapshot: the run is still going
+        self.assertEqual(handler.running('pad'), 1)
+        self.assertEqual(handler.cancel('pad'), 1)
+        deadline = time.monotonic() + TIMEOUT
+        while handler.running('pad'):
+            self.assertLess(time.monotonic(), deadline, "stream run never stopped")
+            time.sleep(0.01)
+        self.assertEqual(handler.last_result('sleep 30').returncode, -signal.SIGTERM)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# Test cases for the idempotent result cache
+
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+from src.managers.result_cache import ResultCache
+from src.models.execution import ExecutionResult
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 100.0
+        clock = mock.patch('src.managers.result_cache.time.monotonic', lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+        self.starts = 0
+
+    def _run(self, cache, key, ttl=10.0, output=b'ok', **kwargs):
+        """Run key through the cache with a job that finishes at once"""
+        def start():
+            self.starts += 1
+            future = Future()
+            future.set_result(ExecutionResult(alias=str(key), returncode=0, output=output,
+                                              **kwargs))
+            return future
+        return cache.run(key, ttl, start).result()
+
+    def test_fresh_result_is_reused(self):
+        cache = ResultCache()
+        first = self._run(cache, 'a')
+        second = self._run(cache, 'a')
+        self.assertIs(first, second)
+        self.assertEqual(self.starts, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_result_expires_after_ttl(self):
+        cache = ResultCache()
+        self._run(cache, 'a', ttl=5.0)
+        self.now += 4.9
+        self._run(cache, 'a', ttl=5.0)
+        self.assertEqual(self.starts, 1)
+        self.now += 0.2
+        self._run(cache, 'a', ttl=5.0)
+        self.assertEqual(self.starts, 2)
+
+    def test_zero_ttl_only_shares_runs_in_flight(self):
+        cache = ResultCache()
+        pending = Future()
+        first = cache.run('a', 0, lambda: pending)
+        second = cache.run('a', 0, lambda: self.fail("second run started"))
+        self.assertIs(first, second)
+        self.assertEqual(cache.shared, 1)
+        pending.set_result(ExecutionResult(alias='a', returncode=0))
+        self.assertEqual(first.result().returncode, 0)
+        self._run(cache, 'a', ttl=0)
+        self.assertEqual(self.starts, 1)
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_failed_runs_are_not_cached(self):
+        cache = ResultCache()
+        self._run(cache, 'a', timed_out=True)
+        self._run(cache, 'a', error="boom")
+        self.assertEqual(self.starts, 2)
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResultCache(max_entries=2)
+        self._run(cache, 'a')
+        self._run(cache, 'b')
+        self._run(cache, 'a')  # Hit: a is now the most recent
+        self._run(cache, 'c')
+        self.assertEqual(cache.evictions, 1)
+        starts = self.starts
+        self._run(cache, 'a')
+        self.assertEqual(self.starts, starts)
+        self._run(cache, 'b')
+        self.assertEqual(self.starts, starts + 1)
+
+    def test_byte_budget_evicts_oldest_output(self):
+        cache = ResultCache(max_bytes=10)
+        self._run(cache, 'a', output=b'x' * 6)
+        self._run(cache, 'b', output=b'y' * 6)
+        stats = cache.stats()
+        self.assertEqual((stats['entries'], stats['bytes'], stats['evictions']), (1, 6, 1))
+        starts = self.starts
+        self._run(cache, 'b', output=b'y' * 6)
+        self.assertEqual(self.starts, starts)
+
+    def test_output_over_the_budget_is_never_kept(self):
+        cache = ResultCache(max_bytes=4)
+        self._run(cache, 'a', output=b'x' * 5)
+        self.assertEqual(cache.stats()['bytes'], 0)
+
+    def test_start_failure_releases_the_key(self):
+        cache = ResultCache()
+        with self.assertRaises(RuntimeError):
+            cache.run('a', 10, mock.Mock(side_effect=RuntimeError("queue full")))
+        self._run(cache, 'a')
+        self.assertEqual(self.starts, 1)
+
+    def test_invalidate(self):
+        cache = ResultCache()
+        self._run(cache, 'a')
+        self._run(cache, 'b')
+        cache.invalidate('a')
+        self.assertEqual(cache.stats()['entries'], 1)
+        cache.invalidate()
+        self.assertEqual(cache.stats()['bytes'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
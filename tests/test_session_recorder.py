@@ -0,0 +1,88 @@
+# Test cases for MIDI session recording and replay
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.managers.fake_midi_backend import FakeMidiBackend, drum_roll
+from src.managers.midi_manager import MIDIManager
+from src.utils.session_recorder import (
+    HEADER, RECORD, SessionRecorder, list_sessions, read_session
+)
+
+PORT = 'Launchpad Mini MK3'
+
+
+class SessionRecorderTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = tmp.name
+
+    def _recorder(self, **kwargs) -> SessionRecorder:
+        recorder = SessionRecorder(self.directory, **kwargs)
+        self.addCleanup(recorder.close)
+        return recorder
+
+    def test_round_trip_keeps_messages_and_deltas(self):
+        recorder = self._recorder()
+        events = [([0x90, 11, 127], 0.0), ([0x90, 11, 0], 0.125), ([0xF0, 1, 2, 3, 0xF7], 2.5)]
+        for message, delta in events:
+            recorder.write(message, delta)
+        recorder.write([], 1.0)           # Nothing to record
+        recorder.write([0] * 256, 1.0)    # Too long for a record
+        recorder.close()
+        self.assertEqual(list(read_session(str(recorder.path))), events)
+        self.assertEqual(recorder.records, 3)
+        # Trimmed to what was written
+        size = HEADER.size + sum(RECORD.size + len(m) for m, _ in events)
+        self.assertEqual(os.path.getsize(recorder.path), size)
+
+    def test_full_segments_roll_over_and_old_ones_rotate_out(self):
+        recorder = self._recorder(segment_size=0, max_files=2)  # Smallest allowed segment
+        per_segment = (recorder.segment_size - HEADER.size) // (RECORD.size + 3)
+        for i in range(per_segment * 4):
+            recorder.write([0x90, i % 128, 127], 0.001)
+        recorder.close()
+        self.assertEqual(len(list_sessions(self.directory)), 2)
+        current = list(read_session(str(recorder.path)))
+        self.assertEqual(len(current), per_segment)
+        self.assertEqual(current[-1][0], [0x90, (per_segment * 4 - 1) % 128, 127])
+
+    def test_cut_off_recording_reads_up_to_the_damage(self):
+        recorder = self._recorder()
+        recorder.write([0x90, 11, 127], 0.0)
+        recorder.write([0x90, 11, 0], 0.1)
+        recorder.close()
+        path = Path(recorder.path)
+        path.write_bytes(path.read_bytes()[:-1])
+        self.assertEqual([m for m, _ in read_session(str(path))], [[0x90, 11, 127]])
+
+    def test_rejects_other_files(self):
+        path = Path(self.directory) / 'session-x.lprec'
+        path.write_bytes(b'not a recording at all')
+        with self.assertRaises(ValueError):
+            list(read_session(str(path)))
+
+    def test_manager_records_input_before_dispatch(self):
+        backend = FakeMidiBackend(PORT)
+        midi = MIDIManager(backend=backend)
+        recorder = self._recorder()
+        midi.recorder = recorder
+        self.assertTrue(midi.connect(PORT))
+        received = []
+        midi.set_callback(lambda event, data=None: received.append(event))
+        events = list(drum_roll(1000, 10))
+        backend.play(events, realtime=False)
+        recorder.close()
+
+        replayed = list(read_session(str(recorder.path)))
+        self.assertEqual([m for m, _ in replayed], [m for m, _ in events])
+        for (_, recorded), (_, original) in zip(replayed, events):
+            self.assertAlmostEqual(recorded, original, places=6)  # Stored as float32
+        self.assertEqual(len(received), len(events))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+# Test cases for the warm shell pool
+
+import time
+import unittest
+
+from src.handlers.shell_pool import ShellPool
+
+
+class ShellPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = ShellPool('/bin/sh', size=2, health_interval=0)
+        self.addCleanup(self.pool.close)
+        self.pool.start()
+        self._wait_for(lambda: self.pool.stats()['idle'] == 2)
+
+    def _wait_for(self, condition, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, "timed out waiting")
+            time.sleep(0.01)
+
+    def test_runs_commands_with_their_status(self):
+        output = []
+        completion = self.pool.run('echo hi; (exit 3)', 5.0, sink=output.append)
+        self.assertEqual(completion.result(5), 3)
+        self.assertEqual(b''.join(output), b'hi\n')
+
+    def test_idle_shells_are_capped_at_size(self):
+        shells = [self.pool.acquire(), self.pool.acquire()]
+        self.assertIsNone(self.pool.acquire())  # Empty: a replacement is spawned
+        self._wait_for(lambda: self.pool.stats()['idle'] == 1)
+        for shell in shells:
+            self.pool.release(shell)
+        self.assertEqual(self.pool.stats()['idle'], 2)
+        self.assertFalse(shells[1].is_alive())
+
+    def test_health_check_replaces_dead_shells_without_spending_them(self):
+        dead = self.pool._idle[0]
+        dead.kill()
+        self.assertEqual(self.pool.health_check(), 1)
+        self._wait_for(lambda: self.pool.stats()['idle'] == 2)
+        self.assertNotIn(dead, self.pool._idle)
+        self.assertEqual([shell.commands_run for shell in self.pool._idle], [0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()